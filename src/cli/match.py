@@ -164,10 +164,10 @@ def match_group() -> None:
 )
 @click.option(
     "--combination-strategy",
-    type=click.Choice(["greedy"]),
+    type=click.Choice(["greedy", "exact"]),
     default="greedy",
     show_default=True,
-    help="Composite solver strategy.",
+    help="Composite solver strategy (exact: fewest facilities for the best coverage).",
 )
 @click.option(
     "--no-alternative-solutions",
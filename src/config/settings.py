@@ -177,6 +177,50 @@ STORAGE_SKIP_DIRECTORY_BOOTSTRAP = _get_secret_or_env(
     "STORAGE_SKIP_DIRECTORY_BOOTSTRAP", "false"
 ).lower() in ("true", "1", "t")
 
+# Persistent key/metadata index (SQLite, one file per storage target under
+# STORAGE_INDEX_DIR) kept by StorageManager on writes. Domain listings, solution
+# listings and staleness checks read it instead of fetching every object body.
+# Off by default: writes by other replicas (or files dropped into local storage
+# by hand) only show up after the next STORAGE_INDEX_RESCAN_SECONDS reconcile,
+# so enable it only for single-writer deployments or where that lag is fine.
+STORAGE_INDEX_ENABLED = _get_secret_or_env(
+    "STORAGE_INDEX_ENABLED", "false"
+).lower() in ("true", "1", "t")
+STORAGE_INDEX_DIR = _get_secret_or_env(
+    "STORAGE_INDEX_DIR", str(Path.home() / ".ohm" / "storage-index")
+)
+# How long a reconciled prefix is trusted before the next indexed query lists
+# it again to pick up objects written by other processes (0 = every query).
+STORAGE_INDEX_RESCAN_SECONDS = max(
+    0.0, float(_get_secret_or_env("STORAGE_INDEX_RESCAN_SECONDS", "60"))
+)
+
+# In-flight requests for bulk storage operations (get/put/delete_objects) on
+# backends without a native batch call for the operation.
+STORAGE_BULK_CONCURRENCY = max(
+    1, int(_get_secret_or_env("STORAGE_BULK_CONCURRENCY", "16"))
+)
+
+# S3 provider: connections in the client pool shared by every provider for the
+# same endpoint/credentials (also the size of the thread pool its calls run on).
+S3_MAX_POOL_CONNECTIONS = max(
+    1, int(_get_secret_or_env("S3_MAX_POOL_CONNECTIONS", "32"))
+)
+# Uploads larger than this go through multipart upload in parts of
+# S3_MULTIPART_CHUNK_SIZE bytes (S3 requires at least 5 MiB per part).
+S3_MULTIPART_THRESHOLD = int(
+    _get_secret_or_env("S3_MULTIPART_THRESHOLD", str(8 * 1024 * 1024))
+)
+S3_MULTIPART_CHUNK_SIZE = max(
+    5 * 1024 * 1024,
+    int(_get_secret_or_env("S3_MULTIPART_CHUNK_SIZE", str(8 * 1024 * 1024))),
+)
+# GCS provider: threads in the pool every GCS call runs on, shared by all GCS
+# providers in the process (also the size of each client's connection pool).
+GCS_MAX_POOL_CONNECTIONS = max(
+    1, int(_get_secret_or_env("GCS_MAX_POOL_CONNECTIONS", "32"))
+)
+
 # Cache Configuration
 CACHE_ENABLED = _get_secret_or_env("CACHE_ENABLED", "true").lower() in (
     "true",
@@ -228,6 +272,18 @@ if MAX_DEPTH < 0 or MAX_DEPTH > 10:
         "Consider using a value between 1-5 for optimal performance."
     )
 
+# Child manifests and BOMs loaded at once while exploding a BOM. Loads were
+# sequential, one reference at a time, so a wide BOM cost one storage round
+# trip per referenced sub-assembly in sequence.
+BOM_RESOLUTION_CONCURRENCY = max(
+    1, int(_get_secret_or_env("BOM_RESOLUTION_CONCURRENCY", "8"))
+)
+
+# Entries in the in-process memo of exploded BOMs (whole designs and shared
+# sub-assemblies), keyed by manifest content hash. Cleared on OKH writes.
+# 0 disables the memo.
+BOM_EXPLOSION_CACHE_SIZE = int(_get_secret_or_env("BOM_EXPLOSION_CACHE_SIZE", "512"))
+
 # NLP veto (second opinion on fuzzy direct + heuristic hits)
 MATCHING_NLP_VETO_ENABLED = _get_secret_or_env(
     "MATCHING_NLP_VETO_ENABLED", "false"
@@ -271,6 +327,54 @@ MATCHING_INIT_TIMEOUT_SECONDS = float(
     _get_secret_or_env("MATCHING_INIT_TIMEOUT_SECONDS", "120")
 )
 
+# Facilities evaluated at once by MatchingService.find_matches_with_manifest.
+# 1 (default) keeps the sequential walk; higher values overlap capability
+# extraction (run on worker threads) and the layer cascade across facilities.
+# Results, ordering and max_solutions early-stop are identical either way.
+MATCHING_FACILITY_CONCURRENCY = max(
+    1, int(_get_secret_or_env("MATCHING_FACILITY_CONCURRENCY", "1"))
+)
+
+# Entries in MatchingService's memo of cascade verdicts per normalized
+# (requirement, capability) pair. The process vocabulary is small, so this
+# bounds memory rather than hit rate. 0 disables the memo.
+MATCHING_PAIR_CACHE_SIZE = int(_get_secret_or_env("MATCHING_PAIR_CACHE_SIZE", "50000"))
+
+# Entries in MatchingService's memo of extracted, normalized capabilities per
+# facility revision (id, content hash, domain, extractor). Roughly one entry per
+# facility per domain. 0 disables the memo.
+MATCHING_CAPABILITY_CACHE_SIZE = int(
+    _get_secret_or_env("MATCHING_CAPABILITY_CACHE_SIZE", "20000")
+)
+
+# Entries in MatchingService's memo of single-level match verdicts per
+# (manifest revision, facility revision), including no-match verdicts. Roughly
+# one entry per facility per distinct manifest matched. 0 disables the memo.
+MATCHING_RESULT_CACHE_SIZE = int(
+    _get_secret_or_env("MATCHING_RESULT_CACHE_SIZE", "50000")
+)
+
+# Level of the matching engine's per-facility and per-pair detail records
+# (capability lists, pair hits, coverage lines). Each match request logs one
+# aggregated "Matching summary" at INFO regardless; the detail only costs
+# anything when this level is enabled. A request may override it.
+MATCHING_HOT_PATH_LOG_LEVEL = _get_secret_or_env(
+    "MATCHING_HOT_PATH_LOG_LEVEL", "DEBUG"
+).upper()
+
+# Fraction (0-1) of enabled hot-path detail records actually emitted.
+MATCHING_HOT_PATH_LOG_SAMPLE_RATE = min(
+    1.0,
+    max(0.0, float(_get_secret_or_env("MATCHING_HOT_PATH_LOG_SAMPLE_RATE", "1.0"))),
+)
+
+# Distinct component process profiles matched at once by nested (BOM) matching.
+# Components sharing a profile are matched once and fanned out, so this bounds
+# the number of profile-by-pool evaluations in flight, not BOM lines.
+MATCHING_COMPONENT_CONCURRENCY = max(
+    1, int(_get_secret_or_env("MATCHING_COMPONENT_CONCURRENCY", "8"))
+)
+
 # Federation (Phase 5 MVP — disabled by default)
 OHM_FEDERATION_ENABLED = _get_secret_or_env(
     "OHM_FEDERATION_ENABLED", "false"
@@ -79,18 +79,31 @@ def get_azure_credentials() -> Dict[str, str]:
 
 
 def get_aws_credentials() -> Dict[str, str]:
-    """Get AWS S3 credentials from environment variables"""
+    """Get AWS S3 credentials from environment variables
+
+    With neither AWS_ACCESS_KEY_ID nor AWS_SECRET_ACCESS_KEY set, only the
+    region is returned and boto3's default chain (ECS/Fargate task role,
+    instance profile, shared config) supplies credentials.
+    """
     access_key = _env("AWS_ACCESS_KEY_ID")
     secret_key = _env("AWS_SECRET_ACCESS_KEY")
     region = _env("AWS_DEFAULT_REGION") or "us-east-1"
 
+    if not access_key and not secret_key:
+        logger.info("Using the AWS default credential chain")
+        return {"region": region}
+
     if not access_key or not secret_key:
         raise MissingCredentialsError(
             "AWS credentials not found. "
             "Please set AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY environment variables."
         )
 
-    return {"access_key": access_key, "secret_key": secret_key, "region": region}
+    credentials = {"access_key": access_key, "secret_key": secret_key, "region": region}
+    session_token = _env("AWS_SESSION_TOKEN")
+    if session_token:
+        credentials["session_token"] = session_token
+    return credentials
 
 
 def get_gcp_credentials() -> Dict[str, str]:
@@ -167,6 +180,10 @@ def create_storage_config(
         credentials = get_aws_credentials()
         if not bucket_name:
             bucket_name = _env("AWS_S3_BUCKET")
+        # S3-compatible stores (MinIO, moto server) via the SDK's standard names
+        endpoint_url = (
+            endpoint_url or _env("AWS_ENDPOINT_URL_S3") or _env("AWS_ENDPOINT_URL")
+        )
     elif provider == "gcs":
         credentials = get_gcp_credentials()
         if not bucket_name:
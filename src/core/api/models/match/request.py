@@ -56,6 +56,41 @@ class MatchRequest(BaseAPIRequest, LLMRequestMixin):
     # Quality and validation options
     min_confidence: Optional[float] = 0.1  # Relaxed default; caller may raise as needed
     max_results: Optional[int] = 10
+    top_k: bool = Field(
+        False,
+        description=(
+            "Single-level only: return the max_results highest-confidence facilities "
+            "instead of the first max_results that pass the match threshold. "
+            "Facilities whose score bound cannot make the list are skipped."
+        ),
+    )
+    hot_path_log_level: Optional[
+        Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+    ] = Field(
+        None,
+        description=(
+            "Level for this request's per-facility and per-pair matching logs "
+            "(defaults to MATCHING_HOT_PATH_LOG_LEVEL). Use INFO to trace one "
+            "request without lowering the service log level."
+        ),
+    )
+    hot_path_log_sample_rate: Optional[float] = Field(
+        None,
+        ge=0.0,
+        le=1.0,
+        description=(
+            "Fraction of this request's per-facility and per-pair matching logs "
+            "to emit (defaults to MATCHING_HOT_PATH_LOG_SAMPLE_RATE)."
+        ),
+    )
+    debug: bool = Field(
+        False,
+        description=(
+            "Single-level only: attach this request's per-layer matching "
+            "statistics (calls, hit rates, latency histograms) to "
+            "matching_metrics.layers in the response."
+        ),
+    )
 
     # Unified depth-based matching control
     max_depth: Optional[int] = Field(
@@ -129,8 +164,9 @@ class MatchRequest(BaseAPIRequest, LLMRequestMixin):
     combination_strategy: Optional[str] = Field(
         "greedy",
         description=(
-            "Strategy identifier for facility-combination solver. "
-            "Current values are forward-compatible; 'greedy' is the default."
+            "Strategy identifier for facility-combination solver: 'greedy' "
+            "(default) or 'exact' (fewest facilities for the best coverage). "
+            "Unknown values fall back to 'greedy'."
         ),
     )
 
@@ -334,6 +370,45 @@ class FacilityMatchRequest(BaseAPIRequest):
     )
 
 
+class BatchMatchRequest(BaseAPIRequest):
+    """Batch match request: many designs against one shared facility pool."""
+
+    okh_ids: Optional[List[UUID]] = Field(
+        None, description="Stored OKH designs to match"
+    )
+    okh_manifests: Optional[List[dict]] = Field(
+        None, description="Inline OKH manifests to match (after okh_ids)"
+    )
+    domain: Optional[str] = Field(
+        None,
+        description="Optional explicit domain; skips content-based domain detection.",
+    )
+    okw_facilities: Optional[List[Dict[str, Any]]] = Field(
+        None,
+        description="Optional list of OKW facilities (as dicts) to use instead of loading from storage",
+    )
+    okw_ids: Optional[List[str]] = Field(
+        None,
+        description="Restrict the shared facility pool to this subset of OKW facility IDs.",
+    )
+    min_confidence: Optional[float] = Field(
+        0.1,
+        ge=0.0,
+        le=1.0,
+        description="Minimum solution score for a facility to be reported.",
+    )
+    max_results: Optional[int] = Field(
+        10, ge=1, description="Maximum number of solutions reported per design."
+    )
+
+    @model_validator(mode="after")
+    def validate_input(self):
+        """Require at least one design."""
+        if not self.okh_ids and not self.okh_manifests:
+            raise ValueError("Must provide okh_ids and/or okh_manifests")
+        return self
+
+
 class SimulationParameters(BaseModel):
     """Parameters for simulation"""
 
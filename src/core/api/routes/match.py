@@ -26,6 +26,7 @@ from fastapi import (
     UploadFile,
     status,
 )
+from fastapi.responses import StreamingResponse
 
 from src.config.settings import (
     MATCHING_EAGER_INIT,
@@ -43,6 +44,7 @@ from ...models.okh import OKHManifest
 from ...models.okw import ManufacturingFacility
 from ...registry.domain_registry import DomainRegistry
 from ...services.domain_service import DomainDetector
+from ...services.matching import match_log_scope
 from ...services.matching_service import MatchingService
 from ...services.okh_service import OKHService
 from ...services.okw_service import (
@@ -52,6 +54,7 @@ from ...services.okw_service import (
     resolve_matching_local_okw_json_dir,
 )
 from ...services.storage_service import StorageService
+from ...matching.facility_index import FacilityProcessIndex, get_facility_index
 from ...matching.match_modes import MATCH_MODE_NESTED, MATCH_MODE_SINGLE_LEVEL
 from ...taxonomy import taxonomy as _process_taxonomy
 from ...utils.logging import get_logger
@@ -81,6 +84,7 @@ from ..models.base import (
 
 # Import existing models and services
 from ..models.match.request import (
+    BatchMatchRequest,
     FacilityMatchRequest,
     MatchRequest,
     SimulateRequest,
@@ -228,6 +232,17 @@ async def match_requirements_to_capabilities(
         return matching_service
 
     try:
+        # top_k ranks single-facility solutions and needs a k; the composite
+        # solver would otherwise ignore it silently.
+        if request.top_k and (
+            request.allow_facility_combinations or not request.max_results
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="top_k requires max_results and cannot be combined with "
+                "allow_facility_combinations",
+            )
+
         # 1. Detect domain from request
         domain = await _detect_domain_from_request(request)
         logger.info(
@@ -312,6 +327,7 @@ async def match_requirements_to_capabilities(
                 required_processes=required_processes,
                 request_id=request_id,
                 max_candidates=request.max_candidate_facilities,
+                index=get_facility_index(),
             )
 
         if not facilities:
@@ -400,14 +416,20 @@ async def match_requirements_to_capabilities(
         else:
             # Single-level matching (existing logic)
             svc = await _ensure_matching_service()
-            matching_results = await _perform_enhanced_matching(
-                svc,
-                requirements_data,
-                facilities,
-                request,
-                request_id,
-                domain=domain,
-            )
+            with match_log_scope(
+                logger,
+                level=request.hot_path_log_level,
+                sample_rate=request.hot_path_log_sample_rate,
+                request_id=request_id,
+            ) as match_log:
+                matching_results = await _perform_enhanced_matching(
+                    svc,
+                    requirements_data,
+                    facilities,
+                    request,
+                    request_id,
+                    domain=domain,
+                )
 
             # Process and format results
             solutions = await _process_matching_results(
@@ -462,6 +484,10 @@ async def match_requirements_to_capabilities(
                 },
                 "validation_results": validation_results_dicts,
             }
+            if request.debug:
+                response_data["matching_metrics"]["layers"] = match_log.summary(
+                    histogram=True
+                )
 
             matched_processes = _collect_matched_processes_from_solutions(solutions)
             composite_applied = any(bool(s.get("is_composite")) for s in solutions)
@@ -644,6 +670,206 @@ async def match_requirements_to_capabilities(
         )
 
 
+def _stream_frame(event: str, data: Dict[str, Any], sse: bool) -> str:
+    """Encode one stream event as an SSE frame or an NDJSON line."""
+    payload = json.dumps(data, default=str)
+    if sse:
+        return f"event: {event}\ndata: {payload}\n\n"
+    return json.dumps({"event": event, "data": data}, default=str) + "\n"
+
+
+@router.post(
+    "/stream",
+    status_code=status.HTTP_200_OK,
+    summary="Streaming Requirements Matching (Single-Level)",
+    description="""
+    Single-level manufacturing matching that streams each solution as soon as
+    its facility is accepted, instead of returning once every facility has
+    been evaluated. Accepts the same body as `POST /match`.
+
+    **Encoding:** newline-delimited JSON (`{"event": ..., "data": ...}` per
+    line) by default; Server-Sent Events when `format=sse` or the request
+    sends `Accept: text/event-stream`.
+
+    **Events:**
+    - `progress`: `processed_facilities`, `total_facilities`, `progress_pct`
+    - `solution`: one solution in the `POST /match` shape, plus `sequence`
+      and `validation`; solutions below `min_confidence` are not sent
+    - `summary`: final frame with totals, `match_summary` and `coverage_gaps`
+    - `error`: sent instead of `summary` if matching fails mid-stream
+
+    Solutions arrive in evaluation order, not ranked. Closing the connection
+    cancels the remaining work. Nested, facility-combination and cooking
+    matches are not streamed; use `POST /match`.
+    """,
+    responses={
+        200: {
+            "content": {"application/x-ndjson": {}, "text/event-stream": {}},
+            "description": "Progress and solution events, then a summary",
+        },
+    },
+)
+async def match_stream(
+    request: MatchRequest,
+    http_request: Request,
+    format: Optional[str] = Query(
+        None, pattern="^(ndjson|sse)$", description="Stream encoding"
+    ),
+    storage_service: StorageService = Depends(get_storage_service),
+    matching_service: MatchingService = Depends(get_matching_service),
+) -> StreamingResponse:
+    """Stream single-level match events for one design."""
+    request_id = getattr(http_request.state, "request_id", None)
+    start_time = datetime.now()
+    sse = format == "sse" or (
+        format is None and "text/event-stream" in http_request.headers.get("accept", "")
+    )
+
+    try:
+        domain = await _detect_domain_from_request(request)
+        max_depth = request.max_depth or 0
+        if domain != "manufacturing" or max_depth > 0:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Streaming supports single-level manufacturing matching only; "
+                "use POST /match",
+            )
+        if request.allow_facility_combinations:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Facility-combination matching is not streamed; use POST /match",
+            )
+
+        okh_service: Optional[OKHService] = None
+        if not request.okh_manifest and (
+            request.okh_id is not None or request.okh_url is not None
+        ):
+            okh_service = await OKHService.get_instance()
+        okh_manifest = await _extract_okh_manifest(
+            request, okh_service, storage_service, request_id
+        )
+        if not okh_manifest:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Must provide either okh_manifest, okh_id, or okh_url",
+            )
+
+        required_processes = _extract_required_processes_from_manifest(okh_manifest)
+        facilities = await _get_filtered_facilities(
+            storage_service,
+            request,
+            request_id,
+            domain=domain,
+            okh_manifest=okh_manifest,
+        )
+        if required_processes and facilities:
+            facilities = _prefilter_facilities_by_required_processes(
+                facilities=facilities,
+                required_processes=required_processes,
+                request_id=request_id,
+                max_candidates=request.max_candidate_facilities,
+                index=get_facility_index(),
+            )
+    except HTTPException:
+        raise
+    except Exception as e:
+        error_response = create_error_response(
+            error=e,
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            request_id=request_id,
+            suggestion="Please try again or contact support if the issue persists",
+        )
+        logger.error(f"Error preparing streaming match: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=error_response.model_dump(mode="json"),
+        )
+
+    min_confidence = (
+        request.min_confidence if request.min_confidence is not None else 0.1
+    )
+
+    async def frames():
+        emitted: List[dict] = []
+        processed = 0
+        events = matching_service.iter_matches_with_manifest(
+            okh_manifest=okh_manifest,
+            facilities=facilities,
+            explicit_domain=domain,
+            max_solutions=request.max_results,
+        )
+        try:
+            async for event in events:
+                processed = max(processed, event.processed_facilities)
+                if event.kind == "progress":
+                    yield _stream_frame(
+                        "progress",
+                        {
+                            "processed_facilities": event.processed_facilities,
+                            "total_facilities": event.total_facilities,
+                            "progress_pct": event.progress_pct,
+                        },
+                        sse,
+                    )
+                    continue
+                result = _format_manufacturing_solution(
+                    event.solution, [event.facility]
+                )
+                if result is None or result["confidence"] < min_confidence:
+                    continue
+                validation = await _validate_results([result], request_id)
+                result["sequence"] = len(emitted) + 1
+                result["validation"] = (
+                    validation[0].model_dump() if validation else None
+                )
+                emitted.append(result)
+                yield _stream_frame("solution", result, sse)
+        except Exception as e:
+            logger.error(
+                f"Error in streaming match: {e}",
+                extra={"request_id": request_id},
+                exc_info=True,
+            )
+            yield _stream_frame(
+                "error", {"error": str(e), "request_id": request_id}, sse
+            )
+            return
+        finally:
+            await events.aclose()
+
+        match_summary, coverage_gaps = _build_match_summary(
+            required_processes=required_processes,
+            matched_processes=_collect_matched_processes_from_solutions(emitted),
+            solution_count=len(emitted),
+            matching_mode=MATCH_MODE_SINGLE_LEVEL,
+            request=request,
+        )
+        logger.info(
+            f"Streaming match completed: {len(emitted)} solutions",
+            extra={"request_id": request_id, "solutions_count": len(emitted)},
+        )
+        yield _stream_frame(
+            "summary",
+            {
+                "total_solutions": len(emitted),
+                "matching_mode": MATCH_MODE_SINGLE_LEVEL,
+                "processed_facilities": processed,
+                "total_facilities": len(facilities),
+                "processing_time": (datetime.now() - start_time).total_seconds(),
+                "match_summary": match_summary,
+                "coverage_gaps": coverage_gaps,
+                "request_id": request_id,
+            },
+            sse,
+        )
+
+    return StreamingResponse(
+        frames(),
+        media_type="text/event-stream" if sse else "application/x-ndjson",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
 # Validation endpoint (enhanced version)
 @router.post(
     "/validate",
@@ -1030,9 +1256,11 @@ async def match_requirements_from_file(
     Reverse matching: given an OKW facility, return the OKH designs it can produce.
 
     This is the inverse of `POST /api/match` (which finds facilities for a design).
-    It evaluates every design in the catalog against the single target facility
-    using the same matching logic, and returns the designs the facility can make,
-    ranked by confidence.
+    Designs whose process requirements could not reach the partial-match
+    threshold against the facility are skipped using a process index; the rest
+    are evaluated against the single target facility using the same matching
+    logic, and the designs the facility can make are returned ranked by
+    confidence.
 
     **Body:**
     - `okw_id` (required): the facility to find producible designs for
@@ -1064,22 +1292,18 @@ async def match_designs_for_facility(
                 detail=f"Facility {request.okw_id} not found",
             )
 
-        # Load the full design catalog (list yields minimal manifests; the matcher
-        # needs full manifests to extract process requirements, so re-load each).
-        manifests: List[OKHManifest] = []
-        page = 1
-        page_size = 200
-        while True:
-            summaries, _ = await okh_service.list(page=page, page_size=page_size)
-            if not summaries:
-                break
-            for summary in summaries:
-                full = await okh_service.get(summary.id)
-                if full is not None:
-                    manifests.append(full)
-            if len(summaries) < page_size:
-                break
-            page += 1
+        if request.domain in (None, "manufacturing"):
+            # Only designs the facility could plausibly cover are parsed and
+            # matched; the design index answers that from cached requirement
+            # vectors.
+            manifests, catalog_size = await okh_service.design_candidates(facility)
+        else:
+            # The process taxonomy is manufacturing-only; other domains are
+            # evaluated against the whole catalogue.
+            _, catalog_size = await okh_service.list(page=1, page_size=1)
+            manifests, _ = await okh_service.list(
+                page=1, page_size=max(catalog_size, 1)
+            )
 
         designs = await matching_service.find_designs_for_facility(
             facility=facility,
@@ -1089,6 +1313,7 @@ async def match_designs_for_facility(
             ),
             max_results=request.max_results,
             explicit_domain=request.domain,
+            design_index=okh_service.design_index,
         )
 
         processing_time = (datetime.now() - start_time).total_seconds()
@@ -1100,6 +1325,7 @@ async def match_designs_for_facility(
             "designs": designs,
             "total_designs": len(designs),
             "designs_considered": len(manifests),
+            "designs_in_catalog": catalog_size,
             "processing_time": processing_time,
         }
 
@@ -1119,6 +1345,177 @@ async def match_designs_for_facility(
         )
 
 
+# Batch matching: many designs against one facility pool
+@router.post(
+    "/batch",
+    status_code=status.HTTP_200_OK,
+    summary="Batch Match (Many Designs, One Facility Pool)",
+    description="""
+    Match many OKH designs against one shared facility pool and stream the
+    results as newline-delimited JSON, one line per design as it finishes.
+
+    Each facility's capabilities are extracted once and each distinct process
+    requirement is checked against each distinct capability set once, so the
+    cost grows with the process vocabulary rather than designs × facilities.
+
+    **Body:**
+    - `okh_ids` and/or `okh_manifests`: the designs to match
+    - `okw_facilities` (optional): inline facility pool; otherwise the configured source
+    - `okw_ids` (optional): restrict the pool to these facility IDs
+    - `min_confidence` / `max_results`: per-design solution filter and cap
+    - `domain` (optional): explicit domain override
+
+    **Stream:** one object per design (`index`, `okh_id`, `okh_title`,
+    `domain`, `solutions`, `total_solutions`, `error`), in completion order,
+    followed by a final `{"summary": {...}}` line.
+    """,
+    responses={
+        200: {
+            "content": {"application/x-ndjson": {}},
+            "description": "One JSON object per design, newline-delimited",
+        },
+    },
+)
+async def match_batch(
+    request: BatchMatchRequest,
+    http_request: Request,
+    matching_service: MatchingService = Depends(get_matching_service),
+    okh_service: OKHService = Depends(get_okh_service),
+) -> StreamingResponse:
+    """Stream per-design match results for a batch of designs."""
+    request_id = getattr(http_request.state, "request_id", None)
+    start_time = datetime.now()
+
+    try:
+        if request.okw_facilities is not None:
+            facilities = []
+            for item in request.okw_facilities:
+                try:
+                    facilities.append(ManufacturingFacility.from_dict(item))
+                except Exception as e:
+                    logger.warning(
+                        "Skipping invalid inline OKW facility dict",
+                        extra={"request_id": request_id, "error": str(e)},
+                    )
+        else:
+            from src.config.storage_config import resolve_effective_source
+
+            facilities = await resolve_match_facilities(
+                effective_source=resolve_effective_source(),
+                domain=request.domain or "manufacturing",
+                request_id=request_id or "",
+            )
+        okw_id_subset = {str(i) for i in (request.okw_ids or []) if i is not None}
+        if okw_id_subset:
+            facilities = [f for f in facilities if str(f.id) in okw_id_subset]
+
+        # Designs that cannot be loaded still get their line in the stream.
+        manifests: List[OKHManifest] = []
+        failures: List[dict] = []
+        for okh_id in request.okh_ids or []:
+            manifest = await okh_service.get(okh_id)
+            if manifest is None:
+                failures.append(
+                    {"okh_id": str(okh_id), "error": f"OKH {okh_id} not found"}
+                )
+            else:
+                manifests.append(manifest)
+        for raw in request.okh_manifests or []:
+            try:
+                manifests.append(OKHManifest.from_dict(raw))
+            except Exception as e:
+                failures.append(
+                    {
+                        "okh_id": raw.get("id") if isinstance(raw, dict) else None,
+                        "error": f"Invalid OKH manifest: {e}",
+                    }
+                )
+
+        logger.info(
+            "Batch match started",
+            extra={
+                "request_id": request_id,
+                "design_count": len(manifests) + len(failures),
+                "facility_count": len(facilities),
+            },
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        error_response = create_error_response(
+            error=e,
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            request_id=request_id,
+            suggestion="Please try again or contact support if the issue persists",
+        )
+        logger.error(f"Error preparing batch match: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=error_response.model_dump(mode="json"),
+        )
+
+    min_confidence = (
+        request.min_confidence if request.min_confidence is not None else 0.1
+    )
+
+    async def lines():
+        matched = 0
+        for offset, failure in enumerate(failures, start=len(manifests)):
+            yield json.dumps(
+                {
+                    "index": offset,
+                    "okh_id": failure["okh_id"],
+                    "okh_title": None,
+                    "domain": None,
+                    "solutions": [],
+                    "total_solutions": 0,
+                    "error": failure["error"],
+                }
+            ) + "\n"
+        try:
+            async for result in matching_service.match_many(
+                manifests, facilities, explicit_domain=request.domain
+            ):
+                ranked = sorted(
+                    (s for s in result.solutions if s.score >= min_confidence),
+                    key=lambda s: s.score,
+                    reverse=True,
+                )
+                if ranked:
+                    matched += 1
+                yield json.dumps(
+                    {
+                        "index": result.index,
+                        "okh_id": str(getattr(result.manifest, "id", None)),
+                        "okh_title": getattr(result.manifest, "title", None),
+                        "domain": result.domain,
+                        "solutions": [
+                            s.to_dict() for s in ranked[: request.max_results]
+                        ],
+                        "total_solutions": len(ranked),
+                        "error": result.error,
+                    },
+                    default=str,
+                ) + "\n"
+        except Exception as e:
+            logger.error(f"Error in batch match stream: {e}", exc_info=True)
+            yield json.dumps({"error": str(e), "request_id": request_id}) + "\n"
+            return
+        yield json.dumps(
+            {
+                "summary": {
+                    "total_designs": len(manifests) + len(failures),
+                    "designs_matched": matched,
+                    "facility_count": len(facilities),
+                    "processing_time": (datetime.now() - start_time).total_seconds(),
+                    "request_id": request_id,
+                }
+            }
+        ) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
 # Domains endpoints (enhanced version)
 @router.get(
     "/domains",
@@ -1550,11 +1947,8 @@ def _processes_match(required: str, capability: str) -> bool:
             return True
         # cap_id covers req_id when req_id is an ancestor of cap_id
         # (e.g. "3d_printing" is ancestor of "3d_printing_fdm")
-        try:
-            if req_id in (_process_taxonomy.get_ancestors(cap_id) or []):
-                return True
-        except Exception:
-            pass
+        if _process_taxonomy.is_ancestor(req_id, cap_id):
+            return True
 
     # Fallback: normalize Wikipedia URI slugs and do substring comparison
     def _slug(s: str) -> str:
@@ -2230,73 +2624,33 @@ async def _extract_recipe(
         )
 
 
-def _extract_facility_process_names_for_prefilter(facility: Any) -> set[str]:
-    """Best-effort process extraction for cheap candidate prefiltering."""
-    if hasattr(facility, "to_dict"):
-        raw = facility.to_dict()
-    elif isinstance(facility, dict):
-        raw = facility
-    else:
-        return set()
-
-    capabilities = raw.get("capabilities") or []
-    names: set[str] = set()
-    for cap in capabilities:
-        if isinstance(cap, dict):
-            candidate = (
-                cap.get("process_name")
-                or cap.get("type")
-                or cap.get("name")
-                or cap.get("label")
-            )
-            if candidate and isinstance(candidate, str):
-                names.add(candidate.strip().lower())
-    return {n for n in names if n}
-
-
 def _prefilter_facilities_by_required_processes(
     facilities: List[Any],
     required_processes: List[str],
     request_id: str,
     max_candidates: Optional[int],
+    index: Optional[FacilityProcessIndex] = None,
 ) -> List[Any]:
-    """Narrow facility pool by overlap with required processes before heavy matching."""
+    """Narrow facility pool to those that can reach partial-match coverage.
+
+    Facilities held in ``index`` (the OKW capability index) are answered from
+    its posting lists; any others are resolved on the fly. Requirements the
+    taxonomy cannot resolve still match a facility naming the same process,
+    case-insensitively. Candidates are ranked by definite requirement hits
+    before ``max_candidates`` applies.
+    """
     if not facilities or not required_processes:
         return facilities
 
-    normalized_required: set[str] = set()
-    for p in required_processes:
-        if not p:
-            continue
-        p_norm = str(p).strip().lower()
-        if not p_norm:
-            continue
-        normalized_required.add(p_norm)
-        canonical = _process_taxonomy.normalize(p_norm)
-        if canonical:
-            normalized_required.add(canonical)
-
-    if not normalized_required:
+    query = (index or FacilityProcessIndex()).query(required_processes)
+    if query is None:
         return facilities
 
     scored: List[tuple[int, Any]] = []
     for facility in facilities:
-        process_names = _extract_facility_process_names_for_prefilter(facility)
-        if not process_names:
-            continue
-
-        score = 0
-        for req in normalized_required:
-            for cap in process_names:
-                if req == cap:
-                    score += 2
-                    continue
-                req_c = _process_taxonomy.normalize(req)
-                cap_c = _process_taxonomy.normalize(cap)
-                if req_c and cap_c and _process_taxonomy.are_related(req_c, cap_c):
-                    score += 1
-        if score > 0:
-            scored.append((score, facility))
+        hits = query.hits_for(facility)
+        if hits is not None:
+            scored.append((hits, facility))
 
     if not scored:
         # No facility advertises a required process (MoM has zero coverage for
@@ -2311,7 +2665,7 @@ def _prefilter_facilities_by_required_processes(
             "Requirement-aware prefilter found no overlap; keeping full facility pool",
             extra={
                 "request_id": request_id,
-                "required_process_count": len(normalized_required),
+                "required_process_count": query.total,
                 "facility_count": len(facilities),
                 "selected_candidates": len(fallback),
                 "max_candidates": max_candidates,
@@ -2799,6 +3153,13 @@ async def _perform_enhanced_matching(
                         explicit_domain=domain,
                         max_solutions=request.max_results,
                     )
+            elif request.top_k:
+                solutions = await matching_service.find_top_matches_with_manifest(
+                    okh_manifest=requirements_data,
+                    facilities=facilities,
+                    k=request.max_results,
+                    explicit_domain=domain,
+                )
             else:
                 solutions = await matching_service.find_matches_with_manifest(
                     okh_manifest=requirements_data,
@@ -2810,147 +3171,9 @@ async def _perform_enhanced_matching(
             # Convert SupplyTreeSolution objects to dict format expected by API
             results = []
             for solution in solutions:
-                representative_tree = None
-                if getattr(solution, "all_trees", None):
-                    representative_tree = max(
-                        solution.all_trees, key=lambda t: t.confidence_score
-                    )
-                elif hasattr(solution, "tree"):
-                    representative_tree = solution.tree
-
-                if not representative_tree:
+                solution_dict = _format_manufacturing_solution(solution, facilities)
+                if solution_dict is None:
                     continue
-
-                # Extract facility information from the solution
-                facility_name = (
-                    representative_tree.facility_name
-                    if representative_tree.facility_name
-                    else "Unknown Facility"
-                )
-
-                # Try to find the facility in the facilities list to get its ID
-                facility_id = None
-                facility_data = None
-                representative_okw_ref = (
-                    str(representative_tree.okw_reference)
-                    if getattr(representative_tree, "okw_reference", None)
-                    else None
-                )
-                for facility in facilities:
-                    if (
-                        representative_okw_ref
-                        and str(getattr(facility, "id", "")) == representative_okw_ref
-                    ):
-                        facility_id = representative_okw_ref
-                        facility_data = (
-                            facility.to_dict()
-                            if hasattr(facility, "to_dict")
-                            else facility
-                        )
-                        break
-                    if hasattr(facility, "name") and facility.name == facility_name:
-                        facility_id = str(facility.id)
-                        facility_data = facility.to_dict()
-                        break
-                    elif (
-                        isinstance(facility, dict)
-                        and facility.get("name") == facility_name
-                    ):
-                        facility_id = facility.get("id", "unknown")
-                        facility_data = facility
-                        break
-
-                # If we couldn't find the facility, try to extract from tree metadata
-                if not facility_id:
-                    facility_id = (
-                        representative_tree.metadata.get("facility_id")
-                        if representative_tree.metadata
-                        else None
-                    )
-                    if not facility_id:
-                        # Generate a fallback ID when facility_id is not available
-                        # This is a temporary identifier for the response, not a stored facility ID
-                        from uuid import uuid4
-
-                        facility_id = str(uuid4())[:8]
-
-                # Create solution dict in expected format
-                if not facility_data:
-                    facility_data = {
-                        "id": facility_id,
-                        "name": facility_name,
-                    }
-                elif isinstance(facility_data, dict):
-                    facility_data.setdefault("id", facility_id)
-                    facility_data.setdefault("name", facility_name)
-
-                solution_dict = {
-                    "tree": representative_tree.to_dict(),
-                    "facility": facility_data,
-                    "facility_id": facility_id,
-                    "facility_name": facility_name,
-                    "match_type": "manufacturing",
-                    "confidence": (
-                        representative_tree.confidence_score
-                        if representative_tree.confidence_score
-                        else solution.score
-                    ),
-                    "score": solution.score,
-                    "metrics": solution.metrics,
-                }
-                if len(getattr(solution, "all_trees", [])) > 1:
-                    solution_dict["facility_ids"] = [
-                        str(tree.okw_reference)
-                        for tree in solution.all_trees
-                        if getattr(tree, "okw_reference", None)
-                    ]
-                    solution_dict["facility_names"] = [
-                        tree.facility_name for tree in solution.all_trees
-                    ]
-                    solution_dict["is_composite"] = True
-                    solution_dict["solution"] = solution.to_dict()
-                    facility_details = []
-                    for tree in solution.all_trees:
-                        tree_facility_data = None
-                        tree_facility_id = (
-                            str(tree.okw_reference) if tree.okw_reference else None
-                        )
-                        for facility in facilities:
-                            if (
-                                tree_facility_id
-                                and str(getattr(facility, "id", "")) == tree_facility_id
-                            ):
-                                tree_facility_data = (
-                                    facility.to_dict()
-                                    if hasattr(facility, "to_dict")
-                                    else facility
-                                )
-                                break
-                            if (
-                                hasattr(facility, "name")
-                                and facility.name == tree.facility_name
-                            ):
-                                tree_facility_data = (
-                                    facility.to_dict()
-                                    if hasattr(facility, "to_dict")
-                                    else facility
-                                )
-                                if not tree_facility_id:
-                                    tree_facility_id = str(getattr(facility, "id", ""))
-                                break
-                        if not tree_facility_data:
-                            tree_facility_data = {
-                                "id": tree_facility_id,
-                                "name": tree.facility_name,
-                            }
-                        facility_details.append(
-                            {
-                                "facility_id": tree_facility_id,
-                                "facility_name": tree.facility_name,
-                                "facility": tree_facility_data or {},
-                            }
-                        )
-                    solution_dict["facility_details"] = facility_details
                 if composite_warning:
                     solution_dict["warning"] = composite_warning
                 results.append(solution_dict)
@@ -3115,6 +3338,142 @@ async def _perform_enhanced_matching(
         )
 
 
+def _format_manufacturing_solution(
+    solution: Any, facilities: List[Any]
+) -> Optional[dict]:
+    """API result dict for one manufacturing ``SupplyTreeSolution``.
+
+    Resolves the solution's facility (or facilities, for composites) from
+    ``facilities``. Returns None when the solution has no tree.
+    """
+    representative_tree = None
+    if getattr(solution, "all_trees", None):
+        representative_tree = max(solution.all_trees, key=lambda t: t.confidence_score)
+    elif hasattr(solution, "tree"):
+        representative_tree = solution.tree
+
+    if not representative_tree:
+        return None
+
+    # Extract facility information from the solution
+    facility_name = (
+        representative_tree.facility_name
+        if representative_tree.facility_name
+        else "Unknown Facility"
+    )
+
+    # Try to find the facility in the facilities list to get its ID
+    facility_id = None
+    facility_data = None
+    representative_okw_ref = (
+        str(representative_tree.okw_reference)
+        if getattr(representative_tree, "okw_reference", None)
+        else None
+    )
+    for facility in facilities:
+        if (
+            representative_okw_ref
+            and str(getattr(facility, "id", "")) == representative_okw_ref
+        ):
+            facility_id = representative_okw_ref
+            facility_data = (
+                facility.to_dict() if hasattr(facility, "to_dict") else facility
+            )
+            break
+        if hasattr(facility, "name") and facility.name == facility_name:
+            facility_id = str(facility.id)
+            facility_data = facility.to_dict()
+            break
+        elif isinstance(facility, dict) and facility.get("name") == facility_name:
+            facility_id = facility.get("id", "unknown")
+            facility_data = facility
+            break
+
+    # If we couldn't find the facility, try to extract from tree metadata
+    if not facility_id:
+        facility_id = (
+            representative_tree.metadata.get("facility_id")
+            if representative_tree.metadata
+            else None
+        )
+        if not facility_id:
+            # Generate a fallback ID when facility_id is not available
+            # This is a temporary identifier for the response, not a stored facility ID
+            from uuid import uuid4
+
+            facility_id = str(uuid4())[:8]
+
+    # Create solution dict in expected format
+    if not facility_data:
+        facility_data = {
+            "id": facility_id,
+            "name": facility_name,
+        }
+    elif isinstance(facility_data, dict):
+        facility_data.setdefault("id", facility_id)
+        facility_data.setdefault("name", facility_name)
+
+    solution_dict = {
+        "tree": representative_tree.to_dict(),
+        "facility": facility_data,
+        "facility_id": facility_id,
+        "facility_name": facility_name,
+        "match_type": "manufacturing",
+        "confidence": (
+            representative_tree.confidence_score
+            if representative_tree.confidence_score
+            else solution.score
+        ),
+        "score": solution.score,
+        "metrics": solution.metrics,
+    }
+    if len(getattr(solution, "all_trees", [])) > 1:
+        solution_dict["facility_ids"] = [
+            str(tree.okw_reference)
+            for tree in solution.all_trees
+            if getattr(tree, "okw_reference", None)
+        ]
+        solution_dict["facility_names"] = [
+            tree.facility_name for tree in solution.all_trees
+        ]
+        solution_dict["is_composite"] = True
+        solution_dict["solution"] = solution.to_dict()
+        facility_details = []
+        for tree in solution.all_trees:
+            tree_facility_data = None
+            tree_facility_id = str(tree.okw_reference) if tree.okw_reference else None
+            for facility in facilities:
+                if (
+                    tree_facility_id
+                    and str(getattr(facility, "id", "")) == tree_facility_id
+                ):
+                    tree_facility_data = (
+                        facility.to_dict() if hasattr(facility, "to_dict") else facility
+                    )
+                    break
+                if hasattr(facility, "name") and facility.name == tree.facility_name:
+                    tree_facility_data = (
+                        facility.to_dict() if hasattr(facility, "to_dict") else facility
+                    )
+                    if not tree_facility_id:
+                        tree_facility_id = str(getattr(facility, "id", ""))
+                    break
+            if not tree_facility_data:
+                tree_facility_data = {
+                    "id": tree_facility_id,
+                    "name": tree.facility_name,
+                }
+            facility_details.append(
+                {
+                    "facility_id": tree_facility_id,
+                    "facility_name": tree.facility_name,
+                    "facility": tree_facility_data or {},
+                }
+            )
+        solution_dict["facility_details"] = facility_details
+    return solution_dict
+
+
 async def _process_matching_results(
     results: List[dict],
     request: MatchRequest,
@@ -100,18 +100,8 @@ async def search_okw(
 ) -> Any:
     """Search for facilities by criteria. Uses OKWService so only objects under okw/ are considered."""
     try:
-        # Load all OKW facilities from the service (scoped to okw/ prefix via SmartFileDiscovery)
-        facilities = []
-        fetch_page = 1
-        fetch_page_size = 500
-        while True:
-            batch, total = await okw_service.list(
-                page=fetch_page, page_size=fetch_page_size, filter_params=None
-            )
-            facilities.extend(batch)
-            if len(batch) < fetch_page_size or len(facilities) >= total:
-                break
-            fetch_page += 1
+        # Load all OKW facilities from the service's cached catalogue (okw/ only)
+        facilities = [f async for f in okw_service.iter_facilities()]
 
         logger.info(
             f"Loaded {len(facilities)} OKW facilities from service (okw/ only)."
@@ -364,6 +364,7 @@ async def _validate_utility_result(
     - Error summaries
     - Performance metrics
     - LLM usage and costs
+    - Matching cascade layer calls, hit rates and latency histograms
     
     Supports both JSON format (default) and Prometheus format for cloud monitoring.
     
@@ -479,6 +480,8 @@ def _format_prometheus_metrics(tracker, endpoint: Optional[str] = None) -> str:
         lines.append("# TYPE http_requests_failed_total counter")
         lines.append(f'http_requests_failed_total {summary.get("failed_requests", 0)}')
 
+        _add_matching_prometheus_metrics(lines, tracker)
+
         # Endpoint-specific metrics
         if isinstance(all_endpoints, dict):
             for endpoint_key, endpoint_data in all_endpoints.items():
@@ -494,6 +497,44 @@ def _format_prometheus_metrics(tracker, endpoint: Optional[str] = None) -> str:
     return "\n".join(lines) + "\n"
 
 
+def _add_matching_prometheus_metrics(lines: list, tracker) -> None:
+    """Add Prometheus metrics for the matching cascade layers"""
+    layers = tracker.matching_metrics.get_matching_summary()["layers"]
+    if not layers:
+        return
+
+    lines.append(
+        "# HELP matching_layer_calls_total Matching layer evaluations by layer"
+    )
+    lines.append("# TYPE matching_layer_calls_total counter")
+    for layer, stats in layers.items():
+        lines.append(f'matching_layer_calls_total{{layer="{layer}"}} {stats["calls"]}')
+
+    lines.append(
+        "# HELP matching_layer_hits_total Matching layer evaluations that matched "
+        "(vetoes for the veto layer)"
+    )
+    lines.append("# TYPE matching_layer_hits_total counter")
+    for layer, stats in layers.items():
+        lines.append(f'matching_layer_hits_total{{layer="{layer}"}} {stats["hits"]}')
+
+    lines.append(
+        "# HELP matching_layer_duration_seconds Matching layer evaluation latency"
+    )
+    lines.append("# TYPE matching_layer_duration_seconds histogram")
+    for layer, stats in layers.items():
+        for le, count in stats["latency_buckets"].items():
+            lines.append(
+                f'matching_layer_duration_seconds_bucket{{layer="{layer}",le="{le}"}} {count}'
+            )
+        lines.append(
+            f'matching_layer_duration_seconds_sum{{layer="{layer}"}} {stats["seconds"]}'
+        )
+        lines.append(
+            f'matching_layer_duration_seconds_count{{layer="{layer}"}} {stats["calls"]}'
+        )
+
+
 def _add_endpoint_prometheus_metrics(
     lines: list, endpoint_data: dict, method: str, path: str
 ):
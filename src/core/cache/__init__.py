@@ -3,5 +3,6 @@
 from .backends.base import CacheBackend, CacheStats
 from .helper import cached
 from .keys import namespaced_key
+from .memo import LRUMemo
 
-__all__ = ["CacheBackend", "CacheStats", "cached", "namespaced_key"]
+__all__ = ["CacheBackend", "CacheStats", "LRUMemo", "cached", "namespaced_key"]
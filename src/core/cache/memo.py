@@ -0,0 +1,110 @@
+"""In-process LRU memo for hot-path lookups that must not leave the process.
+
+The shared :class:`~src.core.services.cache_service.CacheService` may be backed
+by Redis, which costs a network round trip and a serialization per lookup —
+fine for a catalogue, ruinous for something consulted per (requirement,
+capability) pair. ``LRUMemo`` keeps such values in process, bounded by entry
+count, and registers itself so ``CacheService.get_stats()`` can report its
+hit/miss counters alongside the shared backend's.
+"""
+
+from __future__ import annotations
+
+import weakref
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Generic, Hashable, List, Optional, TypeVar
+
+V = TypeVar("V")
+
+_registry: "weakref.WeakSet[LRUMemo]" = weakref.WeakSet()
+
+
+class LRUMemo(Generic[V]):
+    """Thread-safe, size-bounded LRU map with hit/miss counters.
+
+    ``max_size <= 0`` disables the memo: every ``get`` misses and ``set`` is a
+    no-op, so callers need no separate code path when it is switched off.
+    """
+
+    def __init__(self, name: str, max_size: int) -> None:
+        self.name = name
+        self.max_size = max_size
+        self._data: OrderedDict[Hashable, V] = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        _registry.add(self)
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    def get(self, key: Hashable) -> Optional[V]:
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self._misses += 1
+                return None
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: Hashable, value: V) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+            elif len(self._data) >= self.max_size:
+                self._data.popitem(last=False)
+                self._evictions += 1
+            self._data[key] = value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._data),
+                "max_size": self.max_size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else None,
+            }
+
+
+def registered_memos(name: Optional[str] = None) -> List[LRUMemo]:
+    """Live memos, optionally only those registered under ``name``."""
+    return [m for m in list(_registry) if name is None or m.name == name]
+
+
+def clear_memos(name: str) -> None:
+    """Empty every live memo registered under ``name``."""
+    for memo in registered_memos(name):
+        memo.clear()
+
+
+def memo_stats() -> Dict[str, Dict[str, Any]]:
+    """Stats per memo name, summed across instances sharing that name."""
+    totals: Dict[str, Dict[str, Any]] = {}
+    for memo in registered_memos():
+        s = memo.stats()
+        agg = totals.setdefault(
+            memo.name,
+            {"size": 0, "max_size": 0, "hits": 0, "misses": 0, "evictions": 0},
+        )
+        for field in ("size", "max_size", "hits", "misses", "evictions"):
+            agg[field] += s[field]
+    for agg in totals.values():
+        lookups = agg["hits"] + agg["misses"]
+        agg["hit_rate"] = round(agg["hits"] / lookups, 4) if lookups else None
+    return totals
@@ -51,9 +51,11 @@ from .logging import (
 from .metrics import (
     ErrorMetrics,
     LLMMetrics,
+    MatchingLayerMetrics,
     PerformanceMetrics,
     get_error_metrics,
     get_llm_metrics,
+    get_matching_layer_metrics,
     get_performance_metrics,
 )
 
@@ -101,7 +103,9 @@ __all__ = [
     "ErrorMetrics",
     "PerformanceMetrics",
     "LLMMetrics",
+    "MatchingLayerMetrics",
     "get_error_metrics",
     "get_performance_metrics",
     "get_llm_metrics",
+    "get_matching_layer_metrics",
 ]
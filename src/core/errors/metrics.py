@@ -516,6 +516,115 @@ class LLMMetrics:
             }
 
 
+# Upper bounds (seconds) of the matching-layer latency histogram buckets; a
+# final overflow bucket catches everything slower.
+MATCHING_LAYER_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+
+
+@dataclass
+class LayerLatency:
+    """Call count, hit count and latency histogram of one matching layer.
+
+    ``hits`` and ``decided`` only count calls with a boolean outcome
+    (``observe(..., hit=None)`` times a call without one), so the hit rate of
+    timing-only layers is ``None``.
+    """
+
+    calls: int = 0
+    decided: int = 0
+    hits: int = 0
+    seconds: float = 0.0
+    buckets: List[int] = field(
+        default_factory=lambda: [0] * (len(MATCHING_LAYER_BUCKETS) + 1)
+    )
+
+    def observe(self, seconds: float, hit: Optional[bool] = None) -> None:
+        self.calls += 1
+        self.seconds += seconds
+        if hit is not None:
+            self.decided += 1
+            self.hits += bool(hit)
+        for i, bound in enumerate(MATCHING_LAYER_BUCKETS):
+            if seconds <= bound:
+                self.buckets[i] += 1
+                return
+        self.buckets[-1] += 1
+
+    def merge(self, other: "LayerLatency") -> None:
+        self.calls += other.calls
+        self.decided += other.decided
+        self.hits += other.hits
+        self.seconds += other.seconds
+        self.buckets = [a + b for a, b in zip(self.buckets, other.buckets)]
+
+    @property
+    def hit_rate(self) -> Optional[float]:
+        return self.hits / self.decided if self.decided else None
+
+    def cumulative_buckets(self) -> List[tuple]:
+        """Prometheus-style ``(le, count)`` pairs, ending with ``+Inf``."""
+        total = 0
+        pairs = []
+        for bound, count in zip(
+            (*(str(b) for b in MATCHING_LAYER_BUCKETS), "+Inf"), self.buckets
+        ):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+    def to_dict(self, histogram: bool = True) -> Dict[str, Any]:
+        data: Dict[str, Any] = {
+            "calls": self.calls,
+            "hits": self.hits,
+            "hit_rate": (
+                round(self.hit_rate, 4) if self.hit_rate is not None else None
+            ),
+            "seconds": round(self.seconds, 6),
+            "avg_ms": round(self.seconds * 1000 / self.calls, 3) if self.calls else 0.0,
+        }
+        if histogram:
+            data["latency_buckets"] = dict(self.cumulative_buckets())
+        return data
+
+
+class MatchingLayerMetrics:
+    """
+    Metrics collector for the matching cascade.
+
+    Aggregates per-layer calls, hit rates and latency histograms (direct,
+    heuristic, NLP match, NLP similarity, veto, supply-tree generation) and
+    the matching counters of every finished match request.
+    """
+
+    def __init__(self):
+        self.layers: Dict[str, LayerLatency] = {}
+        self.counters: Dict[str, int] = defaultdict(int)
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def record_request(
+        self, layers: Dict[str, LayerLatency], counters: Dict[str, int]
+    ) -> None:
+        """Fold one request's layer statistics and counters into the totals"""
+        with self._lock:
+            self.requests += 1
+            for name, stats in layers.items():
+                self.layers.setdefault(name, LayerLatency()).merge(stats)
+            for name, value in counters.items():
+                self.counters[name] += value
+
+    def get_matching_summary(self) -> Dict[str, Any]:
+        """Get matching layer metrics summary"""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "counters": dict(self.counters),
+                "layers": {
+                    name: stats.to_dict() for name, stats in sorted(self.layers.items())
+                },
+            }
+
+
 # Global metrics instances
 # Data models for MetricsTracker
 @dataclass
@@ -621,6 +730,7 @@ class MetricsTracker:
         self.error_metrics = get_error_metrics()
         self.performance_metrics = get_performance_metrics()
         self.llm_metrics = get_llm_metrics()
+        self.matching_metrics = get_matching_layer_metrics()
 
         # Request tracking
         self._active_requests: Dict[str, RequestMetrics] = {}
@@ -861,6 +971,21 @@ class MetricsTracker:
         except Exception as e:
             logger.warning(f"Failed to track LLM request end: {e}", exc_info=True)
 
+    def record_matching(
+        self, layers: Dict[str, LayerLatency], counters: Dict[str, int]
+    ) -> None:
+        """
+        Track one match request's cascade layer statistics.
+
+        Args:
+            layers: Per-layer calls, hits and latency histogram
+            counters: Matching counters (pairs evaluated, cache hits, ...)
+        """
+        try:
+            self.matching_metrics.record_request(layers, counters)
+        except Exception as e:
+            logger.warning(f"Failed to track matching layers: {e}", exc_info=True)
+
     def get_summary(self) -> Dict[str, Any]:
         """
         Get overall metrics summary.
@@ -884,6 +1009,7 @@ class MetricsTracker:
                 "error_summary": self.error_metrics.get_error_summary(),
                 "performance_summary": self.performance_metrics.get_performance_summary(),
                 "llm_summary": self.llm_metrics.get_llm_summary(),
+                "matching_summary": self.matching_metrics.get_matching_summary(),
             }
 
     def get_endpoint_metrics(
@@ -963,6 +1089,7 @@ class MetricsTracker:
 _error_metrics: Optional[ErrorMetrics] = None
 _performance_metrics: Optional[PerformanceMetrics] = None
 _llm_metrics: Optional[LLMMetrics] = None
+_matching_layer_metrics: Optional[MatchingLayerMetrics] = None
 
 
 def get_error_metrics() -> ErrorMetrics:
@@ -989,6 +1116,14 @@ def get_llm_metrics() -> LLMMetrics:
     return _llm_metrics
 
 
+def get_matching_layer_metrics() -> MatchingLayerMetrics:
+    """Get global matching layer metrics instance"""
+    global _matching_layer_metrics
+    if _matching_layer_metrics is None:
+        _matching_layer_metrics = MatchingLayerMetrics()
+    return _matching_layer_metrics
+
+
 # Global MetricsTracker instance
 _metrics_tracker: Optional[MetricsTracker] = None
 
@@ -33,7 +33,9 @@ from .capability_rules import (
     get_capability_matcher,
     get_rule_manager,
 )
+from .design_index import DesignProcessIndex, get_design_index
 from .direct_matcher import DirectMatcher
+from .facility_index import FacilityProcessIndex, get_facility_index
 from .heuristic_matcher import HeuristicMatcher
 from .layers.base import (
     MatchingLayer,
@@ -76,7 +78,12 @@ __all__ = [
     "CapabilityMatchResult",
     "RuleType",
     "RuleDirection",
+    # Facility and design candidate selection
+    "FacilityProcessIndex",
+    "DesignProcessIndex",
     # Factory functions
+    "get_facility_index",
+    "get_design_index",
     "get_rule_manager",
     "get_capability_matcher",
     "create_rule_manager",
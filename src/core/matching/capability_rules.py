@@ -23,7 +23,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import yaml
 
@@ -31,6 +31,21 @@ from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Bumped on every rule mutation (add/remove/replace, file load, reload) in any
+# rule set. Memoized match verdicts key on it, so a verdict computed under an
+# older rule state can never be served after the rules change.
+_rules_version = 0
+
+
+def rules_version() -> int:
+    """Current process-wide capability-rules version."""
+    return _rules_version
+
+
+def _bump_rules_version() -> None:
+    global _rules_version
+    _rules_version += 1
+
 
 class RuleType(Enum):
     """Types of capability rules"""
@@ -158,6 +173,14 @@ class CapabilityRule:
         # Check if the requirement is in the satisfies_requirements list
         return self.can_satisfy_requirement(requirement)
 
+    def index_keys(self) -> Set[Tuple[str, str]]:
+        """``(requirement, capability)`` keys this rule satisfies, normalized
+        the same way as :meth:`requirement_can_be_satisfied_by`."""
+        capability = self.capability.lower().strip()
+        return {
+            (req.lower().strip(), capability) for req in self.satisfies_requirements
+        }
+
     def to_dict(self, include_metadata: bool = False) -> Dict[str, Any]:
         """Convert rule to dictionary for serialization"""
         result = {
@@ -220,6 +243,12 @@ class CapabilityRuleSet:
     metadata: Dict[str, Any] = field(default_factory=dict)
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
+    # (requirement, capability) -> ids of rules satisfying it, in the order
+    # ``rules`` holds them. Maintained by add_rule/remove_rule; mutate
+    # ``rules`` only through those.
+    _rule_index: Dict[Tuple[str, str], List[str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         """Validate rule set data after initialization"""
@@ -245,6 +274,23 @@ class CapabilityRuleSet:
                 f"Rule set version '{self.version}' does not follow semantic versioning (X.Y.Z)"
             )
 
+        self._rebuild_index()
+
+    def _rebuild_index(self) -> None:
+        """Index every rule under the (requirement, capability) keys it satisfies."""
+        self._rule_index = {}
+        for rule_id, rule in self.rules.items():
+            for key in rule.index_keys():
+                self._rule_index.setdefault(key, []).append(rule_id)
+
+    def _unindex_rule(self, rule: CapabilityRule) -> None:
+        for key in rule.index_keys():
+            rule_ids = self._rule_index.get(key)
+            if rule_ids and rule.id in rule_ids:
+                rule_ids.remove(rule.id)
+                if not rule_ids:
+                    del self._rule_index[key]
+
     def add_rule(self, rule: CapabilityRule) -> None:
         """Add a rule to this rule set"""
         if rule.domain != self.domain and rule.domain != "general":
@@ -252,15 +298,25 @@ class CapabilityRuleSet:
                 f"Adding rule {rule.id} with domain {rule.domain} to rule set for domain {self.domain}"
             )
 
+        replaced = self.rules.get(rule.id)
         self.rules[rule.id] = rule
+        if replaced is None:
+            for key in rule.index_keys():
+                self._rule_index.setdefault(key, []).append(rule.id)
+        else:
+            # A replacement keeps its position in ``rules``; reindex so
+            # postings keep that order too.
+            self._rebuild_index()
         self.updated_at = datetime.now()
+        _bump_rules_version()
         logger.debug(f"Added rule {rule.id} to domain {self.domain}")
 
     def remove_rule(self, rule_id: str) -> bool:
         """Remove a rule from this rule set"""
         if rule_id in self.rules:
-            del self.rules[rule_id]
+            self._unindex_rule(self.rules.pop(rule_id))
             self.updated_at = datetime.now()
+            _bump_rules_version()
             logger.debug(f"Removed rule {rule_id} from domain {self.domain}")
             return True
         return False
@@ -294,11 +350,12 @@ class CapabilityRuleSet:
         Returns:
             List of rules where the capability can satisfy the requirement
         """
-        matching_rules = []
-        for rule in self.rules.values():
-            if rule.requirement_can_be_satisfied_by(requirement, capability):
-                matching_rules.append(rule)
-        return matching_rules
+        if not requirement or not capability:
+            return []
+        rule_ids = self._rule_index.get(
+            (requirement.lower().strip(), capability.lower().strip()), ()
+        )
+        return [self.rules[rule_id] for rule_id in rule_ids]
 
     def to_dict(self, include_metadata: bool = False) -> Dict[str, Any]:
         """Convert rule set to dictionary for serialization"""
@@ -450,6 +507,7 @@ class CapabilityRuleManager:
 
         rule_set = CapabilityRuleSet.from_dict(data)
         self.rule_sets[rule_set.domain] = rule_set
+        _bump_rules_version()
         logger.info(
             f"Loaded rule set for domain '{rule_set.domain}' with {len(rule_set.rules)} rules"
         )
@@ -466,6 +524,7 @@ class CapabilityRuleManager:
     def add_rule_set(self, rule_set: CapabilityRuleSet) -> None:
         """Add a new rule set"""
         self.rule_sets[rule_set.domain] = rule_set
+        _bump_rules_version()
         logger.info(
             f"Added rule set for domain '{rule_set.domain}' with {len(rule_set.rules)} rules"
         )
@@ -474,6 +533,7 @@ class CapabilityRuleManager:
         """Remove a rule set for a domain"""
         if domain in self.rule_sets:
             del self.rule_sets[domain]
+            _bump_rules_version()
             logger.info(f"Removed rule set for domain '{domain}'")
             return True
         return False
@@ -541,6 +601,7 @@ class CapabilityRuleManager:
         """Reload all rules from files"""
         logger.info("Reloading all capability rules")
         self.rule_sets.clear()
+        _bump_rules_version()
         self._initialized = False
         await self.initialize()
 
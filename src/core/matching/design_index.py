@@ -0,0 +1,261 @@
+"""
+Inverted index from canonical process ID to the designs that require it.
+
+Reverse matching ("which designs can this facility make?") used to run the
+full matcher against every manifest in the catalogue, so its cost grew with the
+catalogue even when the facility shared no process with most designs. The index
+is the mirror of :mod:`.facility_index`: each design's process requirements are
+resolved to ``ProcessTaxonomy`` canonical IDs once, when the design is written
+or the catalogue is assembled, and kept both as posting lists
+``canonical_id -> {okh_id}`` and as a per-design requirement vector (canonical
+ID -> occurrences, plus the count the taxonomy could not resolve).
+
+A query takes one facility, expands its processes to every related canonical
+ID, and walks only those posting lists. Each design reached gets an optimistic
+coverage bound from its cached vector; designs that could not reach the
+partial-match threshold are never parsed or matched. The bound is the same one
+:class:`.facility_index.ProcessQuery` applies in the forward direction:
+unresolvable requirements count as satisfiable. A facility advertising
+processes the taxonomy cannot resolve keeps every design with requirements (the
+NLP layer may still match free text).
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from ..taxonomy import taxonomy as _default_taxonomy
+from ..taxonomy.process_taxonomy import ProcessTaxonomy
+from .facility_index import MIN_COVERAGE, facility_process_names
+
+
+def _get(obj: Any, name: str) -> Any:
+    return obj.get(name) if isinstance(obj, dict) else getattr(obj, name, None)
+
+
+def design_process_names(manifest: Any) -> List[str]:
+    """Raw process requirements a design declares, one entry per occurrence.
+
+    Same sources, in the same order, as the manufacturing extractor's
+    requirement extraction: ``manufacturing_specs.process_requirements``,
+    top-level ``manufacturing_processes``, then each part's TSDC codes.
+    Occurrences are kept because the matcher counts them. Accepts model
+    objects or plain dicts.
+    """
+    names: List[str] = []
+
+    def _add(value: Any) -> None:
+        if isinstance(value, str) and value.strip():
+            names.append(value.strip())
+
+    specs = _get(manifest, "manufacturing_specs")
+    for requirement in (_get(specs, "process_requirements") if specs else None) or []:
+        _add(_get(requirement, "process_name"))
+    for process in _get(manifest, "manufacturing_processes") or []:
+        _add(process)
+    for part in _get(manifest, "parts") or []:
+        for tsdc in _get(part, "tsdc") or []:
+            _add(tsdc)
+    return names
+
+
+@dataclass(frozen=True)
+class DesignRequirementProfile:
+    """A design's requirement vector resolved against the taxonomy."""
+
+    # (canonical_id, occurrences), sorted by canonical ID.
+    groups: Tuple[Tuple[str, int], ...]
+    unresolved: int
+
+    @property
+    def total(self) -> int:
+        return self.unresolved + sum(count for _, count in self.groups)
+
+    @property
+    def canonical_ids(self) -> FrozenSet[str]:
+        return frozenset(cid for cid, _ in self.groups)
+
+    def hits(self, related: FrozenSet[str]) -> int:
+        """Requirement occurrences whose canonical ID is in ``related``."""
+        return sum(count for cid, count in self.groups if cid in related)
+
+    def bound(self, hits: int) -> float:
+        """Best coverage the matcher could report given ``hits`` definite hits."""
+        return (hits + self.unresolved) / self.total if self.total else 0.0
+
+
+class DesignProcessIndex:
+    """Canonical process ID -> OKH design IDs, maintained incrementally.
+
+    Design IDs are stored as strings. ``upsert`` replaces a design's previous
+    postings, so callers can feed every write and every fresh catalogue load
+    through it without tracking what changed. ``source`` is the token of the
+    catalogue assembly the index was last rebuilt from, so a reader can tell
+    whether it reflects the catalogue in hand.
+    """
+
+    def __init__(self, process_taxonomy: Optional[ProcessTaxonomy] = None) -> None:
+        self._taxonomy = process_taxonomy or _default_taxonomy
+        self._postings: Dict[str, Set[str]] = {}
+        self._profiles: Dict[str, DesignRequirementProfile] = {}
+        # Designs with at least one requirement the taxonomy cannot resolve.
+        self._open: Set[str] = set()
+        self.source: Optional[str] = None
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+    def __contains__(self, okh_id: Any) -> bool:
+        return str(okh_id) in self._profiles
+
+    def ids(self) -> Set[str]:
+        """IDs of every indexed design."""
+        return set(self._profiles)
+
+    def profile(self, manifest: Any) -> DesignRequirementProfile:
+        """Resolve a design's requirements without touching the index."""
+        groups: Counter = Counter()
+        unresolved = 0
+        for name in design_process_names(manifest):
+            cid = self._taxonomy.normalize(name)
+            if cid:
+                groups[cid] += 1
+            else:
+                unresolved += 1
+        return DesignRequirementProfile(tuple(sorted(groups.items())), unresolved)
+
+    def upsert(self, manifest: Any) -> None:
+        """Index (or re-index) one design."""
+        okh_id = _get(manifest, "id")
+        if okh_id is None:
+            return
+        key = str(okh_id)
+        self._drop(key)
+        profile = self.profile(manifest)
+        self._profiles[key] = profile
+        for cid in profile.canonical_ids:
+            self._postings.setdefault(cid, set()).add(key)
+        if profile.unresolved:
+            self._open.add(key)
+
+    def remove(self, okh_id: Any) -> bool:
+        """Drop a design from the index; True if it was indexed."""
+        return self._drop(str(okh_id))
+
+    def rebuild(self, manifests: Iterable[Any], source: Optional[str] = None) -> None:
+        """Replace the whole index with ``manifests`` from catalogue ``source``."""
+        self.clear()
+        for manifest in manifests:
+            self.upsert(manifest)
+        self.source = source
+
+    def clear(self) -> None:
+        self._postings = {}
+        self._profiles = {}
+        self._open = set()
+        self.source = None
+
+    def query(self, facility: Any, min_coverage: float = MIN_COVERAGE) -> "DesignQuery":
+        """Prepare the candidate query for one facility."""
+        return DesignQuery(self, facility, min_coverage)
+
+    def _drop(self, key: str) -> bool:
+        profile = self._profiles.pop(key, None)
+        if profile is None:
+            return False
+        for cid in profile.canonical_ids:
+            postings = self._postings.get(cid)
+            if postings is not None:
+                postings.discard(key)
+                if not postings:
+                    del self._postings[cid]
+        self._open.discard(key)
+        return True
+
+
+class DesignQuery:
+    """Coverage bound for one facility against indexed and ad-hoc designs."""
+
+    def __init__(
+        self, index: DesignProcessIndex, facility: Any, min_coverage: float
+    ) -> None:
+        self._index = index
+        self.min_coverage = min_coverage
+        canonical: Set[str] = set()
+        self.has_unresolved = False
+        for name in facility_process_names(facility):
+            cid = index._taxonomy.normalize(name)
+            if cid:
+                canonical.add(cid)
+            else:
+                self.has_unresolved = True
+        # ``are_related`` is symmetric, so a requirement can only be met by this
+        # facility when its canonical ID is related to one the facility has.
+        related: Set[str] = set()
+        for cid in canonical:
+            related |= index._taxonomy.get_related(cid) | {cid}
+        self.related: FrozenSet[str] = frozenset(related)
+        self._indexed: Optional[Dict[str, float]] = None
+
+    @property
+    def is_empty(self) -> bool:
+        """True when the facility advertises no processes at all."""
+        return not self.related and not self.has_unresolved
+
+    def _keeps(self, profile: DesignRequirementProfile, hits: int) -> bool:
+        if not profile.total or self.is_empty:
+            return False
+        return self.has_unresolved or profile.bound(hits) >= self.min_coverage
+
+    def indexed_candidates(self) -> Dict[str, float]:
+        """Indexed design ID -> coverage bound, for those that can reach coverage."""
+        if self._indexed is None:
+            index = self._index
+            reached: Set[str] = set()
+            for cid in self.related:
+                reached |= index._postings.get(cid, set())
+            if self.has_unresolved:
+                reached = set(index._profiles)
+            else:
+                # Unresolvable requirements alone may reach the threshold.
+                reached |= index._open
+            result: Dict[str, float] = {}
+            for key in reached:
+                profile = index._profiles[key]
+                hits = profile.hits(self.related)
+                if self._keeps(profile, hits):
+                    result[key] = profile.bound(hits)
+            self._indexed = result
+        return self._indexed
+
+    def ranked_ids(self) -> List[str]:
+        """Indexed candidates, highest coverage bound first (ties by ID)."""
+        candidates = self.indexed_candidates()
+        return sorted(candidates, key=lambda key: (-candidates[key], key))
+
+    def bound_for(self, manifest: Any) -> Optional[float]:
+        """Coverage bound for ``manifest``, or None when it cannot reach coverage.
+
+        Indexed designs are answered from the cached vectors; anything else
+        (inline manifests, objects without an ``id``) is resolved on the fly.
+        """
+        okh_id = _get(manifest, "id")
+        if okh_id is not None and okh_id in self._index:
+            return self.indexed_candidates().get(str(okh_id))
+
+        profile = self._index.profile(manifest)
+        hits = profile.hits(self.related)
+        return profile.bound(hits) if self._keeps(profile, hits) else None
+
+
+_design_index: Optional[DesignProcessIndex] = None
+
+
+def get_design_index() -> DesignProcessIndex:
+    """Get the global design process index (maintained by ``OKHService``)."""
+    global _design_index
+    if _design_index is None:
+        _design_index = DesignProcessIndex()
+    return _design_index
@@ -0,0 +1,183 @@
+"""
+Set-cover solvers for facility-combination (composite) matching.
+
+Requirement coverage is held as integer bitmasks: bit ``i`` of a facility's
+mask is set when it covers requirement ``i``. Unions, gains and "is anything
+left" checks are then single integer operations instead of Python set work.
+
+Two strategies pick which facilities to combine:
+
+- ``greedy`` — repeatedly take the facility covering the most still-uncovered
+  requirements (ties: larger total coverage, then input order).
+- ``exact`` — branch-and-bound search for the cover with the most requirements
+  covered and, among those, the fewest facilities, within the facility limit.
+
+Both optionally start from a seed facility, which is how composite matching
+produces alternative solutions.
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+COMBINATION_STRATEGY_GREEDY = "greedy"
+COMBINATION_STRATEGY_EXACT = "exact"
+COMBINATION_STRATEGIES = (COMBINATION_STRATEGY_GREEDY, COMBINATION_STRATEGY_EXACT)
+
+# Search nodes the exact solver may expand before settling for the best cover
+# found so far (never worse than greedy). Realistic pools, after identical and
+# dominated masks are dropped, finish far below this.
+EXACT_COVER_NODE_LIMIT = 200_000
+
+
+def mask_of(indices) -> int:
+    """Bitmask with the given bit positions set."""
+    mask = 0
+    for i in indices:
+        mask |= 1 << i
+    return mask
+
+
+def indices_of(mask: int) -> List[int]:
+    """Sorted bit positions set in ``mask``."""
+    out = []
+    while mask:
+        low = mask & -mask
+        out.append(low.bit_length() - 1)
+        mask ^= low
+    return out
+
+
+def distinct_masks(masks: Sequence[int]) -> Tuple[List[int], List[List[int]]]:
+    """Collapse identical masks, keeping first-seen order.
+
+    Returns the distinct masks and, for each, the input positions sharing it.
+    """
+    groups: Dict[int, List[int]] = {}
+    for position, mask in enumerate(masks):
+        groups.setdefault(mask, []).append(position)
+    return list(groups), list(groups.values())
+
+
+def greedy_cover(
+    masks: Sequence[int], limit: int, seed: Optional[int] = None
+) -> List[int]:
+    """Greedy max-gain cover; returns selected positions in selection order."""
+    uncovered = 0
+    for mask in masks:
+        uncovered |= mask
+    selected: List[int] = []
+
+    if seed is not None and 0 <= seed < len(masks) and masks[seed] & uncovered:
+        selected.append(seed)
+        uncovered &= ~masks[seed]
+
+    while uncovered and len(selected) < limit:
+        best, best_gain, best_total = None, 0, 0
+        for position, mask in enumerate(masks):
+            gain = (mask & uncovered).bit_count()
+            # Selected masks have no gain left, so they are never re-picked.
+            if gain > best_gain or (
+                gain == best_gain and gain and mask.bit_count() > best_total
+            ):
+                best, best_gain, best_total = position, gain, mask.bit_count()
+        if best is None:
+            break
+        selected.append(best)
+        uncovered &= ~masks[best]
+    return selected
+
+
+def exact_cover(
+    masks: Sequence[int],
+    limit: int,
+    seed: Optional[int] = None,
+    node_limit: int = EXACT_COVER_NODE_LIMIT,
+) -> List[int]:
+    """Best cover within ``limit`` facilities, found by branch and bound.
+
+    "Best" means the most requirements covered, then the fewest facilities.
+    Identical masks and masks contained in another mask are never needed for
+    an optimum and are dropped before searching. The search branches on the
+    lowest requirement not yet settled: cover it with one of the facilities
+    covering it, or give it up. Past ``node_limit`` expansions the best cover
+    found so far is returned; it is never worse than :func:`greedy_cover`.
+    """
+    if limit < 1 or not masks:
+        return []
+
+    forced: List[int] = []
+    covered = 0
+    if seed is not None and 0 <= seed < len(masks) and masks[seed]:
+        forced.append(seed)
+        covered = masks[seed]
+
+    reachable = 0
+    for mask in masks:
+        reachable |= mask
+
+    # Keep one position per mask that is not strictly contained in another;
+    # among equals the first in input order wins.
+    distinct, members = distinct_masks(masks)
+    keep: List[Tuple[int, int]] = []
+    for i, mask in enumerate(distinct):
+        if any(
+            j != i and (mask & other) == mask and other != mask
+            for j, other in enumerate(distinct)
+        ):
+            continue
+        keep.append((members[i][0], mask))
+    keep.sort(key=lambda item: (-item[1].bit_count(), item[0]))
+
+    # The greedy cover is a feasible incumbent, so the bound prunes from the start.
+    best_selection = greedy_cover(masks, limit, seed=forced[0] if forced else None)
+    best_covered = 0
+    for position in best_selection:
+        best_covered |= masks[position]
+
+    seen: Set[Tuple[int, int, int]] = set()
+    budget = [node_limit]
+
+    def search(covered: int, open_bits: int, chosen: List[int]) -> None:
+        nonlocal best_covered, best_selection
+        count = covered.bit_count()
+        best_count = best_covered.bit_count()
+        if count > best_count or (
+            count == best_count and len(chosen) < len(best_selection)
+        ):
+            best_covered, best_selection = covered, list(chosen)
+            best_count = count
+        if not open_bits or len(chosen) >= limit or budget[0] <= 0:
+            return
+        # Giving up different requirements in a different order reaches the
+        # same state; explore each once.
+        state = (covered, open_bits, len(chosen))
+        if state in seen:
+            return
+        seen.add(state)
+        budget[0] -= 1
+
+        # A better cover either covers more within ``limit`` facilities or
+        # covers as much with fewer than the incumbent. Bound both by the
+        # largest gains still available, capped by what is still open.
+        gains = heapq.nlargest(
+            limit - len(chosen), ((mask & open_bits).bit_count() for _, mask in keep)
+        )
+        open_count = open_bits.bit_count()
+        more = count + min(open_count, sum(gains))
+        fewer = max(0, len(best_selection) - 1 - len(chosen))
+        as_much = count + min(open_count, sum(gains[:fewer]))
+        if more <= best_count and as_much < best_count:
+            return
+
+        low = open_bits & -open_bits
+        for position, mask in keep:
+            if mask & low:
+                chosen.append(position)
+                search(covered | mask, open_bits & ~mask, chosen)
+                chosen.pop()
+        search(covered, open_bits & ~low, chosen)
+
+    search(covered, reachable & ~covered, forced)
+    return best_selection
@@ -0,0 +1,284 @@
+"""
+Inverted index from canonical process ID to the facilities that advertise it.
+
+Candidate selection used to re-extract every facility's processes on every
+match request and compare them pairwise against the requirements. The index
+resolves each facility's processes to ``ProcessTaxonomy`` canonical IDs once,
+when the facility is written or loaded, and keeps posting lists
+``canonical_id -> {facility_id}``. A query walks only the posting lists of the
+IDs related to each requirement (itself, ancestors, descendants and siblings —
+the same relation as :meth:`ProcessTaxonomy.are_related`), so its cost follows
+the number of facilities that actually share a process, not the pool size.
+
+Selection is an optimistic bound on ``MatchingService._can_satisfy_requirements``
+coverage: a facility is kept when it *could* reach the partial-match threshold.
+Requirements the taxonomy cannot resolve count as satisfiable. They are also
+compared, case-insensitively, with the raw names of the processes a facility
+advertises that the taxonomy cannot resolve either: a facility sharing such a
+name is kept whatever its bound, and each shared occurrence counts as a hit.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence, Set
+
+from ..taxonomy import taxonomy as _default_taxonomy
+from ..taxonomy.process_taxonomy import ProcessTaxonomy
+
+# Mirrors PARTIAL_MATCH_THRESHOLD in MatchingService._can_satisfy_requirements.
+MIN_COVERAGE = 0.6
+
+
+def facility_process_names(facility: Any) -> List[str]:
+    """Raw process identifiers a facility advertises.
+
+    Same sources as the manufacturing extractor's capability extraction:
+    top-level ``manufacturing_processes`` plus each equipment item's
+    ``manufacturing_process(es)``. Accepts model objects or plain dicts.
+    """
+
+    def _get(obj: Any, name: str) -> Any:
+        return obj.get(name) if isinstance(obj, dict) else getattr(obj, name, None)
+
+    names: List[str] = []
+
+    def _add(value: Any) -> None:
+        values = value if isinstance(value, (list, tuple)) else [value]
+        for v in values:
+            if isinstance(v, str) and v.strip():
+                names.append(v.strip())
+
+    _add(_get(facility, "manufacturing_processes") or [])
+    for equipment in _get(facility, "equipment") or []:
+        _add(_get(equipment, "manufacturing_process") or [])
+        _add(_get(equipment, "manufacturing_processes") or [])
+    return list(dict.fromkeys(names))
+
+
+@dataclass(frozen=True)
+class FacilityProcessProfile:
+    """A facility's processes resolved against the taxonomy."""
+
+    canonical_ids: FrozenSet[str]
+    # Lower-cased raw names the taxonomy could not resolve.
+    unresolved_names: FrozenSet[str]
+
+    @property
+    def has_unresolved(self) -> bool:
+        return bool(self.unresolved_names)
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.canonical_ids and not self.unresolved_names
+
+
+class FacilityProcessIndex:
+    """Canonical process ID -> facility IDs, maintained incrementally.
+
+    Facility IDs are stored as strings. ``upsert`` replaces a facility's
+    previous postings, so callers can feed every write and every fresh load
+    through it without tracking what changed.
+    """
+
+    def __init__(self, process_taxonomy: Optional[ProcessTaxonomy] = None) -> None:
+        self._taxonomy = process_taxonomy or _default_taxonomy
+        self._postings: Dict[str, Set[str]] = {}
+        self._profiles: Dict[str, FacilityProcessProfile] = {}
+        # Unresolvable raw process name (lower-cased) -> facility IDs.
+        self._open: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+    def __contains__(self, facility_id: Any) -> bool:
+        return str(facility_id) in self._profiles
+
+    def profile(self, facility: Any) -> FacilityProcessProfile:
+        """Resolve a facility's processes without touching the index."""
+        canonical: Set[str] = set()
+        unresolved: Set[str] = set()
+        for name in facility_process_names(facility):
+            cid = self._taxonomy.normalize(name)
+            if cid:
+                canonical.add(cid)
+            else:
+                unresolved.add(name.lower())
+        return FacilityProcessProfile(frozenset(canonical), frozenset(unresolved))
+
+    def upsert(self, facility: Any) -> None:
+        """Index (or re-index) one facility."""
+        facility_id = getattr(facility, "id", None)
+        if facility_id is None:
+            return
+        key = str(facility_id)
+        self._drop(key)
+        profile = self.profile(facility)
+        self._profiles[key] = profile
+        for cid in profile.canonical_ids:
+            self._postings.setdefault(cid, set()).add(key)
+        for name in profile.unresolved_names:
+            self._open.setdefault(name, set()).add(key)
+
+    def remove(self, facility_id: Any) -> bool:
+        """Drop a facility from the index; True if it was indexed."""
+        return self._drop(str(facility_id))
+
+    def rebuild(self, facilities: Iterable[Any]) -> None:
+        """Replace the whole index with ``facilities``."""
+        self.clear()
+        for facility in facilities:
+            self.upsert(facility)
+
+    def clear(self) -> None:
+        self._postings = {}
+        self._profiles = {}
+        self._open = {}
+
+    def related_ids(self, canonical_id: str) -> Set[str]:
+        """IDs ``are_related`` to ``canonical_id``: itself, ancestors, descendants, siblings."""
+        return self._taxonomy.get_related(canonical_id) | {canonical_id}
+
+    def query(
+        self, required_processes: Sequence[str], min_coverage: float = MIN_COVERAGE
+    ) -> Optional["ProcessQuery"]:
+        """Prepare a candidate query, or None when there is nothing to select on."""
+        required = [str(p).strip() for p in required_processes or [] if p]
+        required = [p for p in required if p]
+        if not required:
+            return None
+        return ProcessQuery(self, required, min_coverage)
+
+    def _drop(self, key: str) -> bool:
+        profile = self._profiles.pop(key, None)
+        if profile is None:
+            return False
+        for postings_by_id, ids in (
+            (self._postings, profile.canonical_ids),
+            (self._open, profile.unresolved_names),
+        ):
+            for posting_id in ids:
+                postings = postings_by_id.get(posting_id)
+                if postings is not None:
+                    postings.discard(key)
+                    if not postings:
+                        del postings_by_id[posting_id]
+        return True
+
+
+class ProcessQuery:
+    """Coverage bound for one requirement list against indexed and ad-hoc facilities.
+
+    Requirements are counted by occurrence, as the matcher does: a design with
+    five laser-cut parts and one assembly step weighs laser cutting 5/6.
+    """
+
+    def __init__(
+        self,
+        index: FacilityProcessIndex,
+        required: List[str],
+        min_coverage: float,
+    ) -> None:
+        self._index = index
+        self.min_coverage = min_coverage
+        self.total = len(required)
+        groups: Counter = Counter()
+        unresolved: Counter = Counter()
+        for name in required:
+            cid = index._taxonomy.normalize(name)
+            if cid:
+                groups[cid] += 1
+            else:
+                unresolved[name.lower()] += 1
+        self.unresolved = sum(unresolved.values())
+        # lower-cased unresolvable requirement -> occurrences
+        self._unresolved_names = dict(unresolved)
+        # canonical requirement -> (occurrences, related IDs)
+        self._groups = {
+            cid: (count, frozenset(index.related_ids(cid)))
+            for cid, count in groups.items()
+        }
+        self._indexed_hits: Optional[Dict[str, int]] = None
+
+    @property
+    def resolvable(self) -> bool:
+        """True when at least one requirement resolves to a canonical ID."""
+        return bool(self._groups)
+
+    def _reaches(self, hits: int) -> bool:
+        return (hits + self.unresolved) / self.total >= self.min_coverage
+
+    def indexed_candidates(self) -> Dict[str, int]:
+        """Indexed facility ID -> definite hits, for those that can reach coverage.
+
+        Hits are canonical hits plus occurrences of unresolvable requirements
+        the facility names verbatim; only the canonical ones feed the bound,
+        which already counts every unresolvable requirement as satisfiable.
+        """
+        if self._indexed_hits is None:
+            index = self._index
+            hits: Counter = Counter()
+            for count, related in self._groups.values():
+                matched: Set[str] = set()
+                for cid in related:
+                    matched |= index._postings.get(cid, set())
+                for key in matched:
+                    hits[key] += count
+            named: Counter = Counter()
+            for name, count in self._unresolved_names.items():
+                for key in index._open.get(name, ()):
+                    named[key] += count
+            result = {
+                key: h + named.get(key, 0)
+                for key, h in hits.items()
+                if self._reaches(h)
+            }
+            if self._reaches(0):
+                # Unresolvable requirements alone reach the threshold.
+                for key, profile in index._profiles.items():
+                    if not profile.is_empty:
+                        result.setdefault(key, named.get(key, 0))
+            for key, n in named.items():
+                result.setdefault(key, hits.get(key, 0) + n)
+            self._indexed_hits = result
+        return self._indexed_hits
+
+    def hits_for(self, facility: Any) -> Optional[int]:
+        """Definite hits for ``facility``, or None when it cannot reach coverage.
+
+        Indexed facilities are answered from the posting lists; anything else
+        (network stubs, local-dir loads, objects without an ``id``) is resolved
+        on the fly.
+        """
+        facility_id = getattr(facility, "id", None)
+        if facility_id is not None and facility_id in self._index:
+            return self.indexed_candidates().get(str(facility_id))
+
+        profile = self._index.profile(facility)
+        if profile.is_empty:
+            return None
+        hits = sum(
+            count
+            for count, related in self._groups.values()
+            if profile.canonical_ids & related
+        )
+        named = sum(
+            count
+            for name, count in self._unresolved_names.items()
+            if name in profile.unresolved_names
+        )
+        if named or self._reaches(hits):
+            return hits + named
+        return None
+
+
+_facility_index: Optional[FacilityProcessIndex] = None
+
+
+def get_facility_index() -> FacilityProcessIndex:
+    """Get the global facility process index (maintained by ``OKWService``)."""
+    global _facility_index
+    if _facility_index is None:
+        _facility_index = FacilityProcessIndex()
+    return _facility_index
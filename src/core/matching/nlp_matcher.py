@@ -14,9 +14,8 @@ following the same pattern as the generation system's NLP layer.
 
 import logging
 import re
-import warnings
 from difflib import SequenceMatcher
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 # Import spaCy availability only; models load via shared loader
 try:
@@ -29,6 +28,9 @@ except ImportError:
 from ..nlp.spacy_loader import load_spacy_english
 from .layers.base import BaseMatchingLayer, MatchingLayer, MatchingResult, MatchQuality
 
+if TYPE_CHECKING:
+    from ..nlp.embedding_index import EmbeddingIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -48,6 +50,8 @@ class NLPMatcher(BaseMatchingLayer):
     - Configurable similarity thresholds
     - Comprehensive metadata tracking
     - Fallback to string similarity when spaCy is not available
+    - Embedding index: each distinct term goes through spaCy once, and one
+      requirement is scored against all capabilities in a single vector op
 
     The implementation follows the same pattern as the generation system's NLP layer,
     using :func:`load_spacy_english` (preferring ``en_core_web_md`` with word vectors).
@@ -84,6 +88,11 @@ class NLPMatcher(BaseMatchingLayer):
         # Lazy loading - don't initialize spaCy until first use to save memory
         self._nlp = None
         self._nlp_initialized = False
+        self._embedding_index: Optional["EmbeddingIndex"] = None
+        # Scoring errors that fell back to string similarity or no result;
+        # callers compare it before and after a call to tell a degraded score
+        # from a real one (e.g. so it is not memoized).
+        self.failures = 0
         self._domain_patterns = None
         self._patterns_initialized = False
 
@@ -114,6 +123,17 @@ class NLPMatcher(BaseMatchingLayer):
         self._nlp_initialized = True
         return self._nlp
 
+    def _ensure_embedding_index(self) -> Optional["EmbeddingIndex"]:
+        """Embedding index over the loaded spaCy model, or None without one."""
+        if self._embedding_index is None:
+            nlp = self._ensure_nlp_initialized()
+            if nlp is None:
+                return None
+            from ..nlp.embedding_index import EmbeddingIndex
+
+            self._embedding_index = EmbeddingIndex(nlp)
+        return self._embedding_index
+
     def _ensure_domain_patterns_initialized(self):
         """Lazy initialization of domain patterns to save memory"""
         if self._patterns_initialized:
@@ -243,11 +263,29 @@ class NLPMatcher(BaseMatchingLayer):
 
             results = []
 
-            # Match each requirement against each capability
+            # Score each requirement against all capabilities at once. A batch
+            # that fails only costs its own requirement, which is re-scored
+            # pair by pair, instead of discarding every result.
             for requirement in requirements:
-                for capability in capabilities:
-                    result = await self._match_single(requirement, capability)
-                    results.append(result)
+                try:
+                    similarities = await self.calculate_semantic_similarities(
+                        requirement, capabilities
+                    )
+                except Exception as e:
+                    self.failures += 1
+                    logger.warning(
+                        f"Batched NLP scoring failed for {requirement!r}: {e}, "
+                        "falling back to pairwise matching"
+                    )
+                    for capability in capabilities:
+                        results.append(
+                            await self._match_single(requirement, capability)
+                        )
+                    continue
+                for capability, similarity in zip(capabilities, similarities):
+                    results.append(
+                        self._build_match_result(requirement, capability, similarity)
+                    )
 
             # End metrics tracking
             matches_found = sum(1 for r in results if r.matched)
@@ -257,6 +295,7 @@ class NLPMatcher(BaseMatchingLayer):
             return results
 
         except Exception as e:
+            self.failures += 1
             return self.handle_matching_error(e, [])
 
     async def _match_single(self, requirement: str, capability: str) -> MatchingResult:
@@ -275,53 +314,10 @@ class NLPMatcher(BaseMatchingLayer):
             similarity = await self.calculate_semantic_similarity(
                 requirement, capability
             )
-
-            # Determine if this is a match based on threshold
-            matched = similarity >= self.similarity_threshold
-
-            # Determine match quality
-            if similarity >= 0.9:
-                quality = MatchQuality.SEMANTIC_MATCH
-            elif similarity >= 0.7:
-                quality = MatchQuality.SEMANTIC_MATCH
-            else:
-                quality = MatchQuality.NO_MATCH
-
-            # Generate reasons for the match/no-match
-            reasons = []
-            if matched:
-                reasons.append(
-                    f"Semantic similarity {similarity:.3f} >= threshold {self.similarity_threshold}"
-                )
-                nlp = self._ensure_nlp_initialized()
-                if nlp:
-                    reasons.append("spaCy semantic analysis")
-                else:
-                    reasons.append("String similarity fallback")
-            else:
-                reasons.append(
-                    f"Semantic similarity {similarity:.3f} < threshold {self.similarity_threshold}"
-                )
-
-            # Add domain-specific context
-            domain_patterns = self._ensure_domain_patterns_initialized()
-            if self.domain in domain_patterns:
-                domain_context = self._analyze_domain_context(requirement, capability)
-                if domain_context:
-                    reasons.append(domain_context)
-
-            return self.create_matching_result(
-                requirement=requirement,
-                capability=capability,
-                matched=matched,
-                confidence=similarity,
-                method="nlp_semantic_match",
-                reasons=reasons,
-                quality=quality,
-                semantic_similarity=similarity,
-            )
+            return self._build_match_result(requirement, capability, similarity)
 
         except Exception as e:
+            self.failures += 1
             logger.error(f"Error in NLP matching: {e}", exc_info=True)
             return self.create_matching_result(
                 requirement=requirement,
@@ -334,6 +330,55 @@ class NLPMatcher(BaseMatchingLayer):
                 semantic_similarity=0.0,
             )
 
+    def _build_match_result(
+        self, requirement: str, capability: str, similarity: float
+    ) -> MatchingResult:
+        """Turn a similarity score into a MatchingResult with reasons and quality."""
+        # Determine if this is a match based on threshold
+        matched = similarity >= self.similarity_threshold
+
+        # Determine match quality
+        if similarity >= 0.9:
+            quality = MatchQuality.SEMANTIC_MATCH
+        elif similarity >= 0.7:
+            quality = MatchQuality.SEMANTIC_MATCH
+        else:
+            quality = MatchQuality.NO_MATCH
+
+        # Generate reasons for the match/no-match
+        reasons = []
+        if matched:
+            reasons.append(
+                f"Semantic similarity {similarity:.3f} >= threshold {self.similarity_threshold}"
+            )
+            nlp = self._ensure_nlp_initialized()
+            if nlp:
+                reasons.append("spaCy semantic analysis")
+            else:
+                reasons.append("String similarity fallback")
+        else:
+            reasons.append(
+                f"Semantic similarity {similarity:.3f} < threshold {self.similarity_threshold}"
+            )
+
+        # Add domain-specific context
+        domain_patterns = self._ensure_domain_patterns_initialized()
+        if self.domain in domain_patterns:
+            domain_context = self._analyze_domain_context(requirement, capability)
+            if domain_context:
+                reasons.append(domain_context)
+
+        return self.create_matching_result(
+            requirement=requirement,
+            capability=capability,
+            matched=matched,
+            confidence=similarity,
+            method="nlp_semantic_match",
+            reasons=reasons,
+            quality=quality,
+            semantic_similarity=similarity,
+        )
+
     async def calculate_semantic_similarity(self, text1: str, text2: str) -> float:
         """
         Calculate semantic similarity between two text strings with domain context awareness.
@@ -348,44 +393,71 @@ class NLPMatcher(BaseMatchingLayer):
         if not text1 or not text2:
             return 0.0
 
+        similarities = await self.calculate_semantic_similarities(text1, [text2])
+        return similarities[0]
+
+    async def calculate_semantic_similarities(
+        self, text: str, candidates: List[str]
+    ) -> List[float]:
+        """
+        Score one text against many candidates in a single vector operation.
+
+        Each distinct context-enhanced text is embedded once (batched through
+        ``nlp.pipe``) and kept in the matcher's embedding index, so repeated
+        terms cost a row lookup rather than a spaCy pipeline pass. Scores are
+        the same ``similarity + domain_boost`` clamp as the pairwise path.
+
+        Args:
+            text: Text to score (typically a requirement)
+            candidates: Texts to score it against (typically capabilities)
+
+        Returns:
+            One similarity score between 0.0 and 1.0 per candidate
+        """
+        if not text:
+            return [0.0] * len(candidates)
+
         # Normalize text
-        text1 = self._normalize_text(text1)
-        text2 = self._normalize_text(text2)
+        text_norm = self._normalize_text(text)
+        candidate_norms = [self._normalize_text(c) if c else "" for c in candidates]
 
         # Enhance texts with domain context for better semantic understanding
-        context_enhanced_text1 = self._enhance_with_domain_context(text1)
-        context_enhanced_text2 = self._enhance_with_domain_context(text2)
+        enhanced_text = self._enhance_with_domain_context(text_norm)
+        scored = [i for i, c in enumerate(candidates) if c]
+        enhanced_candidates = [
+            self._enhance_with_domain_context(candidate_norms[i]) for i in scored
+        ]
+
+        scores = [0.0] * len(candidates)
 
         # If spaCy is available, use semantic similarity with context
-        nlp = self._ensure_nlp_initialized()
-        if nlp:
+        index = self._ensure_embedding_index()
+        if index is not None:
             try:
-                # Process context-enhanced texts with spaCy
-                doc1 = nlp(context_enhanced_text1)
-                doc2 = nlp(context_enhanced_text2)
-
-                # Calculate semantic similarity (suppress spaCy W008 empty-vectors warning)
-                with warnings.catch_warnings():
-                    warnings.filterwarnings(
-                        "ignore",
-                        message=".*empty vectors.*",
-                        category=UserWarning,
+                similarities = index.similarities(enhanced_text, enhanced_candidates)
+                for i, similarity in zip(scored, similarities.tolist()):
+                    # Apply domain-specific boosting for known manufacturing terms
+                    domain_boost = self._calculate_domain_boost(
+                        text_norm, candidate_norms[i]
                     )
-                    similarity = doc1.similarity(doc2)
-
-                # Apply domain-specific boosting for known manufacturing terms
-                domain_boost = self._calculate_domain_boost(text1, text2)
-                boosted_similarity = min(1.0, similarity + domain_boost)
-
-                return max(0.0, min(1.0, boosted_similarity))  # Clamp to [0, 1]
+                    boosted_similarity = min(1.0, similarity + domain_boost)
+                    scores[i] = max(
+                        0.0, min(1.0, boosted_similarity)
+                    )  # Clamp to [0, 1]
+                return scores
 
             except Exception as e:
+                self.failures += 1
                 logger.warning(
                     f"spaCy similarity calculation failed: {e}, falling back to string similarity"
                 )
 
         # Fallback to string similarity with domain context
-        return self._calculate_string_similarity_with_context(text1, text2)
+        for i in scored:
+            scores[i] = self._calculate_string_similarity_with_context(
+                text_norm, candidate_norms[i]
+            )
+        return scores
 
     async def find_synonyms(self, term: str) -> List[str]:
         """
@@ -664,6 +736,7 @@ class NLPMatcher(BaseMatchingLayer):
             # spaCy models don't have explicit cleanup, but we can clear the reference
             self._nlp = None
             self._nlp_initialized = False
+        self._embedding_index = None
 
         # Clear domain patterns to free memory
         self._domain_patterns = None
@@ -13,6 +13,7 @@ from .capability_rules import (
     CapabilityRule,
     CapabilityRuleManager,
     CapabilityRuleSet,
+    _bump_rules_version,
 )
 from .validation import ValidationService
 
@@ -331,6 +332,7 @@ class RulesService:
         This operation cannot be rolled back.
         """
         self.rule_manager.rule_sets.clear()
+        _bump_rules_version()
         logger.warning("All rules have been reset")
 
     async def reload_rules(self, domain: Optional[str] = None) -> Dict[str, Any]:
@@ -348,10 +350,18 @@ class RulesService:
             - reloaded_domains: list of domains that were reloaded
             - total_rules: total number of rules loaded
         """
+        # Deferred: the services package imports this module's siblings.
+        from ..services.matching import (
+            invalidate_match_results,
+            invalidate_pair_verdicts,
+        )
+
         if domain:
             # Reload specific domain by reloading all and filtering
             # (CapabilityRuleManager doesn't support single-domain reload)
             await self.rule_manager.reload_rules()
+            invalidate_pair_verdicts()
+            invalidate_match_results()
             rule_set = self.rule_manager.get_rule_set(domain)
             if rule_set:
                 return {
@@ -368,6 +378,8 @@ class RulesService:
             before_domains = list(self.rule_manager.rule_sets.keys())
 
             await self.rule_manager.reload_rules()
+            invalidate_pair_verdicts()
+            invalidate_match_results()
 
             after_count = sum(
                 len(rs.rules) for rs in self.rule_manager.rule_sets.values()
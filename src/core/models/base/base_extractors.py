@@ -64,6 +64,10 @@ class ExtractionResult(Generic[T]):
 class BaseExtractor(ABC):
     """Base class for all extractors"""
 
+    # Bump when a change alters extraction output, so cached results keyed on
+    # the extractor (e.g. per-facility capability lists) are not reused.
+    version = "1"
+
     def __init__(self):
         self._preprocessors = []
 
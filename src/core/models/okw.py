@@ -917,7 +917,7 @@ class ManufacturingFacility:
             if req_id:
                 cap_id = taxonomy.normalize(process_url)
                 if cap_id and (
-                    req_id == cap_id or req_id in (taxonomy.get_ancestors(cap_id) or [])
+                    req_id == cap_id or taxonomy.is_ancestor(req_id, cap_id)
                 ):
                     return True
             if process_name.lower() in process_url.lower():
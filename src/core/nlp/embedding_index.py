@@ -0,0 +1,157 @@
+"""
+Vector index over spaCy document embeddings.
+
+Scoring a pair with ``nlp(a).similarity(nlp(b))`` runs the full pipeline twice
+per pair. Matching vocabularies are small and repeat constantly, so
+:class:`EmbeddingIndex` runs each distinct text through ``nlp.pipe`` once,
+keeps its vector as a row of a contiguous float32 matrix, and scores one text
+against many with a single matrix–vector product.
+
+Scores follow ``Doc.similarity``: identical token sequences score 1.0, a text
+without a vector scores 0.0, otherwise cosine similarity rounded to float32.
+The dot product is computed by one BLAS call for the whole candidate set
+rather than per pair, so scores agree with ``Doc.similarity`` to float32
+precision (a few ULP), not necessarily bit for bit.
+
+Requires NumPy, which every spaCy install already depends on.
+"""
+
+from __future__ import annotations
+
+import logging
+from threading import Lock
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_TERMS = 20000
+
+
+class EmbeddingIndex:
+    """Per-pipeline cache of document vectors with batched cosine scoring.
+
+    Rows are appended as new texts are seen; once ``max_terms`` distinct texts
+    have been stored the index is emptied and refilled, which bounds memory
+    when callers feed it free text rather than a process vocabulary.
+    """
+
+    def __init__(
+        self, nlp: Any, max_terms: int = DEFAULT_MAX_TERMS, batch_size: int = 256
+    ) -> None:
+        self._nlp = nlp
+        self.max_terms = max(1, max_terms)
+        self.batch_size = batch_size
+        self._lock = Lock()
+        self._rows: Dict[str, int] = {}
+        self._vectors = np.zeros((0, 0), dtype=np.float32)
+        self._norms = np.zeros(0, dtype=np.float64)
+        self._token_keys: List[Tuple[int, ...]] = []
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, text: str) -> bool:
+        return text in self._rows
+
+    def clear(self) -> None:
+        with self._lock:
+            self._reset()
+
+    def add(self, texts: Iterable[str]) -> None:
+        """Embed every text not already indexed, batched through ``nlp.pipe``."""
+        with self._lock:
+            self._add_missing(texts)
+
+    def similarities(self, text: str, candidates: Sequence[str]) -> np.ndarray:
+        """``Doc.similarity`` of ``text`` against each candidate, as float64 scores."""
+        with self._lock:
+            self._add_missing([text, *candidates])
+            query = self._rows[text]
+            rows = np.fromiter(
+                (self._rows[c] for c in candidates),
+                dtype=np.intp,
+                count=len(candidates),
+            )
+            vectors = self._vectors
+            norms = self._norms
+            token_keys = self._token_keys
+
+        scores = np.zeros(len(candidates), dtype=np.float64)
+        if not len(candidates):
+            return scores
+
+        query_norm = norms[query]
+        if query_norm:
+            candidate_norms = norms[rows]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                cosine = vectors[rows] @ vectors[query]
+                cosine = cosine / (candidate_norms * query_norm).astype(np.float32)
+            scores = np.where(candidate_norms > 0, cosine, 0.0).astype(np.float64)
+
+        # Doc.similarity short-circuits identical token sequences to exactly 1.0,
+        # even when neither side has a vector.
+        query_key = token_keys[query]
+        for i, row in enumerate(rows):
+            if token_keys[row] == query_key:
+                scores[i] = 1.0
+        return scores
+
+    def _reset(self) -> None:
+        self._rows = {}
+        self._vectors = np.zeros((0, 0), dtype=np.float32)
+        self._norms = np.zeros(0, dtype=np.float64)
+        self._token_keys = []
+
+    def _add_missing(self, texts: Iterable[str]) -> None:
+        wanted = list(dict.fromkeys(texts))
+        missing = [t for t in wanted if t not in self._rows]
+        if not missing:
+            return
+        if len(self._rows) + len(missing) > self.max_terms:
+            logger.debug(
+                "Embedding index full (%d terms); starting over", len(self._rows)
+            )
+            self._reset()
+            # Texts of this request that were indexed before the reset are
+            # gone too; a request larger than max_terms is still embedded whole.
+            missing = wanted
+
+        attr = self._vector_key_attr()
+        docs = list(self._nlp.pipe(missing, batch_size=self.batch_size))
+        width = max((doc.vector.shape[0] for doc in docs), default=0)
+        width = max(width, self._vectors.shape[1])
+
+        start = len(self._rows)
+        needed = start + len(docs)
+        if needed > self._vectors.shape[0] or width != self._vectors.shape[1]:
+            capacity = max(needed, 2 * self._vectors.shape[0], 64)
+            grown = np.zeros((capacity, width), dtype=np.float32)
+            grown[:start, : self._vectors.shape[1]] = self._vectors[:start]
+            self._vectors = grown
+            norms = np.zeros(capacity, dtype=np.float64)
+            norms[:start] = self._norms[:start]
+            self._norms = norms
+
+        for offset, (text, doc) in enumerate(zip(missing, docs)):
+            row = start + offset
+            vector = np.asarray(doc.vector, dtype=np.float32)
+            self._vectors[row, : vector.shape[0]] = vector
+            self._norms[row] = _doc_vector_norm(vector)
+            self._token_keys.append(tuple(doc.to_array([attr]).tolist()))
+            self._rows[text] = row
+
+    def _vector_key_attr(self) -> Any:
+        from spacy.attrs import ORTH
+
+        return getattr(self._nlp.vocab.vectors, "attr", ORTH)
+
+
+def _doc_vector_norm(vector: np.ndarray) -> float:
+    """``Doc.vector_norm``: float32 squares accumulated left to right in double."""
+    if not vector.size:
+        return 0.0
+    squares = (vector * vector).astype(np.float64)
+    total = float(np.cumsum(squares)[-1])
+    return float(np.sqrt(total)) if total != 0 else 0.0
@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List
 
 from ..models.package import PackageMetadata
+from ..storage.base import ObjectWrite
 from ..storage.package_storage import (
     build_info_key_candidates,
     default_package_prefix,
@@ -22,6 +23,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Package files read into memory and uploaded per bulk ``put_objects`` call.
+PUSH_BATCH_SIZE = 32
+
 
 class PackageRemoteStorage:
     """Handles remote storage operations for OKH packages.
@@ -184,55 +188,70 @@ class PackageRemoteStorage:
                 push_results["uploaded_files"].append("file-manifest.json")
                 logger.info(f"Uploaded file manifest: {file_manifest_key}")
 
-            # 4. Upload all package files
-            for file_info in package_metadata.file_inventory:
-                try:
-                    local_file_path = (
-                        local_package_path / file_info.local_path
-                    ).resolve()
-                    if not local_file_path.exists():
-                        logger.warning(f"Local file not found: {local_file_path}")
+            # 4. Upload all package files, PUSH_BATCH_SIZE per bulk call
+            inventory = package_metadata.file_inventory
+            for start in range(0, len(inventory), PUSH_BATCH_SIZE):
+                writes: Dict[str, ObjectWrite] = {}
+                for file_info in inventory[start : start + PUSH_BATCH_SIZE]:
+                    try:
+                        local_file_path = (
+                            local_package_path / file_info.local_path
+                        ).resolve()
+                        if not local_file_path.exists():
+                            logger.warning(f"Local file not found: {local_file_path}")
+                            push_results["failed_files"].append(
+                                {
+                                    "file": file_info.local_path,
+                                    "error": "Local file not found",
+                                }
+                            )
+                            continue
+
+                        with open(local_file_path, "rb") as f:
+                            file_data = f.read()
+
+                        # Remote storage key for this file
+                        writes[file_info.local_path] = ObjectWrite(
+                            key=self._get_file_key(
+                                org, project, version, file_info.local_path
+                            ),
+                            data=file_data,
+                            content_type=file_info.content_type
+                            or "application/octet-stream",
+                            metadata={
+                                "package_name": package_metadata.package_name,
+                                "version": version,
+                                "original_url": file_info.original_url,
+                                "file_type": file_info.file_type,
+                                "part_name": file_info.part_name or "",
+                                "checksum_sha256": file_info.checksum_sha256,
+                                "size_bytes": str(file_info.size_bytes),
+                            },
+                        )
+                    except Exception as e:
+                        logger.error(
+                            f"Failed to upload file {file_info.local_path}: {e}"
+                        )
                         push_results["failed_files"].append(
-                            {
-                                "file": file_info.local_path,
-                                "error": "Local file not found",
-                            }
+                            {"file": file_info.local_path, "error": str(e)}
                         )
-                        continue
-
-                    # Get remote storage key for this file
-                    remote_file_key = self._get_file_key(
-                        org, project, version, file_info.local_path
-                    )
 
-                    # Upload file
-                    with open(local_file_path, "rb") as f:
-                        file_data = f.read()
-
-                    await self.storage_service.manager.put_object(
-                        key=remote_file_key,
-                        data=file_data,
-                        content_type=file_info.content_type
-                        or "application/octet-stream",
-                        metadata={
-                            "package_name": package_metadata.package_name,
-                            "version": version,
-                            "original_url": file_info.original_url,
-                            "file_type": file_info.file_type,
-                            "part_name": file_info.part_name or "",
-                            "checksum_sha256": file_info.checksum_sha256,
-                            "size_bytes": str(file_info.size_bytes),
-                        },
+                try:
+                    stored = await self.storage_service.manager.put_objects(
+                        writes.values()
                     )
-
-                    push_results["uploaded_files"].append(file_info.local_path)
-                    logger.info(f"Uploaded file: {remote_file_key}")
-
                 except Exception as e:
-                    logger.error(f"Failed to upload file {file_info.local_path}: {e}")
-                    push_results["failed_files"].append(
-                        {"file": file_info.local_path, "error": str(e)}
-                    )
+                    stored = {write.key: e for write in writes.values()}
+                for local_path, write in writes.items():
+                    result = stored.get(write.key)
+                    if isinstance(result, Exception):
+                        logger.error(f"Failed to upload file {local_path}: {result}")
+                        push_results["failed_files"].append(
+                            {"file": local_path, "error": str(result)}
+                        )
+                    else:
+                        push_results["uploaded_files"].append(local_path)
+                        logger.info(f"Uploaded file: {write.key}")
 
             # 5. Create package index entry
             await self._create_package_index_entry(
@@ -184,12 +184,15 @@ class AssetService(BaseService["AssetService"]):
         if not (self.storage and self.storage.manager):
             return []
         discovery = SmartFileDiscovery(self.storage.manager)
+        file_infos = await discovery.discover_files(_PREFIX)
+        bodies = await self.storage.manager.get_objects(fi.key for fi in file_infos)
         records: Dict[str, AssetRecord] = {}
-        for fi in await discovery.discover_files(_PREFIX):
+        for fi in file_infos:
             try:
-                data = json.loads(
-                    (await self.storage.manager.get_object(fi.key)).decode()
-                )
+                body = bodies[fi.key]
+                if isinstance(body, Exception):
+                    raise body
+                data = json.loads(body.decode())
                 record = AssetRecord.from_dict(data)
                 if manifest_id and record.manifest_id != manifest_id:
                     continue
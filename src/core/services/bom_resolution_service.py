@@ -3,18 +3,48 @@ BOM Resolution Service for nested supply tree generation.
 
 This service handles loading and parsing BOMs from OKH manifests,
 supporting both embedded BOMs (within manifest) and external BOM files.
+
+Explosion treats referenced manifests as a DAG keyed by content hash. Each
+sub-assembly is resolved and exploded once, however many parents share it, and
+the result is memoized in process (see ``BOM_EXPLOSION_MEMO``) so repeated
+nested matches of the same design skip the recursion. References back to a
+manifest that is already being expanded are not followed, so cyclic BOMs
+terminate instead of recursing to ``max_depth``. A memoized sub-assembly is
+reused only where none of the manifests it reaches is being expanded above it,
+so a cut never leaks from one walk into another. Callers always get private
+copies of memoized components and manifests.
 """
 
+import asyncio
+import copy
+import hashlib
 import json
 import os
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 from uuid import UUID, uuid4
 
 import yaml
 
-from src.config.settings import MAX_DEPTH
+from src.config.settings import (
+    BOM_EXPLOSION_CACHE_SIZE,
+    BOM_RESOLUTION_CONCURRENCY,
+    MAX_DEPTH,
+)
 
+from ..cache.memo import LRUMemo, clear_memos
 from ..models.bom import BillOfMaterials, Component
 from ..models.component_match import ComponentMatch
 from ..models.okh import OKHManifest, PartSpec
@@ -23,6 +53,109 @@ from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+BOM_EXPLOSION_MEMO = "bom_explosions"
+
+_explosion_memo: Optional[LRUMemo] = None
+
+
+def _explosions() -> LRUMemo:
+    """The process-wide memo of exploded designs and sub-assemblies."""
+    global _explosion_memo
+    if _explosion_memo is None:
+        _explosion_memo = LRUMemo(BOM_EXPLOSION_MEMO, BOM_EXPLOSION_CACHE_SIZE)
+    return _explosion_memo
+
+
+def invalidate_bom_explosions() -> None:
+    """Drop every memoized explosion (e.g. after an OKH write)."""
+    clear_memos(BOM_EXPLOSION_MEMO)
+
+
+def manifest_content_hash(okh_manifest: OKHManifest) -> str:
+    """Stable digest of a manifest's serialized content."""
+    payload = json.dumps(okh_manifest.to_dict(), sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class ExplodedComponent:
+    """One row of an exploded BOM, relative to the BOM it was exploded from.
+
+    ``depth``, ``path`` and a ``None`` ``parent_component_id`` are relative to
+    that BOM's top level; :func:`_rebase` places a row under a parent. Rows and
+    the objects they hold are shared between requests and must not be mutated;
+    the public explode methods hand out copies (see :func:`_private_copy`).
+    """
+
+    component: Component
+    depth: int
+    parent_component_id: Optional[str]
+    okh_manifest: Optional[OKHManifest]
+    path: Tuple[str, ...]
+    unresolved_reference: Optional[Dict[str, str]] = None
+
+
+def _rebase(
+    rows: Iterable[ExplodedComponent],
+    depth: int,
+    parent_id: Optional[str],
+    path: Tuple[str, ...],
+) -> Iterator[ExplodedComponent]:
+    for row in rows:
+        yield replace(
+            row,
+            depth=depth + row.depth,
+            parent_component_id=(
+                row.parent_component_id
+                if row.parent_component_id is not None
+                else parent_id
+            ),
+            path=path + row.path,
+        )
+
+
+# An explosion's rows, whether it cut a reference cycle, and the content hashes
+# of every referenced manifest it reached (followed or cut).
+Explosion = Tuple[Tuple[ExplodedComponent, ...], bool, FrozenSet[str]]
+
+
+def _private_copy(value: Any, keep: Iterable[Any] = ()) -> Any:
+    """Deep copy of ``value`` that leaves the objects in ``keep`` as they are."""
+    return copy.deepcopy(value, {id(obj): obj for obj in keep})
+
+
+def _walk_components(components: Iterable[Component]) -> Iterator[Component]:
+    for component in components:
+        yield component
+        yield from _walk_components(component.sub_components or [])
+
+
+def _component_matches(
+    rows: Iterable[ExplodedComponent],
+    depth: int,
+    parent_id: Optional[str],
+    path: List[str],
+) -> List[ComponentMatch]:
+    """Fresh ``ComponentMatch`` objects for (possibly shared) exploded rows."""
+    matches = []
+    for row in _rebase(rows, depth, parent_id, tuple(path)):
+        match = ComponentMatch(
+            component=row.component,
+            depth=row.depth,
+            parent_component_id=row.parent_component_id,
+            okh_manifest=row.okh_manifest,
+            path=list(row.path),
+        )
+        if row.unresolved_reference is not None:
+            match.has_unresolved_reference = True
+            match.unresolved_reference = row.unresolved_reference
+        matches.append(match)
+    return matches
+
+
+def _reference_key(reference: Dict[str, Any]) -> Hashable:
+    return tuple(sorted((str(k), str(v)) for k, v in reference.items()))
+
 
 class BOMResolutionService:
     """Service for resolving BOMs from OKH manifests"""
@@ -30,6 +163,12 @@ class BOMResolutionService:
     def __init__(self, okh_service: Optional[OKHService] = None):
         """Initialize BOM resolution service"""
         self.okh_service = okh_service
+        # Per-instance (i.e. per-request) memos: in-flight or finished loads of
+        # referenced manifests and their BOMs, and exploded sub-assemblies.
+        self._references: Dict[Hashable, "asyncio.Future[Optional[OKHManifest]]"] = {}
+        self._boms: Dict[str, "asyncio.Future[BillOfMaterials]"] = {}
+        self._subtrees: Dict[Tuple[str, int], Explosion] = {}
+        self._load_limit: Optional[asyncio.Semaphore] = None
 
     def _detect_bom_type(self, okh_manifest: OKHManifest) -> str:
         """
@@ -608,15 +747,16 @@ class BOMResolutionService:
         Recursively explode BOM into flat list with depth tracking.
 
         Algorithm:
-        1. For each component in BOM:
+        1. Load every external reference in the BOM concurrently
+        2. For each component in BOM:
            a. Create ComponentMatch with current depth and path
            b. If component has reference to external OKH:
-              - Load OKH manifest
-              - If OKH has BOM, recursively explode it
+              - Use the loaded OKH manifest
+              - If OKH has BOM, explode it (once per manifest, see module docs)
            c. If component has sub-components:
               - Recursively explode sub-components (depth + 1)
            d. Add ComponentMatch to result list
-        2. Return flat list of ComponentMatches
+        3. Return flat list of ComponentMatches
 
         Args:
             bom: BillOfMaterials to explode
@@ -642,27 +782,94 @@ class BOMResolutionService:
         if current_depth >= max_depth:
             raise ValueError(f"Max depth {max_depth} exceeded at depth {current_depth}")
 
-        component_matches = []
-
         # Use provided okh_service or self.okh_service
         service = okh_service or self.okh_service
 
+        rows, _, _ = await self._explode_rows(
+            bom, service, max_depth - current_depth, frozenset()
+        )
+        # The caller's own components stay as they are; memoized sub-assemblies
+        # are copied so no two callers share them.
+        rows = _private_copy(rows, _walk_components(bom.components))
+        return _component_matches(rows, current_depth, parent_id, path)
+
+    async def explode_manifest(
+        self,
+        okh_manifest: OKHManifest,
+        okh_service: Optional[OKHService] = None,
+        max_depth: Optional[int] = None,
+        manifest_path: Optional[str] = None,
+    ) -> Tuple[BillOfMaterials, List[ComponentMatch]]:
+        """Resolve and explode a design's BOM, memoized by manifest content.
+
+        Equivalent to :meth:`resolve_bom` followed by :meth:`explode_bom`, but a
+        design seen before (same content, ``manifest_path`` and ``max_depth``)
+        skips both. Explosions that cut a reference cycle are not memoized
+        across requests, as the cut depends on where the walk started.
+
+        Returns:
+            The resolved BOM and a fresh list of ComponentMatch objects.
+
+        Raises:
+            ValueError: If the BOM has components and ``max_depth`` is below 1
+        """
+        if max_depth is None:
+            max_depth = MAX_DEPTH
+        service = okh_service or self.okh_service
+
+        key = manifest_content_hash(okh_manifest)
+        memo_key = ("manifest", key, manifest_path, max_depth)
+        cached = _explosions().get(memo_key)
+        if cached is not None:
+            bom, rows = cached
+        else:
+            bom = await self.resolve_bom(
+                okh_manifest, service, manifest_path=manifest_path
+            )
+            rows, cut = (), False
+            if bom.components:
+                if max_depth <= 0:
+                    raise ValueError(f"Max depth {max_depth} exceeded at depth 0")
+                rows, cut, _ = await self._explode_rows(
+                    bom, service, max_depth, frozenset({key})
+                )
+            if not cut:
+                _explosions().set(memo_key, (bom, rows))
+
+        # One copy for both, so bom.components and the matches stay in step.
+        bom, rows = _private_copy((bom, rows))
+        return bom, _component_matches(rows, 0, None, [])
+
+    async def _explode_rows(
+        self,
+        bom: BillOfMaterials,
+        service: Optional[OKHService],
+        remaining: int,
+        expanding: FrozenSet[str],
+    ) -> Explosion:
+        """Explode ``bom`` into relative rows; ``remaining`` levels are allowed.
+
+        ``expanding`` holds the content hashes of the manifests being expanded
+        above this BOM. Returns the rows, whether a reference cycle was cut and
+        the content hashes of the referenced manifests reached on the way.
+        """
+        if service:
+            await self._prefetch(bom.components, service, remaining)
+
+        rows: List[ExplodedComponent] = []
+        cut = False
+        reached: Set[str] = set()
+
         for component in bom.components:
             # Build component path
-            component_path = path + [component.name]
-
-            # Create ComponentMatch
-            component_match = ComponentMatch(
-                component=component,
-                depth=current_depth,
-                parent_component_id=parent_id,
-                path=component_path,
-            )
+            component_path = (component.name,)
+            okh_manifest = None
+            unresolved_reference = None
 
             # Resolve external OKH reference if present (graceful failure)
             if component.reference and service:
                 try:
-                    okh_manifest = await self.resolve_component_reference(
+                    okh_manifest = await self._load_reference(
                         component.reference, service
                     )
                     if not okh_manifest:
@@ -674,40 +881,49 @@ class BOMResolutionService:
                                 "component_id": component.id,
                                 "component_name": component.name,
                                 "reference": component.reference,
-                                "depth": current_depth,
-                                "path": " > ".join(component_path),
                             },
                         )
                         # Mark component match as having unresolved reference
-                        component_match.has_unresolved_reference = True
-                        component_match.unresolved_reference = component.reference
-                    if okh_manifest:
-                        component_match.okh_manifest = okh_manifest
-
+                        unresolved_reference = component.reference
+                    elif remaining > 1:
                         # If referenced OKH has BOM (embedded or external), explode it
-                        # Check depth before recursing
-                        if (current_depth + 1) < max_depth:
+                        child = manifest_content_hash(okh_manifest)
+                        reached.add(child)
+                        if child in expanding:
+                            cut = True
+                            logger.warning(
+                                f"Component '{component.name}' references a manifest "
+                                f"already being expanded; not following the cycle",
+                                extra={
+                                    "component_id": component.id,
+                                    "component_name": component.name,
+                                    "reference": component.reference,
+                                },
+                            )
+                        else:
                             try:
-                                nested_bom = await self.resolve_bom(
-                                    okh_manifest, service
+                                (
+                                    nested,
+                                    nested_cut,
+                                    nested_reached,
+                                ) = await self._explode_manifest_rows(
+                                    okh_manifest,
+                                    child,
+                                    service,
+                                    remaining - 1,
+                                    expanding,
+                                )
+                                cut = cut or nested_cut
+                                reached |= nested_reached
+                                rows.extend(
+                                    _rebase(nested, 1, component.id, component_path)
                                 )
-                                if nested_bom.components:
-                                    nested_matches = await self.explode_bom(
-                                        nested_bom,
-                                        service,
-                                        max_depth,
-                                        current_depth + 1,
-                                        component.id,
-                                        component_path,
-                                    )
-                                    component_matches.extend(nested_matches)
                             except Exception as e:
                                 logger.warning(
                                     f"Failed to explode nested BOM for component '{component.name}': {e}",
                                     extra={
                                         "component_id": component.id,
                                         "component_name": component.name,
-                                        "depth": current_depth,
                                         "error_type": type(e).__name__,
                                     },
                                 )
@@ -719,31 +935,140 @@ class BOMResolutionService:
                             "component_id": component.id,
                             "component_name": component.name,
                             "reference": component.reference,
-                            "depth": current_depth,
                             "error_type": type(e).__name__,
-                            "path": " > ".join(component_path),
                         },
                     )
                     # Continue processing - component match will use component data directly
 
             # Explode sub-components if present (check depth before recursing)
-            if component.sub_components and (current_depth + 1) < max_depth:
+            if component.sub_components and remaining > 1:
                 for sub_component in component.sub_components:
                     # Create temporary BOM for sub-components
                     sub_bom = BillOfMaterials(
                         name=f"{component.name} Sub-components",
                         components=[sub_component],
                     )
-                    sub_matches = await self.explode_bom(
-                        sub_bom,
-                        service,
-                        max_depth,
-                        current_depth + 1,
-                        component.id,
-                        component_path,
+                    sub_rows, sub_cut, sub_reached = await self._explode_rows(
+                        sub_bom, service, remaining - 1, expanding
                     )
-                    component_matches.extend(sub_matches)
+                    cut = cut or sub_cut
+                    reached |= sub_reached
+                    rows.extend(_rebase(sub_rows, 1, component.id, component_path))
+
+            rows.append(
+                ExplodedComponent(
+                    component=component,
+                    depth=0,
+                    parent_component_id=None,
+                    okh_manifest=okh_manifest,
+                    path=component_path,
+                    unresolved_reference=unresolved_reference,
+                )
+            )
+
+        return tuple(rows), cut, frozenset(reached)
+
+    async def _explode_manifest_rows(
+        self,
+        okh_manifest: OKHManifest,
+        key: str,
+        service: OKHService,
+        remaining: int,
+        expanding: FrozenSet[str],
+    ) -> Explosion:
+        """Relative rows of a referenced manifest's BOM, exploded once per context.
+
+        An explosion that reaches none of the manifests in ``expanding`` cut
+        nothing because of them: any cut in it is to ``key`` or inside the
+        sub-assembly, and would be the same under any other walk that also
+        avoids what it reaches. Only such explosions are memoized, and a
+        memoized one is reused only where that still holds.
+        """
+        memo_key = (key, remaining)
+        result = self._subtrees.get(memo_key)
+        if result is not None and not result[2] & expanding:
+            return result
+
+        shared = _explosions().get(("subtree",) + memo_key)
+        if shared is not None and not shared[2] & expanding:
+            result = shared
+        else:
+            nested_bom = await self._load_bom(okh_manifest, key, service)
+            result = ((), False, frozenset())
+            if nested_bom.components:
+                result = await self._explode_rows(
+                    nested_bom, service, remaining, expanding | {key}
+                )
+            if result[2] & expanding:
+                return result
+            _explosions().set(("subtree",) + memo_key, result)
 
-            component_matches.append(component_match)
+        self._subtrees[memo_key] = result
+        return result
 
-        return component_matches
+    async def _prefetch(
+        self, components: List[Component], service: OKHService, remaining: int
+    ) -> None:
+        """Start loading every reference (and its BOM) this explosion will need.
+
+        Loads run concurrently, up to ``BOM_RESOLUTION_CONCURRENCY`` at a time;
+        the explosion itself then walks the BOM in order and finds them loaded.
+        Failures are left in the memo for the walk to report as before.
+        """
+        wanted: List[Tuple[Dict[str, str], int]] = []
+
+        def walk(items: List[Component], level: int) -> None:
+            for component in items:
+                if component.reference:
+                    wanted.append((component.reference, level))
+                if component.sub_components and level + 1 < remaining:
+                    walk(component.sub_components, level + 1)
+
+        walk(components, 0)
+        if not wanted:
+            return
+
+        manifests = await asyncio.gather(
+            *(self._load_reference(reference, service) for reference, _ in wanted),
+            return_exceptions=True,
+        )
+        boms = []
+        for (_, level), manifest in zip(wanted, manifests):
+            if isinstance(manifest, OKHManifest) and level + 1 < remaining:
+                key = manifest_content_hash(manifest)
+                boms.append(self._load_bom(manifest, key, service))
+        await asyncio.gather(*boms, return_exceptions=True)
+
+    def _bounded(self, coro):
+        """Run ``coro`` under this instance's load concurrency limit."""
+        if self._load_limit is None:
+            self._load_limit = asyncio.Semaphore(BOM_RESOLUTION_CONCURRENCY)
+
+        async def run():
+            async with self._load_limit:
+                return await coro
+
+        return asyncio.ensure_future(run())
+
+    async def _load_reference(
+        self, reference: Dict[str, str], service: OKHService
+    ) -> Optional[OKHManifest]:
+        """:meth:`resolve_component_reference`, loaded once per reference."""
+        if not isinstance(reference, dict):
+            return await self.resolve_component_reference(reference, service)
+        key = _reference_key(reference)
+        future = self._references.get(key)
+        if future is None:
+            future = self._bounded(self.resolve_component_reference(reference, service))
+            self._references[key] = future
+        return await asyncio.shield(future)
+
+    async def _load_bom(
+        self, okh_manifest: OKHManifest, key: str, service: OKHService
+    ) -> BillOfMaterials:
+        """:meth:`resolve_bom`, loaded once per manifest content hash."""
+        future = self._boms.get(key)
+        if future is None:
+            future = self._bounded(self.resolve_bom(okh_manifest, service))
+            self._boms[key] = future
+        return await asyncio.shield(future)
@@ -20,6 +20,7 @@ from src.config.settings import (
 
 from ..cache.backends.memory import MemoryCacheBackend
 from ..cache.backends.redis_backend import RedisCacheBackend
+from ..cache.memo import memo_stats
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -128,6 +129,9 @@ class CacheService:
                 else None
             ),
             **extra,
+            # In-process hot-path memos (e.g. matching pair verdicts); they
+            # bypass the backend, so their counters are reported separately.
+            "memos": memo_stats(),
         }
 
 
@@ -1,13 +1,67 @@
 """Matching layer orchestration helpers."""
 
+from ._capability_cache import (
+    FACILITY_CAPABILITY_MEMO,
+    FacilityCapabilities,
+    capability_cache_key,
+    document_digest,
+    facility_content_hash,
+    invalidate_facility_capabilities,
+    new_facility_capability_cache,
+)
 from ._layer_cascade import (
+    SUPPLY_TREE_HEURISTIC_CONFIDENCE,
     LayerEvaluation,
     evaluate_layers,
     evaluate_layers_supply_tree,
 )
+from ._match_cache import (
+    MATCH_RESULT_MEMO,
+    MatchVerdict,
+    invalidate_match_results,
+    match_result_key,
+    new_match_result_cache,
+)
+from ._match_log import (
+    MatchLogScope,
+    count_match_event,
+    current_match_log,
+    hot_log,
+    layer_timer,
+    match_log_scope,
+)
+from ._verdict_cache import (
+    PAIR_VERDICT_MEMO,
+    invalidate_pair_verdicts,
+    new_pair_verdict_cache,
+    pair_verdict_key,
+)
 
 __all__ = [
+    "FACILITY_CAPABILITY_MEMO",
+    "FacilityCapabilities",
+    "MATCH_RESULT_MEMO",
+    "MatchVerdict",
+    "PAIR_VERDICT_MEMO",
+    "SUPPLY_TREE_HEURISTIC_CONFIDENCE",
     "LayerEvaluation",
+    "MatchLogScope",
+    "capability_cache_key",
+    "count_match_event",
+    "current_match_log",
+    "document_digest",
     "evaluate_layers",
     "evaluate_layers_supply_tree",
+    "facility_content_hash",
+    "hot_log",
+    "invalidate_facility_capabilities",
+    "invalidate_match_results",
+    "invalidate_pair_verdicts",
+    "layer_timer",
+    "match_log_scope",
+    "match_result_key",
+    "new_facility_capability_cache",
+    "new_match_result_cache",
+    "new_pair_verdict_cache",
+    "pair_verdict_key",
 ]
@@ -0,0 +1,91 @@
+"""
+Memo of extracted, normalized capabilities per facility revision.
+
+Every match path runs the domain extractor over each candidate facility and
+normalizes the resulting process names, on every request, although facilities
+rarely change. The result is a pure function of the facility's content, the
+domain, the extractor and the process taxonomy, so it is memoized under that
+key. Catalogue facilities stand for their content by id and catalogue version;
+any other facility is hashed per request, so an edit simply misses. OKW writes
+additionally clear the memo so superseded revisions do not linger.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from src.config.settings import MATCHING_CAPABILITY_CACHE_SIZE
+
+from ...cache.memo import LRUMemo, clear_memos
+from ...taxonomy import taxonomy_version
+
+FACILITY_CAPABILITY_MEMO = "matching_facility_capabilities"
+
+
+@dataclass(frozen=True)
+class FacilityCapabilities:
+    """One facility revision's extracted capabilities.
+
+    ``capabilities`` is the extractor's capability list as returned;
+    ``terms`` are their normalized, non-empty process names in order. Both are
+    shared between requests and must not be mutated.
+    """
+
+    capabilities: Tuple[Dict[str, Any], ...]
+    terms: Tuple[str, ...]
+
+
+def new_facility_capability_cache() -> LRUMemo:
+    """A capability memo sized from ``MATCHING_CAPABILITY_CACHE_SIZE`` (0 disables it)."""
+    return LRUMemo(FACILITY_CAPABILITY_MEMO, MATCHING_CAPABILITY_CACHE_SIZE)
+
+
+def facility_content_hash(facility_data: Dict[str, Any]) -> str:
+    """Stable digest of a facility's serialized content."""
+    payload = json.dumps(facility_data, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def document_digest(document: Any) -> Optional[str]:
+    """:func:`facility_content_hash` of ``document.to_dict()``, or None.
+
+    Computed on every call: models are mutable, so a digest remembered per
+    object would outlive an in-place edit. Catalogue facilities avoid the cost
+    by keying on their catalogue revision instead (see
+    ``OKWService.catalog_revision``). Returns None for objects without
+    ``to_dict``.
+    """
+    to_dict = getattr(document, "to_dict", None)
+    if not callable(to_dict):
+        return None
+    return facility_content_hash(to_dict())
+
+
+def extractor_version(extractor: Any) -> str:
+    """Identity of an extractor implementation, including its ``version``."""
+    cls = type(extractor)
+    return f"{cls.__module__}.{cls.__qualname__}:{getattr(extractor, 'version', '')}"
+
+
+def capability_cache_key(
+    facility_id: Any, revision: Hashable, domain: str, extractor: Any
+) -> Tuple[Hashable, ...]:
+    """Cache key for one facility revision under the current taxonomy.
+
+    ``revision`` is the facility's catalogue version or its content hash.
+    """
+    return (
+        str(facility_id),
+        revision,
+        domain,
+        extractor_version(extractor),
+        taxonomy_version(),
+    )
+
+
+def invalidate_facility_capabilities() -> None:
+    """Drop every memoized capability list (e.g. after an OKW write)."""
+    clear_memos(FACILITY_CAPABILITY_MEMO)
@@ -3,17 +3,67 @@ Shared orchestration for the direct → heuristic → NLP matching cascade.
 
 Supports cascade mode (legacy short-circuit) and veto mode (NLP second opinion
 on fuzzy direct and heuristic hits).
+
+Inside a match request (see :func:`match_log_scope`) every layer call is timed
+into the request's statistics with its outcome: ``direct``, ``heuristic``,
+``nlp_match``, ``nlp_similarity``, ``veto`` (hit = vetoed) and, for supply-tree
+scoring, ``partial_similarity``.
 """
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass, field
-from typing import Awaitable, Callable, Literal, Optional, Tuple
+from typing import Any, Awaitable, Callable, Literal, Optional, Tuple, TypeVar
+
+from ._match_log import MatchLogScope, current_match_log
 
 LayerKind = Literal["direct", "heuristic", "nlp", "none"]
 DirectPath = Literal["strong", "fuzzy", "none"]
 CascadeMode = Literal["cascade", "veto"]
 
+# Supply-tree score of a heuristic hit: the most any layer other than direct
+# gives a pair (NLP gives 0.7, partial similarity at most 0.6). Top-K matching
+# bounds facility scores with it.
+SUPPLY_TREE_HEURISTIC_CONFIDENCE = 0.8
+
+T = TypeVar("T")
+
+
+async def _timed(
+    scope: Optional[MatchLogScope],
+    layer: str,
+    call: Callable[[], Awaitable[T]],
+    hit: Callable[[T], Optional[bool]],
+) -> T:
+    """Await ``call()``, recording its latency and outcome under ``layer``."""
+    if scope is None:
+        return await call()
+    start = time.perf_counter()
+    result = await call()
+    scope.record(layer, time.perf_counter() - start, hit(result))
+    return result
+
+
+async def _veto_similarity(
+    scope: Optional[MatchLogScope],
+    nlp_similarity: Callable[[], Awaitable[Optional[float]]],
+    veto_threshold: float,
+) -> Tuple[Optional[float], bool]:
+    """NLP similarity for a veto decision: (similarity, vetoed)."""
+    start = time.perf_counter()
+    sim = await nlp_similarity()
+    vetoed = sim is not None and sim < veto_threshold
+    if scope is not None:
+        seconds = time.perf_counter() - start
+        scope.record("nlp_similarity", seconds)
+        scope.record("veto", seconds, vetoed)
+    return sim, vetoed
+
+
+def _matched(result: Tuple[Any, ...]) -> bool:
+    return bool(result[0])
+
 
 @dataclass
 class LayerEvaluation:
@@ -39,7 +89,8 @@ async def evaluate_layers(
     veto_threshold: float = 0.2,
 ) -> LayerEvaluation:
     """Run direct → heuristic → NLP with optional NLP veto on fuzzy/heuristic hits."""
-    dm, dpath = await direct_eval()
+    scope = current_match_log()
+    dm, dpath = await _timed(scope, "direct", direct_eval, _matched)
 
     if mode == "cascade":
         if dm:
@@ -49,7 +100,7 @@ async def evaluate_layers(
                 confidence=0.95,
                 direct_path=dpath,
             )
-        hm, rule_id = await heuristic_eval()
+        hm, rule_id = await _timed(scope, "heuristic", heuristic_eval, _matched)
         if hm:
             return LayerEvaluation(
                 matched=True,
@@ -58,7 +109,7 @@ async def evaluate_layers(
                 direct_path="none",
                 rule_id=rule_id,
             )
-        if await nlp_match():
+        if await _timed(scope, "nlp_match", nlp_match, bool):
             return LayerEvaluation(
                 matched=True,
                 layer="nlp",
@@ -85,8 +136,8 @@ async def evaluate_layers(
         )
 
     if dm and dpath == "fuzzy":
-        sim = await nlp_similarity()
-        if sim is not None and sim < veto_threshold:
+        sim, vetoed = await _veto_similarity(scope, nlp_similarity, veto_threshold)
+        if vetoed:
             dm = False
             dpath = "none"
             notes_veto.append("nlp_veto:fuzzy_direct")
@@ -101,10 +152,10 @@ async def evaluate_layers(
                 notes=notes_veto,
             )
 
-    hm, rule_id = await heuristic_eval()
+    hm, rule_id = await _timed(scope, "heuristic", heuristic_eval, _matched)
     if hm:
-        sim = await nlp_similarity()
-        if sim is not None and sim < veto_threshold:
+        sim, vetoed = await _veto_similarity(scope, nlp_similarity, veto_threshold)
+        if vetoed:
             notes_veto.append("nlp_veto:heuristic")
         else:
             return LayerEvaluation(
@@ -118,7 +169,7 @@ async def evaluate_layers(
                 notes=notes_veto,
             )
 
-    if await nlp_match():
+    if await _timed(scope, "nlp_match", nlp_match, bool):
         return LayerEvaluation(
             matched=True,
             layer="nlp",
@@ -157,7 +208,8 @@ async def evaluate_layers_supply_tree(
         (confidence, match_type) where match_type is
         direct|heuristic|nlp|partial|no_match
     """
-    dm, dpath = await direct_eval()
+    scope = current_match_log()
+    dm, dpath = await _timed(scope, "direct", direct_eval, _matched)
 
     if require_direct_match:
         if dm:
@@ -170,8 +222,8 @@ async def evaluate_layers_supply_tree(
         if dm and dpath == "strong":
             return (1.0, "direct")
         if dm and dpath == "fuzzy":
-            sim = await nlp_similarity()
-            if sim is not None and sim < veto_threshold:
+            _, vetoed = await _veto_similarity(scope, nlp_similarity, veto_threshold)
+            if vetoed:
                 dm = False
             else:
                 return (1.0, "direct")
@@ -179,19 +231,24 @@ async def evaluate_layers_supply_tree(
     if dm:
         return (1.0, "direct")
 
-    hm, _ = await heuristic_eval()
+    hm, _ = await _timed(scope, "heuristic", heuristic_eval, _matched)
     if use_veto and hm:
-        sim = await nlp_similarity()
-        if sim is not None and sim < veto_threshold:
+        _, vetoed = await _veto_similarity(scope, nlp_similarity, veto_threshold)
+        if vetoed:
             hm = False
 
     if hm:
-        return (0.8, "heuristic")
+        return (SUPPLY_TREE_HEURISTIC_CONFIDENCE, "heuristic")
 
-    if await nlp_match():
+    if await _timed(scope, "nlp_match", nlp_match, bool):
         return (0.7, "nlp")
 
+    start = time.perf_counter()
     sim_partial = partial_similarity()
+    if scope is not None:
+        scope.record(
+            "partial_similarity", time.perf_counter() - start, sim_partial >= 0.3
+        )
     if sim_partial >= 0.3:
         return (sim_partial * 0.6, "partial")
 
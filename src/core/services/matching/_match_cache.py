@@ -0,0 +1,136 @@
+"""
+Memo of single-level match verdicts per (manifest revision, facility revision).
+
+Dashboards and integrations re-run the same OKH against the same facility pool
+over and over; only the ``cache_response`` decorator helped, and only for
+byte-identical requests within its TTL. Whether one facility matches one
+manifest, and the supply tree it yields, is a pure function of the two
+documents' contents, the domain, the extractor, the capability rules, the
+process taxonomy and the matching thresholds, so each facility's verdict is
+memoized under that key. A repeated match is then one lookup per facility.
+
+A catalogue facility's revision is its id plus the OKW ``catalog_version``, so
+any OKW write re-evaluates the pool once; request-supplied facilities and the
+manifest are hashed on every request, so an edit always misses.
+
+No-match verdicts are stored too, so an unchanged non-matching facility costs
+nothing either.
+"""
+
+from __future__ import annotations
+
+import copy
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Optional, Tuple
+from uuid import UUID, uuid4
+
+from src.config.settings import MATCHING_RESULT_CACHE_SIZE
+
+from ...cache.memo import LRUMemo, clear_memos
+from ...matching.capability_rules import rules_version
+from ...models.supply_trees import SupplyTreeSolution
+from ...taxonomy import taxonomy_version
+from ._capability_cache import extractor_version
+
+MATCH_RESULT_MEMO = "matching_results"
+
+
+@dataclass(frozen=True)
+class MatchVerdict:
+    """One facility's outcome against one manifest; ``solution`` None = no match.
+
+    The stored solution is a private copy; :meth:`restore` hands every caller
+    its own copy with fresh supply-tree ids, so results can be mutated,
+    serialized or persisted freely without two requests sharing an id.
+    """
+
+    solution: Optional[SupplyTreeSolution]
+
+    @classmethod
+    def of(cls, solution: Optional[SupplyTreeSolution]) -> "MatchVerdict":
+        return cls(copy.deepcopy(solution))
+
+    def restore(self) -> Optional[SupplyTreeSolution]:
+        if self.solution is None:
+            return None
+        return _with_fresh_tree_ids(copy.deepcopy(self.solution))
+
+
+def _with_fresh_tree_ids(solution: SupplyTreeSolution) -> SupplyTreeSolution:
+    """Give every tree of ``solution`` a new id and rewrite references to it.
+
+    ``deepcopy`` keeps trees shared between ``all_trees``, ``root_trees`` and
+    ``component_mapping`` shared, so each tree object is renamed once.
+    """
+    trees = {id(tree): tree for tree in solution.all_trees}
+    for tree in solution.root_trees or []:
+        trees.setdefault(id(tree), tree)
+    for mapped in (solution.component_mapping or {}).values():
+        for tree in mapped:
+            trees.setdefault(id(tree), tree)
+
+    renamed: Dict[UUID, UUID] = {tree.id: uuid4() for tree in trees.values()}
+
+    def rename(tree_id: Any) -> Any:
+        return renamed.get(tree_id, tree_id)
+
+    for tree in trees.values():
+        tree.id = renamed[tree.id]
+        tree.parent_tree_id = rename(tree.parent_tree_id)
+        tree.child_tree_ids = [rename(child) for child in tree.child_tree_ids]
+    if solution.dependency_graph is not None:
+        solution.dependency_graph = {
+            rename(tree_id): [rename(dep) for dep in deps]
+            for tree_id, deps in solution.dependency_graph.items()
+        }
+    if solution.production_sequence is not None:
+        solution.production_sequence = [
+            [rename(tree_id) for tree_id in stage]
+            for stage in solution.production_sequence
+        ]
+    return solution
+
+
+def new_match_result_cache() -> LRUMemo:
+    """A verdict memo sized from ``MATCHING_RESULT_CACHE_SIZE`` (0 disables it)."""
+    return LRUMemo(MATCH_RESULT_MEMO, MATCHING_RESULT_CACHE_SIZE)
+
+
+def match_result_key(
+    mode: str,
+    manifest_hash: str,
+    facility_id: Any,
+    facility_revision: Hashable,
+    domain: str,
+    extractor: Any,
+    thresholds: Tuple[Hashable, ...],
+) -> Tuple[Hashable, ...]:
+    """Cache key for one (manifest, facility) revision pair.
+
+    ``facility_revision`` is the facility's catalogue version or content hash
+    (see ``MatchingService._facility_revision``).
+
+    ``thresholds`` carries every tunable that can flip a verdict (partial-match
+    threshold, NLP veto settings); the rules and taxonomy versions are read
+    here so a reload moves every key on.
+    """
+    return (
+        mode,
+        manifest_hash,
+        str(facility_id),
+        facility_revision,
+        domain,
+        extractor_version(extractor),
+        rules_version(),
+        taxonomy_version(),
+        *thresholds,
+    )
+
+
+def invalidate_match_results() -> None:
+    """Drop every memoized match verdict (e.g. after a rules reload).
+
+    Content hashes and versions already keep stale entries unreachable; this
+    frees them instead of waiting for LRU eviction.
+    """
+    clear_memos(MATCH_RESULT_MEMO)
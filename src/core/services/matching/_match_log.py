@@ -0,0 +1,192 @@
+"""
+Logging control and aggregated statistics for the matching hot path.
+
+The single-level walk used to log several records per facility and per
+matched pair, each building lists of process names for ``extra=`` whether or
+not the record was emitted; on large pools that cost more than the matching.
+Hot-path records now go through :func:`hot_log`, which checks the level (and
+sampling rate) first and only then builds the payload, and the per-facility
+picture is replaced by one "Matching summary" record per request with counters
+and per-layer timings.
+
+A :class:`MatchLogScope` carries a request's level, sampling rate and
+statistics in a context variable, so the deep call sites (cascade layers,
+supply-tree scoring) need no extra parameters. Nested scopes reuse the
+outermost one, so a request produces exactly one summary; its per-layer
+statistics are then folded into the process-wide ``MetricsTracker`` for
+``/metrics``.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional, Union
+
+from src.config.settings import (
+    MATCHING_HOT_PATH_LOG_LEVEL,
+    MATCHING_HOT_PATH_LOG_SAMPLE_RATE,
+)
+
+from ...errors.metrics import LayerLatency, get_metrics_tracker
+
+Extra = Union[Dict[str, Any], Callable[[], Dict[str, Any]], None]
+
+_current: ContextVar[Optional["MatchLogScope"]] = ContextVar(
+    "matching_log_scope", default=None
+)
+
+
+def _level(value: Union[int, str, None]) -> int:
+    if isinstance(value, int):
+        return value
+    level = logging.getLevelName(str(value or MATCHING_HOT_PATH_LOG_LEVEL).upper())
+    return level if isinstance(level, int) else logging.DEBUG
+
+
+_DEFAULT_LEVEL = _level(None)
+
+
+class _LayerTimer:
+    __slots__ = ("_scope", "_layer", "_start")
+
+    def __init__(self, scope: "MatchLogScope", layer: str) -> None:
+        self._scope = scope
+        self._layer = layer
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter()
+
+    def __exit__(self, *exc: Any) -> None:
+        self._scope.record(self._layer, time.perf_counter() - self._start)
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class MatchLogScope:
+    """One request's hot-path log level, sampling rate and statistics."""
+
+    def __init__(
+        self,
+        level: Union[int, str, None] = None,
+        sample_rate: Optional[float] = None,
+    ) -> None:
+        self.level = _level(level)
+        self.sample_rate = (
+            MATCHING_HOT_PATH_LOG_SAMPLE_RATE if sample_rate is None else sample_rate
+        )
+        self.counters: Counter = Counter()
+        self.layers: Dict[str, LayerLatency] = {}
+        self.started = time.perf_counter()
+
+    def count(self, name: str, n: int = 1) -> None:
+        self.counters[name] += n
+
+    def record(self, layer: str, seconds: float, hit: Optional[bool] = None) -> None:
+        """One call of ``layer``; ``hit`` is its outcome where it has one."""
+        stats = self.layers.get(layer)
+        if stats is None:
+            stats = self.layers[layer] = LayerLatency()
+        stats.observe(seconds, hit)
+
+    def timer(self, layer: str) -> _LayerTimer:
+        return _LayerTimer(self, layer)
+
+    def summary(self, histogram: bool = False) -> Dict[str, Any]:
+        """Counters, per-layer calls/hits/seconds and elapsed time so far."""
+        return {
+            "elapsed_seconds": round(time.perf_counter() - self.started, 6),
+            **dict(self.counters),
+            "layers": {
+                layer: stats.to_dict(histogram=histogram)
+                for layer, stats in sorted(self.layers.items())
+            },
+        }
+
+
+def current_match_log() -> Optional[MatchLogScope]:
+    """The active scope, if a match request is in progress."""
+    return _current.get()
+
+
+@contextmanager
+def match_log_scope(
+    logger: logging.Logger,
+    level: Union[int, str, None] = None,
+    sample_rate: Optional[float] = None,
+    **summary_extra: Any,
+) -> Iterator[MatchLogScope]:
+    """Open a request scope, logging its summary at INFO when it closes.
+
+    The closing scope also records its layer statistics and counters on the
+    global ``MetricsTracker``. Inside an existing scope this yields that scope unchanged (its level and
+    sampling rate win) and logs nothing; the outermost scope reports.
+    """
+    outer = _current.get()
+    if outer is not None:
+        yield outer
+        return
+    scope = MatchLogScope(level, sample_rate)
+    token = _current.set(scope)
+    try:
+        yield scope
+    finally:
+        try:
+            _current.reset(token)
+        except ValueError:
+            # Closed from another context (an async generator finalized by a
+            # different task); that context never saw the scope.
+            pass
+        logger.info("Matching summary", extra={**summary_extra, **scope.summary()})
+        get_metrics_tracker().record_matching(scope.layers, dict(scope.counters))
+
+
+def hot_log(logger: logging.Logger, msg: str, *args: Any, extra: Extra = None) -> None:
+    """Log one hot-path detail record at the request's level, lazily.
+
+    ``args`` are %-formatted by ``logging`` only when the record is emitted;
+    ``extra`` may be a zero-argument callable so its payload is built only
+    then too.
+    """
+    scope = _current.get()
+    level = scope.level if scope is not None else _DEFAULT_LEVEL
+    if not logger.isEnabledFor(level):
+        return
+    rate = scope.sample_rate if scope is not None else MATCHING_HOT_PATH_LOG_SAMPLE_RATE
+    if rate < 1.0 and random.random() >= rate:
+        return
+    logger.log(
+        level,
+        msg,
+        *args,
+        extra=extra() if callable(extra) else extra,
+        stacklevel=2,
+    )
+
+
+def layer_timer(layer: str) -> Union[_LayerTimer, _NullTimer]:
+    """Context manager timing one call of ``layer`` into the active scope."""
+    scope = _current.get()
+    return scope.timer(layer) if scope is not None else _NULL_TIMER
+
+
+def count_match_event(name: str, n: int = 1) -> None:
+    """Add ``n`` to counter ``name`` of the active scope, if any."""
+    scope = _current.get()
+    if scope is not None:
+        scope.count(name, n)
@@ -0,0 +1,60 @@
+"""
+Memo of cascade verdicts per normalized (requirement, capability) pair.
+
+The direct → heuristic → NLP cascade is a pure function of the two normalized
+process names, the domain, the cascade mode/veto threshold and the loaded
+capability rules. Process vocabularies are small, so the same pairs recur
+across facilities, requests and call sites; after warm-up nearly every pair is
+a dictionary hit instead of a cascade run.
+"""
+
+from __future__ import annotations
+
+from typing import Hashable, Tuple
+
+from src.config.settings import MATCHING_PAIR_CACHE_SIZE
+
+from ...cache.memo import LRUMemo, clear_memos
+from ...matching.capability_rules import rules_version
+
+PAIR_VERDICT_MEMO = "matching_pair_verdicts"
+
+
+def new_pair_verdict_cache() -> LRUMemo:
+    """A verdict memo sized from ``MATCHING_PAIR_CACHE_SIZE`` (0 disables it)."""
+    return LRUMemo(PAIR_VERDICT_MEMO, MATCHING_PAIR_CACHE_SIZE)
+
+
+def pair_verdict_key(
+    kind: str,
+    req_process: str,
+    cap_process: str,
+    domain: str,
+    mode: str,
+    veto_threshold: float,
+    *extra: Hashable,
+) -> Tuple[Hashable, ...]:
+    """Cache key for one pair under the current rules version.
+
+    ``kind`` separates the boolean cascade (``"layers"``) from supply-tree
+    scoring (``"supply_tree"``), which returns a different shape.
+    """
+    return (
+        kind,
+        req_process,
+        cap_process,
+        domain,
+        mode,
+        veto_threshold,
+        rules_version(),
+        *extra,
+    )
+
+
+def invalidate_pair_verdicts() -> None:
+    """Drop every memoized verdict (e.g. after a rules reload).
+
+    Entries would already be unreachable once the rules version moves on; this
+    frees them instead of waiting for LRU eviction.
+    """
+    clear_memos(PAIR_VERDICT_MEMO)
@@ -1,8 +1,26 @@
-from typing import Any, Dict, List, Literal, Optional, Set, Tuple
-from uuid import UUID
+import asyncio
+import heapq
+from collections import Counter, deque
+from dataclasses import dataclass, replace
+from typing import (
+    Any,
+    AsyncIterator,
+    Deque,
+    Dict,
+    Hashable,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+from uuid import UUID, uuid4
 
 from src.config.settings import (
     MAX_DEPTH,
+    MATCHING_COMPONENT_CONCURRENCY,
+    MATCHING_FACILITY_CONCURRENCY,
     MATCHING_NLP_VETO_ENABLED,
     MATCHING_NLP_VETO_THRESHOLD,
     MATCHING_PREINIT_NLP,
@@ -11,9 +29,19 @@ from src.config.settings import (
 from ..domains.cooking.direct_matcher import CookingDirectMatcher
 from ..domains.manufacturing.direct_matcher import MfgDirectMatcher
 from ..matching.capability_rules import CapabilityMatcher, CapabilityRuleManager
+from ..matching.facility_cover import (
+    COMBINATION_STRATEGIES,
+    COMBINATION_STRATEGY_EXACT,
+    COMBINATION_STRATEGY_GREEDY,
+    exact_cover,
+    greedy_cover,
+    indices_of,
+)
+from ..matching.design_index import DesignProcessIndex
 from ..matching.match_modes import (
     MATCH_MODE_FACILITY_COMBINATION,
     MATCH_MODE_NESTED,
+    MATCH_MODE_SINGLE_LEVEL,
 )
 from ..matching.nlp_matcher import NLPMatcher
 from ..models.bom import Component
@@ -32,12 +60,75 @@ from ..services.bom_resolution_service import BOMResolutionService
 from ..services.domain_service import DomainDetector
 from ..taxonomy import taxonomy
 from ..utils.logging import get_logger
-from .matching import evaluate_layers, evaluate_layers_supply_tree
+from .matching import (
+    FacilityCapabilities,
+    SUPPLY_TREE_HEURISTIC_CONFIDENCE,
+    LayerEvaluation,
+    MatchVerdict,
+    capability_cache_key,
+    count_match_event,
+    evaluate_layers,
+    document_digest,
+    evaluate_layers_supply_tree,
+    hot_log,
+    layer_timer,
+    match_log_scope,
+    match_result_key,
+    new_facility_capability_cache,
+    new_match_result_cache,
+    new_pair_verdict_cache,
+    pair_verdict_key,
+)
 from .okh_service import OKHService
 from .okw_service import OKWService
 
 logger = get_logger(__name__)
 
+# Partial-match threshold: a facility must satisfy this fraction of requirement
+# occurrences to be considered a candidate.  Using occurrence counts (not
+# deduplicated) ensures that the dominant process type carries the most weight
+# — e.g. a laser-cut project with 5 "LASER" requirements and 1 "Assembly"
+# requirement scores 83 % against a laser cutting facility (5/6 > 0.6).
+PARTIAL_MATCH_THRESHOLD = 0.6
+
+
+@dataclass
+class MatchEvent:
+    """One event from :meth:`MatchingService.iter_matches_with_manifest`.
+
+    ``kind`` is ``"progress"`` or ``"solution"``. ``processed_facilities`` is
+    the 1-based position in the facility list the event refers to; solution
+    events also carry the accepted solution and its facility.
+    """
+
+    kind: Literal["progress", "solution"]
+    processed_facilities: int
+    total_facilities: int
+    solution: Optional[SupplyTreeSolution] = None
+    facility: Optional[ManufacturingFacility] = None
+
+    @property
+    def progress_pct(self) -> float:
+        if not self.total_facilities:
+            return 100.0
+        return round((self.processed_facilities / self.total_facilities) * 100, 1)
+
+
+@dataclass
+class ManifestMatchResult:
+    """One manifest's outcome from :meth:`MatchingService.match_many`.
+
+    ``index`` is the manifest's position in the input sequence (results are
+    yielded in completion order). ``error`` is set, and ``solutions`` empty,
+    when that manifest could not be matched.
+    """
+
+    index: int
+    manifest: OKHManifest
+    domain: Optional[str]
+    solutions: Set[SupplyTreeSolution]
+    error: Optional[str] = None
+
 
 class MatchingService:
     """Match OKH (or domain) requirements against OKW capabilities.
@@ -64,6 +155,17 @@ class MatchingService:
         }
         self.okh_service: Optional[OKHService] = None
         self.okw_service: Optional[OKWService] = None
+        # Cascade verdicts per normalized (requirement, capability) pair; see
+        # matching/_verdict_cache.py. NLP timeouts and layers that fell back
+        # after an exception bump the counters below, so a verdict computed
+        # under either is not memoized (see _degradation_mark).
+        self._pair_verdicts = new_pair_verdict_cache()
+        self._capability_memo = new_facility_capability_cache()
+        # Single-level verdicts per (manifest, facility) revision pair; see
+        # matching/_match_cache.py.
+        self._match_results = new_match_result_cache()
+        self._nlp_timeouts = 0
+        self._layer_failures = 0
 
     @classmethod
     async def get_instance(
@@ -202,19 +304,69 @@ class MatchingService:
         optimization_criteria: Optional[Dict[str, float]] = None,
         explicit_domain: Optional[str] = None,
         max_solutions: Optional[int] = None,
+        max_workers: Optional[int] = None,
     ) -> Set[SupplyTreeSolution]:
         """Run domain detection, requirement extraction, and per-facility matching.
 
+        Collects :meth:`iter_matches_with_manifest`; see there for the walk.
+
         Args:
             okh_manifest: In-memory OKH to match.
             facilities: Candidate facilities (OKW) to evaluate.
             optimization_criteria: Optional scoring weights.
             explicit_domain: When set, skips content-based domain detection.
             max_solutions: Optional early-stop count for matched facilities.
+            max_workers: Facilities evaluated concurrently (defaults to
+                ``MATCHING_FACILITY_CONCURRENCY``). Any value yields the same
+                solutions in the same order as a sequential walk.
 
         Returns:
             Distinct ``SupplyTreeSolution`` objects (deduplicated by facility where applicable).
 
+        Raises:
+            RuntimeError: If the service was not initialized.
+        """
+        solutions: Set[SupplyTreeSolution] = set()
+        async for event in self.iter_matches_with_manifest(
+            okh_manifest,
+            facilities,
+            optimization_criteria=optimization_criteria,
+            explicit_domain=explicit_domain,
+            max_solutions=max_solutions,
+            max_workers=max_workers,
+        ):
+            if event.solution is not None:
+                solutions.add(event.solution)
+        return solutions
+
+    async def iter_matches_with_manifest(
+        self,
+        okh_manifest: OKHManifest,
+        facilities: List[ManufacturingFacility],
+        optimization_criteria: Optional[Dict[str, float]] = None,
+        explicit_domain: Optional[str] = None,
+        max_solutions: Optional[int] = None,
+        max_workers: Optional[int] = None,
+    ) -> AsyncIterator["MatchEvent"]:
+        """Single-level matching as a stream of progress and solution events.
+
+        A ``"solution"`` event is yielded as soon as a facility is accepted, in
+        the same order :meth:`find_matches_with_manifest` would add it, and a
+        ``"progress"`` event wherever the walk logs "Matching progress".
+        Closing the iterator early cancels the facilities still in flight.
+
+        Args:
+            okh_manifest: In-memory OKH to match.
+            facilities: Candidate facilities (OKW) to evaluate.
+            optimization_criteria: Optional scoring weights.
+            explicit_domain: When set, skips content-based domain detection.
+            max_solutions: Optional early-stop count for matched facilities.
+            max_workers: Facilities evaluated concurrently (defaults to
+                ``MATCHING_FACILITY_CONCURRENCY``).
+
+        Yields:
+            :class:`MatchEvent` objects.
+
         Raises:
             RuntimeError: If the service was not initialized.
         """
@@ -229,149 +381,777 @@ class MatchingService:
         )
 
         try:
-            # Detect domain from the inputs
-            domain = await self._detect_domain_for_matching(
-                okh_manifest, facilities, explicit_domain
-            )
+            with match_log_scope(
+                logger,
+                matching_mode=MATCH_MODE_SINGLE_LEVEL,
+                total_facilities=len(facilities),
+            ):
+                domain, extractor, requirements = await self._prepare_manifest_match(
+                    okh_manifest, facilities, explicit_domain
+                )
 
-            # Get the domain services
-            domain_services = DomainRegistry.get_domain_services(domain)
-            extractor = domain_services.extractor
+                solutions = set()
+                # Track processed facility IDs to avoid duplicates
+                processed_facility_ids: Set[UUID] = set()
+                # Verdicts are memoized per facility revision, so a repeat of this
+                # match only re-evaluates what changed since the last run.
+                manifest_hash = self._content_hash(okh_manifest)
+                reused = 0
+
+                total_facilities = len(facilities)
+                progress_step = (
+                    10 if total_facilities >= 10 else max(1, total_facilities)
+                )
+                workers = max(
+                    1,
+                    int(
+                        max_workers
+                        if max_workers is not None
+                        else MATCHING_FACILITY_CONCURRENCY
+                    ),
+                )
 
-            # Extract requirements using the domain extractor
-            manifest_data = okh_manifest.to_dict()
-            extraction_result = extractor.extract_requirements(manifest_data)
-            requirements = (
-                extraction_result.data.content.get("process_requirements", [])
-                if extraction_result.data
-                else []
-            )
+                async def evaluate(
+                    facility: ManufacturingFacility,
+                ) -> Optional[SupplyTreeSolution]:
+                    nonlocal reused
+                    solution, hit = await self._match_facility(
+                        okh_manifest,
+                        facility,
+                        requirements,
+                        extractor,
+                        domain,
+                        manifest_hash,
+                        offload=workers > 1,
+                    )
+                    reused += hit
+                    return solution
+
+                # Facilities are evaluated through a window of at most ``workers``
+                # in-flight tasks, and results are consumed strictly in input order.
+                # That keeps the result set, its insertion order and the
+                # max_solutions cut-off identical to a sequential walk; work still in
+                # flight past the cut-off is cancelled and discarded.
+                facility_iter = iter(enumerate(facilities, start=1))
+                in_flight: Deque[Tuple[int, ManufacturingFacility, "asyncio.Task"]] = (
+                    deque()
+                )
+                progress: List[MatchEvent] = []
+
+                def schedule() -> None:
+                    while len(in_flight) < workers:
+                        nxt = next(facility_iter, None)
+                        if nxt is None:
+                            return
+                        idx, facility = nxt
+                        if (
+                            idx == 1
+                            or idx % progress_step == 0
+                            or idx == total_facilities
+                        ):
+                            event = MatchEvent("progress", idx, total_facilities)
+                            logger.info(
+                                "Matching progress",
+                                extra={
+                                    "processed_facilities": idx,
+                                    "total_facilities": total_facilities,
+                                    "progress_pct": event.progress_pct,
+                                },
+                            )
+                            progress.append(event)
+                        # Skip if we've already processed this facility ID
+                        if facility.id in processed_facility_ids:
+                            count_match_event("duplicates_skipped")
+                            hot_log(
+                                logger,
+                                "Skipping duplicate facility %s (%s)",
+                                facility.id,
+                                facility.name,
+                            )
+                            continue
+                        processed_facility_ids.add(facility.id)
+                        in_flight.append(
+                            (idx, facility, asyncio.ensure_future(evaluate(facility)))
+                        )
 
-            logger.info(
-                "Extracted requirements from OKH manifest",
-                extra={
-                    "requirement_count": len(requirements),
-                    "requirements": [
-                        (
-                            req.get("process_name", "")
-                            if isinstance(req, dict)
-                            else str(req)
+                try:
+                    schedule()
+                    while progress:
+                        yield progress.pop(0)
+                    while in_flight:
+                        idx, facility, task = in_flight.popleft()
+                        solution = await task
+                        if solution is not None:
+                            solutions.add(solution)
+                            hot_log(
+                                logger,
+                                "Found matching facility",
+                                extra=lambda: {
+                                    "facility_id": str(facility.id),
+                                    "confidence_score": solution.score,
+                                },
+                            )
+                            yield MatchEvent(
+                                "solution",
+                                idx,
+                                total_facilities,
+                                solution=solution,
+                                facility=facility,
+                            )
+                            if (
+                                max_solutions is not None
+                                and len(solutions) >= max_solutions
+                            ):
+                                logger.info(
+                                    "Early stop: max_solutions reached",
+                                    extra={
+                                        "max_solutions": max_solutions,
+                                        "processed_facilities": idx,
+                                        "total_facilities": total_facilities,
+                                    },
+                                )
+                                break
+                        schedule()
+                        while progress:
+                            yield progress.pop(0)
+                finally:
+                    for _, _, task in in_flight:
+                        task.cancel()
+                    if in_flight:
+                        await asyncio.gather(
+                            *(task for _, _, task in in_flight), return_exceptions=True
                         )
-                        for req in requirements
-                    ],
-                },
+                logger.info(
+                    "Match finding completed",
+                    extra={
+                        "solution_count": len(solutions),
+                        "reused_verdicts": reused,
+                        "evaluated_facilities": len(processed_facility_ids),
+                    },
+                )
+
+        except Exception as e:
+            logger.error(
+                "Error finding matches (in-memory manifest)",
+                extra={"error": str(e)},
+                exc_info=True,
             )
+            raise
 
-            solutions = set()
-            # Track processed facility IDs to avoid duplicates
-            processed_facility_ids: Set[UUID] = set()
+    async def find_top_matches_with_manifest(
+        self,
+        okh_manifest: OKHManifest,
+        facilities: List[ManufacturingFacility],
+        k: int,
+        explicit_domain: Optional[str] = None,
+        max_workers: Optional[int] = None,
+    ) -> List[SupplyTreeSolution]:
+        """The ``k`` best-scoring single-level solutions, best first.
+
+        ``max_solutions`` on :meth:`find_matches_with_manifest` keeps the first
+        facilities that pass the threshold; this keeps the best ones. Each
+        facility first gets a cheap upper bound on its supply-tree score
+        (:meth:`_supply_tree_score_bound`: direct layer and memoized verdicts
+        only). Facilities are evaluated in descending bound order against a
+        bounded min-heap of the best ``k`` so far, and the walk stops once no
+        remaining bound can displace the heap's minimum, so the NLP layer and
+        supply-tree generation never run for facilities that cannot make the
+        list. The result equals evaluating every facility and taking the top
+        ``k`` by (score, input order).
 
-            total_facilities = len(facilities)
-            progress_step = 10 if total_facilities >= 10 else max(1, total_facilities)
+        Args:
+            okh_manifest: In-memory OKH to match.
+            facilities: Candidate facilities (OKW) to evaluate.
+            k: Number of solutions to keep.
+            explicit_domain: When set, skips content-based domain detection.
+            max_workers: Facilities evaluated concurrently (defaults to
+                ``MATCHING_FACILITY_CONCURRENCY``).
 
-            for idx, facility in enumerate(facilities, start=1):
-                if idx == 1 or idx % progress_step == 0 or idx == total_facilities:
-                    logger.info(
-                        "Matching progress",
-                        extra={
-                            "processed_facilities": idx,
-                            "total_facilities": total_facilities,
-                            "progress_pct": (
-                                round((idx / total_facilities) * 100, 1)
-                                if total_facilities
-                                else 100.0
-                            ),
-                        },
-                    )
-                # Skip if we've already processed this facility ID
-                if facility.id in processed_facility_ids:
-                    logger.debug(
-                        f"Skipping duplicate facility {facility.id} ({facility.name})",
-                        extra={
-                            "facility_id": str(facility.id),
-                            "facility_name": facility.name,
-                        },
-                    )
-                    continue
+        Returns:
+            Up to ``k`` solutions, highest score first (ties in input order).
 
-                processed_facility_ids.add(facility.id)
+        Raises:
+            RuntimeError: If the service was not initialized.
+        """
+        await self.ensure_initialized()
+        if k <= 0:
+            return []
 
-                logger.debug(
-                    "Checking facility for matches",
-                    extra={
-                        "facility_id": str(facility.id),
-                        "facility_name": facility.name,
-                    },
+        with match_log_scope(
+            logger, matching_mode="top-k", total_facilities=len(facilities), k=k
+        ):
+            try:
+                domain, extractor, requirements = await self._prepare_manifest_match(
+                    okh_manifest, facilities, explicit_domain
                 )
-                # Extract capabilities using the domain extractor
-                facility_data = facility.to_dict()
-                extraction_result = extractor.extract_capabilities(facility_data)
-                capabilities = (
-                    extraction_result.data.content.get("capabilities", [])
-                    if extraction_result.data
-                    else []
+                manifest_hash = self._content_hash(okh_manifest)
+                workers = max(
+                    1,
+                    int(
+                        max_workers
+                        if max_workers is not None
+                        else MATCHING_FACILITY_CONCURRENCY
+                    ),
                 )
 
+                # First occurrence of each facility id, as in the sequential walk.
+                candidates: List[Tuple[float, int, ManufacturingFacility]] = []
+                seen: Set[Any] = set()
+                for idx, facility in enumerate(facilities):
+                    if facility.id in seen:
+                        continue
+                    seen.add(facility.id)
+                    bound = await self._supply_tree_score_bound(
+                        okh_manifest, facility, domain
+                    )
+                    candidates.append((bound, idx, facility))
+                candidates.sort(key=lambda c: (-c[0], c[1]))
+
+                # Min-heap of (score, -input index, solution): the root is the
+                # entry the next facility has to beat.
+                best: List[Tuple[float, int, SupplyTreeSolution]] = []
+                in_flight: Deque[Tuple[int, "asyncio.Task"]] = deque()
+                evaluated = 0
+
+                def schedule() -> None:
+                    nonlocal evaluated
+                    while len(in_flight) < workers and evaluated < len(candidates):
+                        bound, idx, facility = candidates[evaluated]
+                        if len(best) >= k and (bound, -idx) <= best[0][:2]:
+                            # Candidates are in (bound desc, index asc) order, so
+                            # nothing from here on can enter the heap either.
+                            del candidates[evaluated:]
+                            return
+                        evaluated += 1
+                        in_flight.append(
+                            (
+                                idx,
+                                asyncio.ensure_future(
+                                    self._match_facility(
+                                        okh_manifest,
+                                        facility,
+                                        requirements,
+                                        extractor,
+                                        domain,
+                                        manifest_hash,
+                                        offload=workers > 1,
+                                    )
+                                ),
+                            )
+                        )
+
+                try:
+                    schedule()
+                    while in_flight:
+                        idx, task = in_flight.popleft()
+                        solution, _ = await task
+                        if solution is not None:
+                            entry = (solution.score, -idx, solution)
+                            if len(best) < k:
+                                heapq.heappush(best, entry)
+                            elif entry[:2] > best[0][:2]:
+                                heapq.heapreplace(best, entry)
+                        schedule()
+                finally:
+                    for _, task in in_flight:
+                        task.cancel()
+                    if in_flight:
+                        await asyncio.gather(
+                            *(task for _, task in in_flight), return_exceptions=True
+                        )
+
                 logger.info(
-                    f"Extracted capabilities for facility {facility.name}",
+                    "Top-k match finding completed",
                     extra={
-                        "facility_id": str(facility.id),
-                        "facility_name": facility.name,
-                        "capability_count": len(capabilities),
-                        "capabilities": [
-                            cap.get("process_name", "")
-                            for cap in capabilities
-                            if isinstance(cap, dict)
-                        ],
+                        "k": k,
+                        "solution_count": len(best),
+                        "evaluated_facilities": evaluated,
+                        "total_facilities": len(seen),
                     },
                 )
+                return [
+                    entry[2]
+                    for entry in sorted(best, key=lambda e: e[:2], reverse=True)
+                ]
 
-                if await self._can_satisfy_requirements(
-                    requirements, capabilities, domain
-                ):
+            except Exception as e:
+                logger.error(
+                    "Error finding top matches (in-memory manifest)",
+                    extra={"error": str(e)},
+                    exc_info=True,
+                )
+                raise
+
+    async def _supply_tree_score_bound(
+        self,
+        okh_manifest: OKHManifest,
+        facility: ManufacturingFacility,
+        domain: str,
+    ) -> float:
+        """Upper bound on the confidence :meth:`_generate_supply_tree` can give.
+
+        Mirrors its averaging over ``manufacturing_processes``, but scores each
+        pair from the verdict memo when present and otherwise from the direct
+        layer alone: 1.0 for a direct hit, else the best any later layer could
+        give (``SUPPLY_TREE_HEURISTIC_CONFIDENCE``), or 0.0 for URI pairs, which
+        only match directly.
+        """
+        process_requirements = okh_manifest.manufacturing_processes or []
+        if not process_requirements:
+            return 0.7 if domain == "cooking" else 0.0
+        capabilities = [
+            self._normalize_process_name(c).lower().strip()
+            for c in self._supply_tree_capabilities(facility)
+        ]
+
+        def is_uri(value: str) -> bool:
+            return value.startswith("http://") or value.startswith("https://")
+
+        total = 0.0
+        for process_name in process_requirements:
+            if not isinstance(process_name, str):
+                continue
+            req = self._normalize_process_name(process_name).lower().strip()
+            best = 0.0
+            for cap in capabilities:
+                direct_only = is_uri(req) or is_uri(cap)
+                cached = self._pair_verdicts.get(
+                    self._supply_tree_pair_key(req, cap, domain, direct_only)
+                )
+                if cached is not None:
+                    bound = cached[0]
+                elif (await self._direct_match_evaluate(req, cap, domain))[0]:
+                    bound = 1.0
+                else:
+                    bound = 0.0 if direct_only else SUPPLY_TREE_HEURISTIC_CONFIDENCE
+                best = max(best, bound)
+                if best >= 1.0:
+                    break
+            total += best
+        return max(0.0, min(1.0, total / len(process_requirements)))
+
+    async def _prepare_manifest_match(
+        self,
+        okh_manifest: OKHManifest,
+        facilities: List[ManufacturingFacility],
+        explicit_domain: Optional[str],
+    ) -> Tuple[str, Any, List[Dict[str, Any]]]:
+        """Detect the domain and extract the manifest's requirements.
+
+        Returns:
+            ``(domain, extractor, requirements)``.
+        """
+        # Detect domain from the inputs
+        domain = await self._detect_domain_for_matching(
+            okh_manifest, facilities, explicit_domain
+        )
+
+        # Get the domain services
+        domain_services = DomainRegistry.get_domain_services(domain)
+        extractor = domain_services.extractor
+
+        # Extract requirements using the domain extractor
+        requirements = self._extract_manifest_requirements(extractor, okh_manifest)
+
+        logger.info(
+            "Extracted requirements from OKH manifest",
+            extra={
+                "requirement_count": len(requirements),
+                "requirements": [
+                    (req.get("process_name", "") if isinstance(req, dict) else str(req))
+                    for req in requirements
+                ],
+            },
+        )
+        return domain, extractor, requirements
+
+    async def _match_facility(
+        self,
+        okh_manifest: OKHManifest,
+        facility: ManufacturingFacility,
+        requirements: List[Dict[str, Any]],
+        extractor: Any,
+        domain: str,
+        manifest_hash: Optional[str],
+        offload: bool = False,
+    ) -> Tuple[Optional[SupplyTreeSolution], bool]:
+        """Single-level verdict for one facility: (solution or None, memo hit).
+
+        ``offload`` runs capability extraction in a worker thread.
+        """
+        hot_log(
+            logger,
+            "Checking facility for matches",
+            extra=lambda: {
+                "facility_id": str(facility.id),
+                "facility_name": facility.name,
+            },
+        )
+        count_match_event("facilities_evaluated")
+        verdict_key = self._match_result_key(manifest_hash, facility, domain, extractor)
+        if verdict_key is not None:
+            cached = self._match_results.get(verdict_key)
+            if cached is not None:
+                count_match_event("verdicts_reused")
+                solution = cached.restore()
+                if solution is not None:
+                    count_match_event("facilities_matched")
+                return solution, True
+        degraded_before = self._degradation_mark()
+
+        # Extract capabilities using the domain extractor. to_dict() and
+        # extraction are synchronous CPU work, so with concurrent
+        # evaluation they run off the event loop.
+        with layer_timer("extraction"):
+            if offload:
+                capabilities = await asyncio.to_thread(
+                    self._extract_facility_capabilities, extractor, facility, domain
+                )
+            else:
+                capabilities = self._extract_facility_capabilities(
+                    extractor, facility, domain
+                )
+
+        hot_log(
+            logger,
+            "Extracted capabilities for facility %s",
+            facility.name,
+            extra=lambda: {
+                "facility_id": str(facility.id),
+                "facility_name": facility.name,
+                "capability_count": len(capabilities),
+                "capabilities": [
+                    cap.get("process_name", "")
+                    for cap in capabilities
+                    if isinstance(cap, dict)
+                ],
+            },
+        )
+
+        solution = None
+        with layer_timer("requirement_check"):
+            satisfied = await self._can_satisfy_requirements(
+                requirements, capabilities, domain
+            )
+        if satisfied:
+            count_match_event("facilities_matched")
+            with layer_timer("supply_tree"):
+                tree = await self._generate_supply_tree(okh_manifest, facility, domain)
+            # Use factory method for single-tree solution (backward compatible)
+            solution = SupplyTreeSolution.from_single_tree(
+                tree=tree,
+                score=tree.confidence_score,  # Use tree's confidence score
+                metrics={
+                    "facility_count": 1,
+                    "requirement_count": len(requirements),
+                    "capability_count": len(capabilities),
+                },
+            )
+        # A verdict reached under an NLP timeout or a layer fallback is not final.
+        if verdict_key is not None and self._degradation_mark() == degraded_before:
+            self._match_results.set(verdict_key, MatchVerdict.of(solution))
+        return solution, False
+
+    @staticmethod
+    def _content_hash(document: Any) -> Optional[str]:
+        """Content digest of a model with ``to_dict``, or None.
+
+        Computed on every call: models are mutable, so a digest remembered per
+        object would outlive an in-place edit.
+        """
+        return document_digest(document)
+
+    def _facility_revision(self, facility: Any) -> Optional[Hashable]:
+        """Cache revision of one facility: its catalogue version, else its content hash.
+
+        An unedited catalogue record is keyed as ``("catalog", version)`` with
+        its id alongside, skipping serialization; anything else (inline
+        facilities, MoM stubs, edited copies) is hashed on every request.
+        """
+        if self.okw_service is not None:
+            version = self.okw_service.catalog_revision(facility)
+            if version is not None:
+                return ("catalog", version)
+        return self._content_hash(facility)
+
+    def _match_result_key(
+        self,
+        manifest_hash: Optional[str],
+        facility: ManufacturingFacility,
+        domain: str,
+        extractor: Any,
+    ) -> Optional[Tuple[Any, ...]]:
+        """Verdict-memo key for one facility, or None when it cannot be cached."""
+        if manifest_hash is None:
+            return None
+        facility_revision = self._facility_revision(facility)
+        if facility_revision is None:
+            return None
+        return match_result_key(
+            MATCH_MODE_SINGLE_LEVEL,
+            manifest_hash,
+            facility.id,
+            facility_revision,
+            domain,
+            extractor,
+            (
+                PARTIAL_MATCH_THRESHOLD,
+                MATCHING_NLP_VETO_ENABLED,
+                MATCHING_NLP_VETO_THRESHOLD,
+            ),
+        )
+
+    def _facility_capabilities(
+        self, extractor: Any, facility: ManufacturingFacility, domain: str
+    ) -> FacilityCapabilities:
+        """Extracted capabilities and normalized process terms for one facility.
+
+        Memoized per facility revision (id, catalogue version or content hash,
+        domain, extractor), so extraction runs once per facility edit rather
+        than once per request.
+        """
+        key = capability_cache_key(
+            facility.id, self._facility_revision(facility), domain, extractor
+        )
+        cached = self._capability_memo.get(key)
+        if cached is not None:
+            return cached
+        extraction_result = extractor.extract_capabilities(facility.to_dict())
+        capabilities = (
+            extraction_result.data.content.get("capabilities", [])
+            if extraction_result.data and extraction_result.data.content
+            else []
+        )
+        entry = FacilityCapabilities(
+            capabilities=tuple(capabilities),
+            terms=tuple(
+                self._process_terms(self._normalize_capability_list(capabilities))
+            ),
+        )
+        self._capability_memo.set(key, entry)
+        return entry
+
+    def _extract_facility_capabilities(
+        self, extractor: Any, facility: ManufacturingFacility, domain: str
+    ) -> List[Dict[str, Any]]:
+        """Run the domain extractor over one facility and return its capability list."""
+        return list(
+            self._facility_capabilities(extractor, facility, domain).capabilities
+        )
+
+    def _extract_manifest_requirements(
+        self, extractor: Any, okh_manifest: OKHManifest
+    ) -> List[Dict[str, Any]]:
+        """Run the domain extractor over one manifest and return its process requirements."""
+        extraction_result = extractor.extract_requirements(okh_manifest.to_dict())
+        return (
+            extraction_result.data.content.get("process_requirements", [])
+            if extraction_result.data
+            else []
+        )
+
+    def _process_terms(self, items: List[Dict[str, Any]]) -> List[str]:
+        """Normalized, non-empty process names of requirement/capability dicts, in order."""
+        terms = []
+        for item in items:
+            raw = item.get("process_name", "").strip()
+            term = self._normalize_process_name(raw).lower().strip()
+            if term:
+                terms.append(term)
+        return terms
+
+    async def match_many(
+        self,
+        manifests: Sequence[OKHManifest],
+        facilities: List[ManufacturingFacility],
+        explicit_domain: Optional[str] = None,
+        max_solutions: Optional[int] = None,
+        max_workers: Optional[int] = None,
+    ) -> AsyncIterator[ManifestMatchResult]:
+        """Match many manifests against one facility pool, streaming results.
+
+        Gives each manifest the solutions :meth:`find_matches_with_manifest`
+        would, but shares the work that repeats across manifests: every
+        facility's capabilities are extracted once per domain, facilities with
+        the same capability terms are evaluated once, and each distinct
+        requirement term is checked against each distinct capability set once.
+        The resulting coverage matrix (requirement term × capability set) is
+        then scored per manifest with the usual partial-match threshold.
+
+        Args:
+            manifests: In-memory OKH manifests to match.
+            facilities: Candidate facilities shared by every manifest.
+            explicit_domain: When set, skips content-based domain detection.
+            max_solutions: Optional per-manifest early-stop count.
+            max_workers: Manifests whose supply trees are built concurrently
+                (defaults to ``MATCHING_FACILITY_CONCURRENCY``).
+
+        Yields:
+            One :class:`ManifestMatchResult` per manifest, as each finishes.
+
+        Raises:
+            RuntimeError: If the service was not initialized.
+        """
+        await self.ensure_initialized()
+
+        # Same de-duplication as the single-manifest walk: first occurrence wins.
+        pool: List[ManufacturingFacility] = []
+        seen_ids: Set[Any] = set()
+        for facility in facilities:
+            if facility.id in seen_ids:
+                continue
+            seen_ids.add(facility.id)
+            pool.append(facility)
+
+        consensus = None
+        if not explicit_domain:
+            domains = {
+                getattr(f, "domain", None)
+                or (f.to_dict().get("domain") if hasattr(f, "to_dict") else None)
+                for f in pool
+            }
+            domains.discard(None)
+            consensus = domains.pop() if len(domains) == 1 else None
+
+        # Requirement terms per manifest, grouped by the manifest's domain.
+        pending: List[ManifestMatchResult] = []
+        requirements: Dict[int, Tuple[List[Dict[str, Any]], List[str]]] = {}
+        extractors: Dict[str, Any] = {}
+        for index, manifest in enumerate(manifests):
+            result = ManifestMatchResult(
+                index=index, manifest=manifest, domain=None, solutions=set()
+            )
+            pending.append(result)
+            try:
+                result.domain = await self._detect_domain_for_matching(
+                    manifest,
+                    pool,
+                    explicit_domain or getattr(manifest, "domain", None) or consensus,
+                )
+                if result.domain not in extractors:
+                    extractors[result.domain] = DomainRegistry.get_domain_services(
+                        result.domain
+                    ).extractor
+                req_list = self._normalize_requirement_list(
+                    self._extract_manifest_requirements(
+                        extractors[result.domain], manifest
+                    )
+                )
+                requirements[index] = (req_list, self._process_terms(req_list))
+            except Exception as e:
+                result.error = f"{type(e).__name__}: {e}"
+
+        # Capability sets per domain: facility -> signature of its capability
+        # terms, and the coverage of each distinct requirement term per signature.
+        signatures: Dict[str, List[Tuple[str, ...]]] = {}
+        capability_counts: Dict[str, List[int]] = {}
+        coverage: Dict[str, Dict[str, Dict[Tuple[str, ...], bool]]] = {}
+        for domain, extractor in extractors.items():
+            vocabulary = {
+                term
+                for result in pending
+                if result.domain == domain and result.index in requirements
+                for term in requirements[result.index][1]
+            }
+            if not vocabulary:
+                continue
+            domain_signatures, counts = [], []
+            for facility in pool:
+                extracted = self._facility_capabilities(extractor, facility, domain)
+                counts.append(len(extracted.capabilities))
+                domain_signatures.append(tuple(dict.fromkeys(extracted.terms)))
+            signatures[domain] = domain_signatures
+            capability_counts[domain] = counts
+
+            matrix: Dict[str, Dict[Tuple[str, ...], bool]] = {}
+            distinct = list(dict.fromkeys(domain_signatures))
+            for term in sorted(vocabulary):
+                row: Dict[Tuple[str, ...], bool] = {}
+                for signature in distinct:
+                    covered = False
+                    for cap_term in signature:
+                        if (await self._evaluate_pair(term, cap_term, domain)).matched:
+                            covered = True
+                            break
+                    row[signature] = covered
+                matrix[term] = row
+            coverage[domain] = matrix
+
+            logger.info(
+                "Batch coverage matrix computed",
+                extra={
+                    "domain": domain,
+                    "requirement_terms": len(vocabulary),
+                    "capability_sets": len(distinct),
+                    "facility_count": len(pool),
+                },
+            )
+
+        async def finish(result: ManifestMatchResult) -> ManifestMatchResult:
+            if result.error is not None:
+                return result
+            req_list, terms = requirements[result.index]
+            if not terms:
+                return result
+            occurrences = Counter(terms)
+            matrix = coverage[result.domain]
+            for position, facility in enumerate(pool):
+                signature = signatures[result.domain][position]
+                satisfied = sum(
+                    count
+                    for term, count in occurrences.items()
+                    if matrix[term][signature]
+                )
+                if satisfied / len(terms) < PARTIAL_MATCH_THRESHOLD:
+                    continue
+                try:
                     tree = await self._generate_supply_tree(
-                        okh_manifest, facility, domain
+                        result.manifest, facility, result.domain
                     )
-                    # Use factory method for single-tree solution (backward compatible)
-                    solution = SupplyTreeSolution.from_single_tree(
+                except Exception as e:
+                    result.error = f"{type(e).__name__}: {e}"
+                    result.solutions = set()
+                    return result
+                result.solutions.add(
+                    SupplyTreeSolution.from_single_tree(
                         tree=tree,
-                        score=tree.confidence_score,  # Use tree's confidence score
+                        score=tree.confidence_score,
                         metrics={
                             "facility_count": 1,
-                            "requirement_count": len(requirements),
-                            "capability_count": len(capabilities),
-                        },
-                    )
-                    solutions.add(solution)
-                    logger.info(
-                        "Found matching facility",
-                        extra={
-                            "facility_id": str(facility.id),
-                            "confidence_score": tree.confidence_score,
+                            "requirement_count": len(req_list),
+                            "capability_count": capability_counts[result.domain][
+                                position
+                            ],
                         },
                     )
-                    if max_solutions is not None and len(solutions) >= max_solutions:
-                        logger.info(
-                            "Early stop: max_solutions reached",
-                            extra={
-                                "max_solutions": max_solutions,
-                                "processed_facilities": idx,
-                                "total_facilities": total_facilities,
-                            },
-                        )
-                        break
-            logger.info(
-                "Match finding completed", extra={"solution_count": len(solutions)}
-            )
-            return solutions
+                )
+                if max_solutions is not None and len(result.solutions) >= max_solutions:
+                    break
+            return result
+
+        workers = max(
+            1,
+            int(
+                max_workers
+                if max_workers is not None
+                else MATCHING_FACILITY_CONCURRENCY
+            ),
+        )
+        semaphore = asyncio.Semaphore(workers)
 
-        except Exception as e:
-            logger.error(
-                "Error finding matches (in-memory manifest)",
-                extra={"error": str(e)},
-                exc_info=True,
-            )
-            raise
+        async def bounded(result: ManifestMatchResult) -> ManifestMatchResult:
+            async with semaphore:
+                return await finish(result)
+
+        tasks = [asyncio.ensure_future(bounded(result)) for result in pending]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
 
     async def find_designs_for_facility(
         self,
@@ -380,6 +1160,7 @@ class MatchingService:
         min_confidence: float = 0.1,
         max_results: Optional[int] = None,
         explicit_domain: Optional[str] = None,
+        design_index: Optional[DesignProcessIndex] = None,
     ) -> List[Dict[str, Any]]:
         """Reverse match: which of the given designs can this facility produce?
 
@@ -388,6 +1169,11 @@ class MatchingService:
         reported when the facility yields a solution scoring at least
         ``min_confidence``. Results are ranked by confidence (descending).
 
+        With a ``design_index``, designs whose requirements could not reach the
+        partial-match threshold against this facility are skipped without
+        running the matcher, and the rest are evaluated in order of their
+        coverage bound, which also breaks confidence ties.
+
         Args:
             facility: The single OKW facility to evaluate designs against.
             manifests: Candidate OKH designs (full manifests, as the matcher
@@ -395,6 +1181,8 @@ class MatchingService:
             min_confidence: Minimum solution score for a design to be reported.
             max_results: Optional cap on the number of designs returned.
             explicit_domain: When set, skips content-based domain detection.
+            design_index: Optional process index used to prefilter and order
+                the designs (manufacturing only; ignored for other domains).
 
         Returns:
             A confidence-ranked list of dicts, each with ``okh_id``,
@@ -405,7 +1193,20 @@ class MatchingService:
         """
         await self.ensure_initialized()
 
-        matched: List[Dict[str, Any]] = []
+        bounds: Dict[int, float] = {}
+        if design_index is not None and explicit_domain in (None, "manufacturing"):
+            query = design_index.query(facility)
+            candidates = []
+            for position, manifest in enumerate(manifests):
+                bound = query.bound_for(manifest)
+                if bound is not None:
+                    bounds[id(manifest)] = bound
+                    candidates.append((-bound, position, manifest))
+            candidates.sort(key=lambda item: item[:2])
+            manifests = [manifest for _, _, manifest in candidates]
+
+        # (confidence, coverage bound, entry)
+        matched: List[Tuple[float, float, Dict[str, Any]]] = []
         for manifest in manifests:
             try:
                 solutions = await self.find_matches_with_manifest(
@@ -429,19 +1230,24 @@ class MatchingService:
                 continue
 
             matched.append(
-                {
-                    "okh_id": str(getattr(manifest, "id", None)),
-                    "okh_title": getattr(manifest, "title", None),
-                    "confidence": best,
-                }
+                (
+                    best,
+                    bounds.get(id(manifest), 0.0),
+                    {
+                        "okh_id": str(getattr(manifest, "id", None)),
+                        "okh_title": getattr(manifest, "title", None),
+                        "confidence": best,
+                    },
+                )
             )
 
-        matched.sort(key=lambda d: d["confidence"], reverse=True)
+        matched.sort(key=lambda item: item[:2], reverse=True)
+        designs = [entry for _, _, entry in matched]
         if max_results is not None:
-            matched = matched[:max_results]
-        for rank, entry in enumerate(matched, start=1):
+            designs = designs[:max_results]
+        for rank, entry in enumerate(designs, start=1):
             entry["rank"] = rank
-        return matched
+        return designs
 
     async def find_composite_matches_with_manifest(
         self,
@@ -456,16 +1262,19 @@ class MatchingService:
         Build aggregate multi-facility solutions when one facility is insufficient.
 
         Phase 2 implementation:
-        - Uses a greedy set-cover strategy over extracted process requirements.
+        - Holds each facility's requirement coverage as a bitmask and solves the
+          set cover over those masks (see :mod:`..matching.facility_cover`).
         - Returns one or more `SupplyTreeSolution` objects with metadata including
           `coverage_ratio` and `coverage_gaps`.
 
         Args:
             okh_manifest: OKH whose process requirements drive set cover.
-            facilities: Pool of facilities to combine (manufacturing domain uses greedy cover).
+            facilities: Pool of facilities to combine (manufacturing domain only).
             max_facilities_per_solution: Upper bound on facilities referenced per composite solution.
             return_alternative_solutions: When true, may return multiple non-dominated covers.
-            combination_strategy: Only ``"greedy"`` is supported; other values log and fall back.
+            combination_strategy: ``"greedy"`` (default) or ``"exact"`` (fewest
+                facilities for the best coverage, by branch and bound); other
+                values log and fall back to greedy.
             explicit_domain: Optional domain override for detection.
 
         Returns:
@@ -482,12 +1291,12 @@ class MatchingService:
             )
             return set()
 
-        if combination_strategy != "greedy":
+        if combination_strategy not in COMBINATION_STRATEGIES:
             logger.warning(
                 "Unsupported combination strategy requested; falling back to greedy",
                 extra={"requested_strategy": combination_strategy},
             )
-            combination_strategy = "greedy"
+            combination_strategy = COMBINATION_STRATEGY_GREEDY
 
         domain = await self._detect_domain_for_matching(
             okh_manifest, facilities, explicit_domain
@@ -531,38 +1340,42 @@ class MatchingService:
             for r in req_list
         ]
 
+        # Coverage as a bitmask per facility (bit i = requirement i covered).
+        # Facilities with the same capability terms share one evaluation, and
+        # each distinct requirement term is checked once per capability set.
+        requirement_terms: Dict[str, int] = {}
+        for index, req in enumerate(req_list):
+            for term in self._process_terms([req]):
+                requirement_terms[term] = requirement_terms.get(term, 0) | 1 << index
+        masks_by_signature: Dict[Tuple[str, ...], int] = {}
         candidate_data: List[Dict[str, Any]] = []
         for facility in facilities:
-            facility_data = facility.to_dict()
-            ext_cap = extractor.extract_capabilities(facility_data)
-            capabilities = (
-                ext_cap.data.content.get("capabilities", [])
-                if ext_cap.data and ext_cap.data.content
-                else []
-            )
+            extracted = self._facility_capabilities(extractor, facility, domain)
+            terms: Sequence[str] = extracted.terms
             if (
-                not capabilities
+                not extracted.capabilities
                 and hasattr(facility, "manufacturing_processes")
                 and facility.manufacturing_processes
             ):
-                capabilities = [
-                    {"process_name": process_name}
-                    for process_name in facility.manufacturing_processes
-                    if isinstance(process_name, str) and process_name.strip()
-                ]
-            cap_list = self._normalize_capability_list(capabilities)
-            covered_indices = await self._covered_requirement_indices(
-                req_list=req_list,
-                cap_list=cap_list,
-                domain=domain,
-            )
-            if covered_indices:
-                candidate_data.append(
-                    {
-                        "facility": facility,
-                        "covered_indices": covered_indices,
-                    }
+                terms = self._process_terms(
+                    [
+                        {"process_name": process_name}
+                        for process_name in facility.manufacturing_processes
+                        if isinstance(process_name, str) and process_name.strip()
+                    ]
                 )
+            signature = tuple(dict.fromkeys(terms))
+            mask = masks_by_signature.get(signature)
+            if mask is None:
+                mask = 0
+                for term, term_mask in requirement_terms.items():
+                    for cap_term in signature:
+                        if (await self._evaluate_pair(term, cap_term, domain)).matched:
+                            mask |= term_mask
+                            break
+                masks_by_signature[signature] = mask
+            if mask:
+                candidate_data.append({"facility": facility, "mask": mask})
 
         if not candidate_data:
             logger.info(
@@ -575,61 +1388,41 @@ class MatchingService:
             )
             return set()
 
+        masks = [candidate["mask"] for candidate in candidate_data]
+        solve = (
+            exact_cover
+            if combination_strategy == COMBINATION_STRATEGY_EXACT
+            else greedy_cover
+        )
+
         async def build_solution(
             seed_idx: Optional[int] = None,
         ) -> Optional[SupplyTreeSolution]:
-            uncovered = set(range(len(req_list)))
-            selected: List[Dict[str, Any]] = []
-
-            if seed_idx is not None and 0 <= seed_idx < len(candidate_data):
-                seeded = candidate_data[seed_idx]
-                gain = len(seeded["covered_indices"] & uncovered)
-                if gain > 0:
-                    selected.append(seeded)
-                    uncovered -= seeded["covered_indices"]
-
-            while uncovered and len(selected) < max_facilities_per_solution:
-                best_idx = None
-                best_gain = 0
-                best_total_cover = 0
-                for idx, candidate in enumerate(candidate_data):
-                    if candidate in selected:
-                        continue
-                    gain = len(candidate["covered_indices"] & uncovered)
-                    total_cover = len(candidate["covered_indices"])
-                    if gain > best_gain or (
-                        gain == best_gain and total_cover > best_total_cover
-                    ):
-                        best_gain = gain
-                        best_total_cover = total_cover
-                        best_idx = idx
-
-                if best_idx is None or best_gain <= 0:
-                    break
-
-                winner = candidate_data[best_idx]
-                selected.append(winner)
-                uncovered -= winner["covered_indices"]
+            selected = [
+                candidate_data[i]
+                for i in solve(masks, max_facilities_per_solution, seed=seed_idx)
+            ]
 
             if not selected:
                 return None
 
             trees: List[SupplyTree] = []
-            covered_union: Set[int] = set()
+            covered_union = 0
             for item in selected:
                 facility = item["facility"]
-                covered_union |= item["covered_indices"]
+                covered_union |= item["mask"]
                 tree = await self._generate_supply_tree(okh_manifest, facility, domain)
                 tree.metadata = tree.metadata or {}
                 tree.metadata["composite_matching"] = True
-                tree.metadata["covered_requirements"] = sorted(item["covered_indices"])
+                tree.metadata["covered_requirements"] = indices_of(item["mask"])
                 trees.append(tree)
+            covered_count = covered_union.bit_count()
 
-            coverage_ratio = len(covered_union) / len(req_list) if req_list else 0.0
+            coverage_ratio = covered_count / len(req_list) if req_list else 0.0
             coverage_gaps = [
                 requirement_names[i]
-                for i in sorted(set(range(len(req_list))) - covered_union)
-                if requirement_names[i]
+                for i in range(len(req_list))
+                if not covered_union >> i & 1 and requirement_names[i]
             ]
 
             score = (
@@ -645,7 +1438,7 @@ class MatchingService:
                 metrics={
                     "facility_count": len(trees),
                     "required_process_count": len(req_list),
-                    "covered_process_count": len(covered_union),
+                    "covered_process_count": covered_count,
                 },
                 metadata={
                     "matching_mode": MATCH_MODE_FACILITY_COMBINATION,
@@ -661,7 +1454,7 @@ class MatchingService:
 
         candidate_order = sorted(
             range(len(candidate_data)),
-            key=lambda i: len(candidate_data[i]["covered_indices"]),
+            key=lambda i: masks[i].bit_count(),
             reverse=True,
         )
         seeds = [None]
@@ -752,9 +1545,10 @@ class MatchingService:
                     continue
 
             # Log input for debugging
-            logger.info(
-                f"Checking if capabilities can satisfy requirements",
-                extra={
+            hot_log(
+                logger,
+                "Checking if capabilities can satisfy requirements",
+                extra=lambda: {
                     "requirement_count": len(req_list),
                     "capability_count": len(cap_list),
                     "requirements": [req.get("process_name", "") for req in req_list],
@@ -763,21 +1557,13 @@ class MatchingService:
             )
 
             if not req_list:
-                logger.debug("No valid requirements to check")
+                hot_log(logger, "No valid requirements to check")
                 return False
 
             if not cap_list:
-                logger.debug("No valid capabilities to check against")
+                hot_log(logger, "No valid capabilities to check against")
                 return False
 
-            # Partial-match threshold: a facility must satisfy this fraction of
-            # requirement occurrences to be considered a candidate.  Using
-            # occurrence counts (not deduplicated) ensures that the dominant
-            # process type carries the most weight — e.g. a laser-cut project
-            # with 5 "LASER" requirements and 1 "Assembly" requirement scores
-            # 83 % against a laser cutting facility (5/6 > 0.6).
-            PARTIAL_MATCH_THRESHOLD = 0.6
-
             total_reqs = 0
             satisfied_reqs = 0
 
@@ -787,7 +1573,7 @@ class MatchingService:
                     self._normalize_process_name(raw_req_process).lower().strip()
                 )
                 if not req_process:
-                    logger.debug(f"Skipping empty requirement: {req}")
+                    hot_log(logger, "Skipping empty requirement: %s", req)
                     continue
 
                 total_reqs += 1
@@ -799,39 +1585,15 @@ class MatchingService:
                         self._normalize_process_name(raw_cap_process).lower().strip()
                     )
                     if not cap_process:
-                        logger.debug(f"Skipping empty capability: {cap}")
+                        hot_log(logger, "Skipping empty capability: %s", cap)
                         continue
 
-                    async def _direct_eval_cs():
-                        return await self._direct_match_evaluate(
-                            req_process, cap_process, domain
-                        )
-
-                    async def _heuristic_eval_cs():
-                        return await self._heuristic_match_with_rule(
-                            req_process, cap_process, domain
-                        )
-
-                    async def _nlp_match_cs():
-                        return await self._nlp_match(req_process, cap_process, domain)
-
-                    async def _nlp_sim_cs():
-                        return await self._nlp_semantic_similarity_for_pair(
-                            req_process, cap_process, domain
-                        )
-
-                    ev_cs = await evaluate_layers(
-                        direct_eval=_direct_eval_cs,
-                        heuristic_eval=_heuristic_eval_cs,
-                        nlp_match=_nlp_match_cs,
-                        nlp_similarity=_nlp_sim_cs,
-                        mode="veto" if MATCHING_NLP_VETO_ENABLED else "cascade",
-                        veto_threshold=MATCHING_NLP_VETO_THRESHOLD,
-                    )
+                    ev_cs = await self._evaluate_pair(req_process, cap_process, domain)
                     if ev_cs.matched:
-                        logger.info(
+                        hot_log(
+                            logger,
                             "Match found",
-                            extra={
+                            extra=lambda: {
                                 "requirement_process": req.get("process_name"),
                                 "capability_process": cap.get("process_name"),
                                 "layer": ev_cs.layer,
@@ -843,9 +1605,11 @@ class MatchingService:
                 if requirement_satisfied:
                     satisfied_reqs += 1
                 else:
-                    logger.debug(
-                        f"Requirement '{req.get('process_name')}' has no matching capability",
-                        extra={
+                    hot_log(
+                        logger,
+                        "Requirement '%s' has no matching capability",
+                        req.get("process_name"),
+                        extra=lambda: {
                             "requirement_process": req.get("process_name"),
                             "capability_count": len(cap_list),
                             "available_capabilities": [
@@ -860,10 +1624,14 @@ class MatchingService:
 
             coverage = satisfied_reqs / total_reqs
             passed = coverage >= PARTIAL_MATCH_THRESHOLD
-            logger.info(
-                f"Requirement coverage: {satisfied_reqs}/{total_reqs} "
-                f"({coverage:.0%}) — {'PASS' if passed else 'FAIL'} "
-                f"(threshold {PARTIAL_MATCH_THRESHOLD:.0%})"
+            hot_log(
+                logger,
+                "Requirement coverage: %d/%d (%.0f%%) — %s (threshold %.0f%%)",
+                satisfied_reqs,
+                total_reqs,
+                coverage * 100,
+                "PASS" if passed else "FAIL",
+                PARTIAL_MATCH_THRESHOLD * 100,
             )
             return passed
 
@@ -908,32 +1676,7 @@ class MatchingService:
                 if not cap_process:
                     continue
 
-                async def _direct_eval_det():
-                    return await self._direct_match_evaluate(
-                        req_process, cap_process, domain
-                    )
-
-                async def _heuristic_eval_det():
-                    return await self._heuristic_match_with_rule(
-                        req_process, cap_process, domain
-                    )
-
-                async def _nlp_match_det():
-                    return await self._nlp_match(req_process, cap_process, domain)
-
-                async def _nlp_sim_det():
-                    return await self._nlp_semantic_similarity_for_pair(
-                        req_process, cap_process, domain
-                    )
-
-                ev_det = await evaluate_layers(
-                    direct_eval=_direct_eval_det,
-                    heuristic_eval=_heuristic_eval_det,
-                    nlp_match=_nlp_match_det,
-                    nlp_similarity=_nlp_sim_det,
-                    mode="veto" if MATCHING_NLP_VETO_ENABLED else "cascade",
-                    veto_threshold=MATCHING_NLP_VETO_THRESHOLD,
-                )
+                ev_det = await self._evaluate_pair(req_process, cap_process, domain)
                 if ev_det.matched:
                     if ev_det.layer == "direct":
                         note_suffix = (
@@ -1106,57 +1849,6 @@ class MatchingService:
                 )
         return req_list
 
-    async def _covered_requirement_indices(
-        self,
-        req_list: List[Dict[str, Any]],
-        cap_list: List[Dict[str, Any]],
-        domain: str,
-    ) -> Set[int]:
-        """Return requirement indexes covered by capability list."""
-        covered: Set[int] = set()
-        for idx, req in enumerate(req_list):
-            raw_req = req.get("process_name", "").strip()
-            req_process = self._normalize_process_name(raw_req).lower().strip()
-            if not req_process:
-                continue
-
-            for cap in cap_list:
-                raw_cap = cap.get("process_name", "").strip()
-                cap_process = self._normalize_process_name(raw_cap).lower().strip()
-                if not cap_process:
-                    continue
-
-                async def _direct_eval_cov():
-                    return await self._direct_match_evaluate(
-                        req_process, cap_process, domain
-                    )
-
-                async def _heuristic_eval_cov():
-                    return await self._heuristic_match_with_rule(
-                        req_process, cap_process, domain
-                    )
-
-                async def _nlp_match_cov():
-                    return await self._nlp_match(req_process, cap_process, domain)
-
-                async def _nlp_sim_cov():
-                    return await self._nlp_semantic_similarity_for_pair(
-                        req_process, cap_process, domain
-                    )
-
-                ev_cov = await evaluate_layers(
-                    direct_eval=_direct_eval_cov,
-                    heuristic_eval=_heuristic_eval_cov,
-                    nlp_match=_nlp_match_cov,
-                    nlp_similarity=_nlp_sim_cov,
-                    mode="veto" if MATCHING_NLP_VETO_ENABLED else "cascade",
-                    veto_threshold=MATCHING_NLP_VETO_THRESHOLD,
-                )
-                if ev_cov.matched:
-                    covered.add(idx)
-                    break
-        return covered
-
     async def get_match_explanation(
         self,
         requirements: List[Dict[str, Any]],
@@ -1212,6 +1904,143 @@ class MatchingService:
             missing_capabilities=missing,
         )
 
+    def _degradation_mark(self) -> int:
+        """Running count of NLP timeouts and cascade-layer failures.
+
+        Unchanged across an evaluation means every layer answered normally;
+        any change means some answer was a fallback, so the verdict is
+        returned but not memoized.
+        """
+        return (
+            self._nlp_timeouts
+            + self._layer_failures
+            + sum(
+                getattr(matcher, "failures", 0)
+                for matcher in self.nlp_matchers.values()
+            )
+        )
+
+    async def _evaluate_pair(
+        self, req_process: str, cap_process: str, domain: str
+    ) -> LayerEvaluation:
+        """Run the direct → heuristic → NLP cascade for one pair, memoized.
+
+        Verdicts are keyed on the normalized pair, domain, cascade mode and
+        rules version; a verdict reached while an NLP call timed out or a
+        layer fell back after an error is returned but not stored.
+        """
+        mode = "veto" if MATCHING_NLP_VETO_ENABLED else "cascade"
+        key = pair_verdict_key(
+            "layers",
+            req_process,
+            cap_process,
+            domain,
+            mode,
+            MATCHING_NLP_VETO_THRESHOLD,
+        )
+        cached = self._pair_verdicts.get(key)
+        if cached is not None:
+            count_match_event("pair_cache_hits")
+            return cached
+        count_match_event("pairs_evaluated")
+
+        async def _direct_eval():
+            return await self._direct_match_evaluate(req_process, cap_process, domain)
+
+        async def _heuristic_eval():
+            return await self._heuristic_match_with_rule(
+                req_process, cap_process, domain
+            )
+
+        async def _nlp_match():
+            return await self._nlp_match(req_process, cap_process, domain)
+
+        async def _nlp_sim():
+            return await self._nlp_semantic_similarity_for_pair(
+                req_process, cap_process, domain
+            )
+
+        degraded_before = self._degradation_mark()
+        evaluation = await evaluate_layers(
+            direct_eval=_direct_eval,
+            heuristic_eval=_heuristic_eval,
+            nlp_match=_nlp_match,
+            nlp_similarity=_nlp_sim,
+            mode=mode,
+            veto_threshold=MATCHING_NLP_VETO_THRESHOLD,
+        )
+        if self._degradation_mark() == degraded_before:
+            self._pair_verdicts.set(key, evaluation)
+        return evaluation
+
+    @staticmethod
+    def _supply_tree_pair_key(
+        req_process: str, cap_process: str, domain: str, require_direct_match: bool
+    ) -> Tuple[Any, ...]:
+        return pair_verdict_key(
+            "supply_tree",
+            req_process,
+            cap_process,
+            domain,
+            "veto" if MATCHING_NLP_VETO_ENABLED else "cascade",
+            MATCHING_NLP_VETO_THRESHOLD,
+            require_direct_match,
+            MATCHING_NLP_VETO_ENABLED,
+        )
+
+    async def _evaluate_pair_supply_tree(
+        self,
+        req_process: str,
+        cap_process: str,
+        domain: str,
+        require_direct_match: bool = False,
+    ) -> Tuple[float, str]:
+        """Supply-tree variant of :meth:`_evaluate_pair` returning (confidence, match_type)."""
+        mode = "veto" if MATCHING_NLP_VETO_ENABLED else "cascade"
+        key = self._supply_tree_pair_key(
+            req_process, cap_process, domain, require_direct_match
+        )
+        cached = self._pair_verdicts.get(key)
+        if cached is not None:
+            count_match_event("pair_cache_hits")
+            return cached
+        count_match_event("pairs_evaluated")
+
+        async def _direct_eval():
+            return await self._direct_match_evaluate(req_process, cap_process, domain)
+
+        async def _heuristic_eval():
+            return await self._heuristic_match_with_rule(
+                req_process, cap_process, domain
+            )
+
+        async def _nlp_match():
+            return await self._nlp_match(req_process, cap_process, domain)
+
+        async def _nlp_sim():
+            return await self._nlp_semantic_similarity_for_pair(
+                req_process, cap_process, domain
+            )
+
+        def _partial_sim() -> float:
+            return self._calculate_process_similarity(req_process, cap_process)
+
+        degraded_before = self._degradation_mark()
+        result = await evaluate_layers_supply_tree(
+            direct_eval=_direct_eval,
+            heuristic_eval=_heuristic_eval,
+            nlp_match=_nlp_match,
+            nlp_similarity=_nlp_sim,
+            partial_similarity=_partial_sim,
+            require_direct_match=require_direct_match,
+            mode=mode,
+            veto_threshold=MATCHING_NLP_VETO_THRESHOLD,
+            veto_enabled=MATCHING_NLP_VETO_ENABLED,
+        )
+        if self._degradation_mark() == degraded_before:
+            self._pair_verdicts.set(key, result)
+        return result
+
     async def _direct_match_evaluate(
         self,
         req_process: str,
@@ -1240,9 +2069,10 @@ class MatchingService:
 
             # Check for exact match after normalization
             if req_normalized == cap_normalized:
-                logger.debug(
+                hot_log(
+                    logger,
                     "Direct exact match found",
-                    extra={
+                    extra=lambda: {
                         "requirement_process": req_process,
                         "capability_process": cap_process,
                         "requirement_normalized": req_normalized,
@@ -1254,9 +2084,10 @@ class MatchingService:
 
             # Check for case-insensitive exact match
             if req_process.lower().strip() == cap_process.lower().strip():
-                logger.debug(
+                hot_log(
+                    logger,
                     "Direct case-insensitive match found",
-                    extra={
+                    extra=lambda: {
                         "requirement_process": req_process,
                         "capability_process": cap_process,
                         "layer": "direct",
@@ -1270,9 +2101,10 @@ class MatchingService:
 
             # Check for substring matches (one contains the other) - only for non-URIs
             if req_normalized in cap_normalized or cap_normalized in req_normalized:
-                logger.debug(
+                hot_log(
+                    logger,
                     "Direct substring match found",
-                    extra={
+                    extra=lambda: {
                         "requirement_process": req_process,
                         "capability_process": cap_process,
                         "requirement_normalized": req_normalized,
@@ -1286,9 +2118,10 @@ class MatchingService:
             # Only for non-URIs to prevent incorrect matches
             similarity = self._calculate_process_similarity(req_process, cap_process)
             if similarity >= 0.3:
-                logger.debug(
+                hot_log(
+                    logger,
                     "Direct similarity match found",
-                    extra={
+                    extra=lambda: {
                         "requirement_process": req_process,
                         "capability_process": cap_process,
                         "requirement_normalized": req_normalized,
@@ -1302,6 +2135,7 @@ class MatchingService:
             return False, "none"
 
         except Exception as e:
+            self._layer_failures += 1
             logger.error(f"Error in Direct Matching layer: {e}", exc_info=True)
             # Fallback to simple matching
             if req_process.lower() == cap_process.lower():
@@ -1351,9 +2185,11 @@ class MatchingService:
                     timeout=0.5,
                 )
             except asyncio.TimeoutError:
+                self._nlp_timeouts += 1
                 return None
 
         except Exception:
+            self._layer_failures += 1
             return None
 
     async def _heuristic_match(
@@ -1398,9 +2234,10 @@ class MatchingService:
                     result.matched and result.confidence >= 0.7
                 ):  # Use 0.7 as threshold for heuristic match
                     rule_id = result.rule_used.id if result.rule_used else None
-                    logger.debug(
+                    hot_log(
+                        logger,
                         "Heuristic match found using capability-centric rules",
-                        extra={
+                        extra=lambda: {
                             "requirement_process": req_process,
                             "capability_process": cap_process,
                             "confidence": result.confidence,
@@ -1413,6 +2250,7 @@ class MatchingService:
             return False, None
 
         except Exception as e:
+            self._layer_failures += 1
             logger.error(f"Error in Heuristic Matching layer: {e}", exc_info=True)
             return False, None
 
@@ -1434,10 +2272,13 @@ class MatchingService:
             # But allow NLP when one is URI and other is simple name (extract name from URI)
             if is_req_uri and is_cap_uri:
                 # Both are URIs - skip NLP to prevent false matches
-                logger.info(
-                    f"SKIPPING NLP for URI-to-URI: req={req_process[:60]}, cap={cap_process[:60]} | "
-                    f"Both are URIs, use direct matching only",
-                    extra={
+                hot_log(
+                    logger,
+                    "SKIPPING NLP for URI-to-URI: req=%.60s, cap=%.60s | "
+                    "Both are URIs, use direct matching only",
+                    req_process,
+                    cap_process,
+                    extra=lambda: {
                         "requirement_process": req_process,
                         "capability_process": cap_process,
                         "requirement_is_uri": is_req_uri,
@@ -1453,9 +2294,12 @@ class MatchingService:
             if is_req_uri:
                 # Extract process name from requirement URI
                 req_for_nlp = self._normalize_process_name(req_process)
-                logger.debug(
-                    f"Extracted process name from requirement URI: '{req_process}' -> '{req_for_nlp}'",
-                    extra={
+                hot_log(
+                    logger,
+                    "Extracted process name from requirement URI: '%s' -> '%s'",
+                    req_process,
+                    req_for_nlp,
+                    extra=lambda: {
                         "original_requirement": req_process,
                         "extracted_requirement": req_for_nlp,
                     },
@@ -1464,9 +2308,12 @@ class MatchingService:
             if is_cap_uri:
                 # Extract process name from capability URI
                 cap_for_nlp = self._normalize_process_name(cap_process)
-                logger.debug(
-                    f"Extracted process name from capability URI: '{cap_process}' -> '{cap_for_nlp}'",
-                    extra={
+                hot_log(
+                    logger,
+                    "Extracted process name from capability URI: '%s' -> '%s'",
+                    cap_process,
+                    cap_for_nlp,
+                    extra=lambda: {
                         "original_capability": cap_process,
                         "extracted_capability": cap_for_nlp,
                     },
@@ -1482,23 +2329,18 @@ class MatchingService:
             nlp_matcher = self.nlp_matchers[domain]
 
             # CRITICAL: Log at INFO level BEFORE calling NLP matcher so we can see what's being matched
-            logger.info(
-                f"CALLING NLP MATCHER: req={req_process[:80]}, cap={cap_process[:80]} | "
-                f"req_is_uri={isinstance(req_process, str) and (req_process.startswith('http://') or req_process.startswith('https://'))}, "
-                f"cap_is_uri={isinstance(cap_process, str) and (cap_process.startswith('http://') or cap_process.startswith('https://'))}",
-                extra={
+            hot_log(
+                logger,
+                "CALLING NLP MATCHER: req=%.80s, cap=%.80s | req_is_uri=%s, cap_is_uri=%s",
+                req_process,
+                cap_process,
+                is_req_uri,
+                is_cap_uri,
+                extra=lambda: {
                     "requirement_process": req_process,
                     "capability_process": cap_process,
-                    "requirement_is_uri": isinstance(req_process, str)
-                    and (
-                        req_process.startswith("http://")
-                        or req_process.startswith("https://")
-                    ),
-                    "capability_is_uri": isinstance(cap_process, str)
-                    and (
-                        cap_process.startswith("http://")
-                        or cap_process.startswith("https://")
-                    ),
+                    "requirement_is_uri": is_req_uri,
+                    "capability_is_uri": is_cap_uri,
                 },
             )
 
@@ -1512,6 +2354,7 @@ class MatchingService:
                     timeout=0.5,  # 500ms timeout
                 )
             except asyncio.TimeoutError:
+                self._nlp_timeouts += 1
                 logger.warning(
                     f"NLP matching timed out for '{req_process}' vs '{cap_process}'"
                 )
@@ -1531,17 +2374,22 @@ class MatchingService:
                     cap_canonical = taxonomy.normalize(cap_process)
                     if req_canonical and cap_canonical:
                         if not taxonomy.are_related(req_canonical, cap_canonical):
-                            logger.info(
-                                f"NLP match REJECTED by taxonomy post-filter: "
-                                f"req='{req_process}' ({req_canonical}) vs "
-                                f"cap='{cap_process}' ({cap_canonical}) "
-                                f"are not related in taxonomy",
+                            hot_log(
+                                logger,
+                                "NLP match REJECTED by taxonomy post-filter: "
+                                "req='%s' (%s) vs cap='%s' (%s) "
+                                "are not related in taxonomy",
+                                req_process,
+                                req_canonical,
+                                cap_process,
+                                cap_canonical,
                             )
                             return False
 
-                    logger.debug(
+                    hot_log(
+                        logger,
                         "NLP match found using semantic similarity",
-                        extra={
+                        extra=lambda: {
                             "requirement_process": req_process,
                             "capability_process": cap_process,
                             "confidence": result.confidence,
@@ -1558,9 +2406,43 @@ class MatchingService:
             return False
 
         except Exception as e:
+            self._layer_failures += 1
             logger.error(f"Error in NLP Matching layer: {e}", exc_info=True)
             return False
 
+    @staticmethod
+    def _supply_tree_capabilities(facility: ManufacturingFacility) -> List[Any]:
+        """Process names a facility offers for supply-tree scoring.
+
+        IMPORTANT: facility.manufacturing_processes is the primary source of
+        truth. Equipment processes are secondary and may be too granular
+        (e.g., "PCB_printer" vs "PCB").
+        """
+        facility_capabilities: List[Any] = []
+
+        # PRIMARY: Use facility's declared manufacturing_processes (most accurate)
+        if (
+            hasattr(facility, "manufacturing_processes")
+            and facility.manufacturing_processes
+        ):
+            if isinstance(facility.manufacturing_processes, list):
+                facility_capabilities.extend(facility.manufacturing_processes)
+            elif isinstance(facility.manufacturing_processes, str):
+                facility_capabilities.append(facility.manufacturing_processes)
+
+        # SECONDARY: Also check equipment processes (for backward compatibility)
+        # KitchenCapability and other capability types may not have .equipment
+        for equipment in getattr(facility, "equipment", None) or []:
+            if hasattr(equipment, "manufacturing_process"):
+                if isinstance(equipment.manufacturing_process, str):
+                    facility_capabilities.append(equipment.manufacturing_process)
+                elif isinstance(equipment.manufacturing_process, list):
+                    facility_capabilities.extend(equipment.manufacturing_process)
+            if hasattr(equipment, "manufacturing_processes"):
+                if isinstance(equipment.manufacturing_processes, list):
+                    facility_capabilities.extend(equipment.manufacturing_processes)
+        return facility_capabilities
+
     async def _generate_supply_tree(
         self,
         manifest: OKHManifest,
@@ -1577,9 +2459,11 @@ class MatchingService:
 
             # DEBUG: Log process requirements for troubleshooting
             if process_requirements:
-                logger.debug(
-                    f"Processing {len(process_requirements)} process requirements for matching",
-                    extra={
+                hot_log(
+                    logger,
+                    "Processing %d process requirements for matching",
+                    len(process_requirements),
+                    extra=lambda: {
                         "process_count": len(process_requirements),
                         "processes": process_requirements,
                         "facility_name": (
@@ -1589,8 +2473,7 @@ class MatchingService:
                 )
 
             # Check if facility can handle the processes using multi-layer matching
-            # IMPORTANT: Use facility.manufacturing_processes as the primary source of truth
-            # Equipment processes are secondary and may be too granular (e.g., "PCB_printer" vs "PCB")
+            facility_capabilities = self._supply_tree_capabilities(facility)
             for process_name in process_requirements:
                 # CRITICAL: Ensure process_name is a string and validate it's a URI if expected
                 if not isinstance(process_name, str):
@@ -1608,36 +2491,6 @@ class MatchingService:
                     self._normalize_process_name(process_name).lower().strip()
                 )
 
-                facility_capabilities = []
-
-                # PRIMARY: Use facility's declared manufacturing_processes (most accurate)
-                if (
-                    hasattr(facility, "manufacturing_processes")
-                    and facility.manufacturing_processes
-                ):
-                    if isinstance(facility.manufacturing_processes, list):
-                        facility_capabilities.extend(facility.manufacturing_processes)
-                    elif isinstance(facility.manufacturing_processes, str):
-                        facility_capabilities.append(facility.manufacturing_processes)
-
-                # SECONDARY: Also check equipment processes (for backward compatibility)
-                # KitchenCapability and other capability types may not have .equipment
-                for equipment in getattr(facility, "equipment", None) or []:
-                    if hasattr(equipment, "manufacturing_process"):
-                        if isinstance(equipment.manufacturing_process, str):
-                            facility_capabilities.append(
-                                equipment.manufacturing_process
-                            )
-                        elif isinstance(equipment.manufacturing_process, list):
-                            facility_capabilities.extend(
-                                equipment.manufacturing_process
-                            )
-                    if hasattr(equipment, "manufacturing_processes"):
-                        if isinstance(equipment.manufacturing_processes, list):
-                            facility_capabilities.extend(
-                                equipment.manufacturing_processes
-                            )
-
                 # Use multi-layer matching for confidence calculation
                 # URI detection is done on the NORMALIZED process name, so plain
                 # names extracted from URIs won't trigger require_direct_match.
@@ -1646,11 +2499,15 @@ class MatchingService:
                     or normalized_process.startswith("https://")
                 )
 
-                logger.debug(
-                    f"Scoring process '{process_name}' (normalized: '{normalized_process}') "
-                    f"against {len(facility_capabilities)} facility capabilities | "
-                    f"facility={facility.name if hasattr(facility, 'name') else 'Unknown'}",
-                    extra={
+                hot_log(
+                    logger,
+                    "Scoring process '%s' (normalized: '%s') "
+                    "against %d facility capabilities | facility=%s",
+                    process_name,
+                    normalized_process,
+                    len(facility_capabilities),
+                    getattr(facility, "name", "Unknown"),
+                    extra=lambda: {
                         "process_name": process_name,
                         "normalized_process": normalized_process,
                         "is_uri": is_process_uri,
@@ -1676,73 +2533,55 @@ class MatchingService:
                     )
                     require_direct_match = is_process_uri or is_capability_uri
 
-                    async def _direct_eval_st():
-                        return await self._direct_match_evaluate(
-                            normalized_process, normalized_capability, domain
-                        )
-
-                    async def _heuristic_eval_st():
-                        return await self._heuristic_match_with_rule(
-                            normalized_process, normalized_capability, domain
-                        )
-
-                    async def _nlp_match_st():
-                        return await self._nlp_match(
-                            normalized_process, normalized_capability, domain
-                        )
-
-                    async def _nlp_sim_st():
-                        return await self._nlp_semantic_similarity_for_pair(
-                            normalized_process, normalized_capability, domain
-                        )
-
-                    def _partial_sim_st() -> float:
-                        return self._calculate_process_similarity(
-                            normalized_process, normalized_capability
-                        )
-
-                    confidence, match_type = await evaluate_layers_supply_tree(
-                        direct_eval=_direct_eval_st,
-                        heuristic_eval=_heuristic_eval_st,
-                        nlp_match=_nlp_match_st,
-                        nlp_similarity=_nlp_sim_st,
-                        partial_similarity=_partial_sim_st,
+                    confidence, match_type = await self._evaluate_pair_supply_tree(
+                        normalized_process,
+                        normalized_capability,
+                        domain,
                         require_direct_match=require_direct_match,
-                        mode="veto" if MATCHING_NLP_VETO_ENABLED else "cascade",
-                        veto_threshold=MATCHING_NLP_VETO_THRESHOLD,
-                        veto_enabled=MATCHING_NLP_VETO_ENABLED,
                     )
                     if match_type == "direct":
-                        logger.debug(
-                            f"Direct match found: process={normalized_process[:50]}, capability={normalized_capability[:50]}",
-                            extra={
+                        hot_log(
+                            logger,
+                            "Direct match found: process=%.50s, capability=%.50s",
+                            normalized_process,
+                            normalized_capability,
+                            extra=lambda: {
                                 "process_name": normalized_process,
                                 "capability_name": normalized_capability,
                                 "match_type": "direct",
                             },
                         )
                     elif match_type == "heuristic":
-                        logger.debug(
-                            f"Heuristic match found: process={normalized_process[:50]}, capability={normalized_capability[:50]}",
-                            extra={
+                        hot_log(
+                            logger,
+                            "Heuristic match found: process=%.50s, capability=%.50s",
+                            normalized_process,
+                            normalized_capability,
+                            extra=lambda: {
                                 "process_name": normalized_process,
                                 "capability_name": normalized_capability,
                                 "match_type": "heuristic",
                             },
                         )
                     elif match_type == "nlp":
-                        logger.debug(
-                            f"NLP match found: process={normalized_process[:50]}, capability={normalized_capability[:50]}",
-                            extra={
+                        hot_log(
+                            logger,
+                            "NLP match found: process=%.50s, capability=%.50s",
+                            normalized_process,
+                            normalized_capability,
+                            extra=lambda: {
                                 "process_name": normalized_process,
                                 "capability_name": normalized_capability,
                                 "match_type": "nlp",
                             },
                         )
                     elif match_type == "no_match" and require_direct_match:
-                        logger.debug(
-                            f"No match (require_direct_match=True): process={normalized_process[:50]}, capability={normalized_capability[:50]}",
-                            extra={
+                        hot_log(
+                            logger,
+                            "No match (require_direct_match=True): process=%.50s, capability=%.50s",
+                            normalized_process,
+                            normalized_capability,
+                            extra=lambda: {
                                 "process_name": normalized_process,
                                 "capability_name": normalized_capability,
                                 "is_process_uri": is_process_uri,
@@ -1786,9 +2625,10 @@ class MatchingService:
                 estimated_time=None,  # Could be calculated based on process complexity
             )
 
-            logger.info(
+            hot_log(
+                logger,
                 "Generated simplified supply tree",
-                extra={
+                extra=lambda: {
                     "okh_id": str(manifest.id),
                     "facility_id": str(facility.id),
                     "confidence_score": confidence_score,
@@ -2405,11 +3245,13 @@ class MatchingService:
         )
 
         try:
-            # Step 1: Resolve BOM and explode into component matches (with graceful fallbacks)
+            # Step 1: Resolve BOM and explode into component matches (with graceful
+            # fallbacks). Memoized by manifest content, so a design matched before
+            # skips resolution and the recursive explosion entirely.
             bom_resolver = BOMResolutionService(service)
             # Pass manifest_path to resolve_bom for external BOM file resolution
-            bom = await bom_resolver.resolve_bom(
-                okh_manifest, service, manifest_path=manifest_path
+            bom, component_matches = await bom_resolver.explode_manifest(
+                okh_manifest, service, max_depth=max_depth, manifest_path=manifest_path
             )
 
             if not bom.components:
@@ -2434,10 +3276,6 @@ class MatchingService:
                     )
                 }
 
-            component_matches = await bom_resolver.explode_bom(
-                bom, service, max_depth=max_depth
-            )
-
             # Count components with unresolved references
             unresolved_count = sum(
                 1
@@ -2472,7 +3310,44 @@ class MatchingService:
             # Step 2: Sort by depth (deepest first) for dependency order
             component_matches.sort(key=lambda x: -x.depth)
 
-            # Step 3: Match each component to facilities (best-effort matching)
+            # Step 3: Match each distinct component profile to facilities once.
+            # Components with the same source manifest and process list yield the
+            # same trees up to component details, so a BOM of dozens of printed
+            # parts scores the pool once and fans the result back out.
+            profiles: Dict[Tuple[int, Tuple[str, ...]], List[ComponentMatch]] = {}
+            for component_match in component_matches:
+                # If component has a reference, use that OKH; otherwise the root OKH
+                manifest = component_match.okh_manifest or okh_manifest
+                key = (
+                    id(manifest),
+                    tuple(self._component_processes(component_match.component)),
+                )
+                profiles.setdefault(key, []).append(component_match)
+
+            semaphore = asyncio.Semaphore(MATCHING_COMPONENT_CONCURRENCY)
+
+            async def match_profile(group: List[ComponentMatch]):
+                first = group[0]
+                async with semaphore:
+                    try:
+                        return await self._match_component_profile(
+                            component=first.component,
+                            manifest=first.okh_manifest or okh_manifest,
+                            facilities=facilities,
+                            domain=domain,
+                        )
+                    except Exception as e:
+                        return e
+
+            outcomes = await asyncio.gather(
+                *(match_profile(group) for group in profiles.values())
+            )
+            templates_by_match: Dict[int, Any] = {
+                id(member): outcome
+                for group, outcome in zip(profiles.values(), outcomes)
+                for member in group
+            }
+
             component_supply_trees: Dict[str, List[SupplyTree]] = {}
             unmatched_components = []
             matched_components = []
@@ -2480,18 +3355,12 @@ class MatchingService:
             for component_match in component_matches:
                 component = component_match.component
 
-                # Determine which OKH to use for matching
-                # If component has a reference, use that OKH; otherwise use the root OKH
-                manifest = component_match.okh_manifest or okh_manifest
-
                 try:
-                    # Match component to facilities (component-level matching logic)
-                    component_trees = await self._match_component_to_facilities(
-                        component=component,
-                        component_match=component_match,
-                        manifest=manifest,
-                        facilities=facilities,
-                        domain=domain,
+                    templates = templates_by_match[id(component_match)]
+                    if isinstance(templates, Exception):
+                        raise templates
+                    component_trees = self._component_trees(
+                        templates, component, component_match
                     )
 
                     component_supply_trees[component.id] = component_trees
@@ -2538,6 +3407,7 @@ class MatchingService:
                         }
                     )
                     # Continue with other components
+                    component_trees = []
                     component_supply_trees[component.id] = []
                     component_match.matched = False
 
@@ -2572,6 +3442,7 @@ class MatchingService:
                 metrics={
                     "facility_count": len(facilities),
                     "component_count": len(component_matches),
+                    "component_profiles": len(profiles),
                     "total_trees": len(all_trees),
                 },
                 metadata={
@@ -2664,6 +3535,35 @@ class MatchingService:
             return canonical
         return tsdc_code
 
+    def _component_processes(self, component: Component) -> List[str]:
+        """Normalized process list a component is matched on.
+
+        Taken from ``requirements["process"]`` then ``metadata["tsdc"]``, each
+        normalized via the taxonomy, de-duplicated and limited to non-empty
+        strings. Components with equal lists match identically against a
+        given manifest and facility pool.
+        """
+        processes: List[str] = []
+
+        # Processes from component requirements (may be strings like "3DP", "PCB")
+        req_processes = (component.requirements or {}).get("process", [])
+        if isinstance(req_processes, str):
+            req_processes = [req_processes]
+        tsdc_codes = (component.metadata or {}).get("tsdc", [])
+        if not isinstance(tsdc_codes, list):
+            tsdc_codes = []
+
+        # Normalize process strings via taxonomy (handles TSDC codes, URIs, plain names)
+        for process in [*req_processes, *tsdc_codes]:
+            normalized = self._tsdc_to_process_uri(process)
+            if (
+                isinstance(normalized, str)
+                and normalized.strip()
+                and normalized not in processes
+            ):
+                processes.append(normalized)
+        return processes
+
     def _create_component_manifest(
         self, base_manifest: OKHManifest, component: Component
     ) -> OKHManifest:
@@ -2685,94 +3585,23 @@ class MatchingService:
 
         component_manifest = copy.deepcopy(base_manifest)
 
-        # CRITICAL: Immediately clear manufacturing_processes to prevent any accidental inheritance
-        # We will set it explicitly based on component's TSDC codes
-        component_manifest.manufacturing_processes = []
-
-        # Extract component processes and convert to URIs
-        component_processes = []
-
-        # Get processes from component requirements (may be strings like "3DP", "PCB")
-        component_requirements = component.requirements or {}
-        req_processes = component_requirements.get("process", [])
-        if isinstance(req_processes, str):
-            req_processes = [req_processes]
-
-        # Normalize process strings via taxonomy (handles TSDC codes, URIs, plain names)
-        for process in req_processes:
-            normalized = self._tsdc_to_process_uri(process)
-            if normalized not in component_processes:
-                component_processes.append(normalized)
-
-        # Convert TSDC codes from metadata
-        if component.metadata and "tsdc" in component.metadata:
-            tsdc_codes = component.metadata.get("tsdc", [])
-            if isinstance(tsdc_codes, list):
-                for tsdc_code in tsdc_codes:
-                    normalized = self._tsdc_to_process_uri(tsdc_code)
-                    if normalized not in component_processes:
-                        component_processes.append(normalized)
-                logger.info(
-                    f"Component '{component.name}' TSDC codes normalized: {tsdc_codes} -> {component_processes}",
-                    extra={
-                        "component_id": component.id,
-                        "component_name": component.name,
-                        "tsdc_codes": tsdc_codes,
-                        "normalized_processes": component_processes,
-                    },
-                )
+        # For component-level matching, never fall back to the base manifest's
+        # processes: a component without its own only matches facilities that
+        # can actually produce it (i.e. none).
+        component_processes = self._component_processes(component)
+        component_manifest.manufacturing_processes = component_processes
 
-        # If we found component-specific processes, use them
-        # Otherwise, for component-level matching, use empty list to prevent fallback
-        # This ensures components only match facilities that can actually produce them
         if component_processes:
-            # Validate: keep only non-empty string processes
-            validated_processes = [
-                proc
-                for proc in component_processes
-                if isinstance(proc, str) and proc.strip()
-            ]
-
-            if validated_processes:
-                component_manifest.manufacturing_processes = validated_processes
-                logger.info(
-                    f"Component '{component.name}' processes set: {validated_processes}",
-                    extra={
-                        "component_id": component.id,
-                        "component_name": component.name,
-                        "processes": validated_processes,
-                        "base_manifest_processes": base_manifest.manufacturing_processes,
-                    },
-                )
-            else:
-                logger.warning(
-                    f"No valid processes for component '{component.name}' after validation",
-                    extra={
-                        "component_id": component.id,
-                        "component_name": component.name,
-                        "original_processes": component_processes,
-                    },
-                )
-                component_manifest.manufacturing_processes = []
+            logger.info(
+                f"Component '{component.name}' processes set: {component_processes}",
+                extra={
+                    "component_id": component.id,
+                    "component_name": component.name,
+                    "processes": component_processes,
+                    "base_manifest_processes": base_manifest.manufacturing_processes,
+                },
+            )
         else:
-            # For component-level matching, don't fall back to base manifest processes
-            # This prevents components from matching all facilities when they have no specific requirements
-            # Only use base manifest processes for root-level matching (not component-level)
-            # CRITICAL: Explicitly set to empty list to prevent any fallback
-            component_manifest.manufacturing_processes = []
-            # Double-check that we didn't accidentally inherit base manifest processes
-            if component_manifest.manufacturing_processes != []:
-                logger.error(
-                    f"CRITICAL: Component manifest still has processes after setting to empty! "
-                    f"component={component.name}, processes={component_manifest.manufacturing_processes}",
-                    extra={
-                        "component_id": component.id,
-                        "component_name": component.name,
-                        "manifest_processes": component_manifest.manufacturing_processes,
-                        "base_manifest_processes": base_manifest.manufacturing_processes,
-                    },
-                )
-                component_manifest.manufacturing_processes = []  # Force to empty
             logger.warning(
                 f"Component '{component.name}' has no specific process requirements (no TSDC codes). "
                 f"This component will not match any facilities unless it has explicit process requirements.",
@@ -2818,8 +3647,26 @@ class MatchingService:
         Returns:
             List of SupplyTrees for this component
         """
-        component_trees = []
+        templates = await self._match_component_profile(
+            component, manifest, facilities, domain
+        )
+        return self._component_trees(
+            templates, component, component_match, min_confidence
+        )
+
+    async def _match_component_profile(
+        self,
+        component: Component,
+        manifest: OKHManifest,
+        facilities: List[ManufacturingFacility],
+        domain: str,
+    ) -> List[SupplyTree]:
+        """Score one component's process profile against every facility.
 
+        Returns one untouched tree per facility. Every component sharing the
+        profile (see :meth:`_component_processes`) gets its own copies via
+        :meth:`_component_trees`, so the pool is scored once per profile.
+        """
         # Create component-specific manifest with component's process requirements
         component_manifest = self._create_component_manifest(manifest, component)
 
@@ -2870,7 +3717,7 @@ class MatchingService:
                 },
             )
 
-        # Match component to each facility
+        templates: List[SupplyTree] = []
         for facility in facilities:
             try:
                 # Generate supply tree using component-specific manifest
@@ -2878,80 +3725,106 @@ class MatchingService:
                 tree = await self._generate_supply_tree(
                     component_manifest, facility, domain
                 )
-
-                logger.debug(
-                    f"Generated tree for component '{component.name}' at facility '{facility.name}': "
-                    f"confidence={tree.confidence_score}",
+            except Exception as e:
+                logger.warning(
+                    f"Failed to generate supply tree for component {component.name} at facility {facility.name}: {e}",
                     extra={
                         "component_id": component.id,
-                        "component_name": component.name,
                         "facility_id": str(facility.id),
-                        "facility_name": facility.name,
-                        "confidence": tree.confidence_score,
-                        "min_confidence": min_confidence,
+                        "error": str(e),
                     },
                 )
+                continue
 
-                # Apply confidence threshold
-                if tree.confidence_score < min_confidence:
-                    logger.debug(
-                        f"Skipping facility {facility.name} for component {component.name} "
-                        f"(confidence {tree.confidence_score} < {min_confidence})",
-                        extra={
-                            "component_id": component.id,
-                            "facility_id": str(facility.id),
-                            "confidence": tree.confidence_score,
-                            "threshold": min_confidence,
-                        },
-                    )
-                    continue
-
-                # Enhance tree with component information
-                tree.component_id = component.id
-                tree.component_name = component.name
-                tree.component_quantity = component.quantity
-                tree.component_unit = component.unit
-                # Handle None component_match gracefully
-                if component_match:
-                    tree.depth = component_match.depth
-                    tree.component_path = component_match.path
-                    tree.production_stage = (
-                        "component" if component_match.depth > 0 else "final"
-                    )
-                else:
-                    # Default values when component_match is None
-                    tree.depth = 0
-                    tree.component_path = [component.name] if component.name else []
-                    tree.production_stage = "final"
+            logger.debug(
+                f"Generated tree for component '{component.name}' at facility '{facility.name}': "
+                f"confidence={tree.confidence_score}",
+                extra={
+                    "component_id": component.id,
+                    "component_name": component.name,
+                    "facility_id": str(facility.id),
+                    "facility_name": facility.name,
+                    "confidence": tree.confidence_score,
+                },
+            )
+            templates.append(tree)
 
-                # Add component-specific metadata
-                if component.requirements:
-                    tree.metadata["component_requirements"] = component.requirements
-                if component.metadata:
-                    tree.metadata["component_metadata"] = component.metadata
+        return templates
 
-                component_trees.append(tree)
+    def _component_trees(
+        self,
+        templates: List[SupplyTree],
+        component: Component,
+        component_match: Optional[ComponentMatch],
+        min_confidence: float = 0.0,
+    ) -> List[SupplyTree]:
+        """Stamp one component onto fresh copies of its profile's trees.
 
+        Each copy gets a new id and its own lists, so parent/child linking on
+        one component never leaks into another sharing the profile.
+        """
+        component_trees = []
+        for template in templates:
+            # Apply confidence threshold
+            if template.confidence_score < min_confidence:
                 logger.debug(
-                    f"Matched component {component.name} to facility {facility.name}",
+                    f"Skipping facility {template.facility_name} for component {component.name} "
+                    f"(confidence {template.confidence_score} < {min_confidence})",
                     extra={
                         "component_id": component.id,
-                        "facility_id": str(facility.id),
-                        "confidence": tree.confidence_score,
-                        "depth": component_match.depth if component_match else 0,
+                        "facility_id": template.okw_reference,
+                        "confidence": template.confidence_score,
+                        "threshold": min_confidence,
                     },
                 )
+                continue
 
-            except Exception as e:
-                logger.warning(
-                    f"Failed to generate supply tree for component {component.name} at facility {facility.name}: {e}",
-                    extra={
-                        "component_id": component.id,
-                        "facility_id": str(facility.id),
-                        "error": str(e),
-                    },
+            tree = replace(
+                template,
+                id=uuid4(),
+                metadata=dict(template.metadata),
+                materials_required=list(template.materials_required),
+                capabilities_used=list(template.capabilities_used),
+                child_tree_ids=[],
+                depends_on=[],
+                required_by=[],
+            )
+
+            # Enhance tree with component information
+            tree.component_id = component.id
+            tree.component_name = component.name
+            tree.component_quantity = component.quantity
+            tree.component_unit = component.unit
+            # Handle None component_match gracefully
+            if component_match:
+                tree.depth = component_match.depth
+                tree.component_path = component_match.path
+                tree.production_stage = (
+                    "component" if component_match.depth > 0 else "final"
                 )
-                continue
+            else:
+                # Default values when component_match is None
+                tree.depth = 0
+                tree.component_path = [component.name] if component.name else []
+                tree.production_stage = "final"
+
+            # Add component-specific metadata
+            if component.requirements:
+                tree.metadata["component_requirements"] = component.requirements
+            if component.metadata:
+                tree.metadata["component_metadata"] = component.metadata
+
+            component_trees.append(tree)
+
+            logger.debug(
+                f"Matched component {component.name} to facility {tree.facility_name}",
+                extra={
+                    "component_id": component.id,
+                    "facility_id": tree.okw_reference,
+                    "confidence": tree.confidence_score,
+                    "depth": component_match.depth if component_match else 0,
+                },
+            )
 
         return component_trees
 
@@ -2,7 +2,7 @@ import asyncio
 import json
 import traceback
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import httpx
 import yaml
@@ -17,6 +17,11 @@ from ..generation.models import LayerConfig, PlatformType
 from ..generation.platforms.github import GitHubExtractor
 from ..generation.platforms.gitlab import GitLabExtractor
 from ..generation.url_router import URLRouter
+from ..matching.design_index import (
+    MIN_COVERAGE,
+    DesignProcessIndex,
+    get_design_index,
+)
 from ..models.okh import OKHManifest, ProcessRequirement
 from ..models.provenance import RecordProvenance, apply_ohm_metadata
 from ..models.visibility import (
@@ -126,6 +131,9 @@ class OKHService(BaseService["OKHService"]):
         self.storage: Optional[StorageService] = None
         self.generation_engine: Optional[GenerationEngine] = None
         self.url_router: Optional[URLRouter] = None
+        # Canonical process -> design ids, kept current on every write and
+        # rebuilt whenever the catalogue is assembled; reverse matching reads it.
+        self.design_index: DesignProcessIndex = get_design_index()
 
     async def _initialize_dependencies(self) -> None:
         """Initialize storage, generation engine, and URL routing dependencies.
@@ -222,6 +230,7 @@ class OKHService(BaseService["OKHService"]):
                 await self._visibility_store().save(
                     str(manifest.id), DEFAULT_VISIBILITY
                 )
+                self.design_index.upsert(manifest)
 
             self._invalidate_catalog_cache()
             return manifest
@@ -544,14 +553,21 @@ class OKHService(BaseService["OKHService"]):
                 key=CATALOG_CACHE_KEY,
             )
         )
+        # Exploded BOMs embed referenced manifests, which this write may change.
+        from .bom_resolution_service import invalidate_bom_explosions
+
+        invalidate_bom_explosions()
 
-    async def _assemble_okh_catalog(self) -> List[Dict[str, Any]]:
+    async def _assemble_okh_catalog(self) -> Dict[str, Any]:
         """Discover, load and dedupe every OKH manifest under ``okh/``.
 
-        Returns ``{"key": storage key, "manifest": raw dict}`` per id. The raw
-        dict is exactly what :meth:`list` feeds to ``OKHManifest.from_dict``, so
-        the cached and uncached paths build identical objects; the key is what
-        lets :meth:`_find_key_for_id` answer from the same cache.
+        ``entries`` holds ``{"key": storage key, "manifest": raw dict}`` per
+        id. The raw dict is exactly what :meth:`list` feeds to
+        ``OKHManifest.from_dict``, so the cached and uncached paths build
+        identical objects; the key is what lets :meth:`_find_key_for_id` answer
+        from the same cache. ``token`` is unique per assembly, so
+        :meth:`design_candidates` can tell whether the design index was built
+        from this catalogue.
         """
         discovery = SmartFileDiscovery(self.storage.manager)
         file_infos = await discovery.discover_files("okh")
@@ -560,7 +576,7 @@ class OKHService(BaseService["OKHService"]):
         semaphore = asyncio.Semaphore(CATALOG_FETCH_CONCURRENCY)
 
         async def load(file_info: FileInfo):
-            """``(file_info, id, raw_dict)``, or None when the object is unusable."""
+            """``(file_info, manifest, raw_dict)``, or None when the object is unusable."""
             async with semaphore:
                 try:
                     data = await self.storage.manager.get_object(file_info.key)
@@ -574,7 +590,7 @@ class OKHService(BaseService["OKHService"]):
                             file_info.key,
                         )
                         return None
-                    return file_info, OKHManifest.from_dict(fixed).id, fixed
+                    return file_info, OKHManifest.from_dict(fixed), fixed
                 except Exception as e:
                     self.logger.error(f"Failed to load OKH file {file_info.key}: {e}")
                     return None
@@ -583,33 +599,38 @@ class OKHService(BaseService["OKHService"]):
 
         # Dedupe by id, newest file wins. gather preserves input order, so this
         # sees the same sequence the previous sequential loop did.
-        winners: Dict[UUID, Tuple[FileInfo, Dict[str, Any]]] = {}
+        winners: Dict[UUID, Tuple[FileInfo, OKHManifest, Dict[str, Any]]] = {}
         for entry in loaded:
             if entry is None:
                 continue
-            file_info, manifest_id, raw = entry
-            existing = winners.get(manifest_id)
+            file_info, manifest, raw = entry
+            existing = winners.get(manifest.id)
             if existing is None:
-                winners[manifest_id] = (file_info, raw)
+                winners[manifest.id] = (file_info, manifest, raw)
                 continue
-            existing_info, _ = existing
+            existing_info = existing[0]
             new_mtime = getattr(file_info, "last_modified", None)
             old_mtime = getattr(existing_info, "last_modified", None)
             if new_mtime and old_mtime and new_mtime > old_mtime:
-                winners[manifest_id] = (file_info, raw)
+                winners[manifest.id] = (file_info, manifest, raw)
 
-        return [
-            {"key": file_info.key, "manifest": raw}
-            for file_info, raw in winners.values()
-        ]
+        # The manifests are already parsed here, so the reverse-match index is
+        # rebuilt from them for free rather than re-parsing the cached dicts.
+        token = uuid4().hex
+        self.design_index.rebuild(
+            (manifest for _, manifest, _ in winners.values()), source=token
+        )
 
-    async def _catalog_entries(self) -> List[Dict[str, Any]]:
-        """The cached catalogue: one entry per manifest id.
+        return {
+            "token": token,
+            "entries": [
+                {"key": file_info.key, "manifest": raw}
+                for file_info, _, raw in winners.values()
+            ],
+        }
 
-        Shared by list / get / _find_key_for_id so a single assembly serves all
-        three. Each previously scanned storage independently, one object at a
-        time.
-        """
+    async def _load_catalog(self) -> Dict[str, Any]:
+        """The cached catalogue assembly (see :meth:`_assemble_okh_catalog`)."""
         return await cached(
             service=CATALOG_CACHE_SERVICE,
             operation=CATALOG_CACHE_OPERATION,
@@ -618,6 +639,56 @@ class OKHService(BaseService["OKHService"]):
             loader=self._assemble_okh_catalog,
         )
 
+    async def _catalog_entries(self) -> List[Dict[str, Any]]:
+        """The cached catalogue: one entry per manifest id.
+
+        Shared by list / get / _find_key_for_id so a single assembly serves all
+        three. Each previously scanned storage independently, one object at a
+        time.
+        """
+        return (await self._load_catalog())["entries"]
+
+    async def design_candidates(
+        self, facility: Any, min_coverage: float = MIN_COVERAGE
+    ) -> Tuple[List[OKHManifest], int]:
+        """Designs ``facility`` could plausibly produce, best coverage bound first.
+
+        Only catalogue entries whose requirements could reach ``min_coverage``
+        against the facility's processes are parsed (see
+        :mod:`..matching.design_index`); everything else is skipped without
+        being loaded into a model.
+
+        Args:
+            facility: The OKW facility (model or dict) to select designs for.
+            min_coverage: Partial-match threshold the bound is checked against.
+
+        Returns:
+            ``(candidate manifests, catalogue size)``.
+        """
+        await self.ensure_initialized()
+        if not self.storage or not self.storage.manager:
+            return [], 0
+
+        catalog = await self._load_catalog()
+        by_id = {
+            str(e["manifest"].get("id")): e["manifest"] for e in catalog["entries"]
+        }
+        if self.design_index.source != catalog["token"]:
+            # The catalogue came from a shared cache another process assembled,
+            # or this index was built from an older assembly; bring it in line.
+            self.design_index.rebuild(
+                (OKHManifest.from_dict(raw) for raw in by_id.values()),
+                source=catalog["token"],
+            )
+
+        query = self.design_index.query(facility, min_coverage)
+        manifests = [
+            OKHManifest.from_dict(by_id[okh_id])
+            for okh_id in query.ranked_ids()
+            if okh_id in by_id
+        ]
+        return manifests, len(by_id)
+
     async def list_manifests(
         self, limit: int = 100, offset: int = 0
     ) -> List[OKHManifest]:
@@ -670,6 +741,8 @@ class OKHService(BaseService["OKHService"]):
                 existing_key, manifest_json.encode("utf-8")
             )
             logger.info(f"Updated OKH manifest at {existing_key}")
+            self.design_index.remove(manifest_id)
+            self.design_index.upsert(manifest)
 
         self._invalidate_catalog_cache()
         return manifest
@@ -784,6 +857,8 @@ class OKHService(BaseService["OKHService"]):
 
             result = await self.storage.manager.delete_object(existing_key)
             self._invalidate_catalog_cache()
+            if result:
+                self.design_index.remove(manifest_id)
             logger.info(f"Deleted OKH manifest at {existing_key}")
             return result
 
@@ -1,10 +1,15 @@
+import copy
 import json
 import os
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
-from uuid import UUID, uuid5, NAMESPACE_URL
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4, uuid5, NAMESPACE_URL
+
+from ..cache.helper import cached
 
 from ..domains.cooking.models import KitchenCapability
+from ..matching.facility_index import FacilityProcessIndex, get_facility_index
 from ..models.okw import FacilityStatus, Location, ManufacturingFacility
 from ..models.provenance import RecordProvenance, apply_ohm_metadata
 from ..models.disclosure import (
@@ -22,7 +27,7 @@ from ..models.visibility import (
 from ..storage.disclosure_store import DisclosureStore
 from ..storage.provenance_store import ProvenanceStore
 from ..storage.visibility_store import VisibilityStore
-from ..storage.smart_discovery import SmartFileDiscovery
+from ..storage.smart_discovery import FileInfo, SmartFileDiscovery
 from ..taxonomy import taxonomy
 from ..utils.country_names import countries_match, display_country_name
 from ..utils.logging import get_logger
@@ -33,6 +38,77 @@ from .storage_service import StorageService
 
 logger = get_logger(__name__)
 
+# Blob reads issued at once when loading an ``okw/`` snapshot. Objects used to
+# be read one at a time, and every page of ``list()`` re-read all of them, so
+# building the network pool cost roughly N²/page_size sequential reads. Bounded
+# like ``OKHService``'s catalogue fetch so a large bucket cannot exhaust the
+# storage client's connection pool.
+OKW_FETCH_CONCURRENCY = 16
+
+# The assembled catalogue is cached like the OKH one, so list/get/search and
+# match candidate selection share a single scan instead of each repeating it.
+# Writes through this service invalidate the entry, so the TTL only covers
+# changes that bypass it — a federation ingest on another replica, or files
+# dropped into the bucket by hand.
+CATALOG_CACHE_TTL_SECONDS = 120
+CATALOG_CACHE_SERVICE = "okw"
+CATALOG_CACHE_OPERATION = "catalog"
+CATALOG_CACHE_KEY = "all"
+
+# Bumped whenever the facility catalogue may have changed: a write through
+# OKWService, or a freshly assembled catalogue replacing the parsed one.
+# Indexes and match caches derived from the catalogue key on it.
+_catalog_version = 0
+
+
+def catalog_version() -> int:
+    """Current process-wide OKW catalogue version."""
+    return _catalog_version
+
+
+def _bump_catalog_version() -> None:
+    global _catalog_version
+    _catalog_version += 1
+
+
+@dataclass
+class OKWSnapshot:
+    """One pass over ``okw/``: every facility and kitchen exactly once.
+
+    Duplicated ids (the same record at several keys) resolve to the most
+    recently modified file. ``keys`` maps each surviving id to its storage key.
+    ``token`` identifies the cached catalogue the snapshot was parsed from and
+    ``version`` is the :func:`catalog_version` it was parsed under.
+
+    Snapshots are shared between callers until the catalogue changes, so the
+    records are never handed out directly: the public accessors return copies
+    (see :meth:`OKWService.iter_facilities`). Invalidation is per process; a
+    write made by another worker is only seen once this process reloads the
+    cached catalogue.
+    """
+
+    facilities: List[ManufacturingFacility] = field(default_factory=list)
+    kitchens: List[KitchenCapability] = field(default_factory=list)
+    keys: Dict[UUID, str] = field(default_factory=dict)
+    file_count: int = 0
+    token: Optional[str] = None
+    version: int = 0
+    by_id: Dict[UUID, ManufacturingFacility] = field(
+        init=False, repr=False, default_factory=dict
+    )
+
+    def __post_init__(self) -> None:
+        self.by_id = {facility.id: facility for facility in self.facilities}
+
+
+def _is_newer(candidate: Any, current: Any) -> bool:
+    """True when ``candidate`` file info should replace ``current`` for the same id."""
+    candidate_modified = getattr(candidate, "last_modified", None)
+    current_modified = getattr(current, "last_modified", None)
+    return bool(candidate_modified) and (
+        not current_modified or candidate_modified > current_modified
+    )
+
 
 # --- Unified network-space projection + filtering (for GET /api/okw/spaces) ----
 
@@ -300,6 +376,11 @@ class OKWService(BaseService["OKWService"]):
         """Initialize the OKW service with base service functionality."""
         super().__init__(service_name, config)
         self.storage: Optional[StorageService] = None
+        # Canonical process -> facility ids, kept current on every write and
+        # refreshed from every storage load; match candidate selection reads it.
+        self.capability_index: FacilityProcessIndex = get_facility_index()
+        # Parsed view of the cached catalogue; see _load_snapshot.
+        self._snapshot: Optional[OKWSnapshot] = None
 
     async def _initialize_dependencies(self) -> None:
         """Initialize storage dependency and ensure it is configured.
@@ -389,6 +470,8 @@ class OKWService(BaseService["OKWService"]):
                 await self._visibility_store().save(
                     str(facility.id), DEFAULT_VISIBILITY
                 )
+                self._invalidate_catalog_cache()
+                self.capability_index.upsert(facility)
 
             return facility
 
@@ -502,7 +585,9 @@ class OKWService(BaseService["OKWService"]):
         }
 
     async def get(self, facility_id: UUID) -> Optional[ManufacturingFacility]:
-        """Discover ``okw/`` files and return the most recently modified row matching ``facility_id``.
+        """Return the facility with ``facility_id`` from the OKW catalogue.
+
+        When several files carry the id, the most recently modified one wins.
 
         Args:
             facility_id: Target facility UUID.
@@ -514,54 +599,9 @@ class OKWService(BaseService["OKWService"]):
             await self.ensure_initialized()
             self.logger.info(f"Getting manufacturing facility with ID {facility_id}")
 
-            if self.storage:
-                # Use smart discovery to find OKW files
-                discovery = SmartFileDiscovery(self.storage.manager)
-                file_infos = await discovery.discover_files("okw")
-
-                self.logger.info(
-                    f"Found {len(file_infos)} OKW files using smart discovery"
-                )
-
-                # Search through OKW files for the matching ID
-                # If multiple files have the same ID, prefer the most recently modified one
-                matching_facilities = []
-                for file_info in file_infos:
-                    try:
-                        data = await self.storage.manager.get_object(file_info.key)
-                        content = data.decode("utf-8")
-                        okw_data = json.loads(content)
-
-                        # Validate and fix UUID issues
-                        fixed_okw_data = UUIDValidator.validate_and_fix_okw_data(
-                            okw_data
-                        )
-
-                        facility = ManufacturingFacility.from_dict(fixed_okw_data)
-                        if facility.id == facility_id:
-                            # Store with file info for sorting
-                            matching_facilities.append((file_info, facility))
-                    except Exception as e:
-                        self.logger.error(
-                            f"Failed to load OKW file {file_info.key}: {e}"
-                        )
-                        continue
-
-                # If multiple matches, return the most recently modified one
-                if matching_facilities:
-                    # Sort by last_modified (most recent first)
-                    matching_facilities.sort(
-                        key=lambda x: (
-                            x[0].last_modified if hasattr(x[0], "last_modified") else ""
-                        ),
-                        reverse=True,
-                    )
-                    self.logger.info(
-                        f"Found {len(matching_facilities)} file(s) with ID {facility_id}, using most recent: {matching_facilities[0][0].key}"
-                    )
-                    return matching_facilities[0][1]
-
-            return None
+            snapshot = await self._load_snapshot()
+            facility = snapshot.by_id.get(facility_id)
+            return copy.deepcopy(facility) if facility is not None else None
 
     async def get_by_id(self, facility_id: UUID) -> Optional[ManufacturingFacility]:
         """Compatibility alias for :meth:`get`.
@@ -584,8 +624,9 @@ class OKWService(BaseService["OKWService"]):
 
         Returns only ``ManufacturingFacility`` objects.  Any file under
         ``okw/`` that is identified as cooking capability (by
-        ``KitchenCapability.is_cooking_capability()``) is skipped and logged at
-        DEBUG level so the two capability types remain strictly separated.
+        ``KitchenCapability.is_cooking_capability()``) is skipped so the two
+        capability types remain strictly separated. Built on
+        :meth:`iter_facilities`, so a page costs one pass over ``okw/``.
 
         Returns:
             A tuple of ``(facilities, total_count)`` where every element
@@ -610,73 +651,198 @@ class OKWService(BaseService["OKWService"]):
             )
             return [], 0
 
-        # Use smart discovery to find OKW files
+        unique_facilities = [f async for f in self.iter_facilities()]
+        start_idx = (page - 1) * page_size
+        end_idx = start_idx + page_size
+        paginated_facilities = unique_facilities[start_idx:end_idx]
+
+        logger.info(
+            f"Found {len(unique_facilities)} unique facilities (page {page}: {len(paginated_facilities)} facilities)"
+        )
+
+        return paginated_facilities, len(unique_facilities)
+
+    async def iter_facilities(self) -> AsyncIterator[ManufacturingFacility]:
+        """Yield every manufacturing facility under ``okw/`` exactly once.
+
+        Served from the cached catalogue (see :meth:`_load_snapshot`); on a miss
+        the whole prefix is discovered and fetched once, so walking all
+        facilities costs at most one read per object however the caller
+        consumes them. Kitchen files are skipped; they belong to
+        :meth:`list_kitchens`.
+
+        Each facility is a private copy, so callers may edit what they receive
+        without corrupting the shared snapshot.
+        """
+        snapshot = await self._load_snapshot()
+        for facility in snapshot.facilities:
+            yield copy.deepcopy(facility)
+
+    async def _load_snapshot(self) -> OKWSnapshot:
+        """The parsed OKW catalogue, reusing the cached assembly when it is current.
+
+        The raw catalogue lives in the shared cache (see
+        :meth:`_assemble_okw_catalog`); parsing it into model objects happens
+        once per assembly per process. A new assembly rebuilds the capability
+        index, which also drops facilities deleted behind this service's back,
+        and bumps :func:`catalog_version`.
+        """
+        await self.ensure_initialized()
+        if not self.storage or not self.storage.manager:
+            return OKWSnapshot()
+
+        catalog = await cached(
+            service=CATALOG_CACHE_SERVICE,
+            operation=CATALOG_CACHE_OPERATION,
+            key=CATALOG_CACHE_KEY,
+            ttl_seconds=CATALOG_CACHE_TTL_SECONDS,
+            loader=self._assemble_okw_catalog,
+        )
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.token == catalog["token"]:
+            return snapshot
+
+        facilities: List[ManufacturingFacility] = []
+        kitchens: List[KitchenCapability] = []
+        keys: Dict[UUID, str] = {}
+        for entry in catalog["entries"]:
+            if entry["kind"] == "kitchen":
+                record = KitchenCapability.from_dict(entry["record"])
+                kitchens.append(record)
+            else:
+                record = ManufacturingFacility.from_dict(entry["record"])
+                facilities.append(record)
+            keys[record.id] = entry["key"]
+
+        _bump_catalog_version()
+        snapshot = OKWSnapshot(
+            facilities=facilities,
+            kitchens=kitchens,
+            keys=keys,
+            file_count=catalog["file_count"],
+            token=catalog["token"],
+            version=catalog_version(),
+        )
+        self._snapshot = snapshot
+        self.capability_index.rebuild(snapshot.facilities)
+        return snapshot
+
+    def catalog_revision(self, facility: Any) -> Optional[int]:
+        """The catalogue version ``facility`` is an unedited record of, or None.
+
+        True only while the parsed snapshot is current and holds an equal
+        record under the same id, so an edited copy or a request-supplied
+        facility that reuses a catalogue id never passes for the stored one.
+        Derived caches key catalogue facilities on ``(id, revision)`` instead
+        of hashing their content.
+        """
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.version != catalog_version():
+            return None
+        record = snapshot.by_id.get(getattr(facility, "id", None))
+        if record is None or record != facility:
+            return None
+        return snapshot.version
+
+    async def _assemble_okw_catalog(self) -> Dict[str, Any]:
+        """Discover, fetch, classify and dedupe everything under ``okw/`` once.
+
+        Objects are fetched with one bulk ``get_objects`` call (at most
+        ``OKW_FETCH_CONCURRENCY`` in flight); results are
+        consumed in discovery order, so dedupe sees the same sequence the old
+        sequential loops did. Entries are ``{"key", "kind", "record"}`` with the
+        UUID-fixed raw dict as ``record``: plain data, so any cache backend can
+        hold it, and exactly what :meth:`_load_snapshot` parses.
+        """
         discovery = SmartFileDiscovery(self.storage.manager)
         file_infos = await discovery.discover_files("okw")
-
         logger.info(f"Found {len(file_infos)} OKW files using smart discovery")
 
-        # Process files and deduplicate by facility ID
-        facilities_by_id: Dict[UUID, ManufacturingFacility] = {}
-        file_info_by_id: Dict[UUID, Any] = {}
+        bodies = await self.storage.manager.get_objects(
+            [fi.key for fi in file_infos], max_concurrency=OKW_FETCH_CONCURRENCY
+        )
 
-        for file_info in file_infos:
+        def load(file_info: FileInfo):
+            """``(file_info, kind, id, raw)``, or None when the object is unusable."""
+            try:
+                data = bodies[file_info.key]
+                if isinstance(data, Exception):
+                    raise data
+                raw = json.loads(data.decode("utf-8"))
+            except Exception as e:
+                logger.error(f"Failed to load OKW file {file_info.key}: {e}")
+                return None
+            if KitchenCapability.is_cooking_capability(raw):
+                try:
+                    kitchen = KitchenCapability.from_dict(raw)
+                    return file_info, "kitchen", kitchen.id, raw
+                except Exception as e:
+                    logger.warning(
+                        f"Skipping file {file_info.key}: could not parse as KitchenCapability: {e}"
+                    )
+                    return None
             try:
-                data = await self.storage.manager.get_object(file_info.key)
-                content = data.decode("utf-8")
-                okw_data = json.loads(content)
-
-                # Skip files that are cooking capabilities — they belong to list_kitchens()
-                if KitchenCapability.is_cooking_capability(okw_data):
-                    logger.debug(f"Skipping kitchen file {file_info.key} in list()")
-                    continue
-
                 # Validate and fix UUID issues
-                fixed_okw_data = UUIDValidator.validate_and_fix_okw_data(okw_data)
-
+                fixed_okw_data = UUIDValidator.validate_and_fix_okw_data(raw)
                 facility = ManufacturingFacility.from_dict(fixed_okw_data)
-                facility_id = facility.id
-
-                # If we haven't seen this ID, or this file is more recent, keep it
-                if facility_id not in facilities_by_id:
-                    facilities_by_id[facility_id] = facility
-                    file_info_by_id[facility_id] = file_info
-                else:
-                    # Compare last_modified dates to keep the most recent
-                    existing_modified = (
-                        file_info_by_id[facility_id].last_modified
-                        if hasattr(file_info_by_id[facility_id], "last_modified")
-                        else None
-                    )
-                    current_modified = (
-                        file_info.last_modified
-                        if hasattr(file_info, "last_modified")
-                        else None
-                    )
-
-                    if current_modified and (
-                        not existing_modified or current_modified > existing_modified
-                    ):
-                        facilities_by_id[facility_id] = facility
-                        file_info_by_id[facility_id] = file_info
-                        logger.debug(
-                            f"Replacing facility {facility_id} with more recent version from {file_info.key}"
-                        )
+                return file_info, "facility", facility.id, fixed_okw_data
             except Exception as e:
                 logger.error(f"Failed to load OKW file {file_info.key}: {e}")
-                continue
+                return None
 
-        # Convert dict values to list and apply pagination
-        unique_facilities = list(facilities_by_id.values())
-        start_idx = (page - 1) * page_size
-        end_idx = start_idx + page_size
-        paginated_facilities = unique_facilities[start_idx:end_idx]
+        loaded = [load(fi) for fi in file_infos]
 
+        # Facilities and kitchens dedupe independently: newest file per id wins.
+        winners: Dict[Tuple[str, UUID], Tuple[FileInfo, Dict[str, Any]]] = {}
+        for entry in loaded:
+            if entry is None:
+                continue
+            file_info, kind, record_id, raw = entry
+            existing = winners.get((kind, record_id))
+            if existing is None or _is_newer(file_info, existing[0]):
+                if existing is not None:
+                    logger.debug(
+                        f"Replacing {record_id} with more recent version from {file_info.key}"
+                    )
+                winners[(kind, record_id)] = (file_info, raw)
+
+        entries = [
+            {"key": file_info.key, "kind": kind, "record": raw}
+            for (kind, _), (file_info, raw) in winners.items()
+        ]
         logger.info(
-            f"Found {len(file_infos)} OKW files, {len(unique_facilities)} unique facilities (page {page}: {len(paginated_facilities)} facilities)"
+            f"Assembled OKW catalogue: {len(entries)} records from "
+            f"{len(file_infos)} OKW files"
         )
+        return {
+            "token": uuid4().hex,
+            "file_count": len(file_infos),
+            "entries": entries,
+        }
 
-        return paginated_facilities, len(unique_facilities)
+    def _invalidate_catalog_cache(self) -> None:
+        """Drop the cached catalogue after a write.
+
+        Other replicas see the next assembly's new token and re-parse; this
+        process also forgets its parsed snapshot, bumps the catalogue version
+        and drops memoized facility capabilities.
+        """
+        from ..cache.keys import namespaced_key
+        from .cache_service import get_cache_service
+        from .matching import invalidate_facility_capabilities
+
+        cache = get_cache_service()
+        cache.delete(
+            namespaced_key(
+                prefix=cache.key_prefix,
+                service=CATALOG_CACHE_SERVICE,
+                operation=CATALOG_CACHE_OPERATION,
+                key=CATALOG_CACHE_KEY,
+            )
+        )
+        self._snapshot = None
+        _bump_catalog_version()
+        invalidate_facility_capabilities()
 
     async def list_facilities(
         self,
@@ -782,22 +948,13 @@ class OKWService(BaseService["OKWService"]):
         """
         candidates: List[Dict[str, Any]] = []
         dropped_no_coords = 0
-        page = 1
-        page_size = 500
-        while True:
-            facilities, _ = await self.list(page=page, page_size=page_size)
-            if not facilities:
-                break
-            for f in facilities:
-                space = _local_facility_to_space(f, require_coords=require_coords)
-                if space is None:
-                    dropped_no_coords += 1
-                    continue
-                space["_facility"] = f
-                candidates.append(space)
-            if len(facilities) < page_size:
-                break
-            page += 1
+        async for f in self.iter_facilities():
+            space = _local_facility_to_space(f, require_coords=require_coords)
+            if space is None:
+                dropped_no_coords += 1
+                continue
+            space["_facility"] = f
+            candidates.append(space)
 
         mom_available = False
         if include_mom:
@@ -875,58 +1032,8 @@ class OKWService(BaseService["OKWService"]):
         if not self.storage:
             return []
 
-        discovery = SmartFileDiscovery(self.storage.manager)
-        file_infos = await discovery.discover_files("okw")
-
-        logger.info(f"Scanning {len(file_infos)} OKW files for kitchen capabilities")
-
-        kitchens_by_id: Dict[UUID, KitchenCapability] = {}
-        file_info_by_id: Dict[UUID, Any] = {}
-
-        for file_info in file_infos:
-            try:
-                data = await self.storage.manager.get_object(file_info.key)
-                content = data.decode("utf-8")
-                raw = json.loads(content)
-
-                if not KitchenCapability.is_cooking_capability(raw):
-                    logger.debug(
-                        f"Skipping non-kitchen file {file_info.key} in list_kitchens()"
-                    )
-                    continue
-
-                kitchen = KitchenCapability.from_dict(raw)
-                kitchen_id = kitchen.id
-
-                if kitchen_id not in kitchens_by_id:
-                    kitchens_by_id[kitchen_id] = kitchen
-                    file_info_by_id[kitchen_id] = file_info
-                else:
-                    existing_modified = (
-                        file_info_by_id[kitchen_id].last_modified
-                        if hasattr(file_info_by_id[kitchen_id], "last_modified")
-                        else None
-                    )
-                    current_modified = (
-                        file_info.last_modified
-                        if hasattr(file_info, "last_modified")
-                        else None
-                    )
-                    if current_modified and (
-                        not existing_modified or current_modified > existing_modified
-                    ):
-                        kitchens_by_id[kitchen_id] = kitchen
-                        file_info_by_id[kitchen_id] = file_info
-                        logger.debug(
-                            f"Replacing kitchen {kitchen_id} with more recent version from {file_info.key}"
-                        )
-            except Exception as e:
-                logger.warning(
-                    f"Skipping file {file_info.key}: could not parse as KitchenCapability: {e}"
-                )
-                continue
-
-        kitchens = list(kitchens_by_id.values())
+        snapshot = await self._load_snapshot()
+        kitchens = copy.deepcopy(snapshot.kitchens)
         logger.info(f"Found {len(kitchens)} unique kitchen capabilities")
         return kitchens
 
@@ -970,6 +1077,10 @@ class OKWService(BaseService["OKWService"]):
                 existing_key, facility_json.encode("utf-8")
             )
             logger.info(f"Updated OKW facility at {existing_key}")
+            self._invalidate_catalog_cache()
+            if facility.id != facility_id:
+                self.capability_index.remove(facility_id)
+            self.capability_index.upsert(facility)
 
         return facility
 
@@ -998,34 +1109,23 @@ class OKWService(BaseService["OKWService"]):
 
             result = await self.storage.manager.delete_object(existing_key)
             logger.info(f"Deleted OKW facility at {existing_key}")
+            self._invalidate_catalog_cache()
+            self.capability_index.remove(facility_id)
             return result
 
         return False
 
     async def _find_key_for_id(self, target_id: UUID) -> Optional[str]:
-        """Discover the storage key for an OKW object id.
+        """Storage key for an OKW object id, answered from the catalogue.
 
         Args:
-            target_id: UUID to match against the stored JSON ``id`` field.
+            target_id: Facility or kitchen UUID.
 
         Returns:
             Matching object key or ``None`` if no key can be resolved.
         """
-        discovery = SmartFileDiscovery(self.storage.manager)
-        file_infos = await discovery.discover_files("okw")
-
-        for file_info in file_infos:
-            try:
-                data = await self.storage.manager.get_object(file_info.key)
-                content = data.decode("utf-8")
-                obj_data = json.loads(content)
-                if obj_data.get("id") == str(target_id):
-                    return file_info.key
-            except Exception as e:
-                logger.debug(f"Could not read {file_info.key} during key lookup: {e}")
-                continue
-
-        return None
+        snapshot = await self._load_snapshot()
+        return snapshot.keys.get(target_id)
 
     async def validate(
         self,
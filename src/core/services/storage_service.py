@@ -1,20 +1,32 @@
+import asyncio
 import json
 import logging
 from datetime import datetime, timedelta
-from typing import Any, Dict, Generic, List, Optional, Tuple, Type, TypeVar
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 from uuid import UUID, uuid4
 
 from ..models.okh import OKHManifest
 from ..models.okw import ManufacturingFacility
 from ..models.supply_trees import SupplyTree, SupplyTreeSolution
 from ..matching.match_modes import MATCH_MODE_SINGLE_LEVEL
-from ..storage.base import StorageConfig
+from ..storage.base import ObjectWrite, StorageConfig
 from ..storage.constants import (
     DEFAULT_SOLUTION_TTL_DAYS,
     STORAGE_OBJECT_TYPE_SOLUTION_METADATA,
     STORAGE_OBJECT_TYPE_SUPPLY_TREE,
     STORAGE_OBJECT_TYPE_SUPPLY_TREE_SOLUTION,
     SUPPLY_TREE_SOLUTIONS_METADATA_PREFIX,
+    SUPPLY_TREE_SOLUTIONS_PREFIX,
     build_solution_key,
     build_solution_metadata_key,
 )
@@ -24,6 +36,54 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Objects read and written per bulk call when copying a bucket into a backup.
+BACKUP_BATCH_SIZE = 100
+
+
+async def _indexed_rows(manager: Any, prefix: str) -> Optional[List[Dict[str, Any]]]:
+    """Rows from the manager's key/metadata index, or None to fall back.
+
+    None when the manager has no index (or it is unavailable); callers then
+    list the prefix and read each object as before.
+    """
+    list_indexed = getattr(manager, "list_indexed", None)
+    if not asyncio.iscoroutinefunction(list_indexed):
+        return None
+    rows = await list_indexed(prefix)
+    return rows if isinstance(rows, list) else None
+
+
+def _solution_staleness(
+    metadata: Dict[str, Any], max_age_days: Optional[int], now: datetime
+) -> Tuple[bool, Optional[str]]:
+    """Staleness verdict for one solution metadata document.
+
+    Raises:
+        Exception: If ``created_at`` is missing or unparseable.
+    """
+    created_at = datetime.fromisoformat(metadata.get("created_at"))
+    expires_at_str = metadata.get("expires_at")
+
+    # Check explicit expiration
+    if expires_at_str:
+        expires_at = datetime.fromisoformat(expires_at_str)
+        if now > expires_at:
+            return (True, "expired")
+
+    # Check age-based staleness
+    age_days = (now - created_at).days
+
+    # Check max_age_days if provided
+    if max_age_days and age_days > max_age_days:
+        return (True, f"too_old_{age_days}_days")
+
+    # Check default TTL
+    ttl_days = metadata.get("ttl_days", DEFAULT_SOLUTION_TTL_DAYS)
+    if age_days > ttl_days:
+        return (True, f"exceeded_ttl_{ttl_days}_days")
+
+    return (False, None)
+
 
 class StorageRegistry:
     """Maps domain string keys to :class:`DomainStorageHandler` subclasses.
@@ -326,6 +386,23 @@ class StorageService:
         trees = []
         count = 0
 
+        rows = await _indexed_rows(self.manager, "supply-trees/")
+        if rows is not None:
+            rows = [
+                row
+                for row in rows
+                if row["key"].endswith(".json") and "id" in row["fields"]
+            ]
+            rows = rows[offset or 0 :]
+            return [
+                {
+                    "id": row["fields"]["id"],
+                    "okh_reference": row["fields"].get("okh_reference"),
+                    "last_modified": row["last_modified"],
+                }
+                for row in (rows[:limit] if limit else rows)
+            ]
+
         try:
             async for obj in self.manager.list_objects(prefix="supply-trees/"):
                 # Skip .gitkeep and other non-JSON files
@@ -529,17 +606,11 @@ class StorageService:
         now = datetime.now()
 
         try:
-            async for obj in self.manager.list_objects(
-                prefix=f"{SUPPLY_TREE_SOLUTIONS_METADATA_PREFIX}/"
-            ):
-                # Skip .gitkeep and other non-JSON files
-                if not obj["key"].endswith(".json"):
+            async for obj, metadata_dict in self._iter_solution_metadata():
+                if metadata_dict is None:
                     continue
 
                 try:
-                    data = await self.manager.get_object(obj["key"])
-                    metadata_dict = json.loads(data.decode("utf-8"))
-
                     # Apply basic filters
                     if okh_id and metadata_dict.get("okh_id") != str(okh_id):
                         continue
@@ -566,8 +637,10 @@ class StorageService:
 
                     # Apply staleness filters
                     if only_stale or not include_stale:
-                        solution_id = UUID(metadata_dict.get("id"))
-                        is_stale, _ = await self.is_solution_stale(solution_id)
+                        try:
+                            is_stale, _ = _solution_staleness(metadata_dict, None, now)
+                        except Exception:
+                            is_stale = True
 
                         if only_stale and not is_stale:
                             continue
@@ -675,6 +748,34 @@ class StorageService:
         # Return True if either file was deleted (handles partial deletion)
         return solution_deleted or metadata_deleted
 
+    async def _iter_solution_metadata(
+        self,
+    ) -> AsyncIterator[Tuple[Dict[str, Any], Optional[Dict[str, Any]]]]:
+        """Yield ``(listing entry, metadata dict)`` per solution metadata object.
+
+        Served from the key/metadata index when available (no object reads);
+        otherwise each object is listed and read. The dict is None when an
+        object could not be read or parsed.
+        """
+        prefix = f"{SUPPLY_TREE_SOLUTIONS_METADATA_PREFIX}/"
+        rows = await _indexed_rows(self.manager, prefix)
+        if rows is not None:
+            for row in rows:
+                if row["key"].endswith(".json"):
+                    yield row, row["fields"]
+            return
+
+        async for obj in self.manager.list_objects(prefix=prefix):
+            # Skip .gitkeep and other non-JSON files
+            if not obj["key"].endswith(".json"):
+                continue
+            try:
+                data = await self.manager.get_object(obj["key"])
+                yield obj, json.loads(data.decode("utf-8"))
+            except Exception as e:
+                logger.error(f"Failed to load solution metadata from {obj['key']}: {e}")
+                yield obj, None
+
     async def is_solution_stale(
         self, solution_id: UUID, max_age_days: Optional[int] = None
     ) -> Tuple[bool, Optional[str]]:
@@ -697,30 +798,7 @@ class StorageService:
         try:
             data = await self.manager.get_object(metadata_key)
             metadata = json.loads(data.decode("utf-8"))
-
-            now = datetime.now()
-            created_at = datetime.fromisoformat(metadata.get("created_at"))
-            expires_at_str = metadata.get("expires_at")
-
-            # Check explicit expiration
-            if expires_at_str:
-                expires_at = datetime.fromisoformat(expires_at_str)
-                if now > expires_at:
-                    return (True, "expired")
-
-            # Check age-based staleness
-            age_days = (now - created_at).days
-
-            # Check max_age_days if provided
-            if max_age_days and age_days > max_age_days:
-                return (True, f"too_old_{age_days}_days")
-
-            # Check default TTL
-            ttl_days = metadata.get("ttl_days", DEFAULT_SOLUTION_TTL_DAYS)
-            if age_days > ttl_days:
-                return (True, f"exceeded_ttl_{ttl_days}_days")
-
-            return (False, None)
+            return _solution_staleness(metadata, max_age_days, datetime.now())
 
         except Exception as e:
             logger.error(f"Failed to check staleness for solution {solution_id}: {e}")
@@ -767,30 +845,25 @@ class StorageService:
             raise RuntimeError("Storage service not configured")
 
         stale_solutions = []
+        now = datetime.now()
 
         try:
-            async for obj in self.manager.list_objects(
-                prefix=f"{SUPPLY_TREE_SOLUTIONS_METADATA_PREFIX}/"
-            ):
-                if not obj["key"].endswith(".json"):
-                    continue
-
+            async for obj, metadata in self._iter_solution_metadata():
                 try:
                     # Extract solution ID from key
                     key = obj["key"]
                     solution_id_str = key.split("/")[-1].replace(".json", "")
                     solution_id = UUID(solution_id_str)
 
-                    # Check if solution is stale
-                    is_stale, _ = await self.is_solution_stale(
-                        solution_id, max_age_days
-                    )
+                    # Check if solution is stale (unreadable metadata is)
+                    try:
+                        is_stale, _ = _solution_staleness(metadata, max_age_days, now)
+                    except Exception:
+                        is_stale = True
 
                     if is_stale:
                         # Check before_date filter if provided
                         if before_date:
-                            data = await self.manager.get_object(key)
-                            metadata = json.loads(data.decode("utf-8"))
                             created_at = datetime.fromisoformat(
                                 metadata.get("created_at")
                             )
@@ -835,31 +908,45 @@ class StorageService:
 
         stale_ids = await self.get_stale_solutions(max_age_days, before_date)
 
-        deleted_count = 0
+        if dry_run:
+            deleted_ids = [str(solution_id) for solution_id in stale_ids]
+            return {
+                "deleted_count": len(deleted_ids),
+                "freed_space": 0,
+                "deleted_ids": deleted_ids,
+                "dry_run": dry_run,
+            }
+
+        # Sizes come from the listing (index) rather than reading each payload
+        solution_keys = {sid: build_solution_key(sid) for sid in stale_ids}
+        metadata_keys = {sid: build_solution_metadata_key(sid) for sid in stale_ids}
+        rows = await _indexed_rows(self.manager, f"{SUPPLY_TREE_SOLUTIONS_PREFIX}/")
+        if rows is not None:
+            sizes = {row["key"]: row["size"] or 0 for row in rows}
+        else:
+            sizes = {}
+            async for obj in self.manager.list_objects(
+                prefix=f"{SUPPLY_TREE_SOLUTIONS_PREFIX}/"
+            ):
+                sizes[obj["key"]] = obj.get("size") or 0
+
+        # Delete payloads and sidecar metadata in one bulk call
+        deleted = await self.manager.delete_objects(
+            [*solution_keys.values(), *metadata_keys.values()]
+        )
+
         freed_space = 0
         deleted_ids = []
-
         for solution_id in stale_ids:
-            if not dry_run:
-                # Get size before deletion
-                solution_key = build_solution_key(solution_id)
-                try:
-                    data = await self.manager.get_object(solution_key)
-                    freed_space += len(data)
-                except Exception:
-                    # If we can't get the size, continue anyway
-                    pass
-
-                # Delete solution
-                if await self.delete_supply_tree_solution(solution_id):
-                    deleted_count += 1
-                    deleted_ids.append(str(solution_id))
-            else:
-                # Dry run - just add to list
+            solution_key = solution_keys[solution_id]
+            if deleted.get(solution_key):
+                freed_space += sizes.get(solution_key, 0)
+            # Counted when either file was deleted (handles partial pairs)
+            if deleted.get(solution_key) or deleted.get(metadata_keys[solution_id]):
                 deleted_ids.append(str(solution_id))
 
         return {
-            "deleted_count": deleted_count if not dry_run else len(deleted_ids),
+            "deleted_count": len(deleted_ids),
             "freed_space": freed_space,
             "deleted_ids": deleted_ids,
             "dry_run": dry_run,
@@ -1068,23 +1155,46 @@ class StorageService:
         object_count = 0
         total_size = 0
 
-        async for obj in self.manager.list_objects():
-            try:
-                data = await self.manager.get_object(obj["key"])
-                backup_key = f"{backup_prefix}{obj['key']}"
-
-                metadata = await self.manager.put_object(
-                    key=backup_key,
-                    data=data,
-                    content_type=obj.get("content_type", "application/octet-stream"),
-                    metadata=obj.get("metadata"),
+        # Copied in bulk batches so memory stays bounded on large buckets
+        batch: List[Dict[str, Any]] = []
+
+        async def copy_batch() -> None:
+            nonlocal object_count, total_size
+            bodies = await self.manager.get_objects(obj["key"] for obj in batch)
+            writes = []
+            for obj in batch:
+                data = bodies[obj["key"]]
+                if isinstance(data, Exception):
+                    logger.error(f"Failed to backup object {obj['key']}: {data}")
+                    continue
+                writes.append(
+                    ObjectWrite(
+                        key=f"{backup_prefix}{obj['key']}",
+                        data=data,
+                        content_type=obj.get(
+                            "content_type", "application/octet-stream"
+                        ),
+                        metadata=obj.get("metadata"),
+                    )
                 )
-
+            stored = await self.manager.put_objects(writes)
+            for write in writes:
+                metadata = stored[write.key]
+                if isinstance(metadata, Exception):
+                    logger.error(f"Failed to backup object {write.key}: {metadata}")
+                    continue
                 object_count += 1
                 total_size += metadata.size
-            except Exception as e:
-                logger.error(f"Failed to backup object {obj['key']}: {e}")
+            batch.clear()
+
+        async for obj in self.manager.list_objects():
+            if obj.get("is_prefix"):
                 continue
+            batch.append(obj)
+            if len(batch) >= BACKUP_BATCH_SIZE:
+                await copy_batch()
+        if batch:
+            await copy_batch()
 
         return {
             "backup_name": backup_name,
@@ -1218,6 +1328,25 @@ class DomainStorageHandler(Generic[T]):
         objects = []
         count = 0
 
+        rows = await _indexed_rows(self.storage_service.manager, f"{self.domain}/")
+        if rows is not None:
+            for row in rows[offset or 0 :]:
+                if limit and len(objects) >= limit:
+                    break
+                try:
+                    objects.append(
+                        {
+                            "id": self._get_object_id_from_dict(row["fields"]),
+                            "type": row["fields"].get("type"),
+                            "last_modified": row["last_modified"],
+                        }
+                    )
+                except Exception as e:
+                    logger.error(
+                        f"Failed to index {self.domain} object {row['key']}: {e}"
+                    )
+            return objects
+
         async for obj in self.storage_service.manager.list_objects(
             prefix=f"{self.domain}/"
         ):
@@ -1286,6 +1415,10 @@ class DomainStorageHandler(Generic[T]):
         """
         objects = await self.list(limit=limit, offset=offset)
 
+        rows = await _indexed_rows(self.storage_service.manager, f"{self.domain}/")
+        if rows is not None:
+            return objects, len(rows)
+
         # Get total count by listing all objects without limit/offset
         total_count = 0
         async for obj in self.storage_service.manager.list_objects(
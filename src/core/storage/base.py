@@ -1,6 +1,25 @@
+import asyncio
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, AsyncIterator, Dict, List, Optional
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+T = TypeVar("T")
+
+# Default number of in-flight requests for the bulk operations' per-object
+# fallback (providers without a native batch call for an operation).
+DEFAULT_BULK_CONCURRENCY = 16
 
 
 class StorageConfig:
@@ -45,8 +64,45 @@ class StorageMetadata:
         self.metadata = metadata or {}
 
 
+class ObjectWrite(NamedTuple):
+    """One object for :meth:`StorageProvider.put_objects`."""
+
+    key: str
+    data: bytes
+    content_type: str = "application/octet-stream"
+    metadata: Optional[Dict[str, str]] = None
+
+
+async def gather_bounded(
+    items: Iterable[T],
+    call: Callable[[T], Awaitable[Any]],
+    max_concurrency: Optional[int] = None,
+) -> List[Any]:
+    """Run ``call`` for every item with at most ``max_concurrency`` in flight.
+
+    Results come back in item order; an exception raised for one item is
+    returned in its slot instead of failing the batch.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency or DEFAULT_BULK_CONCURRENCY)
+
+    async def run(item: T) -> Any:
+        async with semaphore:
+            try:
+                return await call(item)
+            except Exception as e:
+                return e
+
+    return await asyncio.gather(*(run(item) for item in items))
+
+
 class StorageProvider(ABC):
-    """Base class for storage providers"""
+    """Base class for storage providers
+
+    The bulk operations (:meth:`get_objects`, :meth:`put_objects`,
+    :meth:`delete_objects`) default to the single-object calls with bounded
+    concurrency; providers override them where the backend has a native
+    batch API.
+    """
 
     @abstractmethod
     async def connect(self) -> None:
@@ -79,6 +135,48 @@ class StorageProvider(ABC):
         """Delete an object from the storage provider"""
         pass
 
+    async def get_objects(
+        self, keys: Iterable[str], max_concurrency: Optional[int] = None
+    ) -> Dict[str, Union[bytes, Exception]]:
+        """Retrieve several objects.
+
+        Returns:
+            ``key -> bytes`` for every requested key; a key that could not be
+            read maps to the exception instead.
+        """
+        keys = list(keys)
+        results = await gather_bounded(keys, self.get_object, max_concurrency)
+        return dict(zip(keys, results))
+
+    async def put_objects(
+        self, items: Iterable[ObjectWrite], max_concurrency: Optional[int] = None
+    ) -> Dict[str, Union[StorageMetadata, Exception]]:
+        """Store several objects (``ObjectWrite`` or equivalent tuples).
+
+        Returns:
+            ``key -> StorageMetadata``; a failed write maps to the exception.
+        """
+        items = [ObjectWrite(*item) for item in items]
+        results = await gather_bounded(
+            items,
+            lambda item: self.put_object(*item),
+            max_concurrency,
+        )
+        return {item.key: result for item, result in zip(items, results)}
+
+    async def delete_objects(
+        self, keys: Iterable[str], max_concurrency: Optional[int] = None
+    ) -> Dict[str, bool]:
+        """Delete several objects.
+
+        Returns:
+            ``key -> bool`` with the same meaning as :meth:`delete_object`
+            (False when the key did not exist or could not be deleted).
+        """
+        keys = list(keys)
+        results = await gather_bounded(keys, self.delete_object, max_concurrency)
+        return {key: result is True for key, result in zip(keys, results)}
+
     @abstractmethod
     async def list_objects(
         self,
@@ -0,0 +1,237 @@
+"""
+Persistent key/metadata index for a storage target.
+
+Listing endpoints and discovery used to list a prefix and then ``get_object``
+every key just to read a handful of fields (id, type, created_at, okh_id, ...).
+:class:`StorageIndex` keeps one SQLite row per key with the listing fields
+(size, etag, last_modified, content_type, object metadata) and a small
+projection of top-level JSON fields (:data:`INDEXED_FIELDS`), so those
+queries are answered without touching object bodies.
+
+The index is written by :class:`~src.core.storage.manager.StorageManager` on
+``put_object``/``copy_object``/``delete_object``. Objects written by other
+processes are picked up when the manager reconciles a prefix against a
+listing: unchanged keys (same etag, or same size and last_modified when the
+backend reports no etag) keep their rows, and only new or changed bodies are
+read and projected again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from .base import StorageConfig
+
+# Top-level JSON fields copied into the index. Covers the list rows of the
+# domain handlers (id, type), supply trees (okh_reference) and solution
+# metadata (staleness and sort fields).
+INDEXED_FIELDS = (
+    "id",
+    "type",
+    "name",
+    "title",
+    "okh_id",
+    "okh_reference",
+    "okh_title",
+    "facility_name",
+    "matching_mode",
+    "tree_count",
+    "component_count",
+    "facility_count",
+    "score",
+    "created_at",
+    "updated_at",
+    "expires_at",
+    "ttl_days",
+    "tags",
+)
+
+# Bodies larger than this are not parsed for the projection.
+MAX_PROJECTED_BYTES = 4 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    key TEXT PRIMARY KEY,
+    size INTEGER,
+    etag TEXT,
+    last_modified TEXT,
+    content_type TEXT,
+    metadata TEXT,
+    fields TEXT
+);
+CREATE TABLE IF NOT EXISTS scans (
+    prefix TEXT PRIMARY KEY,
+    scanned_at REAL
+);
+"""
+
+
+def project_fields(key: str, data: bytes) -> Dict[str, Any]:
+    """The :data:`INDEXED_FIELDS` of a JSON object body (empty for anything else)."""
+    if not key.endswith(".json") or len(data) > MAX_PROJECTED_BYTES:
+        return {}
+    try:
+        document = json.loads(data)
+    except (ValueError, UnicodeDecodeError):
+        return {}
+    if not isinstance(document, dict):
+        return {}
+    return {
+        name: document[name]
+        for name in INDEXED_FIELDS
+        if name in document
+        and isinstance(document[name], (str, int, float, bool, list, type(None)))
+    }
+
+
+def default_index_path(config: StorageConfig, directory: str) -> Path:
+    """One index file per storage target (provider, bucket, endpoint, account)."""
+    bucket = config.bucket_name
+    if config.provider == "local":
+        bucket = os.path.abspath(os.path.expanduser(os.path.expandvars(bucket)))
+    target = "|".join(
+        [
+            config.provider,
+            bucket,
+            config.endpoint_url or "",
+            config.credentials.get("account_name", ""),
+        ]
+    )
+    digest = hashlib.sha256(target.encode("utf-8")).hexdigest()[:16]
+    return Path(os.path.expanduser(directory)) / f"{config.provider}-{digest}.sqlite3"
+
+
+def _stamp(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+class StorageIndex:
+    """SQLite-backed key -> listing fields + JSON projection.
+
+    Methods are synchronous and block on disk; one connection is shared under
+    a lock, so async callers run them in a worker thread (see
+    :class:`~src.core.storage.manager.StorageManager`).
+    """
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def upsert(
+        self,
+        key: str,
+        *,
+        size: Optional[int],
+        etag: Optional[str],
+        last_modified: Any,
+        content_type: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        fields: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO objects VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    size,
+                    etag,
+                    _stamp(last_modified),
+                    content_type,
+                    json.dumps(metadata or {}),
+                    json.dumps(fields or {}, default=str),
+                ),
+            )
+
+    def upsert_body(self, key: str, data: bytes, **listing: Any) -> None:
+        """:meth:`upsert` with the :func:`project_fields` of ``data``."""
+        self.upsert(key, fields=project_fields(key, data), **listing)
+
+    def remove(self, keys: Iterable[str]) -> None:
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "DELETE FROM objects WHERE key = ?", [(k,) for k in keys]
+            )
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM objects WHERE key = ?", (key,)
+            ).fetchone()
+        return self._row(row) if row is not None else None
+
+    def rows(
+        self, prefix: str = "", where: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """Rows under ``prefix`` in key order, optionally filtered by field equality."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "SELECT * FROM objects WHERE key >= ? AND key < ? ORDER BY key",
+                (prefix, prefix + "\U0010ffff"),
+            )
+            rows = [self._row(row) for row in cursor]
+        if where:
+            rows = [
+                row
+                for row in rows
+                if all(row["fields"].get(k) == v for k, v in where.items())
+            ]
+        return rows
+
+    def scanned_at(self, prefix: str) -> Optional[float]:
+        """When ``prefix`` (or a prefix of it) was last reconciled."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MAX(scanned_at) FROM scans "
+                "WHERE substr(?, 1, length(prefix)) = prefix",
+                (prefix,),
+            ).fetchone()
+        return row[0] if row else None
+
+    def mark_scanned(self, prefix: str, at: Optional[float] = None) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO scans VALUES (?, ?)",
+                (prefix, time.time() if at is None else at),
+            )
+
+    @staticmethod
+    def _row(row: sqlite3.Row) -> Dict[str, Any]:
+        last_modified = row["last_modified"]
+        try:
+            last_modified = (
+                datetime.fromisoformat(last_modified) if last_modified else None
+            )
+        except ValueError:
+            pass
+        return {
+            "key": row["key"],
+            "size": row["size"],
+            "etag": row["etag"],
+            "last_modified": last_modified,
+            "content_type": row["content_type"],
+            "metadata": json.loads(row["metadata"] or "{}"),
+            "fields": json.loads(row["fields"] or "{}"),
+        }
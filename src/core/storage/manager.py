@@ -1,18 +1,38 @@
+import asyncio
 import logging
-from typing import Any, AsyncIterator, Dict, List, Optional
+import time
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Union
 
-from .base import StorageConfig, StorageMetadata, StorageProvider
+from src.config.settings import (
+    STORAGE_BULK_CONCURRENCY,
+    STORAGE_INDEX_DIR,
+    STORAGE_INDEX_ENABLED,
+    STORAGE_INDEX_RESCAN_SECONDS,
+)
+
+from .base import ObjectWrite, StorageConfig, StorageMetadata, StorageProvider
+from .index import StorageIndex, default_index_path
 
 logger = logging.getLogger(__name__)
 
 
 class StorageManager:
-    """Manages storage provider lifecycle and provides unified interface"""
+    """Manages storage provider lifecycle and provides unified interface
+
+    Writes made through the manager also maintain the persistent key/metadata
+    index (see :mod:`src.core.storage.index`), which :meth:`list_indexed`
+    answers listing and filter queries from. SQLite calls block, so every
+    index operation runs in a worker thread rather than on the event loop.
+    """
 
-    def __init__(self, config: StorageConfig):
+    def __init__(self, config: StorageConfig, index_path: Optional[str] = None):
         self.config = config
         self._provider: Optional[StorageProvider] = None
         self._connected = False
+        self._index_path = index_path
+        self._index: Optional[StorageIndex] = None
+        self._index_failed = False
+        self._index_lock = asyncio.Lock()
 
     @property
     def provider(self) -> StorageProvider:
@@ -43,6 +63,41 @@ class StorageManager:
         else:
             raise ValueError(f"Unsupported storage provider: {self.config.provider}")
 
+    async def _open_index(self) -> Optional[StorageIndex]:
+        """The key/metadata index, or None when disabled or unavailable.
+
+        Enabled by ``STORAGE_INDEX_ENABLED`` or an explicit ``index_path``.
+        Opened once, in a worker thread.
+        """
+        if self._index is not None or self._index_failed:
+            return self._index
+        if not (STORAGE_INDEX_ENABLED or self._index_path):
+            return None
+        async with self._index_lock:
+            if self._index is None and not self._index_failed:
+                try:
+                    self._index = await asyncio.to_thread(
+                        StorageIndex,
+                        self._index_path
+                        or default_index_path(self.config, STORAGE_INDEX_DIR),
+                    )
+                except Exception as e:
+                    logger.warning(
+                        f"Storage index unavailable, continuing without: {e}"
+                    )
+                    self._index_failed = True
+        return self._index
+
+    async def _update_index(self, action: str, *args: Any, **kwargs: Any) -> None:
+        """Apply one index write in a worker thread; failures are logged, never raised."""
+        index = await self._open_index()
+        if index is None:
+            return
+        try:
+            await asyncio.to_thread(getattr(index, action), *args, **kwargs)
+        except Exception as e:
+            logger.warning(f"Storage index {action} failed: {e}")
+
     async def connect(self) -> None:
         """Connect to the storage provider"""
         if not self._connected:
@@ -74,7 +129,23 @@ class StorageManager:
     ) -> StorageMetadata:
         """Store an object"""
         await self.ensure_connected()
-        return await self.provider.put_object(key, data, content_type, metadata)
+        stored = await self.provider.put_object(key, data, content_type, metadata)
+        await self._index_stored(key, data, stored)
+        return stored
+
+    async def _index_stored(
+        self, key: str, data: bytes, stored: StorageMetadata
+    ) -> None:
+        await self._update_index(
+            "upsert_body",
+            key,
+            data,
+            size=stored.size,
+            etag=stored.etag,
+            last_modified=stored.modified_at,
+            content_type=stored.content_type,
+            metadata=stored.metadata,
+        )
 
     async def get_object(self, key: str, version_id: Optional[str] = None) -> bytes:
         """Retrieve an object"""
@@ -84,7 +155,45 @@ class StorageManager:
     async def delete_object(self, key: str, version_id: Optional[str] = None) -> bool:
         """Delete an object"""
         await self.ensure_connected()
-        return await self.provider.delete_object(key, version_id)
+        deleted = await self.provider.delete_object(key, version_id)
+        if deleted and version_id is None:
+            await self._update_index("remove", [key])
+        return deleted
+
+    async def get_objects(
+        self, keys: Iterable[str], max_concurrency: Optional[int] = None
+    ) -> Dict[str, Union[bytes, Exception]]:
+        """Retrieve several objects; a key that failed maps to its exception"""
+        await self.ensure_connected()
+        return await self.provider.get_objects(
+            keys, max_concurrency or STORAGE_BULK_CONCURRENCY
+        )
+
+    async def put_objects(
+        self, items: Iterable[ObjectWrite], max_concurrency: Optional[int] = None
+    ) -> Dict[str, Union[StorageMetadata, Exception]]:
+        """Store several objects; a write that failed maps to its exception"""
+        await self.ensure_connected()
+        items = [ObjectWrite(*item) for item in items]
+        stored = await self.provider.put_objects(
+            items, max_concurrency or STORAGE_BULK_CONCURRENCY
+        )
+        for item in items:
+            result = stored.get(item.key)
+            if isinstance(result, StorageMetadata):
+                await self._index_stored(item.key, item.data, result)
+        return stored
+
+    async def delete_objects(
+        self, keys: Iterable[str], max_concurrency: Optional[int] = None
+    ) -> Dict[str, bool]:
+        """Delete several objects; True for each key that was deleted"""
+        await self.ensure_connected()
+        deleted = await self.provider.delete_objects(
+            keys, max_concurrency or STORAGE_BULK_CONCURRENCY
+        )
+        await self._update_index("remove", [key for key, ok in deleted.items() if ok])
+        return deleted
 
     async def list_objects(
         self,
@@ -112,9 +221,114 @@ class StorageManager:
     ) -> StorageMetadata:
         """Copy an object"""
         await self.ensure_connected()
-        return await self.provider.copy_object(
+        copied = await self.provider.copy_object(
             source_key, destination_key, source_version_id
         )
+        index = await self._open_index()
+        source = None
+        if index is not None:
+            try:
+                source = await asyncio.to_thread(index.get, source_key)
+            except Exception as e:
+                logger.warning(f"Storage index get failed: {e}")
+        await self._update_index(
+            "upsert",
+            destination_key,
+            size=copied.size,
+            etag=copied.etag,
+            last_modified=copied.modified_at,
+            content_type=copied.content_type,
+            metadata=copied.metadata,
+            fields=source["fields"] if source else None,
+        )
+        return copied
+
+    async def list_indexed(
+        self, prefix: str = "", where: Optional[Dict[str, Any]] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Index rows under ``prefix`` without reading object bodies.
+
+        Each row has ``key``, ``size``, ``etag``, ``last_modified``,
+        ``content_type``, ``metadata`` and ``fields`` (the indexed JSON
+        projection); ``where`` filters on ``fields`` equality. The prefix is
+        reconciled against a listing first when it was not reconciled in the
+        last ``STORAGE_INDEX_RESCAN_SECONDS``.
+
+        Returns:
+            Rows in key order, or None when the index is unavailable (callers
+            fall back to listing and reading objects).
+        """
+        index = await self._open_index()
+        if index is None:
+            return None
+        await self.ensure_connected()
+        try:
+            scanned_at = await asyncio.to_thread(index.scanned_at, prefix)
+            if (
+                scanned_at is None
+                or time.time() - scanned_at >= STORAGE_INDEX_RESCAN_SECONDS
+            ):
+                await self._reconcile_index(index, prefix)
+            return await asyncio.to_thread(index.rows, prefix, where)
+        except Exception as e:
+            logger.warning(f"Storage index query failed for {prefix!r}: {e}")
+            return None
+
+    async def _reconcile_index(self, index: StorageIndex, prefix: str) -> None:
+        """Bring the index rows under ``prefix`` in line with a listing.
+
+        Keys whose etag (or, without one, size and last_modified) is
+        unchanged are skipped; new and changed JSON bodies are read in one
+        :meth:`get_objects` batch and projected; rows for keys no longer
+        listed are dropped. Index reads and writes run in worker threads.
+        """
+        started = time.time()
+        known = {row["key"]: row for row in await asyncio.to_thread(index.rows, prefix)}
+        changed: List[Dict[str, Any]] = []
+        async for obj in self.provider.list_objects(prefix=prefix or None):
+            if obj.get("is_prefix"):
+                continue
+            key = obj["key"]
+            row = known.pop(key, None)
+            etag = obj.get("etag")
+            last_modified = obj.get("last_modified")
+            if row is not None and (
+                (etag and row["etag"] == etag)
+                or (
+                    not etag
+                    and row["size"] == obj.get("size")
+                    and row["last_modified"] == last_modified
+                )
+            ):
+                continue
+            changed.append(obj)
+
+        bodies = await self.provider.get_objects(
+            [obj["key"] for obj in changed if obj["key"].endswith(".json")],
+            STORAGE_BULK_CONCURRENCY,
+        )
+
+        def apply() -> None:
+            for obj in changed:
+                key = obj["key"]
+                body = bodies.get(key, b"")
+                if isinstance(body, Exception):
+                    # Left for the next reconcile: the listing still differs.
+                    logger.debug(f"Storage index skipped unreadable {key}: {body}")
+                    continue
+                index.upsert_body(
+                    key,
+                    body,
+                    size=obj.get("size"),
+                    etag=obj.get("etag"),
+                    last_modified=obj.get("last_modified"),
+                    content_type=obj.get("content_type"),
+                    metadata=obj.get("metadata"),
+                )
+            index.remove(known)
+            index.mark_scanned(prefix, started)
+
+        await asyncio.to_thread(apply)
 
     async def create_bucket(self, bucket_name: str) -> bool:
         """Create a bucket"""
@@ -166,11 +380,12 @@ class StorageManager:
 
                 # Give extra time for Azure provider to close aiohttp sessions
                 if self.config.provider == "azure_blob":
-                    import asyncio
-
                     logger.debug("Waiting for Azure provider cleanup to complete...")
                     await asyncio.sleep(0.5)  # Extra wait for Azure aiohttp sessions
 
+            if self._index is not None:
+                await asyncio.to_thread(self._index.close)
+                self._index = None
             self._connected = False
             logger.info("Storage Manager cleanup completed")
         except Exception as e:
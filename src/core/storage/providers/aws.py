@@ -1,2 +1,678 @@
-class AWSS3Provider:
-    pass
+"""Amazon S3 storage provider (also MinIO and other S3-compatible endpoints).
+
+boto3 clients are thread-safe and pool their HTTP connections, so every
+provider for the same endpoint, region and credentials shares one client
+(``S3_MAX_POOL_CONNECTIONS`` connections). Blocking calls run on a shared
+thread pool of the same size, which bounds in-flight requests per process.
+"""
+
+import asyncio
+import functools
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from src.config.settings import (
+    S3_MAX_POOL_CONNECTIONS,
+    S3_MULTIPART_CHUNK_SIZE,
+    S3_MULTIPART_THRESHOLD,
+)
+
+from ..base import StorageConfig, StorageMetadata, StorageProvider, gather_bounded
+
+logger = logging.getLogger(__name__)
+
+# Keys per DeleteObjects request (service limit).
+S3_DELETE_BATCH_SIZE = 1000
+# Largest object CopyObject handles in one request; larger copies go part by
+# part with UploadPartCopy.
+S3_MAX_SINGLE_COPY = 5 * 1024**3
+# Parts allowed in one multipart upload (service limit).
+S3_MAX_PARTS = 10000
+
+_NOT_FOUND_CODES = {"404", "NoSuchKey", "NotFound", "NoSuchVersion"}
+
+_clients: Dict[Tuple[str, ...], Any] = {}
+_shared_lock = threading.Lock()
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _shared_executor() -> ThreadPoolExecutor:
+    """Thread pool every S3 call runs on, sized to the connection pool."""
+    global _executor
+    with _shared_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=S3_MAX_POOL_CONNECTIONS, thread_name_prefix="s3"
+            )
+        return _executor
+
+
+def _shared_client(config: StorageConfig) -> Any:
+    """One boto3 S3 client per endpoint, region and credentials."""
+    credentials = config.credentials
+    region = config.region or credentials.get("region") or "us-east-1"
+    cache_key = (
+        config.endpoint_url or "",
+        region,
+        credentials.get("access_key", ""),
+        credentials.get("secret_key", ""),
+        credentials.get("session_token", ""),
+    )
+    with _shared_lock:
+        client = _clients.get(cache_key)
+        if client is None:
+            try:
+                import boto3
+                from botocore.config import Config
+            except ImportError:
+                raise ImportError(
+                    "AWS S3 libraries not installed. "
+                    "Please install with: pip install boto3"
+                )
+
+            client = boto3.session.Session().client(
+                "s3",
+                region_name=region,
+                endpoint_url=config.endpoint_url or None,
+                aws_access_key_id=credentials.get("access_key") or None,
+                aws_secret_access_key=credentials.get("secret_key") or None,
+                aws_session_token=credentials.get("session_token") or None,
+                config=Config(
+                    max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+                    retries={"mode": "standard"},
+                    # Custom endpoints (MinIO, moto server) rarely do
+                    # virtual-hosted buckets.
+                    s3={"addressing_style": "path"} if config.endpoint_url else None,
+                ),
+            )
+            _clients[cache_key] = client
+        return client
+
+
+def _is_not_found(error: Exception) -> bool:
+    response = getattr(error, "response", None) or {}
+    return str(response.get("Error", {}).get("Code")) in _NOT_FOUND_CODES
+
+
+def _etag(value: Optional[str]) -> Optional[str]:
+    return value.strip('"') if value else value
+
+
+class AWSS3Provider(StorageProvider):
+    """Amazon S3 storage provider implementation"""
+
+    def __init__(self, config: StorageConfig):
+        self.config = config
+        self._client: Optional[Any] = None
+        self._connected = False
+
+    async def ensure_connected(self) -> None:
+        """Ensure connection to S3"""
+        if not self._connected:
+            await self.connect()
+
+    async def _run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking boto3 call on the shared S3 thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _shared_executor(), functools.partial(func, *args, **kwargs)
+        )
+
+    async def connect(self) -> None:
+        """Connect to S3"""
+        if not self._connected:
+            try:
+                self._client = await self._run(_shared_client, self.config)
+
+                # Verify the bucket; don't fail startup on a transient error
+                try:
+                    await self._run(
+                        self._client.head_bucket, Bucket=self.config.bucket_name
+                    )
+                except Exception as e:
+                    if _is_not_found(e):
+                        logger.warning(
+                            f"Bucket {self.config.bucket_name} does not exist, but continuing..."
+                        )
+                    else:
+                        logger.error(
+                            f"Failed to verify bucket {self.config.bucket_name}: {e}. "
+                            f"Application will start but storage operations may fail."
+                        )
+
+                self._connected = True
+                logger.info(f"Connected to S3: {self.config.bucket_name}")
+            except Exception as e:
+                logger.error(f"Failed to connect to S3: {e}")
+                raise
+
+    async def disconnect(self) -> None:
+        """Disconnect from S3 (the shared client and its pool stay open)"""
+        if self._connected:
+            self._client = None
+            self._connected = False
+            logger.info("Disconnected from S3")
+
+    async def put_object(
+        self,
+        key: str,
+        data: bytes,
+        content_type: str = "application/octet-stream",
+        metadata: Optional[Dict[str, str]] = None,
+    ) -> StorageMetadata:
+        """Store an object in S3, with multipart upload above S3_MULTIPART_THRESHOLD"""
+        await self.ensure_connected()
+
+        try:
+            extra: Dict[str, Any] = {"ContentType": content_type}
+            if metadata:
+                extra["Metadata"] = {k: str(v) for k, v in metadata.items()}
+
+            if len(data) > S3_MULTIPART_THRESHOLD:
+                response = await self._multipart_upload(key, data, extra)
+            else:
+                response = await self._run(
+                    self._client.put_object,
+                    Bucket=self.config.bucket_name,
+                    Key=key,
+                    Body=data,
+                    **extra,
+                )
+
+            now = datetime.now(timezone.utc)
+            return StorageMetadata(
+                content_type=content_type,
+                size=len(data),
+                created_at=now,
+                modified_at=now,
+                etag=_etag(response.get("ETag")),
+                version_id=response.get("VersionId"),
+                metadata=extra.get("Metadata", {}),
+            )
+        except Exception as e:
+            logger.error(f"Failed to store object {key}: {e}")
+            raise
+
+    async def _multipart_upload(
+        self, key: str, data: bytes, extra: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Upload ``data`` in parts; the upload is aborted if any part fails."""
+        bucket = self.config.bucket_name
+        upload = await self._run(
+            self._client.create_multipart_upload, Bucket=bucket, Key=key, **extra
+        )
+        upload_id = upload["UploadId"]
+        # Grow the part size for objects that would need more than S3_MAX_PARTS
+        chunk = max(S3_MULTIPART_CHUNK_SIZE, -(-len(data) // S3_MAX_PARTS))
+
+        async def upload_part(number: int) -> Dict[str, Any]:
+            start = (number - 1) * chunk
+            part = await self._run(
+                self._client.upload_part,
+                Bucket=bucket,
+                Key=key,
+                UploadId=upload_id,
+                PartNumber=number,
+                Body=data[start : start + chunk],
+            )
+            return {"ETag": part["ETag"], "PartNumber": number}
+
+        try:
+            # Bounded so only the in-flight parts are copied out of ``data``
+            parts = await gather_bounded(
+                range(1, -(-len(data) // chunk) + 1),
+                upload_part,
+                S3_MAX_POOL_CONNECTIONS,
+            )
+            for part in parts:
+                if isinstance(part, Exception):
+                    raise part
+            return await self._run(
+                self._client.complete_multipart_upload,
+                Bucket=bucket,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except BaseException:
+            try:
+                await self._run(
+                    self._client.abort_multipart_upload,
+                    Bucket=bucket,
+                    Key=key,
+                    UploadId=upload_id,
+                )
+            except Exception as e:
+                logger.warning(f"Failed to abort multipart upload of {key}: {e}")
+            raise
+
+    async def get_object(
+        self,
+        key: str,
+        version_id: Optional[str] = None,
+        byte_range: Optional[Tuple[int, Optional[int]]] = None,
+    ) -> bytes:
+        """Retrieve an object from S3
+
+        Args:
+            key: Object key.
+            version_id: Optional object version.
+            byte_range: Optional ``(start, end)`` byte offsets, inclusive as in
+                an HTTP ``Range`` header; ``end`` None reads to the end.
+        """
+        await self.ensure_connected()
+
+        kwargs: Dict[str, Any] = {"Bucket": self.config.bucket_name, "Key": key}
+        if version_id:
+            kwargs["VersionId"] = version_id
+        if byte_range:
+            start, end = byte_range
+            kwargs["Range"] = f"bytes={start}-{'' if end is None else end}"
+
+        # Read the body on the pool thread too (blocking I/O)
+        def _get():
+            return self._client.get_object(**kwargs)["Body"].read()
+
+        try:
+            return await self._run(_get)
+        except Exception as e:
+            if _is_not_found(e):
+                raise FileNotFoundError(f"Object not found: {key}")
+            logger.error(f"Failed to retrieve object {key}: {e}")
+            raise
+
+    async def delete_object(self, key: str, version_id: Optional[str] = None) -> bool:
+        """Delete an object from S3"""
+        await self.ensure_connected()
+
+        kwargs: Dict[str, Any] = {"Bucket": self.config.bucket_name, "Key": key}
+        if version_id:
+            kwargs["VersionId"] = version_id
+
+        # S3 deletes are idempotent; check existence so a miss reports False
+        def _delete():
+            try:
+                self._client.head_object(**kwargs)
+            except Exception as e:
+                if _is_not_found(e):
+                    return False
+                raise
+            self._client.delete_object(**kwargs)
+            return True
+
+        try:
+            return await self._run(_delete)
+        except Exception as e:
+            logger.error(f"Failed to delete object {key}: {e}")
+            return False
+
+    async def delete_objects(
+        self, keys: Iterable[str], max_concurrency: Optional[int] = None
+    ) -> Dict[str, bool]:
+        """Delete several objects with DeleteObjects requests.
+
+        S3 reports keys that did not exist as deleted, so existence comes from
+        one listing per directory the keys fall in (narrowed to their common
+        prefix) and missing keys report False, as in :meth:`delete_object`.
+        The rest go out ``S3_DELETE_BATCH_SIZE`` per request. A request that
+        fails as a whole falls back to per-object deletes.
+        """
+        await self.ensure_connected()
+        keys = list(dict.fromkeys(keys))
+
+        directories: Dict[str, List[str]] = {}
+        for key in keys:
+            directories.setdefault(key.rpartition("/")[0], []).append(key)
+
+        async def listed(group: List[str]) -> Set[str]:
+            prefix = os.path.commonprefix(group)
+            found = set()
+            async for obj in self.list_objects(prefix=prefix or None, delimiter="/"):
+                if not obj.get("is_prefix"):
+                    found.add(obj["key"])
+            return found
+
+        groups = list(directories.values())
+        results: Dict[str, bool] = {}
+        for group, found in zip(
+            groups, await gather_bounded(groups, listed, max_concurrency)
+        ):
+            if isinstance(found, Exception):
+                # Could not tell: let the delete itself report the outcome.
+                continue
+            results.update((key, False) for key in group if key not in found)
+        existing = [key for key in keys if key not in results]
+        chunks = [
+            existing[i : i + S3_DELETE_BATCH_SIZE]
+            for i in range(0, len(existing), S3_DELETE_BATCH_SIZE)
+        ]
+
+        async def delete_chunk(chunk: List[str]) -> Dict[str, bool]:
+            try:
+                response = await self._run(
+                    self._client.delete_objects,
+                    Bucket=self.config.bucket_name,
+                    Delete={"Objects": [{"Key": key} for key in chunk]},
+                )
+            except Exception as e:
+                logger.warning(f"Batch delete of {len(chunk)} objects failed: {e}")
+                return await super(AWSS3Provider, self).delete_objects(
+                    chunk, max_concurrency
+                )
+            deleted = {item["Key"] for item in response.get("Deleted", [])}
+            for error in response.get("Errors", []):
+                logger.error(
+                    f"Failed to delete object {error.get('Key')}: {error.get('Message')}"
+                )
+            return {key: key in deleted for key in chunk}
+
+        for outcome in await gather_bounded(chunks, delete_chunk, max_concurrency):
+            results.update(outcome)
+        return {key: results[key] for key in keys}
+
+    async def list_objects(
+        self,
+        prefix: Optional[str] = None,
+        delimiter: Optional[str] = None,
+        max_keys: Optional[int] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """List objects in S3, one ListObjectsV2 page at a time.
+
+        Only the current page (up to 1000 keys) is held in memory. With a
+        ``delimiter``, common prefixes are yielded as entries with
+        ``is_prefix`` True.
+        """
+        await self.ensure_connected()
+
+        try:
+            params: Dict[str, Any] = {"Bucket": self.config.bucket_name}
+            if prefix:
+                params["Prefix"] = prefix
+            if delimiter:
+                params["Delimiter"] = delimiter
+            if max_keys:
+                params["PaginationConfig"] = {
+                    "MaxItems": max_keys,
+                    "PageSize": min(max_keys, 1000),
+                }
+
+            paginator = self._client.get_paginator("list_objects_v2")
+            pages = iter(paginator.paginate(**params))
+
+            count = 0
+            while True:
+                # Each page is one request (blocking I/O)
+                page = await self._run(next, pages, None)
+                if page is None:
+                    break
+
+                entries = [
+                    {
+                        "key": item["Key"],
+                        "size": item["Size"],
+                        "last_modified": item["LastModified"],
+                        "etag": _etag(item.get("ETag")),
+                    }
+                    for item in page.get("Contents", [])
+                ]
+                entries.extend(
+                    {
+                        "key": common["Prefix"],
+                        "size": 0,
+                        "last_modified": None,
+                        "etag": None,
+                        "metadata": {},
+                        "is_prefix": True,
+                    }
+                    for common in page.get("CommonPrefixes", [])
+                )
+                for entry in sorted(entries, key=lambda e: e["key"]):
+                    yield entry
+                    count += 1
+                    if max_keys and count >= max_keys:
+                        return
+        except Exception as e:
+            logger.error(f"Failed to list objects: {e}")
+            raise
+
+    async def get_object_metadata(
+        self, key: str, version_id: Optional[str] = None
+    ) -> StorageMetadata:
+        """Get metadata for an object"""
+        await self.ensure_connected()
+
+        kwargs: Dict[str, Any] = {"Bucket": self.config.bucket_name, "Key": key}
+        if version_id:
+            kwargs["VersionId"] = version_id
+
+        try:
+            head = await self._run(self._client.head_object, **kwargs)
+        except Exception as e:
+            if _is_not_found(e):
+                raise FileNotFoundError(f"Object not found: {key}")
+            logger.error(f"Failed to get metadata for object {key}: {e}")
+            raise
+
+        return StorageMetadata(
+            content_type=head.get("ContentType") or "application/octet-stream",
+            size=head["ContentLength"],
+            # S3 keeps no creation time separate from the last write
+            created_at=head["LastModified"],
+            modified_at=head["LastModified"],
+            etag=_etag(head.get("ETag")),
+            version_id=head.get("VersionId"),
+            metadata=head.get("Metadata") or {},
+        )
+
+    async def copy_object(
+        self,
+        source_key: str,
+        destination_key: str,
+        source_version_id: Optional[str] = None,
+    ) -> StorageMetadata:
+        """Copy an object server-side (no bytes pass through this process)"""
+        await self.ensure_connected()
+
+        bucket = self.config.bucket_name
+        copy_source: Dict[str, Any] = {"Bucket": bucket, "Key": source_key}
+        if source_version_id:
+            copy_source["VersionId"] = source_version_id
+
+        try:
+            try:
+                source = await self.get_object_metadata(source_key, source_version_id)
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Source object not found: {source_key}")
+
+            if source.size <= S3_MAX_SINGLE_COPY:
+                await self._run(
+                    self._client.copy_object,
+                    CopySource=copy_source,
+                    Bucket=bucket,
+                    Key=destination_key,
+                )
+            else:
+                await self._multipart_copy(copy_source, destination_key, source)
+
+            return await self.get_object_metadata(destination_key)
+        except FileNotFoundError:
+            raise
+        except Exception as e:
+            logger.error(
+                f"Failed to copy object {source_key} to {destination_key}: {e}"
+            )
+            raise
+
+    async def _multipart_copy(
+        self,
+        copy_source: Dict[str, Any],
+        destination_key: str,
+        source: StorageMetadata,
+    ) -> None:
+        """Copy an object over S3_MAX_SINGLE_COPY with UploadPartCopy."""
+        bucket = self.config.bucket_name
+        upload = await self._run(
+            self._client.create_multipart_upload,
+            Bucket=bucket,
+            Key=destination_key,
+            ContentType=source.content_type,
+            Metadata=source.metadata,
+        )
+        upload_id = upload["UploadId"]
+        chunk = max(S3_MULTIPART_CHUNK_SIZE, -(-source.size // S3_MAX_PARTS))
+
+        async def copy_part(number: int) -> Dict[str, Any]:
+            start = (number - 1) * chunk
+            end = min(start + chunk, source.size) - 1
+            part = await self._run(
+                self._client.upload_part_copy,
+                Bucket=bucket,
+                Key=destination_key,
+                UploadId=upload_id,
+                PartNumber=number,
+                CopySource=copy_source,
+                CopySourceRange=f"bytes={start}-{end}",
+            )
+            return {"ETag": part["CopyPartResult"]["ETag"], "PartNumber": number}
+
+        try:
+            parts = await asyncio.gather(
+                *(copy_part(n) for n in range(1, -(-source.size // chunk) + 1))
+            )
+            await self._run(
+                self._client.complete_multipart_upload,
+                Bucket=bucket,
+                Key=destination_key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": list(parts)},
+            )
+        except BaseException:
+            try:
+                await self._run(
+                    self._client.abort_multipart_upload,
+                    Bucket=bucket,
+                    Key=destination_key,
+                    UploadId=upload_id,
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Failed to abort multipart copy to {destination_key}: {e}"
+                )
+            raise
+
+    async def create_bucket(self, bucket_name: str) -> bool:
+        """Create a new bucket"""
+        await self.ensure_connected()
+
+        try:
+            kwargs: Dict[str, Any] = {"Bucket": bucket_name}
+            region = self._client.meta.region_name
+            # us-east-1 is the default location and must not be named
+            if region and region != "us-east-1":
+                kwargs["CreateBucketConfiguration"] = {"LocationConstraint": region}
+            await self._run(self._client.create_bucket, **kwargs)
+            logger.info(f"Created bucket: {bucket_name} in region: {region}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to create bucket {bucket_name}: {e}")
+            return False
+
+    async def delete_bucket(self, bucket_name: str) -> bool:
+        """Delete a bucket (it must be empty)"""
+        await self.ensure_connected()
+
+        try:
+            await self._run(self._client.delete_bucket, Bucket=bucket_name)
+            logger.info(f"Deleted bucket: {bucket_name}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to delete bucket {bucket_name}: {e}")
+            return False
+
+    async def list_buckets(self) -> List[str]:
+        """List all buckets"""
+        await self.ensure_connected()
+
+        try:
+            response = await self._run(self._client.list_buckets)
+            return [bucket["Name"] for bucket in response.get("Buckets", [])]
+        except Exception as e:
+            logger.error(f"Failed to list buckets: {e}")
+            raise
+
+    async def get_bucket_metadata(self, bucket_name: str) -> Dict[str, Any]:
+        """Get metadata for a bucket"""
+        await self.ensure_connected()
+
+        try:
+            try:
+                await self._run(self._client.head_bucket, Bucket=bucket_name)
+            except Exception as e:
+                if _is_not_found(e):
+                    raise FileNotFoundError(f"Bucket not found: {bucket_name}")
+                raise
+            location = await self._run(
+                self._client.get_bucket_location, Bucket=bucket_name
+            )
+            return {
+                "name": bucket_name,
+                # A null LocationConstraint means us-east-1
+                "location": location.get("LocationConstraint") or "us-east-1",
+            }
+        except FileNotFoundError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to get metadata for bucket {bucket_name}: {e}")
+            raise
+
+    async def set_bucket_policy(self, bucket_name: str, policy: Dict[str, Any]) -> bool:
+        """Set bucket policy"""
+        await self.ensure_connected()
+
+        try:
+            await self._run(
+                self._client.put_bucket_policy,
+                Bucket=bucket_name,
+                Policy=json.dumps(policy),
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Failed to set bucket policy for {bucket_name}: {e}")
+            return False
+
+    async def get_bucket_policy(self, bucket_name: str) -> Dict[str, Any]:
+        """Get bucket policy"""
+        await self.ensure_connected()
+
+        try:
+            response = await self._run(
+                self._client.get_bucket_policy, Bucket=bucket_name
+            )
+            return json.loads(response["Policy"])
+        except Exception as e:
+            logger.error(f"Failed to get bucket policy for {bucket_name}: {e}")
+            return {}
+
+    async def cleanup(self) -> None:
+        """Clean up resources"""
+        try:
+            await self.disconnect()
+            logger.info("S3 Provider cleanup completed")
+        except Exception as e:
+            logger.error(f"Error during S3 Provider cleanup: {e}")
+            raise
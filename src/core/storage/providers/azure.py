@@ -1,7 +1,7 @@
 import logging
-from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterable, List, Optional
 
-from ..base import StorageConfig, StorageMetadata, StorageProvider
+from ..base import StorageConfig, StorageMetadata, StorageProvider, gather_bounded
 
 # Import Azure exceptions at module level
 try:
@@ -24,6 +24,9 @@ else:
 
 logger = logging.getLogger(__name__)
 
+# Sub-requests per Blob Batch request (service limit).
+AZURE_BATCH_SIZE = 256
+
 
 class AzureBlobProvider(StorageProvider):
     """Azure Blob Storage provider implementation"""
@@ -395,6 +398,41 @@ class AzureBlobProvider(StorageProvider):
             logger.error(f"Failed to delete object {key}: {e}")
             return False
 
+    async def delete_objects(
+        self, keys: Iterable[str], max_concurrency: Optional[int] = None
+    ) -> Dict[str, bool]:
+        """Delete several blobs with Blob Batch requests.
+
+        Keys go out ``AZURE_BATCH_SIZE`` per request; a batch the endpoint
+        rejects as a whole (e.g. an emulator without batch support) falls
+        back to per-blob deletes.
+        """
+        await self.ensure_connected()
+        keys = list(keys)
+        chunks = [
+            keys[i : i + AZURE_BATCH_SIZE]
+            for i in range(0, len(keys), AZURE_BATCH_SIZE)
+        ]
+
+        async def delete_chunk(chunk: List[str]) -> Dict[str, bool]:
+            try:
+                responses = await self._container.delete_blobs(
+                    *chunk, raise_on_any_failure=False
+                )
+                # One sub-response per blob, in order (404: not there).
+                outcomes = [200 <= r.status_code < 300 async for r in responses]
+                return dict(zip(chunk, outcomes))
+            except Exception as e:
+                logger.warning(f"Batch delete of {len(chunk)} blobs failed: {e}")
+                return await super(AzureBlobProvider, self).delete_objects(
+                    chunk, max_concurrency
+                )
+
+        results: Dict[str, bool] = {}
+        for outcome in await gather_bounded(chunks, delete_chunk, max_concurrency):
+            results.update(outcome)
+        return results
+
     async def list_objects(
         self,
         prefix: Optional[str] = None,
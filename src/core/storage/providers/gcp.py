@@ -1,12 +1,70 @@
+"""Google Cloud Storage provider.
+
+The client library is synchronous. Its calls run on one thread pool shared by
+every GCS provider in the process (``GCS_MAX_POOL_CONNECTIONS`` threads), and
+each client's HTTP connection pool is sized to match, which bounds in-flight
+requests instead of starting a thread per call.
+"""
+
 import asyncio
+import functools
 import json
 import logging
-from typing import Any, AsyncIterator, Dict, List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple
 
-from ..base import StorageConfig, StorageMetadata, StorageProvider
+from src.config.settings import GCS_MAX_POOL_CONNECTIONS
+
+from ..base import StorageConfig, StorageMetadata, StorageProvider, gather_bounded
 
 logger = logging.getLogger(__name__)
 
+# Calls per JSON API batch request (service limit).
+GCS_BATCH_SIZE = 100
+# Objects per list request (service limit).
+GCS_LIST_PAGE_SIZE = 1000
+
+_executor_lock = threading.Lock()
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _shared_executor() -> ThreadPoolExecutor:
+    """Thread pool every GCS call runs on, sized to the connection pool."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=GCS_MAX_POOL_CONNECTIONS, thread_name_prefix="gcs"
+            )
+        return _executor
+
+
+def _size_connection_pool(client: Any) -> None:
+    """Let the client's requests session keep one connection per pool thread.
+
+    requests keeps 10 connections per host by default; with more threads the
+    extra connections are opened and thrown away on every call.
+    """
+    try:
+        from requests.adapters import HTTPAdapter
+
+        adapter = HTTPAdapter(
+            pool_connections=GCS_MAX_POOL_CONNECTIONS,
+            pool_maxsize=GCS_MAX_POOL_CONNECTIONS,
+        )
+        client._http.mount("https://", adapter)
+    except Exception as e:
+        logger.debug(f"Keeping the default GCS connection pool: {e}")
+
+
+def _next_page(pages: Any) -> Optional[Tuple[List[Any], Tuple[str, ...]]]:
+    """Fetch the next listing page: its blobs and common prefixes (or None)."""
+    page = next(pages, None)
+    if page is None:
+        return None
+    return list(page), tuple(getattr(page, "prefixes", ()))
+
 
 class GCSProvider(StorageProvider):
     """Google Cloud Storage provider implementation"""
@@ -22,6 +80,13 @@ class GCSProvider(StorageProvider):
         if not self._connected:
             await self.connect()
 
+    async def _run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking client call on the shared GCS thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _shared_executor(), functools.partial(func, *args, **kwargs)
+        )
+
     def _get_credentials(self) -> Any:
         """Get GCP credentials from config"""
         try:
@@ -80,7 +145,7 @@ class GCSProvider(StorageProvider):
             try:
                 from google.cloud import storage
 
-                credentials, project_id = await asyncio.to_thread(self._get_credentials)
+                credentials, project_id = await self._run(self._get_credentials)
 
                 # Create client (synchronous operation, but fast)
                 def _create_client():
@@ -91,7 +156,8 @@ class GCSProvider(StorageProvider):
                     else:
                         return storage.Client(project=project_id)
 
-                self._client = await asyncio.to_thread(_create_client)
+                self._client = await self._run(_create_client)
+                _size_connection_pool(self._client)
 
                 # Get bucket
                 self._bucket = self._client.bucket(self.config.bucket_name)
@@ -111,7 +177,7 @@ class GCSProvider(StorageProvider):
                         def _check_bucket():
                             return self._bucket.exists()
 
-                        bucket_exists = await asyncio.to_thread(_check_bucket)
+                        bucket_exists = await self._run(_check_bucket)
                         if not bucket_exists:
                             logger.warning(
                                 f"Bucket {self.config.bucket_name} does not exist, but continuing..."
@@ -185,7 +251,7 @@ class GCSProvider(StorageProvider):
                 blob.reload()
                 return blob
 
-            blob = await asyncio.to_thread(_upload)
+            blob = await self._run(_upload)
 
             return StorageMetadata(
                 content_type=blob.content_type or content_type,
@@ -217,7 +283,7 @@ class GCSProvider(StorageProvider):
                     raise FileNotFoundError(f"Object not found: {key}")
                 return blob.download_as_bytes()
 
-            return await asyncio.to_thread(_get)
+            return await self._run(_get)
         except FileNotFoundError:
             raise
         except Exception as e:
@@ -242,48 +308,108 @@ class GCSProvider(StorageProvider):
                 blob.delete()
                 return True
 
-            return await asyncio.to_thread(_delete)
+            return await self._run(_delete)
         except Exception as e:
             logger.error(f"Failed to delete object {key}: {e}")
             return False
 
+    async def delete_objects(
+        self, keys: Iterable[str], max_concurrency: Optional[int] = None
+    ) -> Dict[str, bool]:
+        """Delete several objects with JSON API batch requests.
+
+        Keys go out ``GCS_BATCH_SIZE`` per HTTP request; a batch that fails
+        as a whole falls back to per-object deletes.
+        """
+        await self.ensure_connected()
+        keys = list(keys)
+        chunks = [
+            keys[i : i + GCS_BATCH_SIZE] for i in range(0, len(keys), GCS_BATCH_SIZE)
+        ]
+
+        def _delete_batch(chunk: List[str]) -> List[bool]:
+            with self._client.batch(raise_exception=False) as batch:
+                for key in chunk:
+                    self._bucket.delete_blob(key)
+            # One sub-response per deferred call, in order (404: not there).
+            return [200 <= r.status_code < 300 for r in batch._responses]
+
+        async def delete_chunk(chunk: List[str]) -> Dict[str, bool]:
+            try:
+                outcomes = await self._run(_delete_batch, chunk)
+                return dict(zip(chunk, outcomes))
+            except Exception as e:
+                logger.warning(f"Batch delete of {len(chunk)} objects failed: {e}")
+                return await super(GCSProvider, self).delete_objects(
+                    chunk, max_concurrency
+                )
+
+        results: Dict[str, bool] = {}
+        for outcome in await gather_bounded(chunks, delete_chunk, max_concurrency):
+            results.update(outcome)
+        return results
+
     async def list_objects(
         self,
         prefix: Optional[str] = None,
         delimiter: Optional[str] = None,
         max_keys: Optional[int] = None,
     ) -> AsyncIterator[Dict[str, Any]]:
-        """List objects in Google Cloud Storage"""
+        """List objects in Google Cloud Storage, one page at a time.
+
+        ``max_keys`` is sent as the request's result limit, and only the
+        current page (up to 1000 objects) is held in memory. With a
+        ``delimiter``, common prefixes are yielded as entries with
+        ``is_prefix`` True.
+        """
         await self.ensure_connected()
 
         try:
-            # List blobs with prefix (blocking I/O, but we'll iterate in thread)
-            list_kwargs = {}
-            if prefix:
-                list_kwargs["prefix"] = prefix
-            if delimiter:
-                list_kwargs["delimiter"] = delimiter
+            page_size = GCS_LIST_PAGE_SIZE
             if max_keys:
-                list_kwargs["max_results"] = max_keys
-
-            def _list_blobs():
-                return list(self._bucket.list_blobs(**list_kwargs))
-
-            blobs = await asyncio.to_thread(_list_blobs)
+                page_size = min(max_keys, GCS_LIST_PAGE_SIZE)
+            iterator = self._bucket.list_blobs(
+                prefix=prefix or None,
+                delimiter=delimiter or None,
+                max_results=max_keys or None,
+                page_size=page_size,
+            )
+            pages = iterator.pages
 
             count = 0
-            for blob in blobs:
-                yield {
-                    "key": blob.name,
-                    "size": blob.size,
-                    "last_modified": blob.updated,
-                    "etag": blob.etag,
-                    "metadata": blob.metadata or {},
-                }
-
-                count += 1
-                if max_keys and count >= max_keys:
+            while True:
+                # Each page is one request (blocking I/O)
+                page = await self._run(_next_page, pages)
+                if page is None:
                     break
+
+                blobs, prefixes = page
+                entries = [
+                    {
+                        "key": blob.name,
+                        "size": blob.size,
+                        "last_modified": blob.updated,
+                        "etag": blob.etag,
+                        "metadata": blob.metadata or {},
+                    }
+                    for blob in blobs
+                ]
+                entries.extend(
+                    {
+                        "key": common,
+                        "size": 0,
+                        "last_modified": None,
+                        "etag": None,
+                        "metadata": {},
+                        "is_prefix": True,
+                    }
+                    for common in prefixes
+                )
+                for entry in sorted(entries, key=lambda e: e["key"]):
+                    yield entry
+                    count += 1
+                    if max_keys and count >= max_keys:
+                        return
         except Exception as e:
             logger.error(f"Failed to list objects: {e}")
             raise
@@ -308,7 +434,7 @@ class GCSProvider(StorageProvider):
                 blob.reload()
                 return blob
 
-            blob = await asyncio.to_thread(_get_metadata)
+            blob = await self._run(_get_metadata)
 
             return StorageMetadata(
                 content_type=blob.content_type or "application/octet-stream",
@@ -354,7 +480,7 @@ class GCSProvider(StorageProvider):
                 dest_blob.reload()
                 return dest_blob
 
-            dest_blob = await asyncio.to_thread(_copy)
+            dest_blob = await self._run(_copy)
 
             return StorageMetadata(
                 content_type=dest_blob.content_type or "application/octet-stream",
@@ -387,7 +513,7 @@ class GCSProvider(StorageProvider):
                 logger.info(f"Created bucket: {bucket_name} in location: {location}")
                 return True
 
-            return await asyncio.to_thread(_create)
+            return await self._run(_create)
         except Exception as e:
             logger.error(f"Failed to create bucket {bucket_name}: {e}")
             return False
@@ -405,7 +531,7 @@ class GCSProvider(StorageProvider):
                 logger.info(f"Deleted bucket: {bucket_name}")
                 return True
 
-            return await asyncio.to_thread(_delete)
+            return await self._run(_delete)
         except Exception as e:
             logger.error(f"Failed to delete bucket {bucket_name}: {e}")
             return False
@@ -419,7 +545,7 @@ class GCSProvider(StorageProvider):
             def _list():
                 return [bucket.name for bucket in self._client.list_buckets()]
 
-            return await asyncio.to_thread(_list)
+            return await self._run(_list)
         except Exception as e:
             logger.error(f"Failed to list buckets: {e}")
             raise
@@ -445,7 +571,7 @@ class GCSProvider(StorageProvider):
                     "metadata": bucket.labels or {},
                 }
 
-            return await asyncio.to_thread(_get_metadata)
+            return await self._run(_get_metadata)
         except FileNotFoundError:
             raise
         except Exception as e:
@@ -486,7 +612,7 @@ class GCSProvider(StorageProvider):
                     ]
                 }
 
-            return await asyncio.to_thread(_get_policy)
+            return await self._run(_get_policy)
         except Exception as e:
             logger.error(f"Failed to get bucket policy for {bucket_name}: {e}")
             return {}
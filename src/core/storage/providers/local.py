@@ -1,14 +1,84 @@
 import hashlib
 import json
 import os
+from collections.abc import Mapping
 from datetime import datetime
 from pathlib import Path
-from typing import Any, AsyncIterator, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
 
 import aiofiles
 
 from ..base import StorageConfig, StorageMetadata, StorageProvider
 
+METADATA_SUFFIX = ".meta"
+
+
+def _metadata_from_dict(metadata_dict: Dict[str, Any]) -> StorageMetadata:
+    return StorageMetadata(
+        content_type=metadata_dict["content_type"],
+        size=metadata_dict["size"],
+        created_at=datetime.fromisoformat(metadata_dict["created_at"]),
+        modified_at=datetime.fromisoformat(metadata_dict["modified_at"]),
+        etag=metadata_dict["etag"],
+        version_id=metadata_dict.get("version_id"),
+        metadata=metadata_dict.get("metadata"),
+    )
+
+
+class LocalObjectEntry(Mapping):
+    """One ``list_objects`` entry; sidecar fields load on first access.
+
+    ``key``, ``size`` and ``last_modified`` come from the directory scan.
+    ``etag``, ``metadata`` and ``content_type`` live in the ``.meta`` sidecar,
+    which is read (synchronously, it is a few hundred bytes) only when one of
+    them is looked up, so listings that only need keys never open it. Entries
+    for files without a sidecar report ``etag`` None and empty ``metadata``.
+    Common prefixes from a ``delimiter`` listing carry ``is_prefix`` and no
+    sidecar.
+    """
+
+    _SIDECAR_FIELDS = ("etag", "metadata", "content_type")
+
+    __slots__ = ("_fields", "_sidecar")
+
+    def __init__(self, fields: Dict[str, Any], sidecar: Optional[str]):
+        self._fields = fields
+        self._sidecar = sidecar
+
+    def _load_sidecar(self) -> None:
+        sidecar, self._sidecar = self._sidecar, None
+        try:
+            with open(sidecar, "r") as f:
+                stored = _metadata_from_dict(json.loads(f.read()))
+        except (OSError, ValueError, KeyError):
+            stored = None
+        self._fields["etag"] = stored.etag if stored else None
+        self._fields["metadata"] = stored.metadata if stored else {}
+        self._fields["content_type"] = (
+            stored.content_type if stored else "application/octet-stream"
+        )
+
+    def __getitem__(self, name: str) -> Any:
+        if self._sidecar is not None and name in self._SIDECAR_FIELDS:
+            self._load_sidecar()
+        return self._fields[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._fields or (
+            self._sidecar is not None and name in self._SIDECAR_FIELDS
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._fields
+        if self._sidecar is not None:
+            yield from (f for f in self._SIDECAR_FIELDS if f not in self._fields)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"LocalObjectEntry({self._fields!r}, lazy={self._sidecar is not None})"
+
 
 class LocalStorageProvider(StorageProvider):
     """Local filesystem-based storage provider
@@ -129,7 +199,7 @@ class LocalStorageProvider(StorageProvider):
 
     def _get_metadata_path(self, key: str) -> Path:
         """Get filesystem path for object metadata"""
-        return self.base_path / f"{key}.meta"
+        return self.base_path / f"{key}{METADATA_SUFFIX}"
 
     async def _save_metadata(self, key: str, metadata: StorageMetadata) -> None:
         """Save object metadata to filesystem"""
@@ -155,15 +225,7 @@ class LocalStorageProvider(StorageProvider):
         async with aiofiles.open(metadata_path, "r") as f:
             metadata_dict = json.loads(await f.read())
 
-        return StorageMetadata(
-            content_type=metadata_dict["content_type"],
-            size=metadata_dict["size"],
-            created_at=datetime.fromisoformat(metadata_dict["created_at"]),
-            modified_at=datetime.fromisoformat(metadata_dict["modified_at"]),
-            etag=metadata_dict["etag"],
-            version_id=metadata_dict.get("version_id"),
-            metadata=metadata_dict.get("metadata"),
-        )
+        return _metadata_from_dict(metadata_dict)
 
     async def put_object(
         self,
@@ -234,62 +296,111 @@ class LocalStorageProvider(StorageProvider):
         delimiter: Optional[str] = None,
         max_keys: Optional[int] = None,
     ) -> AsyncIterator[Dict[str, Any]]:
-        """List objects in the filesystem.
+        """List objects in the filesystem, in key order.
+
+        Only the directory holding ``prefix`` (``okw/`` -> ``<root>/okw``) is
+        scanned, with ``os.scandir`` so file type and stat come from the
+        directory entry. With a ``delimiter``, keys containing it after the
+        prefix are rolled up into one common-prefix entry (``key`` ending in
+        the delimiter, ``is_prefix`` True) and, for ``/``, the directory
+        behind it is not descended into.
 
         All files that match the prefix are yielded, regardless of whether a
-        ``.meta`` sidecar file exists.  When metadata is missing the entry is
-        populated from filesystem ``stat`` values so that files written outside
-        of ``put_object`` (e.g. manually copied, or written by an older version
-        of the service) are still discoverable.
+        ``.meta`` sidecar file exists; sidecar fields (``etag``, ``metadata``,
+        ``content_type``) are read lazily, see :class:`LocalObjectEntry`.
         """
         await self.ensure_connected()
 
         # Normalise prefix separator to forward slash so that prefix strings
         # like "okw/" match correctly on all platforms.
-        normalised_prefix = prefix.replace(os.sep, "/") if prefix else None
+        normalised_prefix = prefix.replace(os.sep, "/") if prefix else ""
 
         count = 0
-        for root, _, files in os.walk(self.base_path):
-            for file in files:
-                if file.endswith(".meta"):
-                    continue
-
-                abs_path = os.path.join(root, file)
-                rel_path = os.path.relpath(abs_path, self.base_path)
-                # Always use forward slashes for storage keys so that callers
-                # on Windows and Unix see consistent key strings.
-                key = rel_path.replace(os.sep, "/")
-
-                if normalised_prefix and not key.startswith(normalised_prefix):
-                    continue
-
-                # Prefer persisted metadata; fall back to filesystem stats so
-                # that files without a sidecar are never silently skipped.
-                metadata = await self._load_metadata(rel_path)
-                if metadata:
-                    yield {
-                        "key": key,
-                        "size": metadata.size,
-                        "last_modified": metadata.modified_at,
-                        "etag": metadata.etag,
-                        "metadata": metadata.metadata,
-                    }
-                else:
-                    try:
-                        stat = os.stat(abs_path)
-                        yield {
-                            "key": key,
-                            "size": stat.st_size,
-                            "last_modified": datetime.fromtimestamp(stat.st_mtime),
+        seen_prefixes = set()
+        directory, _, fragment = normalised_prefix.rpartition("/")
+        start = (
+            self.base_path.joinpath(*directory.split("/"))
+            if directory
+            else self.base_path
+        )
+        scan = self._scan(
+            str(start),
+            f"{directory}/" if directory else "",
+            fragment,
+            descend=delimiter != "/",
+        )
+        for key, entry in scan:
+            if delimiter:
+                cut = key.find(delimiter, len(normalised_prefix))
+                if cut != -1:
+                    common = key[: cut + len(delimiter)]
+                    if common in seen_prefixes:
+                        continue
+                    seen_prefixes.add(common)
+                    yield LocalObjectEntry(
+                        {
+                            "key": common,
+                            "size": 0,
+                            "last_modified": None,
                             "etag": None,
                             "metadata": {},
-                        }
+                            "is_prefix": True,
+                        },
+                        None,
+                    )
+                    count += 1
+                    if max_keys and count >= max_keys:
+                        return
+                    continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            yield LocalObjectEntry(
+                {
+                    "key": key,
+                    "size": stat.st_size,
+                    "last_modified": datetime.fromtimestamp(stat.st_mtime),
+                },
+                entry.path + METADATA_SUFFIX,
+            )
+            count += 1
+            if max_keys and count >= max_keys:
+                return
+
+    def _scan(
+        self, path: str, key_base: str, name_prefix: str, descend: bool
+    ) -> Iterator[Tuple[str, Any]]:
+        """Yield ``(key, DirEntry)`` for object files under ``path``, in key order.
+
+        Only entries whose name starts with ``name_prefix`` are considered at
+        this level. Subdirectories are descended into, or yielded as
+        ``(key + "/", None)`` when ``descend`` is false.
+        """
+        try:
+            with os.scandir(path) as it:
+                entries = []
+                for entry in it:
+                    if not entry.name.startswith(name_prefix):
+                        continue
+                    try:
+                        is_dir = entry.is_dir()
                     except OSError:
                         continue
-
-                count += 1
-                if max_keys and count >= max_keys:
-                    return
+                    entries.append((entry.name + "/" if is_dir else entry.name, entry))
+        except (FileNotFoundError, NotADirectoryError):
+            return
+        # Sorting directories by "name/" keeps the output in full-key order.
+        entries.sort(key=lambda item: item[0])
+        for name, entry in entries:
+            key = key_base + name
+            if name.endswith("/"):
+                if descend:
+                    yield from self._scan(entry.path, key, "", descend)
+                else:
+                    yield key, None
+            elif not name.endswith(METADATA_SUFFIX):
+                yield key, entry
 
     async def get_object_metadata(
         self, key: str, version_id: Optional[str] = None
@@ -6,6 +6,7 @@ and locate files of different types (OKH, OKW, Supply Trees) using multiple
 fallback strategies for maximum reliability.
 """
 
+import asyncio
 import json
 from dataclasses import dataclass
 from datetime import datetime
@@ -367,8 +368,22 @@ class SmartFileDiscovery:
         files = []
 
         try:
-            async for obj in self.storage_manager.list_objects():
-                metadata = obj.get("metadata", {})
+            # This strategy looks for tagged objects anywhere in the bucket, so
+            # the query stays unscoped. Within STORAGE_INDEX_RESCAN_SECONDS of
+            # the last reconcile the index answers it without listing; a
+            # reconcile still lists the whole bucket and reads each new or
+            # changed JSON body once.
+            list_indexed = getattr(self.storage_manager, "list_indexed", None)
+            rows = (
+                await list_indexed()
+                if asyncio.iscoroutinefunction(list_indexed)
+                else None
+            )
+            if not isinstance(rows, list):
+                rows = [obj async for obj in self.storage_manager.list_objects()]
+
+            for obj in rows:
+                metadata = obj.get("metadata") or {}
 
                 # Check for file type in metadata
                 if (
@@ -11,6 +11,7 @@ from src.core.taxonomy.process_taxonomy import (
     ProcessTaxonomy,
     load_from_yaml,
     taxonomy,
+    taxonomy_version,
     validate_definitions,
 )
 
@@ -20,5 +21,6 @@ __all__ = [
     "ProcessTaxonomy",
     "load_from_yaml",
     "taxonomy",
+    "taxonomy_version",
     "validate_definitions",
 ]
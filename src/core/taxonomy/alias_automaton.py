@@ -0,0 +1,111 @@
+"""
+Multi-pattern substring matcher for the process alias table.
+
+``ProcessTaxonomy.normalize`` falls back to a substring rule when an input is
+not an exact alias: the first registered alias (of at least five characters)
+that is contained in the input, or that contains the input, wins. Applied as a
+loop over the alias table that is one ``in`` test pair per alias for every
+unrecognized input.
+
+:class:`AliasAutomaton` answers the same question in one pass:
+
+- *alias in key* — an Aho–Corasick automaton over the aliases. Each state
+  records the lowest alias index among the patterns ending there (its own and
+  those reachable through failure links), so scanning the key once yields the
+  earliest-registered alias it contains.
+- *key in alias* — the aliases joined, in registration order, with a separator
+  that cannot occur in a key. The first ``str.find`` hit lies in the
+  earliest-registered alias containing the key.
+
+The smaller of the two indices is the alias the linear scan would have
+returned first.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections import deque
+from typing import Dict, List, Optional, Sequence
+
+_SEPARATOR = "\x00"
+_NO_MATCH = 1 << 62
+
+
+class AliasAutomaton:
+    """Earliest alias related to a key by substring, in registration order."""
+
+    def __init__(self, aliases: Sequence[str]) -> None:
+        self._aliases: List[str] = list(aliases)
+
+        goto: List[Dict[str, int]] = [{}]
+        earliest: List[int] = [_NO_MATCH]
+        for index, alias in enumerate(self._aliases):
+            state = 0
+            for ch in alias:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    earliest.append(_NO_MATCH)
+                state = nxt
+            if index < earliest[state]:
+                earliest[state] = index
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, child in goto[state].items():
+                queue.append(child)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[child] = goto[f].get(ch, 0)
+                if earliest[fail[child]] < earliest[child]:
+                    earliest[child] = earliest[fail[child]]
+
+        self._goto = goto
+        self._fail = fail
+        self._earliest = earliest
+
+        self._joined = _SEPARATOR.join(self._aliases)
+        starts: List[int] = []
+        offset = 0
+        for alias in self._aliases:
+            starts.append(offset)
+            offset += len(alias) + len(_SEPARATOR)
+        self._starts = starts
+
+    def __len__(self) -> int:
+        return len(self._aliases)
+
+    def first_match(self, key: str) -> Optional[int]:
+        """Index of the first alias contained in ``key`` or containing it."""
+        if not self._aliases:
+            return None
+        best = min(self._first_contained_in(key), self._first_containing(key))
+        return None if best == _NO_MATCH else best
+
+    def _first_contained_in(self, key: str) -> int:
+        goto, fail, earliest = self._goto, self._fail, self._earliest
+        state = 0
+        best = _NO_MATCH
+        for ch in key:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if earliest[state] < best:
+                best = earliest[state]
+        return best
+
+    def _first_containing(self, key: str) -> int:
+        if _SEPARATOR in key:
+            for index, alias in enumerate(self._aliases):
+                if key in alias:
+                    return index
+            return _NO_MATCH
+        pos = self._joined.find(key)
+        if pos < 0:
+            return _NO_MATCH
+        return bisect_right(self._starts, pos) - 1
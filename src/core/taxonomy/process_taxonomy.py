@@ -28,12 +28,44 @@ import logging
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, FrozenSet, List, Optional, Set
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, List, Optional, Sequence, Set
+
+if TYPE_CHECKING:
+    import numpy as np
 
 import yaml
 
+from ..cache.memo import LRUMemo
+from .alias_automaton import AliasAutomaton
+
 logger = logging.getLogger(__name__)
 
+# Aliases shorter than this only resolve by exact match (see normalize step 5).
+MIN_SUBSTRING_ALIAS_LENGTH = 5
+
+# normalize() runs for every requirement/capability string on every match;
+# inputs repeat heavily, so results are memoized per taxonomy instance.
+NORMALIZE_MEMO_SIZE = 50000
+NORMALIZE_MEMO = "taxonomy_normalize"
+
+# Moves whenever any taxonomy (re)builds, so caches of normalized process
+# names can key on it instead of being cleared by hand.
+_taxonomy_version = 0
+
+
+def taxonomy_version() -> int:
+    """Current process-wide taxonomy version."""
+    return _taxonomy_version
+
+
+def _bump_taxonomy_version() -> None:
+    global _taxonomy_version
+    _taxonomy_version += 1
+
+
+_SEPARATORS_RE = re.compile(r"[_\-]+")
+_WHITESPACE_RE = re.compile(r"\s+")
+
 # ---------------------------------------------------------------------------
 # Default path for the YAML taxonomy file
 # ---------------------------------------------------------------------------
@@ -977,6 +1009,24 @@ def validate_definitions(definitions: List[ProcessDefinition]) -> List[str]:
     return errors
 
 
+def _mask_of(bits: Dict[str, int], ids: Sequence[str]) -> int:
+    """Bitset of the known IDs in ``ids``."""
+    mask = 0
+    for cid in ids:
+        mask |= bits.get(cid, 0)
+    return mask
+
+
+def _ids_in(mask: int, ids: Sequence[str]) -> Set[str]:
+    """IDs whose bit is set in ``mask``."""
+    result: Set[str] = set()
+    while mask:
+        low = mask & -mask
+        result.add(ids[low.bit_length() - 1])
+        mask ^= low
+    return result
+
+
 class ProcessTaxonomy:
     """
     Canonical manufacturing process taxonomy.
@@ -1012,6 +1062,25 @@ class ProcessTaxonomy:
         # Track which file was loaded (None means built-in definitions)
         self._source_path: Optional[Path] = None
 
+        # Substring fallback over aliases of MIN_SUBSTRING_ALIAS_LENGTH+ chars,
+        # with their canonical IDs in registration order.
+        self._substring_automaton = AliasAutomaton([])
+        self._substring_ids: List[str] = []
+
+        # Hierarchy closure, rebuilt by _build. Bit i of a mask is
+        # self._hierarchy_ids[i]; relation masks encode are_related().
+        self._hierarchy_ids: List[str] = []
+        self._bits: Dict[str, int] = {}
+        self._ancestor_lists: Dict[str, tuple] = {}
+        self._ancestor_masks: Dict[str, int] = {}
+        self._relation_masks: Dict[str, int] = {}
+        self._relation_dense: Optional["np.ndarray"] = None
+
+        # Raw input -> canonical ID ("" for unrecognized); emptied by _build.
+        self._normalize_memo: LRUMemo[str] = LRUMemo(
+            NORMALIZE_MEMO, NORMALIZE_MEMO_SIZE
+        )
+
         self._build(definitions)
 
     # ------------------------------------------------------------------
@@ -1133,6 +1202,55 @@ class ProcessTaxonomy:
                     self._children[defn.parent] = set()
                 self._children[defn.parent].add(defn.canonical_id)
 
+        self._build_closure()
+
+        substring_aliases = [
+            (key, cid)
+            for key, cid in self._alias_map.items()
+            if len(key) >= MIN_SUBSTRING_ALIAS_LENGTH
+        ]
+        self._substring_automaton = AliasAutomaton([k for k, _ in substring_aliases])
+        self._substring_ids = [cid for _, cid in substring_aliases]
+        self._normalize_memo.clear()
+        _bump_taxonomy_version()
+
+    def _build_closure(self) -> None:
+        """Precompute ancestors and ``are_related`` as per-ID bitsets.
+
+        The hierarchy only changes on reload, so every relation query becomes
+        a dict lookup and a bit test instead of two ancestor walks.
+        """
+        ids = list(self._definitions)
+        bits = {cid: 1 << i for i, cid in enumerate(ids)}
+        ancestor_lists = {cid: tuple(self._walk_ancestors(cid)) for cid in ids}
+        ancestor_masks = {
+            cid: _mask_of(bits, ancestors) for cid, ancestors in ancestor_lists.items()
+        }
+
+        # Same process, or one is an ancestor of the other...
+        relation = {cid: bits[cid] | ancestor_masks[cid] for cid in ids}
+        for cid, ancestors in ancestor_lists.items():
+            for ancestor in ancestors:
+                if ancestor in relation:
+                    relation[ancestor] |= bits[cid]
+        # ...or they share a direct parent.
+        siblings: Dict[str, int] = {}
+        for cid in ids:
+            parent = self._definitions[cid].parent
+            if parent:
+                siblings[parent] = siblings.get(parent, 0) | bits[cid]
+        for cid in ids:
+            parent = self._definitions[cid].parent
+            if parent:
+                relation[cid] |= siblings[parent]
+
+        self._hierarchy_ids = ids
+        self._bits = bits
+        self._ancestor_lists = ancestor_lists
+        self._ancestor_masks = ancestor_masks
+        self._relation_masks = relation
+        self._relation_dense = None
+
     def _register_alias(self, alias: str, canonical_id: str) -> None:
         """Register a single alias, after key normalization."""
         key = self._normalize_key(alias)
@@ -1154,8 +1272,8 @@ class ProcessTaxonomy:
         if not text:
             return ""
         key = text.strip().lower()
-        key = re.sub(r"[_\-]+", " ", key)
-        key = re.sub(r"\s+", " ", key)
+        key = _SEPARATORS_RE.sub(" ", key)
+        key = _WHITESPACE_RE.sub(" ", key)
         return key.strip()
 
     # ------------------------------------------------------------------
@@ -1183,6 +1301,15 @@ class ProcessTaxonomy:
         if not input_str or not isinstance(input_str, str):
             return None
 
+        cached = self._normalize_memo.get(input_str)
+        if cached is not None:
+            return cached or None
+        result = self._resolve(input_str)
+        self._normalize_memo.set(input_str, result or "")
+        return result
+
+    def _resolve(self, input_str: str) -> Optional[str]:
+        """Uncached :meth:`normalize` for a non-empty string."""
         text = input_str.strip()
         if not text:
             return None
@@ -1215,11 +1342,11 @@ class ProcessTaxonomy:
         #    from short abbreviations (e.g., "las" matching "plastic",
         #    "pla" matching "electroplating"). Short aliases still work
         #    via exact match in step 4.
-        for alias_key, cid in self._alias_map.items():
-            if len(alias_key) < 5:
-                continue
-            if alias_key in key or key in alias_key:
-                return cid
+        #    The automaton returns the same alias the scan in registration
+        #    order would hit first.
+        index = self._substring_automaton.first_match(key)
+        if index is not None:
+            return self._substring_ids[index]
 
         # 6. Unrecognized
         return None
@@ -1306,6 +1433,10 @@ class ProcessTaxonomy:
         Returns:
             List of ancestor canonical IDs, nearest parent first.
         """
+        return list(self._ancestor_lists.get(canonical_id, ()))
+
+    def _walk_ancestors(self, canonical_id: str) -> List[str]:
+        """Follow parent links from ``canonical_id``; used to build the closure."""
         ancestors: List[str] = []
         current = canonical_id
         visited: Set[str] = set()
@@ -1318,6 +1449,26 @@ class ProcessTaxonomy:
             current = defn.parent
         return ancestors
 
+    def is_ancestor(self, ancestor_id: str, canonical_id: str) -> bool:
+        """True when ``ancestor_id`` is a (transitive) parent of ``canonical_id``.
+
+        Both arguments must be canonical IDs.
+        """
+        return bool(
+            self._ancestor_masks.get(canonical_id, 0) & self._bits.get(ancestor_id, 0)
+        )
+
+    def get_related(self, canonical_id: str) -> Set[str]:
+        """Every canonical ID :meth:`are_related` to ``canonical_id``, itself included.
+
+        Args:
+            canonical_id: A canonical process ID.
+
+        Returns:
+            Set of canonical IDs (empty if unknown).
+        """
+        return _ids_in(self._relation_masks.get(canonical_id, 0), self._hierarchy_ids)
+
     def are_related(self, id_a: str, id_b: str) -> bool:
         """Check if two process IDs are related in the hierarchy.
 
@@ -1333,32 +1484,53 @@ class ProcessTaxonomy:
         Returns:
             True if the processes are related.
         """
-        # Normalize inputs if needed
-        norm_a = self.normalize(id_a) if id_a not in self._definitions else id_a
-        norm_b = self.normalize(id_b) if id_b not in self._definitions else id_b
+        norm_a = self._canonical(id_a)
+        norm_b = self._canonical(id_b)
 
         if norm_a is None or norm_b is None:
             return False
 
-        # Same process
-        if norm_a == norm_b:
-            return True
-
-        # One is ancestor of the other
-        ancestors_a = set(self.get_ancestors(norm_a)) | {norm_a}
-        ancestors_b = set(self.get_ancestors(norm_b)) | {norm_b}
+        return bool(self._relation_masks.get(norm_a, 0) & self._bits.get(norm_b, 0))
 
-        if norm_a in ancestors_b or norm_b in ancestors_a:
-            return True
+    def relation_matrix(
+        self, ids_a: Sequence[str], ids_b: Sequence[str]
+    ) -> "np.ndarray":
+        """:meth:`are_related` for every pair, as a ``len(ids_a) x len(ids_b)`` bool array.
 
-        # Share a common parent (not just root -- direct parent)
-        parent_a = self.get_parent(norm_a)
-        parent_b = self.get_parent(norm_b)
+        Inputs are normalized like :meth:`are_related`; anything that does not
+        resolve yields an all-False row or column. Lets callers check a
+        requirement list against a capability list in one call.
+        """
+        import numpy as np
+
+        if self._relation_dense is None:
+            n = len(self._hierarchy_ids)
+            # Extra last row/column stays False for unresolved inputs.
+            dense = np.zeros((n + 1, n + 1), dtype=bool)
+            for i, cid in enumerate(self._hierarchy_ids):
+                mask = self._relation_masks[cid]
+                for j in range(n):
+                    if mask >> j & 1:
+                        dense[i, j] = True
+            self._relation_dense = dense
+
+        unresolved = len(self._hierarchy_ids)
+        index = {cid: i for i, cid in enumerate(self._hierarchy_ids)}
+
+        def rows(values: Sequence[str]) -> "np.ndarray":
+            return np.fromiter(
+                (index.get(self._canonical(v), unresolved) for v in values),
+                dtype=np.intp,
+                count=len(values),
+            )
 
-        if parent_a and parent_b and parent_a == parent_b:
-            return True
+        return self._relation_dense[np.ix_(rows(ids_a), rows(ids_b))]
 
-        return False
+    def _canonical(self, value: str) -> Optional[str]:
+        """``value`` if it is a canonical ID, else its normalization."""
+        if value in self._definitions:
+            return value
+        return self.normalize(value)
 
     def get_all_canonical_ids(self) -> Set[str]:
         """Return all known canonical process IDs.
@@ -0,0 +1,99 @@
+"""
+Contract test for POST /api/match/batch.
+
+The route streams newline-delimited JSON: one object per design as it
+finishes, designs that could not be loaded included, then a summary line.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+
+from tests.record_fixtures import okh_manifest_dict, okw_facility_dict
+
+
+def _get_app() -> tuple[FastAPI, FastAPI]:
+    from src.core.main import api_v1
+
+    app = FastAPI()
+    app.mount("/v1", api_v1)
+    return app, api_v1
+
+
+@pytest.mark.asyncio
+@pytest.mark.contract
+async def test_batch_streams_one_line_per_design_then_a_summary():
+    from src.core.api.routes.match import get_matching_service, get_okh_service
+    from src.core.services.matching_service import ManifestMatchResult
+
+    app, api_v1 = _get_app()
+    seen = {}
+
+    async def match_many(manifests, facilities, explicit_domain=None):
+        seen["facilities"] = facilities
+        for index, manifest in enumerate(manifests):
+            solution = MagicMock(score=0.8)
+            solution.to_dict.return_value = {"score": 0.8}
+            yield ManifestMatchResult(
+                index=index,
+                manifest=manifest,
+                domain="manufacturing",
+                solutions={solution},
+            )
+
+    matching = SimpleNamespace(match_many=match_many)
+    okh = MagicMock()
+    okh.get = AsyncMock(return_value=None)
+    api_v1.dependency_overrides[get_matching_service] = lambda: matching
+    api_v1.dependency_overrides[get_okh_service] = lambda: okh
+
+    missing = uuid4()
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://testserver"
+        ) as client:
+            resp = await client.post(
+                "/v1/api/match/batch",
+                json={
+                    "okh_ids": [str(missing)],
+                    "okh_manifests": [okh_manifest_dict()],
+                    "okw_facilities": [okw_facility_dict()],
+                },
+            )
+
+        assert resp.status_code == 200, resp.text
+        assert resp.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in resp.text.splitlines()]
+        assert len(lines) == 3 and len(seen["facilities"]) == 1
+        by_error = {bool(line.get("error")): line for line in lines[:2]}
+        assert by_error[True]["okh_id"] == str(missing)
+        assert by_error[False]["solutions"] == [{"score": 0.8}]
+        assert lines[2]["summary"]["total_designs"] == 2
+        assert lines[2]["summary"]["designs_matched"] == 1
+    finally:
+        api_v1.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+@pytest.mark.contract
+async def test_batch_requires_a_design():
+    app, _ = _get_app()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://testserver"
+    ) as client:
+        resp = await client.post("/v1/api/match/batch", json={})
+
+    assert resp.status_code in (400, 422)
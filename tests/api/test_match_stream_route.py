@@ -0,0 +1,123 @@
+"""
+Contract test for POST /api/match/stream.
+
+The route emits progress and solution events while the walk runs, then a
+summary frame; as NDJSON by default, or as Server-Sent Events on request.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+
+from tests.record_fixtures import okh_manifest_dict, okw_facility_dict
+
+
+def _get_app() -> tuple[FastAPI, FastAPI]:
+    from src.core.main import api_v1
+
+    app = FastAPI()
+    app.mount("/v1", api_v1)
+    return app, api_v1
+
+
+def _matching_service():
+    from src.core.models.supply_trees import SupplyTree, SupplyTreeSolution
+    from src.core.services.matching_service import MatchEvent
+
+    async def iter_matches_with_manifest(
+        okh_manifest, facilities, explicit_domain=None, max_solutions=None
+    ):
+        total = len(facilities)
+        yield MatchEvent("progress", 1, total)
+        for facility, score in zip(facilities, (0.9, 0.05)):
+            tree = SupplyTree(
+                facility_name=facility.name,
+                okh_reference=str(okh_manifest.id),
+                okw_reference=str(facility.id),
+                confidence_score=score,
+            )
+            yield MatchEvent(
+                "solution",
+                1,
+                total,
+                solution=SupplyTreeSolution.from_single_tree(tree, score=score),
+                facility=facility,
+            )
+
+    return SimpleNamespace(iter_matches_with_manifest=iter_matches_with_manifest)
+
+
+async def _post(app, path, body, **kwargs):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://testserver"
+    ) as client:
+        return await client.post(path, json=body, **kwargs)
+
+
+@pytest.mark.asyncio
+@pytest.mark.contract
+async def test_stream_emits_solutions_then_a_summary():
+    from src.core.api.routes.match import get_matching_service
+
+    app, api_v1 = _get_app()
+    api_v1.dependency_overrides[get_matching_service] = _matching_service
+    body = {
+        "okh_manifest": okh_manifest_dict(),
+        "okw_facilities": [okw_facility_dict()],
+        "max_candidate_facilities": 50,
+    }
+    try:
+        resp = await _post(app, "/v1/api/match/stream", body)
+        assert resp.status_code == 200, resp.text
+        assert resp.headers["content-type"].startswith("application/x-ndjson")
+        frames = [json.loads(line) for line in resp.text.splitlines()]
+        assert [f["event"] for f in frames] == ["progress", "solution", "summary"]
+        solution = frames[1]["data"]
+        assert solution["sequence"] == 1 and solution["confidence"] == 0.9
+        assert solution["validation"]["is_valid"] is True
+        assert frames[2]["data"]["total_solutions"] == 1
+
+        sse = await _post(
+            app,
+            "/v1/api/match/stream",
+            body,
+            headers={"Accept": "text/event-stream"},
+        )
+        assert sse.headers["content-type"].startswith("text/event-stream")
+        blocks = [b for b in sse.text.split("\n\n") if b]
+        assert [b.splitlines()[0] for b in blocks] == [
+            "event: progress",
+            "event: solution",
+            "event: summary",
+        ]
+    finally:
+        api_v1.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+@pytest.mark.contract
+async def test_nested_matching_is_not_streamed():
+    from src.core.api.routes.match import get_matching_service
+
+    app, api_v1 = _get_app()
+    api_v1.dependency_overrides[get_matching_service] = _matching_service
+    try:
+        resp = await _post(
+            app,
+            "/v1/api/match/stream",
+            {"okh_manifest": okh_manifest_dict(), "max_depth": 2},
+        )
+    finally:
+        api_v1.dependency_overrides.clear()
+
+    assert resp.status_code == 400
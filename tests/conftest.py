@@ -20,6 +20,9 @@ import pytest
 # tests that exercise other providers still override via monkeypatch (env vars
 # take precedence and `get_settings()` is uncached).
 os.environ["STORAGE_PROVIDER"] = "local"
+# Likewise keep the persistent storage index out of $HOME: only tests that pass
+# an explicit ``index_path`` (under tmp_path) exercise it.
+os.environ["STORAGE_INDEX_ENABLED"] = "false"
 
 _TESTS_ROOT = Path(__file__).resolve().parent
 
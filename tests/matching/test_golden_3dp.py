@@ -9,6 +9,8 @@ from uuid import UUID
 
 import pytest
 
+from src.core.services.okw_service import OKWSnapshot
+
 FIXTURES = Path(__file__).resolve().parent / "fixtures"
 MOM_3DP_IRI = "https://maps.ofmaking.org/space/harness-3dp-lab"
 
@@ -58,7 +60,7 @@ async def test_mom_mock_iri_3dp_finds_facility(monkeypatch):
     from src.core.services.okw_service import OKWService
 
     svc = OKWService()
-    svc.list = AsyncMock(return_value=([], 0))
+    svc._load_snapshot = AsyncMock(return_value=OKWSnapshot())
     _patch_mom(monkeypatch)
 
     facilities = await svc.get_network_match_facilities(
@@ -87,10 +89,10 @@ async def test_union_all_3dp_finds_facility(monkeypatch):
 
     local = _local_facility()
 
-    async def list_local(self, page=1, page_size=50, **kwargs):
-        return ([local], 1) if page == 1 else ([], 0)
+    async def snapshot_local(self):
+        return okw_mod.OKWSnapshot(facilities=[local])
 
-    monkeypatch.setattr(okw_mod.OKWService, "list", list_local)
+    monkeypatch.setattr(okw_mod.OKWService, "_load_snapshot", snapshot_local)
     _patch_mom(monkeypatch)
 
     svc = okw_mod.OKWService()
@@ -120,7 +122,7 @@ async def test_multi_req_negative_against_3dp_only_mom(monkeypatch):
     from src.core.services.okw_service import OKWService
 
     svc = OKWService()
-    svc.list = AsyncMock(return_value=([], 0))
+    svc._load_snapshot = AsyncMock(return_value=OKWSnapshot())
     _patch_mom(monkeypatch)
 
     facilities = await svc.get_network_match_facilities(
@@ -147,7 +149,7 @@ async def test_mom_stub_id_is_stable_uuid5(monkeypatch):
     from src.core.services.okw_service import OKWService
 
     svc = OKWService()
-    svc.list = AsyncMock(return_value=([], 0))
+    svc._load_snapshot = AsyncMock(return_value=OKWSnapshot())
     _patch_mom(monkeypatch)
 
     a = await svc.get_network_match_facilities(
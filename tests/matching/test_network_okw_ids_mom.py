@@ -9,6 +9,8 @@ from uuid import uuid5, NAMESPACE_URL
 
 import pytest
 
+from src.core.services.okw_service import OKWSnapshot
+
 FIXTURES = Path(__file__).resolve().parent / "fixtures"
 MOM_IRI = "https://maps.ofmaking.org/space/harness-3dp-lab"
 
@@ -34,7 +36,7 @@ async def test_network_match_okw_ids_mom_iri_keeps_stub(monkeypatch):
     from src.core.services.okw_service import OKWService
 
     svc = OKWService()
-    svc.list = AsyncMock(return_value=([], 0))
+    svc._load_snapshot = AsyncMock(return_value=OKWSnapshot())
     _patch_mom_cache(monkeypatch)
 
     facilities = await svc.get_network_match_facilities(
@@ -55,7 +57,7 @@ async def test_get_filtered_facilities_network_mom_iri(monkeypatch):
     from src.core.services.okw_service import OKWService
 
     svc = OKWService()
-    svc.list = AsyncMock(return_value=([], 0))
+    svc._load_snapshot = AsyncMock(return_value=OKWSnapshot())
     _patch_mom_cache(monkeypatch)
 
     async def fake_get_instance():
@@ -90,7 +92,7 @@ async def test_mom_iri_okw_ids_yields_3dp_solution(monkeypatch):
     from src.core.services.okw_service import OKWService
 
     svc_okw = OKWService()
-    svc_okw.list = AsyncMock(return_value=([], 0))
+    svc_okw._load_snapshot = AsyncMock(return_value=OKWSnapshot())
     _patch_mom_cache(monkeypatch)
 
     facilities = await svc_okw.get_network_match_facilities(
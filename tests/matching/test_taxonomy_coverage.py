@@ -37,13 +37,13 @@ async def test_taxonomy_coverage_offline_mocked_mom(monkeypatch, capsys):
         (FIXTURES / "mom_spaces_3dp.json").read_text(encoding="utf-8")
     )
 
-    async def list_local(self, page=1, page_size=50, **kwargs):
-        return ([local], 1) if page == 1 else ([], 0)
+    async def snapshot_local(self):
+        return okw_mod.OKWSnapshot(facilities=[local])
 
     async def fake_get(force_refresh=False):
         return (mom_spaces, True)
 
-    monkeypatch.setattr(okw_mod.OKWService, "list", list_local)
+    monkeypatch.setattr(okw_mod.OKWService, "_load_snapshot", snapshot_local)
     monkeypatch.setattr(mom.mom_spaces_cache, "get", fake_get)
 
     svc = okw_mod.OKWService()
@@ -0,0 +1,207 @@
+"""BOM explosion walks referenced manifests as a memoized, cycle-safe DAG.
+
+A sub-assembly shared by several parents is loaded and exploded once per
+request, reference loads overlap up to ``BOM_RESOLUTION_CONCURRENCY``, a design
+exploded before skips the recursion entirely, and a reference cycle stops at
+the first repeat instead of recursing to ``max_depth``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from src.core.models.okh import OKHManifest
+from src.core.services import bom_resolution_service as brs
+from src.core.services.bom_resolution_service import (
+    BOMResolutionService,
+    invalidate_bom_explosions,
+)
+
+
+def _manifest(title, *children, parts=()):
+    return OKHManifest.from_dict(
+        {
+            "id": str(uuid4()),
+            "title": title,
+            "version": "1.0.0",
+            "license": {"hardware": "MIT"},
+            "licensor": {"name": "Someone"},
+            "documentation_language": "en",
+            "function": title,
+            "sub_parts": [
+                {
+                    "id": f"{title}/{child.title}-{i}",
+                    "name": child.title,
+                    "reference": {"okh_id": str(child.id)},
+                }
+                for i, child in enumerate(children)
+            ]
+            + [{"id": f"{title}/{name}", "name": name} for name in parts],
+        }
+    )
+
+
+class FakeOKHService:
+    def __init__(self, manifests, latency=0.0):
+        self.by_id = {m.id: m for m in manifests}
+        self.latency = latency
+        self.gets = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get(self, okh_id):
+        self.gets += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            return self.by_id.get(okh_id)
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture(autouse=True)
+def _fresh_memo():
+    invalidate_bom_explosions()
+    yield
+    invalidate_bom_explosions()
+
+
+def _rows(matches):
+    return sorted(
+        (m.component.id, m.depth, m.parent_component_id, tuple(m.path)) for m in matches
+    )
+
+
+@pytest.mark.asyncio
+async def test_shared_subassembly_loads_once_and_lands_under_each_parent():
+    motor = _manifest("motor", parts=["stator", "rotor"])
+    left = _manifest("left", motor)
+    right = _manifest("right", motor)
+    root = _manifest("root", left, right)
+    service = FakeOKHService([motor, left, right])
+
+    bom, matches = await BOMResolutionService(service).explode_manifest(root)
+
+    assert len(bom.components) == 2
+    # left, right and one motor load; the second motor reference is memoized.
+    assert service.gets == 3
+    assert ("motor/stator", 2, "left/motor-0", ("left", "motor", "stator")) in _rows(
+        matches
+    )
+    assert ("motor/stator", 2, "right/motor-0", ("right", "motor", "stator")) in _rows(
+        matches
+    )
+    assert len(matches) == 2 + 2 + 2 * 2
+
+
+@pytest.mark.asyncio
+async def test_matches_the_per_call_explosion():
+    motor = _manifest("motor", parts=["stator"])
+    frame = _manifest("frame", motor, parts=["rail"])
+    root = _manifest("root", frame, motor, parts=["screw"])
+    service = FakeOKHService([motor, frame])
+    resolver = BOMResolutionService(service)
+
+    _, memoized = await resolver.explode_manifest(root, max_depth=3)
+    bom = await BOMResolutionService(service).resolve_bom(root)
+    direct = await BOMResolutionService(service).explode_bom(bom, max_depth=3)
+
+    assert _rows(memoized) == _rows(direct)
+    assert max(m.depth for m in memoized) == 2  # frame > motor > stator
+
+
+@pytest.mark.asyncio
+async def test_repeat_explosions_skip_the_recursion():
+    motor = _manifest("motor", parts=["stator"])
+    root = _manifest("root", motor)
+    service = FakeOKHService([motor])
+
+    _, first = await BOMResolutionService(service).explode_manifest(root)
+    gets = service.gets
+    _, second = await BOMResolutionService(service).explode_manifest(root)
+
+    assert service.gets == gets
+    assert _rows(first) == _rows(second)
+    assert all(a is not b for a, b in zip(first, second))
+
+    invalidate_bom_explosions()
+    await BOMResolutionService(service).explode_manifest(root)
+    assert service.gets > gets
+
+
+@pytest.mark.asyncio
+async def test_reference_cycles_stop_at_the_first_repeat():
+    a = _manifest("a")
+    b = _manifest("b", a)
+    # a -> b -> a: rewrite a's BOM to point at b after both exist.
+    a.sub_parts = [{"id": "a/b", "name": "b", "reference": {"okh_id": str(b.id)}}]
+    service = FakeOKHService([a, b])
+
+    _, matches = await BOMResolutionService(service).explode_manifest(a, max_depth=5)
+
+    assert _rows(matches) == [
+        ("a/b", 0, None, ("b",)),
+        ("b/a-0", 1, "a/b", ("b", "a")),
+    ]
+    # A cut depends on where the walk started, so it is not shared.
+    assert not brs._explosions().get(
+        ("manifest", brs.manifest_content_hash(a), None, 5)
+    )
+
+
+@pytest.mark.asyncio
+async def test_subtrees_are_not_reused_across_cycle_contexts():
+    s = _manifest("S")
+    q = _manifest("Q", s)
+    # S -> Q closes a cycle that only matters below Q.
+    s.sub_parts = [{"id": "S/Q", "name": "Q", "reference": {"okh_id": str(q.id)}}]
+    p = _manifest("P", s)
+    root = _manifest("R", p, q)
+    service = FakeOKHService([s, q, p])
+
+    _, matches = await BOMResolutionService(service).explode_manifest(root, max_depth=6)
+    paths = {tuple(m.path) for m in matches}
+
+    # Under P, S expands Q, whose reference back to S is cut.
+    assert ("P", "S", "Q", "S") in paths
+    assert ("P", "S", "Q", "S", "Q") not in paths
+    # Under Q, S's reference back to Q is cut: S is not reused from under P.
+    assert ("Q", "S", "Q") in paths
+    assert ("Q", "S", "Q", "S") not in paths
+
+
+@pytest.mark.asyncio
+async def test_callers_get_private_copies():
+    motor = _manifest("motor", parts=["stator"])
+    root = _manifest("root", motor)
+    service = FakeOKHService([motor])
+
+    bom, first = await BOMResolutionService(service).explode_manifest(root)
+    assert {id(c) for c in bom.components} <= {id(m.component) for m in first}
+    for match in first:
+        match.component.name = "mutated"
+        match.okh_manifest = None
+    bom.components.clear()
+
+    bom, second = await BOMResolutionService(service).explode_manifest(root)
+
+    assert len(bom.components) == 1
+    assert "mutated" not in {m.component.name for m in second}
+    assert {id(m.component) for m in first}.isdisjoint(id(m.component) for m in second)
+
+
+@pytest.mark.asyncio
+async def test_reference_loads_overlap_within_the_limit(monkeypatch):
+    monkeypatch.setattr(brs, "BOM_RESOLUTION_CONCURRENCY", 4)
+    children = [_manifest(f"c{i}") for i in range(12)]
+    root = _manifest("root", *children)
+    service = FakeOKHService(children, latency=0.01)
+
+    _, matches = await BOMResolutionService(service).explode_manifest(root)
+
+    assert len(matches) == 12 and service.gets == 12
+    assert 1 < service.max_in_flight <= 4
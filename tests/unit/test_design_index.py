@@ -0,0 +1,261 @@
+"""Reverse matching only evaluates designs a facility could plausibly cover.
+
+``DesignProcessIndex`` keeps each design's requirement vector (canonical
+process -> occurrences) and posting lists from canonical process to design.
+A query for one facility must keep exactly the designs whose optimistic
+coverage bound reaches the partial-match threshold, must stay current across
+OKH writes, and ``find_designs_for_facility`` must return the same designs it
+would without the index.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.core.matching.design_index import (
+    MIN_COVERAGE,
+    DesignProcessIndex,
+    design_process_names,
+)
+from src.core.services.okh_service import OKHService
+from src.core.storage.smart_discovery import FileInfo
+from src.core.taxonomy import taxonomy
+
+VOCABULARY = [
+    "cnc_milling",
+    "cnc_turning",
+    "3d_printing",
+    "laser_cutting",
+    "welding",
+    "sewing",
+    "pcb_assembly",
+    "injection_molding",
+    "not-a-known-process",
+]
+
+
+def _design(*processes, parts=()):
+    return {
+        "id": str(uuid4()),
+        "title": "-".join(processes) or "empty",
+        "manufacturing_processes": list(processes),
+        "parts": [{"name": f"p{i}", "tsdc": list(t)} for i, t in enumerate(parts)],
+    }
+
+
+def _facility(*processes):
+    return {"manufacturing_processes": list(processes)}
+
+
+def _reference_keeps(design, facility) -> bool:
+    """Coverage bound computed pairwise straight from ``are_related``."""
+    required = [taxonomy.normalize(n) for n in design_process_names(design)]
+    offered = [taxonomy.normalize(n) for n in facility["manufacturing_processes"]]
+    if not required or not offered:
+        return False
+    if None in offered:
+        return True
+    hits = sum(
+        1
+        for cid in required
+        if cid is None or any(taxonomy.are_related(cid, o) for o in offered)
+    )
+    return hits / len(required) >= MIN_COVERAGE
+
+
+def test_requirements_come_from_every_extractor_source():
+    design = {
+        "manufacturing_specs": {"process_requirements": [{"process_name": "Welding"}]},
+        "manufacturing_processes": ["3DP", " "],
+        "parts": [{"tsdc": ["3DP"]}, {"tsdc": []}],
+    }
+
+    assert design_process_names(design) == ["Welding", "3DP", "3DP"]
+    profile = DesignProcessIndex().profile(design)
+    assert dict(profile.groups) == {"welding": 1, "3d_printing": 2}
+    assert profile.total == 3 and profile.unresolved == 0
+
+
+def test_candidates_match_the_pairwise_bound():
+    rng = random.Random(3)
+    designs = [
+        _design(*rng.choices(VOCABULARY, k=rng.randint(0, 5))) for _ in range(200)
+    ]
+    index = DesignProcessIndex()
+    index.rebuild(designs)
+
+    for _ in range(50):
+        facility = _facility(*rng.sample(VOCABULARY, rng.randint(0, 3)))
+        query = index.query(facility)
+        expected = {d["id"] for d in designs if _reference_keeps(d, facility)}
+
+        assert set(query.indexed_candidates()) == expected, facility
+        # Ad-hoc resolution agrees with the posting lists.
+        fresh = DesignProcessIndex().query(facility)
+        assert {d["id"] for d in designs if fresh.bound_for(d) is not None} == expected
+
+
+def test_ranked_by_coverage_bound():
+    full = _design("cnc_milling", "cnc_milling")
+    most = _design("cnc_milling", "cnc_milling", "welding")
+    none = _design("sewing")
+    index = DesignProcessIndex()
+    index.rebuild([none, most, full])
+
+    query = index.query(_facility("cnc_milling"))
+
+    assert query.ranked_ids() == [full["id"], most["id"]]
+    assert query.indexed_candidates()[most["id"]] == pytest.approx(2 / 3)
+
+
+def test_upsert_and_remove_keep_postings_current():
+    design = _design("sewing")
+    index = DesignProcessIndex()
+    index.upsert(design)
+    assert not index.query(_facility("welding")).indexed_candidates()
+
+    design["manufacturing_processes"] = ["welding"]
+    index.upsert(design)
+    assert list(index.query(_facility("welding")).indexed_candidates()) == [
+        design["id"]
+    ]
+    assert not index.query(_facility("sewing")).indexed_candidates()
+
+    assert index.remove(design["id"]) and len(index) == 0
+    assert not index._postings
+
+
+@pytest.mark.asyncio
+async def test_find_designs_skips_designs_outside_the_bound(monkeypatch):
+    from src.core.services.matching_service import MatchingService
+
+    service = MatchingService()
+    monkeypatch.setattr(service, "ensure_initialized", AsyncMock())
+    evaluated = []
+
+    async def fake_match(manifest, facilities, explicit_domain=None):
+        evaluated.append(manifest.title)
+        return [SimpleNamespace(score=0.8)]
+
+    monkeypatch.setattr(service, "find_matches_with_manifest", fake_match)
+    designs = [
+        SimpleNamespace(**_design(*processes))
+        for processes in [
+            ("sewing",),
+            ("cnc_milling", "welding", "welding"),
+            ("cnc_milling",),
+        ]
+    ]
+    facility = _facility("cnc_milling")
+    index = DesignProcessIndex()
+
+    ranked = await service.find_designs_for_facility(
+        facility, designs, design_index=index
+    )
+
+    # Unindexed manifests are resolved on the fly; the sewing design is never
+    # matched and the full-coverage design goes first on equal confidence.
+    assert evaluated == ["cnc_milling"]
+    assert [d["okh_id"] for d in ranked] == [designs[2].id]
+
+    evaluated.clear()
+    everything = await service.find_designs_for_facility(facility, designs)
+    assert len(evaluated) == 3 and len(everything) == 3
+
+
+def _manifest_dict(title, processes):
+    return {
+        "id": str(uuid4()),
+        "title": title,
+        "version": "1.0.0",
+        "license": {"hardware": "MIT"},
+        "licensor": {"name": "Someone"},
+        "documentation_language": "en",
+        "function": "Does a thing",
+        "manufacturing_processes": processes,
+    }
+
+
+@pytest.mark.asyncio
+async def test_okh_service_maintains_the_index():
+    from src.core.services.cache_service import get_cache_service
+
+    objects = {
+        f"okh/{title}.json": _manifest_dict(title, processes)
+        for title, processes in [
+            ("bracket", ["cnc_milling"]),
+            ("tote", ["sewing"]),
+            ("frame", ["welding", "cnc_milling"]),
+        ]
+    }
+
+    class Manager:
+        async def get_object(self, key):
+            return json.dumps(objects[key]).encode("utf-8")
+
+        async def put_object(self, key, data):
+            objects[key] = json.loads(data)
+
+        async def delete_object(self, key):
+            return objects.pop(key, None) is not None
+
+    async def discover(_prefix):
+        return [
+            FileInfo(key=k, file_type="okh", size=1, last_modified=None, metadata={})
+            for k in objects
+        ]
+
+    service = OKHService()
+    service.storage = SimpleNamespace(manager=Manager())
+    service.ensure_initialized = AsyncMock()
+    service.design_index = DesignProcessIndex()
+    get_cache_service().clear()
+
+    try:
+        with patch("src.core.services.okh_service.SmartFileDiscovery") as Discovery:
+            Discovery.return_value.discover_files = discover
+
+            manifests, total = await service.design_candidates(_facility("welding"))
+            assert total == 3 and [m.title for m in manifests] == []
+
+            manifests, _ = await service.design_candidates(_facility("cnc_milling"))
+            assert [m.title for m in manifests] == ["bracket"]
+
+            tote = objects["okh/tote.json"]
+            await service.update(
+                tote["id"], {**tote, "manufacturing_processes": ["welding"]}
+            )
+            manifests, _ = await service.design_candidates(_facility("welding"))
+            assert [m.title for m in manifests] == ["tote"]
+
+            await service.delete(tote["id"])
+            assert tote["id"] not in service.design_index
+
+            # A catalogue assembled elsewhere (shared cache) is re-indexed.
+            service.design_index.clear()
+            manifests, total = await service.design_candidates(
+                _facility("cnc_milling", "welding")
+            )
+            assert total == 2
+            assert sorted(m.title for m in manifests) == ["bracket", "frame"]
+
+            # Same ids, different content: another process edited a design and
+            # re-assembled the shared catalogue.
+            catalog = await service._load_catalog()
+            frame = next(
+                e["manifest"]
+                for e in catalog["entries"]
+                if e["manifest"]["title"] == "frame"
+            )
+            frame["manufacturing_processes"] = ["sewing"]
+            catalog["token"] = "assembled-elsewhere"
+            manifests, _ = await service.design_candidates(_facility("welding"))
+            assert [m.title for m in manifests] == []
+    finally:
+        get_cache_service().clear()
@@ -0,0 +1,122 @@
+"""Capability extraction runs once per facility revision, not once per request.
+
+``MatchingService`` memoizes each facility's extracted capabilities and their
+normalized process terms under (facility id, revision, domain, extractor,
+taxonomy version). The revision is the catalogue version for an unedited
+catalogue record and the content hash otherwise, so an edited facility is
+re-extracted; OKW writes clear the memo outright.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from src.core.services.matching import (
+    capability_cache_key,
+    facility_content_hash,
+    invalidate_facility_capabilities,
+)
+from src.core.services.matching_service import MatchingService
+from src.core.taxonomy import process_taxonomy
+
+
+class CountingExtractor:
+    version = "1"
+
+    def __init__(self):
+        self.calls = 0
+
+    def extract_capabilities(self, data):
+        self.calls += 1
+        return SimpleNamespace(
+            data=SimpleNamespace(
+                content={
+                    "capabilities": [{"process_name": p} for p in data["processes"]]
+                }
+            )
+        )
+
+
+def _facility(processes, facility_id=None):
+    facility = SimpleNamespace(id=facility_id or uuid4(), processes=list(processes))
+    facility.serializations = 0
+
+    def to_dict():
+        facility.serializations += 1
+        return {"id": str(facility.id), "processes": facility.processes}
+
+    facility.to_dict = to_dict
+    return facility
+
+
+@pytest.fixture
+def service():
+    return MatchingService()
+
+
+def test_repeat_lookups_reuse_the_extraction(service):
+    extractor, facility = CountingExtractor(), _facility(["Milling", "3DP"])
+
+    first = service._facility_capabilities(extractor, facility, "manufacturing")
+    second = service._facility_capabilities(extractor, facility, "manufacturing")
+
+    assert second is first and extractor.calls == 1
+    assert first.terms == ("cnc_milling", "3d_printing")
+    assert service._extract_facility_capabilities(
+        extractor, facility, "manufacturing"
+    ) == [{"process_name": "Milling"}, {"process_name": "3DP"}]
+
+
+def test_edits_domains_and_extractor_versions_miss(service):
+    extractor, facility = CountingExtractor(), _facility(["milling"])
+    service._facility_capabilities(extractor, facility, "manufacturing")
+
+    facility.processes.append("welding")
+    edited = service._facility_capabilities(extractor, facility, "manufacturing")
+    service._facility_capabilities(extractor, facility, "cooking")
+    extractor.version = "2"
+    service._facility_capabilities(extractor, facility, "manufacturing")
+
+    assert extractor.calls == 4
+    assert "welding" in edited.terms
+
+
+def test_okw_writes_and_taxonomy_rebuilds_invalidate(service, monkeypatch):
+    extractor, facility = CountingExtractor(), _facility(["milling"])
+    service._facility_capabilities(extractor, facility, "manufacturing")
+
+    invalidate_facility_capabilities()
+    service._facility_capabilities(extractor, facility, "manufacturing")
+    assert extractor.calls == 2
+
+    process_taxonomy._bump_taxonomy_version()
+    service._facility_capabilities(extractor, facility, "manufacturing")
+    assert extractor.calls == 3
+
+
+def test_catalogue_hits_do_not_serialize_the_facility(service):
+    extractor, facility = CountingExtractor(), _facility(["milling"])
+    version = [1]
+    service.okw_service = SimpleNamespace(catalog_revision=lambda f: version[0])
+
+    for _ in range(3):
+        service._facility_capabilities(extractor, facility, "manufacturing")
+    # Only the extraction itself serialized it.
+    assert facility.serializations == 1 and extractor.calls == 1
+
+    version[0] = 2
+    service._facility_capabilities(extractor, facility, "manufacturing")
+    assert extractor.calls == 2
+
+
+def test_key_is_stable_across_dict_ordering():
+    a = facility_content_hash({"id": "x", "processes": ["milling"], "name": "A"})
+    b = facility_content_hash({"name": "A", "processes": ["milling"], "id": "x"})
+
+    assert a == b
+    assert capability_cache_key("x", a, "manufacturing", CountingExtractor()) == (
+        capability_cache_key("x", b, "manufacturing", CountingExtractor())
+    )
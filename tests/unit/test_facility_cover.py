@@ -0,0 +1,203 @@
+"""Set-cover solvers behind facility-combination matching.
+
+``greedy_cover`` must pick exactly what the set-based greedy loop in
+``find_composite_matches_with_manifest`` used to pick. ``exact_cover`` must
+reach the best coverage with the fewest facilities, checked against brute force.
+"""
+
+from __future__ import annotations
+
+import itertools
+import random
+from types import SimpleNamespace
+from typing import List, Optional, Sequence, Set
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src.core.matching.facility_cover import (
+    distinct_masks,
+    exact_cover,
+    greedy_cover,
+    indices_of,
+    mask_of,
+)
+from src.core.models.supply_trees import SupplyTree
+from src.core.services.matching import LayerEvaluation
+
+
+def _set_greedy(covers: List[Set[int]], n: int, limit: int, seed: Optional[int]):
+    """The original greedy loop, over Python sets."""
+    uncovered = set(range(n))
+    selected: List[int] = []
+    if seed is not None and covers[seed] & uncovered:
+        selected.append(seed)
+        uncovered -= covers[seed]
+    while uncovered and len(selected) < limit:
+        best, best_gain, best_total = None, 0, 0
+        for idx, cover in enumerate(covers):
+            if idx in selected:
+                continue
+            gain, total = len(cover & uncovered), len(cover)
+            if gain > best_gain or (gain == best_gain and total > best_total):
+                best, best_gain, best_total = idx, gain, total
+        if best is None or best_gain <= 0:
+            break
+        selected.append(best)
+        uncovered -= covers[best]
+    return selected
+
+
+def _brute_best(masks: Sequence[int], limit: int, seed: Optional[int]):
+    best = (0, 0)
+    for k in range(1, limit + 1):
+        for combo in itertools.combinations(range(len(masks)), k):
+            if seed is not None and seed not in combo:
+                continue
+            covered = 0
+            for position in combo:
+                covered |= masks[position]
+            best = max(best, (covered.bit_count(), -k))
+    return best
+
+
+def _random_cases(count: int):
+    rng = random.Random(7)
+    for _ in range(count):
+        n = rng.randint(1, 8)
+        masks = [rng.getrandbits(n) or 1 for _ in range(rng.randint(1, 9))]
+        seed = rng.choice([None, *range(len(masks))])
+        yield n, masks, rng.randint(1, 4), seed
+
+
+def test_mask_helpers_round_trip():
+    assert indices_of(mask_of([0, 3, 5])) == [0, 3, 5]
+    assert distinct_masks([3, 1, 3, 1, 4]) == ([3, 1, 4], [[0, 2], [1, 3], [4]])
+
+
+def test_greedy_matches_the_set_based_loop():
+    for n, masks, limit, seed in _random_cases(500):
+        covers = [set(indices_of(mask)) for mask in masks]
+        assert greedy_cover(masks, limit, seed) == _set_greedy(
+            covers, n, limit, seed
+        ), (masks, limit, seed)
+
+
+def test_exact_finds_best_coverage_with_fewest_facilities():
+    for _, masks, limit, seed in _random_cases(500):
+        selected = exact_cover(masks, limit, seed)
+        covered = 0
+        for position in selected:
+            covered |= masks[position]
+
+        assert len(selected) == len(set(selected)) <= limit
+        assert seed is None or seed in selected
+        assert (covered.bit_count(), -len(selected)) == _brute_best(
+            masks, limit, seed
+        ), (masks, limit, seed)
+
+
+def test_exact_beats_greedy_where_greedy_overspends():
+    # Greedy takes the wide middle set first and then needs both halves.
+    masks = [0b111000, 0b000111, 0b011110]
+
+    assert len(greedy_cover(masks, 3)) == 3
+    assert sorted(exact_cover(masks, 3)) == [0, 1]
+
+
+def test_exact_is_fast_on_large_duplicated_pools():
+    rng = random.Random(1)
+    masks = [rng.getrandbits(10) for _ in range(5000)]
+
+    selected = exact_cover(masks, 3)
+
+    covered = 0
+    for position in selected:
+        covered |= masks[position]
+    assert covered == (1 << 10) - 1 and len(selected) == 2
+
+
+@pytest.mark.asyncio
+async def test_composite_matching_with_exact_strategy(monkeypatch):
+    import src.core.services.matching_service as ms
+
+    service = ms.MatchingService()
+    monkeypatch.setattr(service, "ensure_initialized", AsyncMock())
+    monkeypatch.setattr(
+        service, "_detect_domain_for_matching", AsyncMock(return_value="manufacturing")
+    )
+    processes = ["milling", "welding", "knitting", "sewing", "soldering", "casting"]
+    extractor = SimpleNamespace(
+        extract_requirements=lambda _data: SimpleNamespace(
+            data=SimpleNamespace(
+                content={
+                    "process_requirements": [{"process_name": p} for p in processes]
+                }
+            )
+        ),
+        extract_capabilities=lambda data: SimpleNamespace(
+            data=SimpleNamespace(
+                content={"capabilities": [{"process_name": p} for p in data["caps"]]}
+            )
+        ),
+    )
+    monkeypatch.setattr(
+        ms.DomainRegistry,
+        "get_domain_services",
+        lambda _domain: SimpleNamespace(extractor=extractor),
+    )
+    pairs = []
+
+    async def evaluate_pair(req, cap, domain):
+        pairs.append((req, cap))
+        return LayerEvaluation(matched=req == cap, layer="direct", confidence=1.0)
+
+    async def generate_tree(manifest, facility, domain):
+        return SupplyTree(
+            facility_name=facility.name,
+            okh_reference="okh",
+            okw_reference=str(facility.id),
+            confidence_score=0.8,
+        )
+
+    monkeypatch.setattr(service, "_evaluate_pair", evaluate_pair)
+    monkeypatch.setattr(service, "_generate_supply_tree", generate_tree)
+
+    def facility(name, caps):
+        return SimpleNamespace(id=uuid4(), name=name, to_dict=lambda: {"caps": caps})
+
+    pool = [
+        facility("left", processes[:3]),
+        facility("right", processes[3:]),
+        facility("middle", processes[1:5]),
+    ] + [facility(f"copy{i}", processes[1:5]) for i in range(20)]
+    manifest = SimpleNamespace(id=uuid4(), title="t", to_dict=lambda: {})
+
+    await service.find_composite_matches_with_manifest(manifest, pool[:3])
+    distinct_pool_pairs = len(pairs)
+    pairs.clear()
+
+    greedy = await service.find_composite_matches_with_manifest(
+        manifest, pool, return_alternative_solutions=False
+    )
+    # The twenty copies share the middle facility's evaluation.
+    assert len(pairs) == distinct_pool_pairs
+    exact = await service.find_composite_matches_with_manifest(
+        manifest,
+        pool,
+        return_alternative_solutions=False,
+        combination_strategy="exact",
+    )
+
+    (greedy_solution,) = greedy
+    (exact_solution,) = exact
+    assert greedy_solution.metadata["selected_facilities"] == [
+        "middle",
+        "left",
+        "right",
+    ]
+    assert sorted(exact_solution.metadata["selected_facilities"]) == ["left", "right"]
+    assert exact_solution.metadata["combination_strategy"] == "exact"
+    assert exact_solution.metadata["coverage_ratio"] == 1.0
+    assert exact_solution.metadata["coverage_gaps"] == []
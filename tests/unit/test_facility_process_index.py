@@ -0,0 +1,196 @@
+"""Facility candidate selection through the canonical-process inverted index.
+
+The match route used to re-extract every facility's processes per request —
+from a ``capabilities`` key that ``ManufacturingFacility.to_dict()`` never
+emits, so real facilities always fell through to the capped full pool. The
+index resolves processes to taxonomy IDs once, on OKW writes and loads, and
+keeps only facilities that could reach the matcher's 60% coverage threshold.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src.core.api.routes.match import _prefilter_facilities_by_required_processes
+from src.core.matching.facility_index import FacilityProcessIndex
+from src.core.models.okw import (
+    Equipment,
+    FacilityStatus,
+    Location,
+    ManufacturingFacility,
+)
+from src.core.services.okw_service import OKWService
+
+
+def _facility(name, processes=(), equipment_processes=()):
+    return ManufacturingFacility(
+        name=name,
+        location=Location(),
+        facility_status=FacilityStatus.ACTIVE,
+        manufacturing_processes=list(processes),
+        equipment=[
+            Equipment(equipment_type="machine", manufacturing_process=p)
+            for p in equipment_processes
+        ],
+    )
+
+
+def _ids(facilities):
+    return [f.name for f in facilities]
+
+
+def test_postings_follow_taxonomy_relations():
+    index = FacilityProcessIndex()
+    mill = _facility("mill", ["milling"])
+    machining = _facility("machining", ["CNC machining"])
+    laser = _facility("laser", [], ["https://en.wikipedia.org/wiki/Laser_cutting"])
+    index.rebuild([mill, machining, laser])
+
+    candidates = index.query(["cnc machining"]).indexed_candidates()
+
+    # milling is a child of CNC machining, so both reach coverage; laser does not.
+    assert set(candidates) == {str(mill.id), str(machining.id)}
+
+
+def test_coverage_counts_requirement_occurrences():
+    index = FacilityProcessIndex()
+    laser = _facility("laser", ["laser cutting"])
+    assembly = _facility("assembly", ["assembly"])
+    index.rebuild([laser, assembly])
+
+    query = index.query(["laser cutting"] * 5 + ["assembly"])
+
+    # 5/6 for the laser shop passes; 1/6 for the assembly shop does not.
+    assert query.indexed_candidates() == {str(laser.id): 5}
+
+
+def test_unresolvable_requirements_count_as_satisfiable():
+    index = FacilityProcessIndex()
+    laser = _facility("laser", ["laser cutting"])
+    index.upsert(laser)
+
+    query = index.query(["laser cutting", "zz-bespoke-process"])
+
+    assert query.indexed_candidates() == {str(laser.id): 1}
+
+
+def test_free_text_processes_match_unresolved_requirements_by_name():
+    index = FacilityProcessIndex()
+    odd = _facility("odd", ["Knitting"])
+    other = _facility("other", ["zz-bespoke-process"])
+    index.rebuild([odd, other])
+
+    # A facility the taxonomy cannot resolve is no longer kept unconditionally.
+    assert index.query(["soldering"]).indexed_candidates() == {}
+    # It is kept when a requirement names the same process, ignoring case.
+    query = index.query(["soldering"] * 3 + ["knitting"])
+    assert query.indexed_candidates() == {str(odd.id): 1}
+    assert query.hits_for(_facility("ad hoc", ["KNITTING"])) == 1
+    assert query.hits_for(_facility("ad hoc", ["crochet"])) is None
+
+    assert index.remove(odd.id)
+    assert index.query(["soldering"] * 3 + ["knitting"]).indexed_candidates() == {}
+
+
+def test_upsert_replaces_and_remove_drops_postings():
+    index = FacilityProcessIndex()
+    facility = _facility("shop", ["milling"])
+    index.upsert(facility)
+
+    facility.manufacturing_processes = ["welding"]
+    index.upsert(facility)
+    assert index.query(["milling"]).indexed_candidates() == {}
+    assert str(facility.id) in index.query(["welding"]).indexed_candidates()
+
+    assert index.remove(facility.id)
+    assert facility.id not in index
+    assert index.query(["welding"]).indexed_candidates() == {}
+
+
+def test_prefilter_narrows_real_facilities_and_ranks_by_hits():
+    both = _facility("both", ["laser cutting", "3d printing"])
+    laser = _facility("laser", ["laser cutting"])
+    welding = _facility("welding", ["welding"])
+    empty = _facility("empty")
+
+    kept = _prefilter_facilities_by_required_processes(
+        [welding, laser, empty, both],
+        ["laser cutting", "3d printing"],
+        "req-1",
+        None,
+    )
+
+    # "laser" covers 1/2 (< 60%), so only the facility with both survives.
+    assert _ids(kept) == ["both"]
+
+
+def test_prefilter_answers_indexed_facilities_from_the_index(monkeypatch):
+    index = FacilityProcessIndex()
+    pool = [_facility(f"f{i}", ["milling"] if i % 2 else ["welding"]) for i in range(6)]
+    index.rebuild(pool)
+    monkeypatch.setattr(
+        index, "profile", lambda _f: pytest.fail("indexed facility re-resolved")
+    )
+
+    kept = _prefilter_facilities_by_required_processes(
+        pool, ["milling"], "req-1", None, index=index
+    )
+
+    assert _ids(kept) == ["f1", "f3", "f5"]
+
+
+class _MemoryManager:
+    def __init__(self):
+        self.objects = {}
+
+    async def put_object(self, key, data, *args, **kwargs):
+        self.objects[key] = data
+
+    async def delete_object(self, key):
+        return self.objects.pop(key, None) is not None
+
+
+def _service(monkeypatch):
+    svc = OKWService()
+    svc.storage = type("Storage", (), {"manager": _MemoryManager()})()
+    svc.ensure_initialized = AsyncMock()
+    svc.capability_index = FacilityProcessIndex()
+    monkeypatch.setattr(svc, "_visibility_store", lambda: AsyncMock())
+    return svc
+
+
+@pytest.mark.asyncio
+async def test_okw_writes_maintain_the_index(monkeypatch):
+    svc = _service(monkeypatch)
+    facility = _facility("shop", ["milling"])
+
+    await svc.create(facility)
+    assert (
+        str(facility.id) in svc.capability_index.query(["milling"]).indexed_candidates()
+    )
+
+    key = f"okw/{facility.id}.json"
+    monkeypatch.setattr(svc, "_find_key_for_id", AsyncMock(return_value=key))
+    updated = facility.to_dict()
+    updated["manufacturing_processes"] = ["welding"]
+    await svc.update(facility.id, updated)
+    assert svc.capability_index.query(["milling"]).indexed_candidates() == {}
+    assert (
+        str(facility.id) in svc.capability_index.query(["welding"]).indexed_candidates()
+    )
+
+    assert await svc.delete(facility.id)
+    assert facility.id not in svc.capability_index
+
+
+def test_index_accepts_objects_without_ids():
+    class Stub:
+        manufacturing_processes = ["3d printing"]
+
+    query = FacilityProcessIndex().query(["3d printing"])
+
+    assert query.hits_for(Stub()) == 1
+    assert uuid4() not in FacilityProcessIndex()
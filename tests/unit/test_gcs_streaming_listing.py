@@ -0,0 +1,134 @@
+"""GCSProvider listing and blob I/O against a fake bucket.
+
+Listings fetch one page per request and yield it before asking for the next,
+with ``max_keys`` sent as the request's result limit. Blob calls run on the
+shared, bounded GCS thread pool.
+"""
+
+from __future__ import annotations
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.storage.base import StorageConfig
+from src.core.storage.providers import gcp
+
+
+class _Page(list):
+    def __init__(self, blobs, prefixes=()):
+        super().__init__(blobs)
+        self.prefixes = tuple(prefixes)
+
+
+def _blob(name, size=2):
+    return SimpleNamespace(
+        name=name, size=size, updated=None, etag=f"e-{name}", metadata=None
+    )
+
+
+class _Bucket:
+    def __init__(self, pages):
+        self._pages = pages
+        self.calls = []
+        self.fetched = 0
+        self.download_threads = set()
+
+    def list_blobs(self, **kwargs):
+        self.calls.append(kwargs)
+
+        def pages():
+            for page in self._pages:
+                self.fetched += 1
+                yield page
+
+        return SimpleNamespace(pages=pages())
+
+    def blob(self, key, generation=None):
+        def download_as_bytes():
+            self.download_threads.add(threading.current_thread().name)
+            return key.encode()
+
+        return SimpleNamespace(exists=lambda: True, download_as_bytes=download_as_bytes)
+
+
+def _provider(bucket):
+    provider = gcp.GCSProvider(StorageConfig("gcs", "b"))
+    provider._connected = True
+    provider._bucket = bucket
+    return provider
+
+
+@pytest.mark.asyncio
+async def test_listing_yields_each_page_as_it_arrives():
+    bucket = _Bucket(
+        [
+            _Page([_blob(f"okw/{i:04d}.json") for i in range(1000)]),
+            _Page([_blob("okw/1000.json")], prefixes=["okw/archive/"]),
+        ]
+    )
+    provider = _provider(bucket)
+
+    listing = provider.list_objects(prefix="okw/", delimiter="/")
+    first = await listing.__anext__()
+    assert first == {
+        "key": "okw/0000.json",
+        "size": 2,
+        "last_modified": None,
+        "etag": "e-okw/0000.json",
+        "metadata": {},
+    }
+    assert bucket.fetched == 1
+    rest = [obj async for obj in listing]
+    assert len(rest) == 1001 and bucket.fetched == 2
+    assert rest[-1]["key"] == "okw/archive/" and rest[-1]["is_prefix"] is True
+    assert bucket.calls == [
+        {
+            "prefix": "okw/",
+            "delimiter": "/",
+            "max_results": None,
+            "page_size": gcp.GCS_LIST_PAGE_SIZE,
+        }
+    ]
+
+
+@pytest.mark.asyncio
+async def test_max_keys_is_sent_with_the_request():
+    bucket = _Bucket([_Page([_blob(f"k/{i}") for i in range(3)])])
+    provider = _provider(bucket)
+
+    keys = [obj["key"] async for obj in provider.list_objects(max_keys=3)]
+
+    assert keys == ["k/0", "k/1", "k/2"]
+    assert bucket.calls[0]["max_results"] == 3
+    assert bucket.calls[0]["page_size"] == 3
+
+
+@pytest.mark.asyncio
+async def test_downloads_share_the_bounded_pool(monkeypatch):
+    monkeypatch.setattr(gcp, "GCS_MAX_POOL_CONNECTIONS", 2)
+    monkeypatch.setattr(gcp, "_executor", None)
+    bucket = _Bucket([])
+    provider = _provider(bucket)
+
+    bodies = await provider.get_objects([f"k/{i}" for i in range(20)])
+
+    assert bodies["k/7"] == b"k/7"
+    assert bucket.download_threads
+    assert all(name.startswith("gcs") for name in bucket.download_threads)
+    assert len(bucket.download_threads) <= 2
+    gcp._executor.shutdown()
+
+
+def test_client_connection_pool_matches_the_thread_pool(monkeypatch):
+    storage = pytest.importorskip("google.cloud.storage")
+    from google.auth.credentials import AnonymousCredentials
+
+    monkeypatch.setattr(gcp, "GCS_MAX_POOL_CONNECTIONS", 24)
+    client = storage.Client(project="p", credentials=AnonymousCredentials())
+
+    gcp._size_connection_pool(client)
+
+    adapter = client._http.get_adapter("https://storage.googleapis.com")
+    assert adapter._pool_maxsize == 24
@@ -0,0 +1,117 @@
+"""LocalStorageProvider.list_objects scans only the prefix and reads sidecars lazily.
+
+Listing ``okw/`` must not walk ``okh/`` or ``backups/``, must not open any
+``.meta`` sidecar until a caller reads ``etag``/``metadata``/``content_type``,
+and must honour ``delimiter`` by rolling sub-directories up into common
+prefixes without descending into them.
+"""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from src.core.storage.base import StorageConfig
+from src.core.storage.providers import local
+from src.core.storage.providers.local import LocalStorageProvider
+
+
+async def _provider(tmp_path):
+    store = LocalStorageProvider(StorageConfig("local", str(tmp_path / "store")))
+    for key in (
+        "okh/a.json",
+        "okw/b.json",
+        "okw/a.json",
+        "okw/archive/old.json",
+        "okw-legacy/x.json",
+        "backups/2024/okw/c.json",
+    ):
+        await store.put_object(key, b"{}", "application/json", {"domain": key[:3]})
+    # Written outside put_object: no sidecar.
+    (tmp_path / "store" / "okw" / "manual.json").write_bytes(b"[1]")
+    return store
+
+
+async def _keys(store, **kwargs):
+    return [obj["key"] async for obj in store.list_objects(**kwargs)]
+
+
+@pytest.mark.asyncio
+async def test_listing_scans_only_the_prefix_directory(tmp_path, monkeypatch):
+    provider = await _provider(tmp_path)
+    scanned = []
+    real_scandir = os.scandir
+
+    def scandir(path):
+        scanned.append(os.path.relpath(path, provider.base_path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(local.os, "scandir", scandir)
+
+    assert await _keys(provider, prefix="okw/") == [
+        "okw/a.json",
+        "okw/archive/old.json",
+        "okw/b.json",
+        "okw/manual.json",
+    ]
+    assert sorted(scanned) == ["okw", os.path.join("okw", "archive")]
+
+    # A bare name fragment filters the parent directory's entries.
+    assert await _keys(provider, prefix="okw") == [
+        "okw-legacy/x.json",
+        "okw/a.json",
+        "okw/archive/old.json",
+        "okw/b.json",
+        "okw/manual.json",
+    ]
+    assert await _keys(provider, prefix="nothing/") == []
+
+
+@pytest.mark.asyncio
+async def test_sidecars_are_read_only_on_access(tmp_path, monkeypatch):
+    provider = await _provider(tmp_path)
+    opened = []
+    real_open = open
+
+    def spy(path, *args, **kwargs):
+        opened.append(path)
+        return real_open(path, *args, **kwargs)
+
+    monkeypatch.setattr(local, "open", spy, raising=False)
+
+    entries = [obj async for obj in provider.list_objects(prefix="okw/")]
+    assert [e["size"] for e in entries] == [2, 2, 2, 3]
+    assert opened == []
+
+    first, manual = entries[0], entries[-1]
+    assert first["metadata"] == {"domain": "okw"}
+    assert first.get("content_type") == "application/json"
+    assert first["etag"]
+    assert len(opened) == 1
+    assert manual.get("metadata", {}) == {} and manual["etag"] is None
+    assert dict(first)["key"] == "okw/a.json"
+
+
+@pytest.mark.asyncio
+async def test_delimiter_rolls_up_directories(tmp_path):
+    provider = await _provider(tmp_path)
+    objs = [obj async for obj in provider.list_objects(prefix="okw/", delimiter="/")]
+    assert [o["key"] for o in objs] == [
+        "okw/a.json",
+        "okw/archive/",
+        "okw/b.json",
+        "okw/manual.json",
+    ]
+    assert objs[1]["is_prefix"] and "is_prefix" not in objs[0]
+
+    assert await _keys(provider, delimiter="/") == [
+        "backups/",
+        "okh/",
+        "okw-legacy/",
+        "okw/",
+    ]
+    assert await _keys(provider, prefix="okw/", max_keys=2) == [
+        "okw/a.json",
+        "okw/archive/old.json",
+    ]
@@ -0,0 +1,170 @@
+"""Concurrent facility evaluation must be indistinguishable from the sequential walk.
+
+``find_matches_with_manifest`` can evaluate several facilities at once
+(``max_workers`` / ``MATCHING_FACILITY_CONCURRENCY``). The contract that makes
+that safe to turn on: the same solutions, in the same order, with the same
+``max_solutions`` cut-off — only the wall-clock time changes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src.core.models.supply_trees import SupplyTree
+
+
+def _facility(name: str, processes, latency: float = 0.0):
+    return SimpleNamespace(
+        id=uuid4(), name=name, processes=list(processes), latency=latency
+    )
+
+
+def _service(monkeypatch):
+    """A MatchingService whose layers are stubbed to a simple process overlap."""
+    import src.core.services.matching_service as ms
+
+    service = ms.MatchingService()
+    monkeypatch.setattr(service, "ensure_initialized", AsyncMock())
+    monkeypatch.setattr(
+        service, "_detect_domain_for_matching", AsyncMock(return_value="manufacturing")
+    )
+    extractor = SimpleNamespace(
+        extract_requirements=lambda _data: SimpleNamespace(
+            data=SimpleNamespace(
+                content={"process_requirements": [{"process_name": "milling"}]}
+            )
+        )
+    )
+    monkeypatch.setattr(
+        ms.DomainRegistry,
+        "get_domain_services",
+        lambda _domain: SimpleNamespace(extractor=extractor),
+    )
+
+    stats = {"in_flight": 0, "max_in_flight": 0}
+    facilities_by_caps = {}
+
+    async def can_satisfy(requirements, capabilities, domain):
+        stats["in_flight"] += 1
+        stats["max_in_flight"] = max(stats["max_in_flight"], stats["in_flight"])
+        try:
+            facility = facilities_by_caps[id(capabilities)]
+            if facility.latency:
+                await asyncio.sleep(facility.latency)
+            return "milling" in facility.processes
+        finally:
+            stats["in_flight"] -= 1
+
+    def extract(_extractor, f, _domain):
+        caps = [{"process_name": p} for p in f.processes]
+        facilities_by_caps[id(caps)] = f
+        return caps
+
+    async def generate_tree(manifest, facility, domain):
+        return SupplyTree(
+            facility_name=facility.name,
+            okh_reference="okh",
+            okw_reference=str(facility.id),
+            confidence_score=0.9,
+        )
+
+    monkeypatch.setattr(service, "_extract_facility_capabilities", extract)
+    monkeypatch.setattr(service, "_can_satisfy_requirements", can_satisfy)
+    monkeypatch.setattr(service, "_generate_supply_tree", generate_tree)
+    return service, stats
+
+
+def _manifest():
+    return SimpleNamespace(id=uuid4(), to_dict=lambda: {})
+
+
+def _pool():
+    # Later facilities finish first, so completion order differs from input order.
+    return [
+        _facility(
+            f"f{i}", ["milling"] if i % 3 else ["welding"], latency=0.02 - i / 1000
+        )
+        for i in range(15)
+    ]
+
+
+def _names(solutions):
+    return [s.all_trees[0].facility_name for s in solutions]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_results_match_sequential_in_order(monkeypatch):
+    service, _ = _service(monkeypatch)
+    manifest, pool = _manifest(), _pool()
+
+    sequential = await service.find_matches_with_manifest(manifest, pool, max_workers=1)
+    concurrent = await service.find_matches_with_manifest(manifest, pool, max_workers=6)
+
+    assert _names(concurrent) == _names(sequential)
+    assert len(sequential) == 10
+
+
+@pytest.mark.asyncio
+async def test_max_solutions_stops_at_the_same_facilities(monkeypatch):
+    service, _ = _service(monkeypatch)
+    manifest, pool = _manifest(), _pool()
+
+    sequential = await service.find_matches_with_manifest(
+        manifest, pool, max_solutions=3, max_workers=1
+    )
+    concurrent = await service.find_matches_with_manifest(
+        manifest, pool, max_solutions=3, max_workers=8
+    )
+
+    assert _names(concurrent) == _names(sequential)
+    assert sorted(_names(concurrent)) == ["f1", "f2", "f4"]
+
+
+@pytest.mark.asyncio
+async def test_in_flight_evaluations_are_bounded(monkeypatch):
+    service, stats = _service(monkeypatch)
+
+    await service.find_matches_with_manifest(_manifest(), _pool(), max_workers=4)
+
+    assert 1 < stats["max_in_flight"] <= 4
+
+
+@pytest.mark.asyncio
+async def test_duplicate_facility_ids_are_evaluated_once(monkeypatch):
+    service, _ = _service(monkeypatch)
+    facility = _facility("dup", ["milling"])
+
+    solutions = await service.find_matches_with_manifest(
+        _manifest(), [facility, facility, facility], max_workers=3
+    )
+
+    assert _names(solutions) == ["dup"]
+
+
+@pytest.mark.asyncio
+async def test_event_stream_yields_solutions_in_walk_order(monkeypatch):
+    service, stats = _service(monkeypatch)
+    manifest, pool = _manifest(), _pool()
+
+    events = [
+        e
+        async for e in service.iter_matches_with_manifest(manifest, pool, max_workers=6)
+    ]
+
+    solutions = [e.solution for e in events if e.kind == "solution"]
+    assert _names(solutions) == [f.name for f in pool if "milling" in f.processes]
+    progress = [e.processed_facilities for e in events if e.kind == "progress"]
+    assert progress == [1, 10, 15] and events[-1].progress_pct == 100.0
+
+    # Closing the stream after the first solution cancels the work in flight.
+    stream = service.iter_matches_with_manifest(manifest, pool, max_workers=6)
+    async for event in stream:
+        if event.kind == "solution":
+            break
+    await stream.aclose()
+    assert stats["in_flight"] == 0
@@ -0,0 +1,154 @@
+"""Matching hot-path logs are lazy, per-request tunable and summarized once.
+
+Per-facility and per-pair records go through ``hot_log``: below the effective
+level nothing is formatted and ``extra`` payloads are never built. Each request
+ends with exactly one "Matching summary" record carrying counters and
+per-layer timings, however many scopes the call path opens.
+"""
+
+from __future__ import annotations
+
+import logging
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src.core.services.matching import (
+    count_match_event,
+    hot_log,
+    layer_timer,
+    match_log_scope,
+)
+
+LOGGER = "src.core.services.matching_service"
+
+
+def _service(monkeypatch):
+    import src.core.services.matching_service as ms
+
+    service = ms.MatchingService()
+    monkeypatch.setattr(service, "ensure_initialized", AsyncMock())
+    monkeypatch.setattr(
+        service, "_detect_domain_for_matching", AsyncMock(return_value="manufacturing")
+    )
+    monkeypatch.setattr(
+        ms.DomainRegistry,
+        "get_domain_services",
+        lambda _domain: SimpleNamespace(extractor=None),
+    )
+
+    async def direct(req, cap, _domain="manufacturing"):
+        return (req == cap, "strong" if req == cap else "none")
+
+    monkeypatch.setattr(service, "_direct_match_evaluate", direct)
+    monkeypatch.setattr(
+        service, "_heuristic_match_with_rule", AsyncMock(return_value=(False, None))
+    )
+    monkeypatch.setattr(service, "_nlp_match", AsyncMock(return_value=False))
+    monkeypatch.setattr(service, "_calculate_process_similarity", lambda *_: 0.0)
+    monkeypatch.setattr(
+        service,
+        "_extract_manifest_requirements",
+        lambda *_: [{"process_name": "milling"}],
+    )
+    monkeypatch.setattr(
+        service,
+        "_extract_facility_capabilities",
+        lambda _e, facility, _d: [
+            {"process_name": p} for p in facility.manufacturing_processes
+        ],
+    )
+    return service
+
+
+def _pool():
+    return [
+        SimpleNamespace(
+            id=uuid4(), name=f"f{i}", manufacturing_processes=["milling", "welding"]
+        )
+        for i in range(4)
+    ]
+
+
+def _manifest():
+    return SimpleNamespace(
+        id=uuid4(), title="design", manufacturing_processes=["milling"]
+    )
+
+
+def _summaries(caplog):
+    return [r for r in caplog.records if r.getMessage() == "Matching summary"]
+
+
+def test_extras_are_not_built_below_the_level(caplog):
+    logger = logging.getLogger(LOGGER)
+    built = []
+
+    def payload():
+        built.append(1)
+        return {"processes": ["milling"]}
+
+    with caplog.at_level(logging.INFO, logger=LOGGER):
+        with match_log_scope(logger):
+            hot_log(logger, "detail %s", "x", extra=payload)
+        with match_log_scope(logger, level="INFO"):
+            hot_log(logger, "detail %s", "y", extra=payload)
+        with match_log_scope(logger, level="INFO", sample_rate=0.0):
+            hot_log(logger, "detail %s", "z", extra=payload)
+
+    assert built == [1]
+    details = [r for r in caplog.records if r.getMessage().startswith("detail")]
+    assert [r.getMessage() for r in details] == ["detail y"]
+    assert details[0].processes == ["milling"]
+
+
+def test_nested_scopes_log_one_summary(caplog):
+    logger = logging.getLogger(LOGGER)
+    with caplog.at_level(logging.INFO, logger=LOGGER):
+        with match_log_scope(logger, request_id="r1"):
+            with match_log_scope(logger, matching_mode="inner") as inner:
+                count_match_event("pairs_evaluated", 2)
+                with layer_timer("direct"):
+                    pass
+            assert inner.counters["pairs_evaluated"] == 2
+
+    (summary,) = _summaries(caplog)
+    assert summary.request_id == "r1"
+    assert not hasattr(summary, "matching_mode")
+    assert summary.pairs_evaluated == 2
+    assert summary.layers["direct"]["calls"] == 1
+
+
+@pytest.mark.asyncio
+async def test_match_logs_a_summary_not_per_facility_records(monkeypatch, caplog):
+    service = _service(monkeypatch)
+
+    with caplog.at_level(logging.INFO, logger=LOGGER):
+        solutions = await service.find_matches_with_manifest(_manifest(), _pool())
+
+    assert len(solutions) == 4
+    (summary,) = _summaries(caplog)
+    assert summary.total_facilities == 4
+    assert summary.facilities_evaluated == summary.facilities_matched == 4
+    assert {"extraction", "requirement_check", "supply_tree", "direct"} <= set(
+        summary.layers
+    )
+    # Per-facility and per-pair detail stays at DEBUG.
+    assert not any("Found matching facility" in r.getMessage() for r in caplog.records)
+
+
+@pytest.mark.asyncio
+async def test_request_level_override_emits_detail(monkeypatch, caplog):
+    service = _service(monkeypatch)
+    logger = logging.getLogger(LOGGER)
+
+    with caplog.at_level(logging.INFO, logger=LOGGER):
+        with match_log_scope(logger, level="INFO", request_id="trace"):
+            await service.find_matches_with_manifest(_manifest(), _pool())
+
+    found = [r for r in caplog.records if "Found matching facility" in r.getMessage()]
+    assert len(found) == 4
+    (summary,) = _summaries(caplog)
+    assert summary.request_id == "trace" and summary.facilities_matched == 4
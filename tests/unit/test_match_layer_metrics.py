@@ -0,0 +1,119 @@
+"""Per-layer cascade statistics reach the match summary and ``/metrics``.
+
+Inside a match scope every cascade layer call is recorded with its latency
+and outcome (direct, heuristic, NLP match, NLP similarity, veto, partial
+similarity). When the request's scope closes, its statistics are folded into
+the global ``MetricsTracker`` and exported as Prometheus histograms.
+"""
+
+from __future__ import annotations
+
+import logging
+
+import pytest
+
+from src.core.errors import metrics
+from src.core.services.matching import (
+    evaluate_layers,
+    evaluate_layers_supply_tree,
+    match_log_scope,
+)
+
+LOGGER = logging.getLogger("src.core.services.matching_service")
+
+
+def _returning(value):
+    async def call():
+        return value
+
+    return call
+
+
+@pytest.fixture
+def tracker(monkeypatch):
+    monkeypatch.setattr(metrics, "_metrics_tracker", None)
+    monkeypatch.setattr(metrics, "_matching_layer_metrics", None)
+    return metrics.get_metrics_tracker()
+
+
+@pytest.mark.asyncio
+async def test_cascade_records_each_layer_with_its_outcome(tracker):
+    with match_log_scope(LOGGER) as scope:
+        # Fuzzy direct hit vetoed, heuristic hit confirmed.
+        evaluation = await evaluate_layers(
+            direct_eval=_returning((True, "fuzzy")),
+            heuristic_eval=_returning((True, "rule-1")),
+            nlp_match=_returning(False),
+            nlp_similarity=_returning(0.1),
+            mode="veto",
+            veto_threshold=0.05,
+        )
+        assert evaluation.layer == "direct"
+        # No direct hit, heuristic miss, NLP hit.
+        await evaluate_layers(
+            direct_eval=_returning((False, "none")),
+            heuristic_eval=_returning((False, None)),
+            nlp_match=_returning(True),
+            nlp_similarity=_returning(None),
+        )
+        # Supply-tree scoring falls through to partial similarity.
+        await evaluate_layers_supply_tree(
+            direct_eval=_returning((False, "none")),
+            heuristic_eval=_returning((False, None)),
+            nlp_match=_returning(False),
+            nlp_similarity=_returning(None),
+            partial_similarity=lambda: 0.5,
+            require_direct_match=False,
+        )
+
+    layers = scope.summary()["layers"]
+    assert layers["direct"]["calls"] == 3 and layers["direct"]["hits"] == 1
+    assert layers["heuristic"]["calls"] == 2 and layers["heuristic"]["hits"] == 0
+    assert layers["nlp_match"]["calls"] == 2 and layers["nlp_match"]["hit_rate"] == 0.5
+    assert layers["nlp_similarity"]["calls"] == 1
+    assert layers["nlp_similarity"]["hit_rate"] is None
+    assert layers["veto"]["calls"] == 1 and layers["veto"]["hits"] == 0
+    assert layers["partial_similarity"]["hits"] == 1
+
+    exported = tracker.get_summary()["matching_summary"]
+    assert exported["requests"] == 1
+    assert exported["layers"]["direct"]["calls"] == 3
+    assert exported["layers"]["direct"]["latency_buckets"]["+Inf"] == 3
+
+
+@pytest.mark.asyncio
+async def test_vetoes_and_histograms_are_exported_to_prometheus(tracker):
+    from src.core.api.routes.utility import _format_prometheus_metrics
+
+    for _ in range(2):
+        with match_log_scope(LOGGER):
+            await evaluate_layers(
+                direct_eval=_returning((True, "fuzzy")),
+                heuristic_eval=_returning((False, None)),
+                nlp_match=_returning(False),
+                nlp_similarity=_returning(0.01),
+                mode="veto",
+                veto_threshold=0.2,
+            )
+
+    summary = tracker.get_summary()["matching_summary"]
+    assert summary["requests"] == 2
+    assert summary["layers"]["veto"]["hits"] == 2
+
+    text = _format_prometheus_metrics(tracker)
+    assert 'matching_layer_calls_total{layer="direct"} 2' in text
+    assert 'matching_layer_hits_total{layer="veto"} 2' in text
+    assert 'matching_layer_duration_seconds_bucket{layer="veto",le="+Inf"} 2' in text
+    assert 'matching_layer_duration_seconds_count{layer="nlp_match"} 2' in text
+
+
+def test_layer_latency_buckets_are_cumulative():
+    stats = metrics.LayerLatency()
+    for seconds in (0.0001, 0.002, 0.002, 5.0):
+        stats.observe(seconds, hit=seconds < 1)
+
+    buckets = dict(stats.cumulative_buckets())
+    assert buckets["0.0005"] == 1
+    assert buckets["0.005"] == 3
+    assert buckets["1.0"] == 3 and buckets["+Inf"] == 4
+    assert stats.hit_rate == 0.75
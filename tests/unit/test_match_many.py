@@ -0,0 +1,189 @@
+"""Batch matching must give every manifest what the single-manifest walk gives it.
+
+``match_many`` shares the work that repeats across manifests — capability
+extraction, and the requirement × capability cascade — but each manifest's
+solutions must be exactly those of ``find_matches_with_manifest`` against the
+same pool, including duplicate-id handling and the ``max_solutions`` cut-off.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src.core.models.supply_trees import SupplyTree
+from src.core.services.matching import LayerEvaluation
+
+
+def _facility(name: str, processes):
+    facility = SimpleNamespace(id=uuid4(), name=name, processes=list(processes))
+    facility.to_dict = lambda: {"id": str(facility.id), "processes": processes}
+    return facility
+
+
+def _manifest(*processes):
+    return SimpleNamespace(
+        id=uuid4(), title="-".join(processes), domain=None, processes=processes
+    )
+
+
+def _service(monkeypatch):
+    """A MatchingService whose cascade is exact-term equality, with call counts."""
+    import src.core.services.matching_service as ms
+
+    service = ms.MatchingService()
+    monkeypatch.setattr(service, "ensure_initialized", AsyncMock())
+    monkeypatch.setattr(
+        service, "_detect_domain_for_matching", AsyncMock(return_value="manufacturing")
+    )
+    calls = {"extract": 0, "pairs": 0}
+
+    def extract_capabilities(data):
+        calls["extract"] += 1
+        return SimpleNamespace(
+            data=SimpleNamespace(
+                content={
+                    "capabilities": [{"process_name": p} for p in data["processes"]]
+                }
+            )
+        )
+
+    extractor = SimpleNamespace(
+        extract_requirements=lambda data: SimpleNamespace(
+            data=SimpleNamespace(
+                content={
+                    "process_requirements": [
+                        {"process_name": p} for p in data["processes"]
+                    ]
+                }
+            )
+        ),
+        extract_capabilities=extract_capabilities,
+    )
+    monkeypatch.setattr(
+        ms.DomainRegistry,
+        "get_domain_services",
+        lambda _domain: SimpleNamespace(extractor=extractor),
+    )
+
+    async def evaluate_pair(req, cap, domain):
+        calls["pairs"] += 1
+        return LayerEvaluation(matched=req == cap, layer="direct", confidence=1.0)
+
+    async def generate_tree(manifest, facility, domain):
+        return SupplyTree(
+            facility_name=facility.name,
+            okh_reference=manifest.title,
+            okw_reference=str(facility.id),
+            confidence_score=0.9,
+        )
+
+    monkeypatch.setattr(service, "_evaluate_pair", evaluate_pair)
+    monkeypatch.setattr(service, "_generate_supply_tree", generate_tree)
+    return service, calls
+
+
+def _to_dict(manifest):
+    manifest.to_dict = lambda: {"processes": list(manifest.processes)}
+    return manifest
+
+
+def _pool():
+    pool = [
+        _facility(f"f{i}", processes)
+        for i, processes in enumerate(
+            [
+                ["milling"],
+                ["welding"],
+                ["milling", "welding"],
+                ["laser cutting", "welding"],
+                ["knitting"],
+                ["milling"],
+            ]
+        )
+    ]
+    return pool + [pool[2]]  # duplicate id, evaluated once
+
+
+def _manifests():
+    return [
+        _to_dict(m)
+        for m in [
+            _manifest("milling"),
+            _manifest("milling", "milling", "welding"),
+            _manifest("welding", "laser cutting", "knitting"),
+            _manifest("sewing"),
+            _manifest(),
+        ]
+    ]
+
+
+def _names(solutions):
+    return sorted(s.all_trees[0].facility_name for s in solutions)
+
+
+def _summary(solutions):
+    return sorted(
+        (s.all_trees[0].facility_name, sorted(s.metrics.items())) for s in solutions
+    )
+
+
+async def _collect(service, manifests, pool, **kwargs):
+    results = [r async for r in service.match_many(manifests, pool, **kwargs)]
+    return sorted(results, key=lambda r: r.index)
+
+
+@pytest.mark.asyncio
+async def test_results_equal_the_single_manifest_walk(monkeypatch):
+    service, _ = _service(monkeypatch)
+    manifests, pool = _manifests(), _pool()
+
+    batch = await _collect(service, manifests, pool)
+
+    assert [r.index for r in batch] == list(range(len(manifests)))
+    for result, manifest in zip(batch, manifests):
+        single = await service.find_matches_with_manifest(manifest, pool)
+        assert result.error is None
+        assert _summary(result.solutions) == _summary(single), manifest.title
+    assert _names(batch[1].solutions) == ["f0", "f2", "f5"]
+
+
+@pytest.mark.asyncio
+async def test_work_scales_with_vocabulary_not_manifests(monkeypatch):
+    service, calls = _service(monkeypatch)
+    pool = _pool()
+
+    await _collect(service, _manifests() * 20, pool)
+
+    # Six distinct facilities, five capability sets, five requirement terms.
+    assert calls["extract"] == 6
+    assert calls["pairs"] <= 5 * 7
+
+
+@pytest.mark.asyncio
+async def test_max_solutions_applies_per_manifest(monkeypatch):
+    service, _ = _service(monkeypatch)
+    manifests, pool = _manifests(), _pool()
+
+    batch = await _collect(service, manifests, pool, max_solutions=1)
+
+    for result, manifest in zip(batch, manifests):
+        single = await service.find_matches_with_manifest(
+            manifest, pool, max_solutions=1
+        )
+        assert _names(result.solutions) == _names(single)
+
+
+@pytest.mark.asyncio
+async def test_a_failing_manifest_does_not_stop_the_batch(monkeypatch):
+    service, _ = _service(monkeypatch)
+    broken = _manifest("milling")
+    broken.to_dict = lambda: (_ for _ in ()).throw(ValueError("bad manifest"))
+
+    batch = await _collect(service, [broken, *_manifests()[:2]], _pool())
+
+    assert batch[0].error == "ValueError: bad manifest" and not batch[0].solutions
+    assert _names(batch[1].solutions) == ["f0", "f2", "f5"]
@@ -0,0 +1,233 @@
+"""Pairwise cascade verdicts are memoized, and the memo never outlives the rules.
+
+The same normalized (requirement, capability) pair is evaluated for every
+facility that lists it, at several call sites per request. ``MatchingService``
+keeps the cascade verdict per pair so the direct / heuristic / NLP layers run
+once per pair — until the capability rules change. A verdict reached while an
+NLP call timed out, or a layer fell back after an error, is not trustworthy
+enough to keep.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from src.core.cache.memo import LRUMemo
+from src.core.matching.capability_rules import (
+    CapabilityRule,
+    CapabilityRuleSet,
+    RuleType,
+)
+from src.core.services.cache_service import get_cache_service
+from src.core.services.matching import PAIR_VERDICT_MEMO, invalidate_pair_verdicts
+
+
+def _service(monkeypatch):
+    """A MatchingService whose layers count calls; direct matches on equality."""
+    import src.core.services.matching_service as ms
+
+    service = ms.MatchingService()
+    calls = {"direct": 0, "heuristic": 0}
+
+    async def direct(req, cap, domain="manufacturing"):
+        calls["direct"] += 1
+        return (req == cap, "strong" if req == cap else "none")
+
+    async def heuristic(req, cap, domain="manufacturing"):
+        calls["heuristic"] += 1
+        return (False, None)
+
+    async def nlp_match(req, cap, domain="manufacturing"):
+        return False
+
+    async def nlp_sim(req, cap, domain="manufacturing"):
+        return None
+
+    monkeypatch.setattr(service, "_direct_match_evaluate", direct)
+    monkeypatch.setattr(service, "_heuristic_match_with_rule", heuristic)
+    monkeypatch.setattr(service, "_nlp_match", nlp_match)
+    monkeypatch.setattr(service, "_nlp_semantic_similarity_for_pair", nlp_sim)
+    return service, calls
+
+
+@pytest.mark.asyncio
+async def test_repeated_pair_runs_the_cascade_once(monkeypatch):
+    service, calls = _service(monkeypatch)
+
+    first = await service._evaluate_pair("milling", "milling", "manufacturing")
+    second = await service._evaluate_pair("milling", "milling", "manufacturing")
+    await service._evaluate_pair("milling", "turning", "manufacturing")
+
+    assert first.matched and second is first
+    assert calls["direct"] == 2
+
+
+@pytest.mark.asyncio
+async def test_domain_is_part_of_the_key(monkeypatch):
+    service, calls = _service(monkeypatch)
+
+    await service._evaluate_pair("milling", "milling", "manufacturing")
+    await service._evaluate_pair("milling", "milling", "cooking")
+
+    assert calls["direct"] == 2
+
+
+@pytest.mark.asyncio
+async def test_supply_tree_scores_are_memoized_separately(monkeypatch):
+    service, calls = _service(monkeypatch)
+
+    await service._evaluate_pair("milling", "milling", "manufacturing")
+    score = await service._evaluate_pair_supply_tree(
+        "milling", "milling", "manufacturing"
+    )
+    again = await service._evaluate_pair_supply_tree(
+        "milling", "milling", "manufacturing"
+    )
+
+    assert score == again == (1.0, "direct")
+    assert calls["direct"] == 2
+
+
+@pytest.mark.asyncio
+async def test_rule_changes_invalidate_verdicts(monkeypatch):
+    service, calls = _service(monkeypatch)
+    await service._evaluate_pair("a", "b", "manufacturing")
+
+    def rule(rule_id):
+        return CapabilityRule(
+            id=rule_id,
+            type=RuleType.CAPABILITY_MATCH,
+            capability="a",
+            satisfies_requirements=["b"],
+            domain="manufacturing",
+        )
+
+    rule_set = CapabilityRuleSet(domain="manufacturing", rules={"r1": rule("r1")})
+    rule_set.add_rule(rule("r2"))
+    await service._evaluate_pair("a", "b", "manufacturing")
+
+    assert calls["heuristic"] == 2
+
+
+@pytest.mark.asyncio
+async def test_explicit_invalidation_empties_the_memo(monkeypatch):
+    service, calls = _service(monkeypatch)
+    await service._evaluate_pair("milling", "milling", "manufacturing")
+
+    invalidate_pair_verdicts()
+
+    assert len(service._pair_verdicts) == 0
+    await service._evaluate_pair("milling", "milling", "manufacturing")
+    assert calls["direct"] == 2
+
+
+@pytest.mark.asyncio
+async def test_verdict_reached_under_nlp_timeout_is_not_kept(monkeypatch):
+    service, calls = _service(monkeypatch)
+
+    async def timing_out(req, cap, domain="manufacturing"):
+        service._nlp_timeouts += 1
+        return False
+
+    monkeypatch.setattr(service, "_nlp_match", timing_out)
+
+    await service._evaluate_pair("a", "b", "manufacturing")
+    await service._evaluate_pair("a", "b", "manufacturing")
+
+    assert calls["direct"] == 2
+    assert len(service._pair_verdicts) == 0
+
+
+@pytest.mark.asyncio
+async def test_verdict_reached_after_nlp_fallback_is_not_kept(monkeypatch):
+    import src.core.services.matching_service as ms
+
+    service = ms.MatchingService()
+
+    class BrokenIndex:
+        def similarities(self, text, candidates):
+            raise RuntimeError("vector table unavailable")
+
+    matcher = service.nlp_matchers["manufacturing"]
+    monkeypatch.setattr(matcher, "_ensure_embedding_index", lambda: BrokenIndex())
+
+    await service._evaluate_pair("milling", "laser cutting", "manufacturing")
+
+    assert matcher.failures > 0
+    assert len(service._pair_verdicts) == 0
+
+    monkeypatch.setattr(matcher, "_ensure_embedding_index", lambda: None)
+    await service._evaluate_pair("milling", "laser cutting", "manufacturing")
+    assert len(service._pair_verdicts) == 1
+
+
+@pytest.mark.asyncio
+async def test_verdict_reached_after_layer_error_is_not_kept(monkeypatch):
+    import src.core.services.matching_service as ms
+
+    service = ms.MatchingService()
+
+    class BrokenCapabilityMatcher:
+        async def match_requirements_to_capabilities(self, **kwargs):
+            raise RuntimeError("rules store unavailable")
+
+    service.capability_matcher = BrokenCapabilityMatcher()
+
+    await service._evaluate_pair("milling", "laser cutting", "manufacturing")
+
+    assert service._layer_failures == 1
+    assert len(service._pair_verdicts) == 0
+
+
+@pytest.mark.asyncio
+async def test_nlp_timeout_is_counted(monkeypatch):
+    import src.core.services.matching_service as ms
+
+    service = ms.MatchingService()
+
+    class SlowMatcher:
+        async def calculate_semantic_similarity(self, a, b):
+            await asyncio.sleep(1)
+
+    service.nlp_matchers = {"manufacturing": SlowMatcher()}
+    result = await service._nlp_semantic_similarity_for_pair(
+        "milling", "turning", "manufacturing"
+    )
+
+    assert result is None
+    assert service._nlp_timeouts == 1
+
+
+def test_lru_memo_evicts_least_recently_used():
+    memo = LRUMemo("test_memo", 2)
+    memo.set("a", 1)
+    memo.set("b", 2)
+    assert memo.get("a") == 1
+    memo.set("c", 3)
+
+    assert memo.get("b") is None
+    assert memo.get("a") == 1 and memo.get("c") == 3
+    assert memo.stats()["evictions"] == 1
+
+
+def test_zero_size_disables_the_memo():
+    memo = LRUMemo("test_memo", 0)
+    memo.set("a", 1)
+
+    assert not memo.enabled
+    assert memo.get("a") is None
+    assert len(memo) == 0
+
+
+@pytest.mark.asyncio
+async def test_stats_are_reported_by_cache_service(monkeypatch):
+    service, _ = _service(monkeypatch)
+    await service._evaluate_pair("milling", "milling", "manufacturing")
+    await service._evaluate_pair("milling", "milling", "manufacturing")
+
+    stats = get_cache_service().get_stats()["memos"][PAIR_VERDICT_MEMO]
+
+    assert stats["hits"] >= 1 and stats["misses"] >= 1
+    assert 0 < stats["hit_rate"] <= 1
@@ -0,0 +1,225 @@
+"""Repeated matches re-evaluate only facilities that changed.
+
+``find_matches_with_manifest`` memoizes each facility's verdict (solution or
+no match) under the manifest content hash, the facility revision (catalogue
+version for unedited catalogue records, content hash otherwise), the domain,
+the extractor, the rules and taxonomy versions and the matching thresholds. A
+repeat against an unchanged pool does no matching work; after an edit only the
+edited facility is evaluated again and the solution set is patched.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src.core.matching import capability_rules
+from src.core.models.supply_trees import SupplyTree
+
+
+def _facility(name, processes, facility_id=None):
+    facility = SimpleNamespace(
+        id=facility_id or uuid4(), name=name, processes=list(processes)
+    )
+    facility.to_dict = lambda: {"id": str(facility.id), "processes": facility.processes}
+    return facility
+
+
+def _manifest(*processes):
+    manifest = SimpleNamespace(id=uuid4(), title="-".join(processes), domain=None)
+    manifest.processes = list(processes)
+    manifest.to_dict = lambda: {"processes": list(manifest.processes)}
+    return manifest
+
+
+def _service(monkeypatch):
+    import src.core.services.matching_service as ms
+
+    service = ms.MatchingService()
+    monkeypatch.setattr(service, "ensure_initialized", AsyncMock())
+    monkeypatch.setattr(
+        service, "_detect_domain_for_matching", AsyncMock(return_value="manufacturing")
+    )
+    extractor = SimpleNamespace(
+        extract_requirements=lambda data: SimpleNamespace(
+            data=SimpleNamespace(
+                content={
+                    "process_requirements": [
+                        {"process_name": p} for p in data["processes"]
+                    ]
+                }
+            )
+        ),
+    )
+    monkeypatch.setattr(
+        ms.DomainRegistry,
+        "get_domain_services",
+        lambda _domain: SimpleNamespace(extractor=extractor),
+    )
+    evaluated = []
+
+    def extract(_extractor, facility, _domain):
+        evaluated.append(facility.name)
+        return [{"process_name": p} for p in facility.processes]
+
+    async def can_satisfy(requirements, capabilities, _domain):
+        offered = {c["process_name"] for c in capabilities}
+        return all(r["process_name"] in offered for r in requirements)
+
+    async def generate_tree(manifest, facility, _domain):
+        return SupplyTree(
+            facility_name=facility.name,
+            okh_reference=manifest.title,
+            okw_reference=str(facility.id),
+            confidence_score=0.9,
+        )
+
+    monkeypatch.setattr(service, "_extract_facility_capabilities", extract)
+    monkeypatch.setattr(service, "_can_satisfy_requirements", can_satisfy)
+    monkeypatch.setattr(service, "_generate_supply_tree", generate_tree)
+    return service, evaluated
+
+
+def _names(solutions):
+    return sorted(s.all_trees[0].facility_name for s in solutions)
+
+
+@pytest.mark.asyncio
+async def test_repeat_match_reuses_every_verdict(monkeypatch):
+    service, evaluated = _service(monkeypatch)
+    manifest = _manifest("milling")
+    pool = [_facility(f"f{i}", ["milling"] if i % 2 else ["welding"]) for i in range(6)]
+
+    first = await service.find_matches_with_manifest(manifest, pool)
+    evaluated.clear()
+    second = await service.find_matches_with_manifest(manifest, pool)
+
+    assert evaluated == []
+    assert _names(second) == _names(first) == ["f1", "f3", "f5"]
+    # Callers get their own copies of the cached solutions, with their own ids.
+    trees = {id(s.all_trees[0]) for s in first} | {id(s.all_trees[0]) for s in second}
+    assert len(trees) == 6
+    tree_ids = {s.all_trees[0].id for s in first} | {s.all_trees[0].id for s in second}
+    assert len(tree_ids) == 6
+    third = await service.find_matches_with_manifest(manifest, pool)
+    assert not tree_ids & {s.all_trees[0].id for s in third}
+
+
+@pytest.mark.asyncio
+async def test_in_place_edits_are_not_served_from_the_memo(monkeypatch):
+    service, evaluated = _service(monkeypatch)
+    manifest = _manifest("milling")
+    facility = _facility("f0", ["welding"])
+    assert not await service.find_matches_with_manifest(manifest, [facility])
+
+    facility.processes.append("milling")
+    evaluated.clear()
+    assert _names(await service.find_matches_with_manifest(manifest, [facility])) == [
+        "f0"
+    ]
+    assert evaluated == ["f0"]
+
+    manifest.processes.append("drilling")
+    evaluated.clear()
+    assert not await service.find_matches_with_manifest(manifest, [facility])
+    assert evaluated == ["f0"]
+
+
+@pytest.mark.asyncio
+async def test_catalogue_facilities_key_on_the_catalogue_version(monkeypatch):
+    service, evaluated = _service(monkeypatch)
+    version = [1]
+    catalogue = _facility("f0", ["milling"])
+    service.okw_service = SimpleNamespace(
+        catalog_revision=lambda f: version[0] if f is catalogue else None
+    )
+    calls = []
+    to_dict = catalogue.to_dict
+    catalogue.to_dict = lambda: calls.append(1) or to_dict()
+    manifest = _manifest("milling")
+
+    for _ in range(3):
+        await service.find_matches_with_manifest(manifest, [catalogue])
+    assert evaluated == ["f0"] and calls == []
+
+    version[0] = 2
+    evaluated.clear()
+    await service.find_matches_with_manifest(manifest, [catalogue])
+    assert evaluated == ["f0"]
+
+
+@pytest.mark.asyncio
+async def test_only_edited_facilities_are_re_evaluated(monkeypatch):
+    service, evaluated = _service(monkeypatch)
+    manifest = _manifest("milling")
+    pool = [_facility(f"f{i}", ["welding"]) for i in range(4)]
+    assert not await service.find_matches_with_manifest(manifest, pool)
+
+    # Edits arrive as new objects (a re-parsed catalogue entry).
+    pool[2] = _facility("f2", ["milling"], pool[2].id)
+    evaluated.clear()
+    patched = await service.find_matches_with_manifest(manifest, pool)
+
+    assert evaluated == ["f2"]
+    assert _names(patched) == ["f2"]
+
+    # A different manifest revision is a different key.
+    manifest = _manifest("milling", "welding")
+    evaluated.clear()
+    await service.find_matches_with_manifest(manifest, pool)
+    assert len(evaluated) == 4
+
+
+@pytest.mark.asyncio
+async def test_rules_and_threshold_changes_miss(monkeypatch):
+    import src.core.services.matching_service as ms
+
+    service, evaluated = _service(monkeypatch)
+    manifest = _manifest("milling")
+    pool = [_facility("f0", ["milling"]), _facility("f1", ["welding"])]
+    await service.find_matches_with_manifest(manifest, pool)
+
+    capability_rules._bump_rules_version()
+    evaluated.clear()
+    await service.find_matches_with_manifest(manifest, pool)
+    assert evaluated == ["f0", "f1"]
+
+    monkeypatch.setattr(ms, "PARTIAL_MATCH_THRESHOLD", 0.9)
+    evaluated.clear()
+    await service.find_matches_with_manifest(manifest, pool)
+    assert evaluated == ["f0", "f1"]
+
+
+def test_restored_nested_solutions_get_consistent_fresh_ids():
+    from src.core.models.supply_trees import SupplyTreeSolution
+    from src.core.services.matching import MatchVerdict
+
+    parent = SupplyTree(facility_name="p", okh_reference="m", confidence_score=0.9)
+    child = SupplyTree(
+        facility_name="c",
+        okh_reference="m",
+        confidence_score=0.8,
+        parent_tree_id=parent.id,
+    )
+    parent.child_tree_ids = [child.id]
+    solution = SupplyTreeSolution.from_nested_trees(
+        all_trees=[parent, child],
+        root_trees=[parent],
+        component_mapping={"part": [child]},
+    )
+    solution.dependency_graph = {parent.id: [child.id]}
+    solution.production_sequence = [[child.id], [parent.id]]
+
+    restored = MatchVerdict.of(solution).restore()
+
+    new_parent, new_child = restored.all_trees
+    assert {new_parent.id, new_child.id}.isdisjoint({parent.id, child.id})
+    assert restored.root_trees[0] is new_parent
+    assert restored.component_mapping["part"][0] is new_child
+    assert new_child.parent_tree_id == new_parent.id
+    assert new_parent.child_tree_ids == [new_child.id]
+    assert restored.dependency_graph == {new_parent.id: [new_child.id]}
+    assert restored.production_sequence == [[new_child.id], [new_parent.id]]
@@ -0,0 +1,145 @@
+"""Top-k matching returns the best facilities, not the first ones found.
+
+``find_top_matches_with_manifest`` bounds each facility's supply-tree score
+from the direct layer, evaluates facilities best bound first against a
+bounded heap, and stops once no bound can beat the k-th score. The result must
+equal scoring every facility and keeping the top k, and facilities pruned by
+the bound must never reach the NLP layer or supply-tree generation.
+"""
+
+from __future__ import annotations
+
+import random
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+VOCABULARY = ["milling", "welding", "turning", "sewing"]
+# Normalized pairs the stubbed heuristic layer accepts (scored 0.8).
+HEURISTIC = {("welding", "cnc_turning"), ("cnc_milling", "cnc_turning")}
+
+
+def _facility(name, processes):
+    return SimpleNamespace(
+        id=uuid4(), name=name, manufacturing_processes=list(processes)
+    )
+
+
+def _manifest(*processes):
+    return SimpleNamespace(
+        id=uuid4(), title="design", manufacturing_processes=list(processes)
+    )
+
+
+def _service(monkeypatch):
+    import src.core.services.matching_service as ms
+
+    service = ms.MatchingService()
+    monkeypatch.setattr(service, "ensure_initialized", AsyncMock())
+    monkeypatch.setattr(
+        service, "_detect_domain_for_matching", AsyncMock(return_value="manufacturing")
+    )
+    monkeypatch.setattr(
+        ms.DomainRegistry,
+        "get_domain_services",
+        lambda _domain: SimpleNamespace(extractor=None),
+    )
+    calls = {"nlp": set(), "trees": 0}
+
+    async def direct(req, cap, _domain="manufacturing"):
+        return (req == cap, "strong" if req == cap else "none")
+
+    async def heuristic(req, cap, _domain="manufacturing"):
+        return ((req, cap) in HEURISTIC, None)
+
+    async def nlp(req, cap, _domain="manufacturing"):
+        calls["nlp"].add((req, cap))
+        return False
+
+    generate = service._generate_supply_tree
+
+    async def generate_tree(manifest, facility, domain="manufacturing"):
+        calls["trees"] += 1
+        return await generate(manifest, facility, domain)
+
+    monkeypatch.setattr(service, "_direct_match_evaluate", direct)
+    monkeypatch.setattr(service, "_heuristic_match_with_rule", heuristic)
+    monkeypatch.setattr(service, "_nlp_match", nlp)
+    monkeypatch.setattr(service, "_calculate_process_similarity", lambda *_: 0.0)
+    monkeypatch.setattr(service, "_extract_manifest_requirements", lambda *_: [])
+    monkeypatch.setattr(service, "_extract_facility_capabilities", lambda *_: [])
+    monkeypatch.setattr(
+        service, "_can_satisfy_requirements", AsyncMock(return_value=True)
+    )
+    monkeypatch.setattr(service, "_generate_supply_tree", generate_tree)
+    return service, calls
+
+
+def _names(solutions):
+    return [s.all_trees[0].facility_name for s in solutions]
+
+
+@pytest.mark.asyncio
+async def test_top_k_equals_scoring_every_facility(monkeypatch):
+    service, _ = _service(monkeypatch)
+    rng = random.Random(5)
+    pool = [
+        _facility(f"f{i}", rng.sample(VOCABULARY, rng.randint(1, 3))) for i in range(40)
+    ]
+    manifest = _manifest("milling", "welding", "turning")
+
+    everything = await service.find_matches_with_manifest(manifest, pool)
+    order = {f.name: i for i, f in enumerate(pool)}
+    ranked = sorted(
+        everything,
+        key=lambda s: (-s.score, order[s.all_trees[0].facility_name]),
+    )
+
+    for k in (1, 3, 7, 40):
+        top = await service.find_top_matches_with_manifest(
+            manifest, pool, k, max_workers=3
+        )
+        assert _names(top) == _names(ranked[:k]), k
+
+
+@pytest.mark.asyncio
+async def test_facilities_that_cannot_make_the_list_are_never_scored(monkeypatch):
+    service, calls = _service(monkeypatch)
+    # Only the "full" facilities can reach 1.0; the rest are capped at 0.8.
+    pool = [_facility(f"partial{i}", ["turning"]) for i in range(20)]
+    pool[5:5] = [_facility(f"full{i}", ["milling", "welding"]) for i in range(3)]
+    manifest = _manifest("milling", "welding")
+
+    top = await service.find_top_matches_with_manifest(manifest, pool, 3)
+
+    assert _names(top) == ["full0", "full1", "full2"]
+    assert [s.score for s in top] == [1.0, 1.0, 1.0]
+    assert calls["trees"] == 3
+    # Only pairs within the evaluated facilities reached the NLP layer.
+    assert calls["nlp"] and not any("turning" in pair for pair in calls["nlp"])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "options",
+    [{"allow_facility_combinations": True, "max_results": 5}, {"max_results": None}],
+)
+async def test_route_rejects_top_k_it_cannot_honour(options):
+    from fastapi import HTTPException
+
+    from src.core.api.models.match.request import MatchRequest
+    from src.core.api.routes import match as match_mod
+
+    request = MatchRequest.model_construct(
+        okh_manifest={"title": "dummy"}, top_k=True, **options
+    )
+    http_request = SimpleNamespace(state=SimpleNamespace(request_id="unit-test"))
+
+    with pytest.raises(HTTPException) as raised:
+        await match_mod.match_requirements_to_capabilities(
+            request, http_request, storage_service=None
+        )
+    assert raised.value.status_code == 400
+    assert "top_k" in raised.value.detail
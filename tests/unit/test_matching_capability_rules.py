@@ -356,6 +356,55 @@ class TestFindRulesForCapabilityRequirement:
         results = rs.find_rules_for_capability_requirement("laser cutting", "milling")
         assert results == []
 
+    def test_lookup_normalizes_case_and_whitespace(self):
+        rs = _ruleset(rules={"r1": _rule(capability=" CNC Machining ")})
+        results = rs.find_rules_for_capability_requirement("cnc machining", " MILLING")
+        assert [r.id for r in results] == ["r1"]
+
+    def test_index_agrees_with_linear_scan(self):
+        rules = {
+            f"r{i}": _rule(
+                id=f"r{i}",
+                capability=["cnc machining", "laser", "welding"][i % 3],
+                satisfies=[["milling", "Drilling"], ["cutting"], ["milling"]][i % 3],
+            )
+            for i in range(9)
+        }
+        rs = _ruleset(rules=rules)
+        for cap in ["cnc machining", "laser", "welding", "x"]:
+            for req in ["milling", "drilling", "cutting", "", "y"]:
+                expected = [
+                    r
+                    for r in rs.rules.values()
+                    if r.requirement_can_be_satisfied_by(req, cap)
+                ]
+                assert rs.find_rules_for_capability_requirement(cap, req) == expected
+
+    def test_index_follows_add_replace_and_remove(self):
+        rs = _ruleset()
+        rs.add_rule(_rule(id="r2", capability="laser", satisfies=["cutting"]))
+        assert rs.find_rules_for_capability_requirement("laser", "cutting")
+
+        rs.add_rule(_rule(id="r1", capability="cnc machining", satisfies=["turning"]))
+        assert (
+            rs.find_rules_for_capability_requirement("cnc machining", "milling") == []
+        )
+        assert rs.find_rules_for_capability_requirement("cnc machining", "turning")
+
+        rs.remove_rule("r2")
+        assert rs.find_rules_for_capability_requirement("laser", "cutting") == []
+
+    def test_replaced_rule_keeps_its_position(self):
+        rs = _ruleset(
+            rules={
+                "a": _rule(id="a", satisfies=["milling"]),
+                "b": _rule(id="b", satisfies=["milling"]),
+            }
+        )
+        rs.add_rule(_rule(id="a", satisfies=["milling", "boring"]))
+        results = rs.find_rules_for_capability_requirement("cnc machining", "milling")
+        assert [r.id for r in results] == ["a", "b"]
+
 
 # ---------------------------------------------------------------------------
 # CapabilityRuleSet — to_dict / from_dict
@@ -0,0 +1,163 @@
+"""Nested matching scores each distinct component profile once.
+
+``match_with_nested_components`` groups exploded BOM lines by source manifest
+and normalized process list, scores every group against the facility pool
+once, and stamps each component onto its own copies of the resulting trees.
+The per-component results must equal what matching each component alone gives.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src.core.models.bom import Component
+from src.core.models.component_match import ComponentMatch
+from src.core.models.okh import OKHManifest
+from src.core.models.supply_trees import SupplyTree
+
+
+def _root_manifest():
+    return OKHManifest.from_dict(
+        {
+            "id": str(uuid4()),
+            "title": "Printer",
+            "version": "1.0.0",
+            "license": {"hardware": "MIT"},
+            "licensor": {"name": "Someone"},
+            "documentation_language": "en",
+            "function": "Prints",
+        }
+    )
+
+
+def _bom():
+    assembly = Component(
+        id="assembly",
+        name="Assembly",
+        quantity=1,
+        unit="pcs",
+        requirements={"process": "assembly"},
+    )
+    printed = [
+        Component(
+            id=f"printed-{i}",
+            name=f"Bracket {i}",
+            quantity=2,
+            unit="pcs",
+            # TSDC code and taxonomy ID normalize to the same profile.
+            metadata={"tsdc": ["3DP"] if i % 2 else ["3d_printing"]},
+        )
+        for i in range(30)
+    ]
+    boards = [
+        Component(
+            id=f"board-{i}",
+            name=f"Board {i}",
+            quantity=1,
+            unit="pcs",
+            requirements={"process": ["PCB"]},
+        )
+        for i in range(5)
+    ]
+    matches = [ComponentMatch(component=assembly, depth=0, path=["Assembly"])]
+    matches += [
+        ComponentMatch(
+            component=c,
+            depth=1,
+            parent_component_id="assembly",
+            path=["Assembly", c.name],
+        )
+        for c in printed + boards
+    ]
+    return [assembly, *printed, *boards], matches
+
+
+def _service(monkeypatch):
+    import src.core.services.matching_service as ms
+
+    components, matches = _bom()
+
+    class FakeResolver:
+        def __init__(self, _service):
+            pass
+
+        async def explode_manifest(
+            self, manifest, service, max_depth=None, manifest_path=None
+        ):
+            return SimpleNamespace(components=components), list(matches)
+
+    monkeypatch.setattr(ms, "BOMResolutionService", FakeResolver)
+    service = ms.MatchingService()
+    monkeypatch.setattr(service, "ensure_initialized", AsyncMock())
+    calls = []
+
+    async def generate_tree(manifest, facility, domain):
+        calls.append((tuple(manifest.manufacturing_processes), facility.name))
+        overlap = set(manifest.manufacturing_processes) & set(facility.processes)
+        return SupplyTree(
+            facility_name=facility.name,
+            okh_reference=str(manifest.id),
+            okw_reference=str(facility.id),
+            confidence_score=0.9 if overlap else 0.1,
+            capabilities_used=list(facility.processes),
+        )
+
+    monkeypatch.setattr(service, "_generate_supply_tree", generate_tree)
+    return service, calls, matches
+
+
+def _facilities():
+    return [
+        SimpleNamespace(id=uuid4(), name="Print farm", processes=["3d_printing"]),
+        SimpleNamespace(id=uuid4(), name="Fab", processes=["pcb_fabrication"]),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_each_profile_is_scored_once(monkeypatch):
+    service, calls, _ = _service(monkeypatch)
+    facilities = _facilities()
+
+    (solution,) = await service.match_with_nested_components(
+        _root_manifest(), facilities
+    )
+
+    # Assembly, printed and board profiles: 3 x 2 facilities, not 36 x 2.
+    assert len(calls) == 3 * len(facilities)
+    assert solution.metrics["component_profiles"] == 3
+    assert solution.metrics["component_count"] == 36
+    assert len(solution.all_trees) == 36 * len(facilities)
+    assert len({tree.id for tree in solution.all_trees}) == len(solution.all_trees)
+
+
+@pytest.mark.asyncio
+async def test_results_equal_per_component_matching(monkeypatch):
+    service, _, matches = _service(monkeypatch)
+    facilities = _facilities()
+    root = _root_manifest()
+
+    (solution,) = await service.match_with_nested_components(root, facilities)
+
+    def summary(trees):
+        return sorted(
+            (t.component_id, t.component_name, t.facility_name, t.confidence_score)
+            for t in trees
+        )
+
+    for match in matches:
+        alone = await service._match_component_to_facilities(
+            match.component, match, root, facilities, "manufacturing"
+        )
+        shared = solution.component_mapping[match.component.id]
+        assert summary(shared) == summary(alone), match.component.id
+
+    # Copies are independent: nothing mutable is shared between components.
+    first = solution.component_mapping["printed-0"][0]
+    second = solution.component_mapping["printed-2"][0]
+    assert first.id != second.id
+    for name in ("metadata", "capabilities_used", "depends_on", "required_by"):
+        assert getattr(first, name) is not getattr(second, name), name
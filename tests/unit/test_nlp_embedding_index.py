@@ -0,0 +1,218 @@
+"""The embedding index must score like ``Doc.similarity`` while embedding each text once.
+
+``NLPMatcher`` scores through :class:`EmbeddingIndex` instead of running
+``nlp()`` on both sides of every pair. NLP thresholds (match 0.7, veto 0.2,
+per-domain similarity thresholds) were tuned against ``Doc.similarity`` plus
+the domain boost, so the index has to reproduce those scores to float32
+precision. A blank English pipeline with hand-set vectors stands in for
+``en_core_web_md`` so this runs without the model installed.
+"""
+
+from __future__ import annotations
+
+import warnings
+
+import numpy as np
+import pytest
+
+spacy = pytest.importorskip("spacy")
+
+from src.core.matching.nlp_matcher import NLPMatcher  # noqa: E402
+from src.core.nlp.embedding_index import EmbeddingIndex  # noqa: E402
+
+WORDS = [
+    "milling",
+    "turning",
+    "cnc",
+    "machining",
+    "welding",
+    "laser",
+    "cutting",
+    "printing",
+    "assembly",
+    "drilling",
+    "computer",
+    "numerical",
+    "control",
+]
+
+TEXTS = [
+    "milling",
+    "cnc milling",
+    "laser cutting",
+    "welding assembly",
+    "computer numerical control machining",
+    "turning drilling",
+    "printing",
+    "unknownword",
+]
+
+
+@pytest.fixture(scope="module")
+def nlp():
+    pipeline = spacy.blank("en")
+    rng = np.random.default_rng(7)
+    for word in WORDS:
+        pipeline.vocab.set_vector(word, rng.normal(size=64).astype(np.float32))
+    return pipeline
+
+
+def _reference(nlp, a: str, b: str) -> float:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return nlp(a).similarity(nlp(b))
+
+
+def test_scores_match_doc_similarity(nlp):
+    index = EmbeddingIndex(nlp)
+
+    for query in TEXTS:
+        scores = index.similarities(query, TEXTS)
+        expected = [_reference(nlp, query, t) for t in TEXTS]
+        assert scores.tolist() == pytest.approx(expected, abs=1e-6)
+
+
+def test_identical_text_without_vector_scores_one(nlp):
+    index = EmbeddingIndex(nlp)
+
+    scores = index.similarities("unknownword", ["unknownword", "milling"])
+
+    assert scores.tolist() == [1.0, 0.0]
+
+
+def test_each_distinct_text_is_embedded_once(nlp, monkeypatch):
+    index = EmbeddingIndex(nlp)
+    piped = []
+    original_pipe = nlp.pipe
+
+    def counting_pipe(texts, **kwargs):
+        texts = list(texts)
+        piped.extend(texts)
+        return original_pipe(texts, **kwargs)
+
+    monkeypatch.setattr(nlp, "pipe", counting_pipe)
+
+    index.similarities("milling", TEXTS)
+    index.similarities("cnc milling", TEXTS)
+    index.similarities("milling", ["milling", "new term"])
+
+    assert sorted(piped) == sorted(set(TEXTS) | {"new term"})
+
+
+def test_index_starts_over_when_full(nlp):
+    index = EmbeddingIndex(nlp, max_terms=3)
+    index.add(["milling", "turning", "cnc"])
+
+    index.add(["welding"])
+
+    assert len(index) == 1 and "welding" in index
+    assert index.similarities("welding", ["milling"]).tolist() == pytest.approx(
+        [_reference(nlp, "welding", "milling")], abs=1e-6
+    )
+
+
+def test_reset_keeps_texts_already_indexed_for_the_same_request(nlp):
+    index = EmbeddingIndex(nlp, max_terms=4)
+    index.add(["milling", "turning"])
+    candidates = ["turning", "laser cutting", "welding", "drilling"]
+
+    scores = index.similarities("milling", candidates)
+
+    assert scores.tolist() == pytest.approx(
+        [_reference(nlp, "milling", c) for c in candidates], abs=1e-6
+    )
+    assert all(text in index for text in ["milling", *candidates])
+
+
+def _matcher(nlp, domain="manufacturing") -> NLPMatcher:
+    matcher = NLPMatcher(domain=domain)
+    matcher._nlp = nlp
+    matcher._nlp_initialized = True
+    return matcher
+
+
+@pytest.mark.asyncio
+async def test_matcher_scores_keep_domain_boost_and_clamp(nlp):
+    matcher = _matcher(nlp)
+    capabilities = ["CNC Milling", "laser-cutting", "", "3D printing", "welding"]
+
+    scores = await matcher.calculate_semantic_similarities("milling", capabilities)
+
+    for capability, score in zip(capabilities, scores):
+        if not capability:
+            assert score == 0.0
+            continue
+        a = matcher._normalize_text("milling")
+        b = matcher._normalize_text(capability)
+        similarity = _reference(
+            nlp,
+            matcher._enhance_with_domain_context(a),
+            matcher._enhance_with_domain_context(b),
+        )
+        expected = max(
+            0.0, min(1.0, similarity + matcher._calculate_domain_boost(a, b))
+        )
+        assert score == pytest.approx(expected, abs=1e-6)
+        assert await matcher.calculate_semantic_similarity(
+            "milling", capability
+        ) == pytest.approx(score, abs=1e-6)
+
+
+@pytest.mark.asyncio
+async def test_match_scores_all_capabilities_in_one_call(nlp, monkeypatch):
+    matcher = _matcher(nlp)
+    calls = []
+    original = matcher.calculate_semantic_similarities
+
+    async def spy(text, candidates):
+        calls.append((text, list(candidates)))
+        return await original(text, candidates)
+
+    monkeypatch.setattr(matcher, "calculate_semantic_similarities", spy)
+
+    results = await matcher.match(["milling", "welding"], ["milling", "turning"])
+
+    assert [c[0] for c in calls] == ["milling", "welding"]
+    assert len(results) == 4
+    assert results[0].matched and results[0].confidence == 1.0
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_falls_back_to_pairs_for_that_requirement(nlp, monkeypatch):
+    matcher = _matcher(nlp)
+    original = matcher.calculate_semantic_similarities
+
+    async def flaky(text, candidates):
+        # Only the multi-candidate batch fails; single pairs still score.
+        if text == "welding" and len(candidates) > 1:
+            raise RuntimeError("batch scoring failed")
+        return await original(text, candidates)
+
+    monkeypatch.setattr(matcher, "calculate_semantic_similarities", flaky)
+
+    results = await matcher.match(["milling", "welding"], ["milling", "welding"])
+
+    assert [(r.requirement, r.capability) for r in results] == [
+        ("milling", "milling"),
+        ("milling", "welding"),
+        ("welding", "milling"),
+        ("welding", "welding"),
+    ]
+    assert results[0].matched and results[3].matched
+    assert matcher.failures == 1
+
+
+@pytest.mark.asyncio
+async def test_without_spacy_model_falls_back_to_string_similarity():
+    matcher = NLPMatcher(domain="manufacturing")
+    matcher._nlp = None
+    matcher._nlp_initialized = True
+
+    scores = await matcher.calculate_semantic_similarities(
+        "milling", ["milling", "welding"]
+    )
+
+    assert scores == [
+        matcher._calculate_string_similarity_with_context("milling", "milling"),
+        matcher._calculate_string_similarity_with_context("milling", "welding"),
+    ]
@@ -0,0 +1,300 @@
+"""Walking every OKW facility reads each object once, and the result is cached.
+
+``_load_network_candidates`` used to page through ``OKWService.list`` 500 at a
+time, and every page re-ran discovery and re-read every object before slicing,
+so building the network pool cost roughly N²/500 sequential reads. The
+facility iterator loads one snapshot — one discovery, one concurrent read per
+object — and ``list``, the network surface and ``list_kitchens`` share it.
+
+The snapshot comes from a catalogue cached like the OKH one: ``get`` and
+``_find_key_for_id`` answer from it too, writes invalidate it, and
+``catalog_version`` moves whenever it may have changed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.core.matching.facility_index import FacilityProcessIndex
+from src.core.models.okw import ManufacturingFacility
+from src.core.services.okw_service import (
+    OKW_FETCH_CONCURRENCY,
+    OKWService,
+    catalog_version,
+)
+from src.core.storage.base import gather_bounded
+from src.core.storage.smart_discovery import FileInfo
+
+
+def facility_dict(facility_id: str, name: str = "Shop", processes=()) -> dict:
+    return {
+        "id": facility_id,
+        "name": name,
+        "location": {"gps_coordinates": "40.0, -70.0"},
+        "facility_status": "Active",
+        "manufacturing_processes": list(processes),
+    }
+
+
+def kitchen_dict(kitchen_id: str, name: str = "Kitchen") -> dict:
+    return {"id": kitchen_id, "name": name, "appliances": ["oven"]}
+
+
+class FakeStorageManager:
+    """Counts reads and records how many overlap."""
+
+    def __init__(self, objects: dict, latency: float = 0.0):
+        self.objects = objects
+        self.latency = latency
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.get_calls = 0
+
+    async def get_object(self, key: str) -> bytes:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        self.get_calls += 1
+        try:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            payload = self.objects[key]
+            if isinstance(payload, bytes):
+                return payload
+            return json.dumps(payload).encode("utf-8")
+        finally:
+            self.in_flight -= 1
+
+    async def get_objects(self, keys, max_concurrency=None):
+        keys = list(keys)
+        results = await gather_bounded(keys, self.get_object, max_concurrency)
+        return dict(zip(keys, results))
+
+    async def put_object(self, key, data, *args, **kwargs):
+        self.objects[key] = json.loads(data)
+
+    async def delete_object(self, key):
+        return self.objects.pop(key, None) is not None
+
+
+class FakeStorage:
+    def __init__(self, manager):
+        self.manager = manager
+
+
+def file_info(key: str, minutes_old: int = 0) -> FileInfo:
+    return FileInfo(
+        key=key,
+        file_type="okw",
+        size=100,
+        last_modified=datetime(2026, 1, 1) - timedelta(minutes=minutes_old),
+        metadata={},
+    )
+
+
+@pytest.fixture(autouse=True)
+def _isolate_cache():
+    """Each test starts with an empty catalogue cache."""
+    from src.core.services.cache_service import get_cache_service
+
+    get_cache_service().clear()
+    yield
+    get_cache_service().clear()
+
+
+@pytest.fixture
+def build_service():
+    patcher = patch("src.core.services.okw_service.SmartFileDiscovery")
+
+    def build(objects, keys=None, latency=0.0):
+        service = OKWService()
+        manager = FakeStorageManager(objects, latency=latency)
+        service.storage = FakeStorage(manager)
+        service.ensure_initialized = AsyncMock()
+        service._visibility_store = lambda: AsyncMock()
+        service.capability_index = FacilityProcessIndex()
+        infos = keys
+        discovery_calls = []
+
+        async def fake_discover(prefix):
+            discovery_calls.append(prefix)
+            if keys is not None:
+                return infos
+            return [file_info(k) for k in manager.objects]
+
+        Discovery = patcher.start()
+        Discovery.return_value.discover_files = fake_discover
+        return service, manager, discovery_calls
+
+    yield build
+    patcher.stop()
+
+
+@pytest.mark.asyncio
+async def test_network_pool_reads_each_object_once(build_service):
+    """1200 facilities used to take three full scans (pages of 500)."""
+    objects = {f"okw/{i}.json": facility_dict(str(uuid4())) for i in range(1200)}
+    service, manager, discovery_calls = build_service(objects)
+
+    candidates, _, _ = await service._load_network_candidates(
+        include_mom=False, force_refresh=False
+    )
+
+    assert len(candidates) == 1200
+    assert manager.get_calls == 1200
+    assert discovery_calls == ["okw"]
+
+
+@pytest.mark.asyncio
+async def test_reads_are_concurrent_and_bounded(build_service):
+    objects = {f"okw/{i}.json": facility_dict(str(uuid4())) for i in range(60)}
+    service, manager, _ = build_service(objects, latency=0.01)
+
+    facilities = [f async for f in service.iter_facilities()]
+
+    assert len(facilities) == 60
+    assert 1 < manager.max_in_flight <= OKW_FETCH_CONCURRENCY
+
+
+@pytest.mark.asyncio
+async def test_duplicate_ids_keep_the_newest_file(build_service):
+    shared = str(uuid4())
+    objects = {
+        "okw/new.json": facility_dict(shared, name="New"),
+        "okw/old.json": facility_dict(shared, name="Old"),
+    }
+    keys = [file_info("okw/new.json"), file_info("okw/old.json", minutes_old=60)]
+    service, _, _ = build_service(objects, keys=keys)
+
+    facilities, total = await service.list()
+
+    assert total == 1
+    assert facilities[0].name == "New"
+
+
+@pytest.mark.asyncio
+async def test_kitchens_and_facilities_are_split_and_bad_files_skipped(
+    build_service,
+):
+    facility_id, kitchen_id = str(uuid4()), str(uuid4())
+    objects = {
+        "okw/shop.json": facility_dict(facility_id, processes=["milling"]),
+        "okw/kitchen.json": kitchen_dict(kitchen_id),
+        "okw/broken.json": b"{not json",
+        "okw/nameless-kitchen.json": {"id": str(uuid4()), "tools": []},
+    }
+    service, _, _ = build_service(objects)
+
+    facilities, total = await service.list()
+    kitchens = await service.list_kitchens()
+
+    assert total == 1 and str(facilities[0].id) == facility_id
+    assert [str(k.id) for k in kitchens] == [kitchen_id]
+
+
+@pytest.mark.asyncio
+async def test_snapshot_rebuilds_the_capability_index(build_service):
+    kept = str(uuid4())
+    objects = {"okw/kept.json": facility_dict(kept, processes=["milling"])}
+    service, _, _ = build_service(objects)
+    # Indexed earlier, since deleted from storage by another process.
+    service.capability_index.upsert(
+        ManufacturingFacility.from_dict(facility_dict(str(uuid4())))
+    )
+
+    await service.list()
+
+    assert len(service.capability_index) == 1 and kept in service.capability_index
+
+
+@pytest.mark.asyncio
+async def test_list_get_and_key_lookup_share_one_scan(build_service):
+    ids = [str(uuid4()) for _ in range(20)]
+    objects = {f"okw/{i}.json": facility_dict(i) for i in ids}
+    service, manager, discovery_calls = build_service(objects)
+
+    await service.list(page=1, page_size=5)
+    await service.list(page=2, page_size=5)
+    facility = await service.get(UUID(ids[3]))
+    key = await service._find_key_for_id(UUID(ids[7]))
+
+    assert str(facility.id) == ids[3]
+    assert key == f"okw/{ids[7]}.json"
+    assert manager.get_calls == 20 and discovery_calls == ["okw"]
+
+
+@pytest.mark.asyncio
+async def test_parsed_snapshot_is_reused_until_the_catalogue_changes(build_service):
+    objects = {"okw/a.json": facility_dict(str(uuid4()))}
+    service, _, _ = build_service(objects)
+
+    first = await service._load_snapshot()
+    version = catalog_version()
+    second = await service._load_snapshot()
+
+    assert second is first
+    assert catalog_version() == version
+
+
+@pytest.mark.asyncio
+async def test_writes_invalidate_the_catalogue_and_bump_the_version(build_service):
+    existing = str(uuid4())
+    service, manager, _ = build_service({"okw/a.json": facility_dict(existing)})
+    await service.list()
+
+    before = catalog_version()
+    created = await service.create(facility_dict(str(uuid4()), name="New"))
+    assert catalog_version() > before
+    assert await service.get(created.id) is not None
+
+    before = catalog_version()
+    assert await service.delete(UUID(existing))
+    assert catalog_version() > before
+    assert await service.get(UUID(existing)) is None
+    assert [f.name for f in (await service.list())[0]] == ["New"]
+
+
+@pytest.mark.asyncio
+async def test_callers_get_copies_not_the_shared_snapshot(build_service):
+    facility_id = str(uuid4())
+    objects = {
+        "okw/shop.json": facility_dict(facility_id, processes=["milling"]),
+        "okw/kitchen.json": kitchen_dict(str(uuid4())),
+    }
+    service, _, _ = build_service(objects)
+
+    fetched = await service.get(UUID(facility_id))
+    fetched.name = "Edited"
+    fetched.manufacturing_processes.append("welding")
+    listed = (await service.list())[0][0]
+    listed.name = "Edited"
+    (await service.list_kitchens())[0].name = "Edited"
+
+    again = await service.get(UUID(facility_id))
+    assert again.name == "Shop" and again.manufacturing_processes == ["milling"]
+    assert [f.name async for f in service.iter_facilities()] == ["Shop"]
+    assert [k.name for k in await service.list_kitchens()] == ["Kitchen"]
+
+
+@pytest.mark.asyncio
+async def test_catalog_revision_only_vouches_for_unedited_records(build_service):
+    facility_id = str(uuid4())
+    objects = {"okw/shop.json": facility_dict(facility_id, processes=["milling"])}
+    service, _, _ = build_service(objects)
+
+    record = await service.get(UUID(facility_id))
+    assert service.catalog_revision(record) == catalog_version()
+
+    edited = await service.get(UUID(facility_id))
+    edited.manufacturing_processes.append("welding")
+    inline = ManufacturingFacility.from_dict(facility_dict(facility_id, name="Other"))
+    assert service.catalog_revision(edited) is None
+    assert service.catalog_revision(inline) is None
+
+    await service.create(facility_dict(str(uuid4())))
+    assert service.catalog_revision(record) is None
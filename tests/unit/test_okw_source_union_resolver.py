@@ -167,10 +167,10 @@ async def test_union_degrades_to_storage_when_mom_unavailable(clean_env, monkeyp
 
     local = _facility_without_coords()
 
-    async def _one_page(self, *, page, page_size):
-        return ([local], 1) if page == 1 else ([], 0)
+    async def _snapshot(self):
+        return okw_mod.OKWSnapshot(facilities=[local])
 
-    monkeypatch.setattr(okw_mod.OKWService, "list", _one_page)
+    monkeypatch.setattr(okw_mod.OKWService, "_load_snapshot", _snapshot)
     # MoM cache reports unavailable (network down) → no MoM candidates added.
     from src.core.services import mom_bridge
 
@@ -14,6 +14,8 @@ from unittest.mock import AsyncMock
 
 import pytest
 
+from src.core.services.okw_service import OKWSnapshot
+
 _REPO_ROOT = Path(__file__).resolve().parents[2]
 if str(_REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(_REPO_ROOT))
@@ -276,7 +278,9 @@ async def test_get_network_spaces_unions_and_counts(monkeypatch):
     svc = OKWService()
     with_coords = _facility(uuid4(), "Local A", "40.0, -70.0", [])
     without = _facility(uuid4(), "Local B", None, [])
-    svc.list = AsyncMock(return_value=([with_coords, without], 2))
+    svc._load_snapshot = AsyncMock(
+        return_value=OKWSnapshot(facilities=[with_coords, without])
+    )
 
     async def fake_get(force_refresh=False):
         return (
@@ -312,8 +316,10 @@ async def test_get_network_spaces_applies_source_filter(monkeypatch):
     import src.core.services.mom_bridge as mom
 
     svc = OKWService()
-    svc.list = AsyncMock(
-        return_value=([_facility(uuid4(), "Local A", "40.0, -70.0", [])], 1)
+    svc._load_snapshot = AsyncMock(
+        return_value=OKWSnapshot(
+            facilities=[_facility(uuid4(), "Local A", "40.0, -70.0", [])]
+        )
     )
 
     async def fake_get(force_refresh=False):
@@ -345,8 +351,10 @@ async def test_get_network_match_facilities_returns_facilities(monkeypatch):
     import src.core.services.mom_bridge as mom
 
     svc = OKWService()
-    svc.list = AsyncMock(
-        return_value=([_facility(uuid4(), "Local A", "40.0, -70.0", [])], 1)
+    svc._load_snapshot = AsyncMock(
+        return_value=OKWSnapshot(
+            facilities=[_facility(uuid4(), "Local A", "40.0, -70.0", [])]
+        )
     )
 
     async def fake_get(force_refresh=False):
@@ -391,8 +399,10 @@ async def test_get_network_match_facilities_filters_by_space_id(monkeypatch):
     import src.core.services.mom_bridge as mom
 
     svc = OKWService()
-    svc.list = AsyncMock(
-        return_value=([_facility(uuid4(), "Local A", "40.0, -70.0", [])], 1)
+    svc._load_snapshot = AsyncMock(
+        return_value=OKWSnapshot(
+            facilities=[_facility(uuid4(), "Local A", "40.0, -70.0", [])]
+        )
     )
     mom_iri = "urn:mom:space-z"
 
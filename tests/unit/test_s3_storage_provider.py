@@ -0,0 +1,181 @@
+"""AWSS3Provider against moto's in-process S3.
+
+Covers multipart upload above the threshold, byte-range reads, page-by-page
+listing with delimiters, server-side copy, native batch delete and the
+shared client/connection pool.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+moto = pytest.importorskip("moto")
+
+from src.core.storage.base import StorageConfig  # noqa: E402
+from src.core.storage.manager import StorageManager  # noqa: E402
+from src.core.storage.providers import aws  # noqa: E402
+
+BUCKET = "ohm-test"
+MIB = 1024 * 1024
+
+
+@pytest.fixture
+def s3(monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setattr(aws, "_clients", {})
+    with moto.mock_aws():
+        config = StorageConfig(
+            "aws_s3",
+            BUCKET,
+            region="eu-west-1",
+            credentials={"access_key": "testing", "secret_key": "testing"},
+        )
+        aws._shared_client(config).create_bucket(
+            Bucket=BUCKET,
+            CreateBucketConfiguration={"LocationConstraint": "eu-west-1"},
+        )
+        yield config
+
+
+def _spy(monkeypatch, client, name):
+    calls = []
+    real = getattr(client, name)
+
+    def spy(**kwargs):
+        calls.append(kwargs)
+        return real(**kwargs)
+
+    monkeypatch.setattr(client, name, spy)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_round_trip_multipart_and_ranged_reads(s3, monkeypatch):
+    provider = aws.AWSS3Provider(s3)
+    await provider.connect()
+    monkeypatch.setattr(aws, "S3_MULTIPART_THRESHOLD", 6 * MIB)
+    monkeypatch.setattr(aws, "S3_MULTIPART_CHUNK_SIZE", 5 * MIB)
+    parts = _spy(monkeypatch, provider._client, "upload_part")
+
+    small = await provider.put_object(
+        "okw/a.json", b'{"id": "a"}', "application/json", {"domain": "okw"}
+    )
+    assert small.size == 11 and small.etag and '"' not in small.etag
+    assert parts == []
+
+    big = bytes(range(256)) * (12 * MIB // 256)
+    await provider.put_object("packages/big.bin", big)
+    assert [p["PartNumber"] for p in parts] == [1, 2, 3]
+
+    assert await provider.get_object("packages/big.bin") == big
+    assert await provider.get_object("packages/big.bin", byte_range=(5, 9)) == big[5:10]
+    tail = await provider.get_object(
+        "packages/big.bin", byte_range=(len(big) - 3, None)
+    )
+    assert tail == big[-3:]
+    with pytest.raises(FileNotFoundError):
+        await provider.get_object("okw/missing.json")
+
+    meta = await provider.get_object_metadata("okw/a.json")
+    assert meta.content_type == "application/json"
+    assert meta.metadata == {"domain": "okw"}
+
+
+@pytest.mark.asyncio
+async def test_listing_streams_pages_and_rolls_up_prefixes(s3, monkeypatch):
+    provider = aws.AWSS3Provider(s3)
+    await provider.connect()
+    await provider.put_objects((f"okw/{i:04d}.json", b"{}") for i in range(1005))
+    await provider.put_objects([("okw/archive/old.json", b"{}"), ("okh/x.json", b"{}")])
+
+    pages = []
+    real_next = next
+
+    def counting_next(iterator, default):
+        page = real_next(iterator, default)
+        if page is not None:
+            pages.append(len(page.get("Contents", [])))
+        return page
+
+    monkeypatch.setattr(aws, "next", counting_next, raising=False)
+
+    listing = provider.list_objects(prefix="okw/")
+    first = await listing.__anext__()
+    assert first["key"] == "okw/0000.json" and first["size"] == 2
+    assert pages == [1000]  # only the first page has been fetched
+    rest = [obj["key"] async for obj in listing]
+    assert len(rest) == 1005 and pages == [1000, 6]
+
+    rolled = [obj async for obj in provider.list_objects(prefix="okw/0", delimiter="/")]
+    assert len(rolled) == 1000 and not any(o.get("is_prefix") for o in rolled)
+    top = [obj async for obj in provider.list_objects(delimiter="/")]
+    assert [(o["key"], o.get("is_prefix")) for o in top] == [
+        ("okh/", True),
+        ("okw/", True),
+    ]
+    assert len([o async for o in provider.list_objects("okw/", max_keys=3)]) == 3
+
+
+@pytest.mark.asyncio
+async def test_copy_is_server_side_and_deletes_are_batched(s3, monkeypatch):
+    provider = aws.AWSS3Provider(s3)
+    await provider.connect()
+    await provider.put_object("okh/a.json", b"{}", "application/json", {"k": "v"})
+
+    gets = _spy(monkeypatch, provider._client, "get_object")
+    copied = await provider.copy_object("okh/a.json", "backups/okh/a.json")
+    assert copied.metadata == {"k": "v"} and copied.size == 2
+    assert gets == []
+    with pytest.raises(FileNotFoundError):
+        await provider.copy_object("okh/missing.json", "okh/b.json")
+
+    batches = _spy(monkeypatch, provider._client, "delete_objects")
+    heads = _spy(monkeypatch, provider._client, "head_object")
+    monkeypatch.setattr(aws, "S3_DELETE_BATCH_SIZE", 2)
+    await provider.put_object("okh/c.json", b"{}", "application/json")
+    deleted = await provider.delete_objects(
+        ["okh/a.json", "backups/okh/a.json", "okh/other.json", "okh/c.json"]
+    )
+    assert deleted == {
+        "okh/a.json": True,
+        "backups/okh/a.json": True,
+        "okh/other.json": False,
+        "okh/c.json": True,
+    }
+    assert [len(b["Delete"]["Objects"]) for b in batches] == [2, 1]
+    assert heads == []  # existence comes from one listing per directory
+    assert [o async for o in provider.list_objects()] == []
+    assert await provider.delete_object("okh/a.json") is False
+
+
+@pytest.mark.asyncio
+async def test_managers_share_one_client(s3, tmp_path):
+    first, second = (
+        StorageManager(s3, index_path=str(tmp_path / f"{name}.sqlite3"))
+        for name in ("first", "second")
+    )
+    await first.connect()
+    await second.connect()
+    assert isinstance(first.provider, aws.AWSS3Provider)
+    assert first.provider._client is second.provider._client
+
+    await first.put_object("okw/a.json", b'{"id": "a"}')
+    assert await second.get_object("okw/a.json") == b'{"id": "a"}'
+    await first.cleanup()
+    assert await second.get_object("okw/a.json") == b'{"id": "a"}'
+
+
+def test_config_uses_endpoint_env_and_default_credential_chain(monkeypatch):
+    from src.config.storage_config import create_storage_config
+
+    for name in ("AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY", "AWS_ENDPOINT_URL"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("AWS_ENDPOINT_URL_S3", "http://localhost:9000")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "eu-west-1")
+
+    config = create_storage_config("aws_s3", bucket_name=BUCKET)
+
+    # No static keys: boto3 resolves the task role / instance profile itself.
+    assert config.credentials == {"region": "eu-west-1"}
+    assert config.endpoint_url == "http://localhost:9000"
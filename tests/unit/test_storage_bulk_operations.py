@@ -0,0 +1,266 @@
+"""Bulk get/put/delete on providers and the manager, and the services using them.
+
+``StorageProvider`` falls back to the single-object calls with bounded
+concurrency, returning per-key outcomes instead of failing the batch. Azure
+and GCS delete through their native batch APIs, and fall back per object when
+a batch is rejected. The manager keeps the key/metadata index in sync, and
+backup, stale-solution cleanup and package push go through the bulk calls.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.core.models.package import BuildOptions, FileInfo, PackageMetadata
+from src.core.packaging.remote_storage import PackageRemoteStorage
+from src.core.services.storage_service import StorageService
+from src.core.storage.base import ObjectWrite, StorageConfig
+from src.core.storage.constants import build_solution_key, build_solution_metadata_key
+from src.core.storage.manager import StorageManager
+from src.core.storage.providers import azure, gcp
+from src.core.storage.providers.local import LocalStorageProvider
+
+
+def _manager(tmp_path):
+    return StorageManager(
+        StorageConfig("local", str(tmp_path / "store")),
+        index_path=str(tmp_path / "idx.sqlite3"),
+    )
+
+
+async def _service(tmp_path):
+    manager = _manager(tmp_path)
+    await manager.connect()
+    service = StorageService()
+    service.manager = manager
+    service._configured = True
+    return service
+
+
+def _count_calls(monkeypatch, manager, name):
+    calls = []
+    real = getattr(manager, name)
+
+    async def spy(*args, **kwargs):
+        calls.append(args)
+        return await real(*args, **kwargs)
+
+    monkeypatch.setattr(manager, name, spy)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_fallback_is_bounded_and_reports_per_key(tmp_path, monkeypatch):
+    provider = LocalStorageProvider(StorageConfig("local", str(tmp_path)))
+    stored = await provider.put_objects(
+        [ObjectWrite(f"k/{i}", b"x" * i) for i in range(20)]
+        + [("k/typed.json", b"{}", "application/json", {"a": "1"})]
+    )
+    assert stored["k/7"].size == 7
+    assert stored["k/typed.json"].metadata == {"a": "1"}
+
+    in_flight = peak = 0
+    real_get = provider.get_object
+
+    async def slow_get(key, version_id=None):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.005)
+        in_flight -= 1
+        return await real_get(key, version_id)
+
+    monkeypatch.setattr(provider, "get_object", slow_get)
+    bodies = await provider.get_objects(
+        [f"k/{i}" for i in range(20)] + ["k/missing"], max_concurrency=4
+    )
+    assert bodies["k/3"] == b"xxx"
+    assert isinstance(bodies["k/missing"], FileNotFoundError)
+    assert 1 < peak <= 4
+
+    deleted = await provider.delete_objects(["k/1", "k/2"])
+    assert deleted == {"k/1": True, "k/2": True}
+    assert not (tmp_path / "k" / "1").exists()
+
+
+@pytest.mark.asyncio
+async def test_manager_bulk_calls_keep_the_index_in_sync(tmp_path):
+    manager = _manager(tmp_path)
+    await manager.connect()
+    await manager.put_objects(
+        [(f"okw/{i}.json", json.dumps({"id": str(i)}).encode()) for i in range(3)]
+    )
+    await manager.delete_objects(["okw/0.json"])
+
+    rows = await manager.list_indexed("okw/")
+    assert [(r["key"], r["fields"]["id"]) for r in rows] == [
+        ("okw/1.json", "1"),
+        ("okw/2.json", "2"),
+    ]
+
+
+class _AsyncResponses:
+    def __init__(self, codes):
+        self.codes = codes
+
+    def __aiter__(self):
+        async def gen():
+            for code in self.codes:
+                yield SimpleNamespace(status_code=code)
+
+        return gen()
+
+
+@pytest.mark.asyncio
+async def test_azure_deletes_in_native_batches(monkeypatch):
+    provider = azure.AzureBlobProvider(StorageConfig("azure_blob", "c"))
+    provider._connected = True
+    batches = []
+
+    async def delete_blobs(*names, raise_on_any_failure=True):
+        assert raise_on_any_failure is False
+        batches.append(names)
+        if len(batches) == 2:
+            raise RuntimeError("batch not supported")
+        return _AsyncResponses([202] * (len(names) - 1) + [404])
+
+    provider._container = SimpleNamespace(delete_blobs=delete_blobs)
+    single = []
+
+    async def delete_object(key, version_id=None):
+        single.append(key)
+        return True
+
+    monkeypatch.setattr(provider, "delete_object", delete_object)
+    monkeypatch.setattr(azure, "AZURE_BATCH_SIZE", 3)
+
+    results = await provider.delete_objects(
+        [f"b{i}" for i in range(6)], max_concurrency=1
+    )
+
+    assert [len(b) for b in batches] == [3, 3]
+    assert results == {
+        "b0": True,
+        "b1": True,
+        "b2": False,
+        "b3": True,
+        "b4": True,
+        "b5": True,
+    }
+    # The rejected batch fell back to per-blob deletes.
+    assert single == ["b3", "b4", "b5"]
+
+
+@pytest.mark.asyncio
+async def test_gcs_deletes_in_native_batches():
+    provider = gcp.GCSProvider(StorageConfig("gcs", "b"))
+    provider._connected = True
+    deferred = []
+
+    class Batch:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            self._responses = [
+                SimpleNamespace(status_code=204 if key != "gone" else 404)
+                for key in deferred
+            ]
+            deferred.clear()
+
+    provider._client = MagicMock()
+    provider._client.batch.return_value = Batch()
+    provider._bucket = MagicMock()
+    provider._bucket.delete_blob.side_effect = deferred.append
+
+    results = await provider.delete_objects(["a", "gone", "c"])
+
+    assert results == {"a": True, "gone": False, "c": True}
+    provider._client.batch.assert_called_once_with(raise_exception=False)
+
+
+@pytest.mark.asyncio
+async def test_cleanup_and_backup_use_bulk_calls(tmp_path, monkeypatch):
+    service = await _service(tmp_path)
+    manager = service.manager
+    old = (datetime.now() - timedelta(days=400)).isoformat()
+    stale = [uuid4() for _ in range(3)]
+    for sid in stale:
+        await manager.put_object(build_solution_key(sid), b"x" * 10)
+        await manager.put_object(
+            build_solution_metadata_key(sid),
+            json.dumps({"id": str(sid), "created_at": old, "ttl_days": 30}).encode(),
+        )
+    gets = _count_calls(monkeypatch, manager, "get_object")
+    deletes = _count_calls(monkeypatch, manager, "delete_objects")
+
+    preview = await service.cleanup_stale_solutions()
+    assert preview["deleted_count"] == 3 and deletes == []
+
+    result = await service.cleanup_stale_solutions(dry_run=False)
+    assert sorted(result["deleted_ids"]) == sorted(str(s) for s in stale)
+    assert result["freed_space"] == 30
+    assert len(deletes) == 1 and gets == []
+    assert [obj async for obj in manager.list_objects("supply-tree-solutions/")] == []
+
+    await manager.put_object("okw/a.json", b'{"id": "a"}', "application/json")
+    await manager.put_object("okh/b.json", b'{"id": "b"}')
+    puts = _count_calls(monkeypatch, manager, "put_objects")
+    backup = await service.create_backup("snap")
+
+    assert backup["object_count"] == 2 and backup["total_size"] == 22
+    assert len(puts) == 1
+    assert await manager.get_object("backups/snap/okw/a.json") == b'{"id": "a"}'
+
+
+@pytest.mark.asyncio
+async def test_push_package_uploads_files_in_one_bulk_call(tmp_path, monkeypatch):
+    manager = _manager(tmp_path)
+    await manager.connect()
+    package_dir = tmp_path / "pkg"
+    (package_dir / "files").mkdir(parents=True)
+    inventory = []
+    for name in ("a.stl", "b.stl", "missing.stl"):
+        if name != "missing.stl":
+            (package_dir / "files" / name).write_bytes(name.encode())
+        inventory.append(
+            FileInfo(
+                original_url=f"https://example.org/{name}",
+                local_path=f"files/{name}",
+                content_type="model/stl",
+                size_bytes=5,
+                checksum_sha256="0" * 64,
+                downloaded_at=datetime(2026, 1, 1),
+                file_type="design-files",
+            )
+        )
+    metadata = PackageMetadata(
+        package_name="acme/widget",
+        version="1.0.0",
+        okh_manifest_id=uuid4(),
+        build_timestamp=datetime(2026, 1, 1),
+        ohm_version="0.0.0",
+        total_files=3,
+        total_size_bytes=15,
+        file_inventory=inventory,
+        build_options=BuildOptions(),
+        package_path=str(package_dir),
+    )
+    puts = _count_calls(monkeypatch, manager, "put_objects")
+
+    results = await PackageRemoteStorage(SimpleNamespace(manager=manager)).push_package(
+        metadata, package_dir
+    )
+
+    assert results["uploaded_files"] == ["files/a.stl", "files/b.stl"]
+    assert [f["file"] for f in results["failed_files"]] == ["files/missing.stl"]
+    assert len(puts) == 1
+    keys = [obj["key"] async for obj in manager.list_objects("packages/")]
+    assert sum(key.endswith(".stl") for key in keys) == 2
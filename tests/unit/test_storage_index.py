@@ -0,0 +1,177 @@
+"""The persistent key/metadata index answers listings without reading bodies.
+
+``StorageManager`` keeps one SQLite row per key on put/copy/delete, and
+reconciles a prefix against a listing (by etag, or size and mtime) to pick
+up objects written by other processes. Listing services read the indexed
+JSON projection instead of calling ``get_object`` per key.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from datetime import datetime, timedelta
+from uuid import UUID
+
+import pytest
+
+from src.core.services.storage_service import DomainStorageHandler, StorageService
+from src.core.storage import manager as manager_module
+from src.core.storage.base import StorageConfig
+from src.core.storage.index import StorageIndex, project_fields
+from src.core.storage.manager import StorageManager
+
+
+def _manager(tmp_path):
+    return StorageManager(
+        StorageConfig("local", str(tmp_path / "store")),
+        index_path=str(tmp_path / "idx.sqlite3"),
+    )
+
+
+class OkwStorageHandler(DomainStorageHandler[dict]):
+    def _get_object_id_from_dict(self, data):
+        return UUID(data["id"])
+
+
+def _uuid(i):
+    return f"00000000-0000-0000-0000-00000000000{i}"
+
+
+def _body(**fields):
+    return json.dumps(fields).encode("utf-8")
+
+
+def _spy_gets(monkeypatch, manager):
+    reads = []
+    real_get = manager.provider.get_object
+
+    async def get_object(key, version_id=None):
+        reads.append(key)
+        return await real_get(key, version_id)
+
+    monkeypatch.setattr(manager.provider, "get_object", get_object)
+    return reads
+
+
+def test_projection_keeps_only_indexed_scalar_fields():
+    body = _body(id="a", type="okw", name="Shop", nested={"x": 1}, extra=1)
+    assert project_fields("okw/a.json", body) == {
+        "id": "a",
+        "type": "okw",
+        "name": "Shop",
+    }
+    assert project_fields("okw/a.bin", body) == {}
+    assert project_fields("okw/a.json", b"not json") == {}
+
+
+@pytest.mark.asyncio
+async def test_writes_maintain_rows_and_queries_skip_bodies(tmp_path, monkeypatch):
+    manager = _manager(tmp_path)
+    await manager.connect()
+    await manager.put_object("okw/a.json", _body(id="a", type="okw"))
+    await manager.put_object("okw/b.json", _body(id="b", type="lab"))
+    await manager.copy_object("okw/b.json", "okw/c.json")
+    await manager.delete_object("okw/a.json")
+
+    reads = _spy_gets(monkeypatch, manager)
+    rows = await manager.list_indexed("okw/")
+    assert [row["key"] for row in rows] == ["okw/b.json", "okw/c.json"]
+    assert rows[1]["fields"] == {"id": "b", "type": "lab"}
+    assert isinstance(rows[0]["last_modified"], datetime)
+    assert [r["key"] for r in await manager.list_indexed("okw/", {"type": "lab"})] == [
+        "okw/b.json",
+        "okw/c.json",
+    ]
+    # The first query reconciles against a listing; nothing changed on disk.
+    assert reads == []
+
+    # The index survives a restart.
+    await manager.cleanup()
+    reopened = StorageIndex(tmp_path / "idx.sqlite3")
+    assert reopened.get("okw/c.json")["fields"]["id"] == "b"
+    reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_work_runs_off_the_event_loop(tmp_path, monkeypatch):
+    loop_thread = threading.get_ident()
+    threads = set()
+    for name in ("__init__", "upsert", "remove", "get", "rows", "scanned_at"):
+        real = getattr(StorageIndex, name)
+
+        def spy(self, *args, _real=real, **kwargs):
+            threads.add(threading.get_ident())
+            return _real(self, *args, **kwargs)
+
+        monkeypatch.setattr(StorageIndex, name, spy)
+
+    manager = _manager(tmp_path)
+    await manager.connect()
+    await manager.put_object("okw/a.json", _body(id="a"))
+    await manager.copy_object("okw/a.json", "okw/b.json")
+    await manager.delete_object("okw/a.json")
+    assert [r["key"] for r in await manager.list_indexed("okw/")] == ["okw/b.json"]
+    await manager.cleanup()
+
+    assert threads and loop_thread not in threads
+
+
+@pytest.mark.asyncio
+async def test_reconcile_picks_up_external_writes(tmp_path, monkeypatch):
+    manager = _manager(tmp_path)
+    await manager.connect()
+    await manager.put_object("okh/a.json", _body(id="a", title="A"))
+    assert len(await manager.list_indexed("okh/")) == 1
+
+    # Written by another process: no sidecar, no index row.
+    (tmp_path / "store" / "okh" / "b.json").write_bytes(_body(id="b", title="B"))
+    (tmp_path / "store" / "okh" / "a.json").unlink()
+
+    # Within the rescan window the index is trusted as-is.
+    assert [r["key"] for r in await manager.list_indexed("okh/")] == ["okh/a.json"]
+
+    monkeypatch.setattr(manager_module, "STORAGE_INDEX_RESCAN_SECONDS", 0)
+    reads = _spy_gets(monkeypatch, manager)
+    rows = await manager.list_indexed("okh/")
+    assert [(r["key"], r["fields"]["title"]) for r in rows] == [("okh/b.json", "B")]
+    assert reads == ["okh/b.json"]
+
+    # Unchanged on the next reconcile: no body is read again.
+    await manager.list_indexed("okh/")
+    assert reads == ["okh/b.json"]
+
+
+@pytest.mark.asyncio
+async def test_listing_services_answer_from_the_index(tmp_path, monkeypatch):
+    manager = _manager(tmp_path)
+    await manager.connect()
+    service = StorageService()
+    service.manager = manager
+    service._configured = True
+
+    for i in range(3):
+        await manager.put_object(f"okw/{i}.json", _body(id=_uuid(i), type="okw"))
+    now = datetime.now()
+    for i, age in enumerate((1, 400)):
+        await manager.put_object(
+            f"supply-tree-solutions/metadata/{_uuid(i)}.json",
+            _body(
+                id=_uuid(i),
+                okh_id="okh",
+                matching_mode="single-level",
+                created_at=(now - timedelta(days=age)).isoformat(),
+                updated_at=(now - timedelta(days=age)).isoformat(),
+                ttl_days=30,
+            ),
+        )
+    reads = _spy_gets(monkeypatch, manager)
+
+    objects, total = await OkwStorageHandler(service).list_objects(limit=2, offset=1)
+    assert [str(o["id"]) for o in objects] == [_uuid(1), _uuid(2)] and total == 3
+    assert objects[0]["type"] == "okw"
+
+    fresh = await service.list_supply_tree_solutions(include_stale=False)
+    assert [s["id"] for s in fresh] == [_uuid(0)]
+    assert [str(s) for s in await service.get_stale_solutions()] == [_uuid(1)]
+    assert reads == []
@@ -0,0 +1,137 @@
+"""The alias automaton must resolve exactly like the linear substring scan it replaced.
+
+``ProcessTaxonomy.normalize`` step 5 used to loop over the whole alias table
+for every unrecognized input. The automaton and the per-instance memo are pure
+speedups: same canonical ID for every input, including the five-character
+minimum and first-registered-alias-wins order.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Optional
+
+import pytest
+
+from src.core.taxonomy.alias_automaton import AliasAutomaton
+from src.core.taxonomy.process_taxonomy import (
+    DEFAULT_TAXONOMY_PATH,
+    ProcessTaxonomy,
+    load_from_yaml,
+)
+
+
+def _linear_step5(taxonomy: ProcessTaxonomy, key: str) -> Optional[str]:
+    """The original step-5 loop, verbatim."""
+    for alias_key, cid in taxonomy._alias_map.items():
+        if len(alias_key) < 5:
+            continue
+        if alias_key in key or key in alias_key:
+            return cid
+    return None
+
+
+def _reference_normalize(taxonomy: ProcessTaxonomy, input_str) -> Optional[str]:
+    if not input_str or not isinstance(input_str, str):
+        return None
+    text = input_str.strip()
+    if not text:
+        return None
+    if text in taxonomy._definitions:
+        return text
+    if "wikipedia.org/wiki/" in text.lower():
+        slug = taxonomy._extract_wiki_slug(text)
+        if slug:
+            key = taxonomy._normalize_key(slug)
+            if key in taxonomy._alias_map:
+                return taxonomy._alias_map[key]
+    upper = text.upper().strip()
+    if upper in taxonomy._tsdc_map:
+        return taxonomy._tsdc_map[upper]
+    key = taxonomy._normalize_key(text)
+    if key in taxonomy._alias_map:
+        return taxonomy._alias_map[key]
+    return _linear_step5(taxonomy, key)
+
+
+def _inputs(taxonomy: ProcessTaxonomy):
+    rng = random.Random(11)
+    aliases = list(taxonomy._alias_map)
+    inputs = [
+        "milling",
+        "Knitting",
+        "CNC router work",
+        "precision laser-cutting service",
+        "-",
+        "  ",
+        "https://en.wikipedia.org/wiki/Laser_cutting",
+        "https://en.wikipedia.org/wiki/Underwater_basket_weaving",
+        "3DP",
+        "pla",
+        "plastic",
+        "electroplating",
+    ]
+    for alias in aliases:
+        inputs.append(alias)
+        inputs.append(alias.upper().replace(" ", "_"))
+        if len(alias) > 3:
+            start = rng.randrange(len(alias) - 2)
+            inputs.append(alias[start : start + rng.randint(2, len(alias))])
+        inputs.append(f"industrial {alias} services")
+    for _ in range(300):
+        inputs.append(" ".join(rng.sample(aliases, 2)))
+    return inputs
+
+
+@pytest.fixture(scope="module", params=["builtin", "yaml"])
+def taxonomy(request):
+    if request.param == "yaml":
+        return ProcessTaxonomy(load_from_yaml(DEFAULT_TAXONOMY_PATH))
+    return ProcessTaxonomy()
+
+
+def test_normalize_matches_the_linear_scan(taxonomy):
+    for text in _inputs(taxonomy):
+        assert taxonomy.normalize(text) == _reference_normalize(taxonomy, text), text
+
+
+def test_memoized_results_are_stable(taxonomy):
+    inputs = _inputs(taxonomy)[:200]
+    first = [taxonomy.normalize(t) for t in inputs]
+    second = [taxonomy.normalize(t) for t in inputs]
+
+    assert first == second
+    assert taxonomy._normalize_memo.stats()["hits"] >= len(inputs)
+
+
+def test_first_registered_alias_wins():
+    automaton = AliasAutomaton(["laser cutting", "cutting", "laser"])
+
+    assert automaton.first_match("precision laser cutting") == 0
+    assert automaton.first_match("cutting board") == 1
+    assert automaton.first_match("laser") == 0  # contained in alias 0
+    assert automaton.first_match("welding") is None
+
+
+def test_empty_key_matches_like_the_scan():
+    """``"" in alias`` is true, so the scan returned the first long alias."""
+    assert AliasAutomaton(["milling", "turning"]).first_match("") == 0
+    assert AliasAutomaton([]).first_match("") is None
+
+
+def test_reload_rebuilds_automaton_and_forgets_memo(tmp_path):
+    taxonomy = ProcessTaxonomy()
+    assert taxonomy.normalize("wire harness lacing") is None
+
+    yaml_text = DEFAULT_TAXONOMY_PATH.read_text(encoding="utf-8")
+    custom = tmp_path / "taxonomy.yaml"
+    custom.write_text(
+        yaml_text
+        + "\n  harness_lacing:\n"
+        + '    display_name: "Harness Lacing"\n'
+        + '    aliases: ["harness lacing"]\n',
+        encoding="utf-8",
+    )
+    taxonomy.reload(custom)
+
+    assert taxonomy.normalize("wire harness lacing") == "harness_lacing"
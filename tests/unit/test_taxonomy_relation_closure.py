@@ -0,0 +1,102 @@
+"""Hierarchy queries answer from the closure built at load time.
+
+``are_related`` used to walk both ancestor chains and compare parents on every
+call. The closure must give the same answers as that walk for every pair, and
+``relation_matrix`` must agree with ``are_related`` element-wise.
+"""
+
+from __future__ import annotations
+
+from typing import List, Set
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.core.taxonomy.process_taxonomy import (  # noqa: E402
+    DEFAULT_TAXONOMY_PATH,
+    ProcessDefinition,
+    ProcessTaxonomy,
+    load_from_yaml,
+)
+
+
+def _walk(taxonomy: ProcessTaxonomy, cid: str) -> List[str]:
+    ancestors, current, visited = [], cid, set()
+    while current and current not in visited:
+        visited.add(current)
+        defn = taxonomy.get_definition(current)
+        if not defn or not defn.parent:
+            break
+        ancestors.append(defn.parent)
+        current = defn.parent
+    return ancestors
+
+
+def _reference_related(taxonomy: ProcessTaxonomy, a: str, b: str) -> bool:
+    if a == b:
+        return True
+    if a in set(_walk(taxonomy, b)) or b in set(_walk(taxonomy, a)):
+        return True
+    pa, pb = taxonomy.get_parent(a), taxonomy.get_parent(b)
+    return bool(pa and pb and pa == pb)
+
+
+@pytest.fixture(scope="module", params=["builtin", "yaml"])
+def taxonomy(request):
+    if request.param == "yaml":
+        return ProcessTaxonomy(load_from_yaml(DEFAULT_TAXONOMY_PATH))
+    return ProcessTaxonomy()
+
+
+def test_closure_matches_the_ancestor_walk(taxonomy):
+    ids = sorted(taxonomy.get_all_canonical_ids())
+    for a in ids:
+        assert taxonomy.get_ancestors(a) == _walk(taxonomy, a)
+        related: Set[str] = set()
+        for b in ids:
+            expected = _reference_related(taxonomy, a, b)
+            assert taxonomy.are_related(a, b) is expected, (a, b)
+            assert taxonomy.is_ancestor(b, a) is (b in _walk(taxonomy, a))
+            if expected:
+                related.add(b)
+        assert taxonomy.get_related(a) == related
+
+
+def test_relation_matrix_agrees_with_are_related(taxonomy):
+    ids_a = ["milling", "CNC machining", "knitting", "3DP", "laser cutting", ""]
+    ids_b = sorted(taxonomy.get_all_canonical_ids())[:40] + ["knitting"]
+
+    matrix = taxonomy.relation_matrix(ids_a, ids_b)
+
+    assert matrix.shape == (len(ids_a), len(ids_b)) and matrix.dtype == bool
+    for i, a in enumerate(ids_a):
+        for j, b in enumerate(ids_b):
+            assert matrix[i, j] == taxonomy.are_related(a, b), (a, b)
+
+
+def test_relation_matrix_handles_empty_inputs(taxonomy):
+    assert taxonomy.relation_matrix([], ["milling"]).shape == (0, 1)
+
+
+def test_returned_collections_are_copies(taxonomy):
+    taxonomy.get_ancestors("cnc_milling").append("bogus")
+    taxonomy.get_children("cnc_machining").add("bogus")
+
+    assert "bogus" not in taxonomy.get_ancestors("cnc_milling")
+    assert "bogus" not in taxonomy.get_children("cnc_machining")
+
+
+def test_cyclic_parents_terminate():
+    taxonomy = ProcessTaxonomy(
+        [
+            ProcessDefinition(canonical_id="a", display_name="A", parent="b"),
+            ProcessDefinition(canonical_id="b", display_name="B", parent="a"),
+            ProcessDefinition(canonical_id="c", display_name="C", parent="ghost"),
+        ]
+    )
+
+    assert taxonomy.get_ancestors("a") == ["b", "a"]
+    assert taxonomy.get_ancestors("c") == ["ghost"]
+    assert taxonomy.are_related("a", "b")
+    assert not taxonomy.are_related("a", "c")